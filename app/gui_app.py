@@ -44,6 +44,14 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QImage, QPixmap, QFont
 
+# Ảnh gửi lên API: thu nhỏ + JPEG chất lượng tối ưu (dùng chung với backend)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "aws"))
+try:
+    from backend.utils.image_normalizer import encode_frame
+except ImportError:
+    def encode_frame(frame):
+        return cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85])[1].tobytes()
+
 # ============ CẤU HÌNH ============
 # API Configuration
 USE_LOCAL_API = False  # Set False to use AWS API Gateway
@@ -1331,8 +1339,7 @@ class FaceRecognitionApp(QMainWindow):
             return
 
         try:
-            _, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 95])
-            files = {"image": ("frame.jpg", buffer.tobytes(), "image/jpeg")}
+            files = {"image": ("frame.jpg", encode_frame(frame), "image/jpeg")}
 
             response = requests.post(
                 f"{API_URL}/api/v1/identify",
@@ -1611,10 +1618,8 @@ class FaceRecognitionApp(QMainWindow):
 
         try:
             # Encode frame to JPEG and convert to base64
-            _, buffer = cv2.imencode(
-                ".jpg", self.captured_frame, [cv2.IMWRITE_JPEG_QUALITY, 95]
-            )
-            image_base64 = base64.b64encode(buffer.tobytes()).decode("utf-8")
+            image_bytes = encode_frame(self.captured_frame)
+            image_base64 = base64.b64encode(image_bytes).decode("utf-8")
 
             # Sanitize user_id - remove non-ASCII characters
             user_id = re.sub(r"[^a-zA-Z0-9_-]", "", user_name.lower().replace(" ", "_"))
@@ -1643,7 +1648,7 @@ class FaceRecognitionApp(QMainWindow):
 
             # Prepare image file
             files = {
-                "image": ("photo.jpg", buffer.tobytes(), "image/jpeg")
+                "image": ("photo.jpg", image_bytes, "image/jpeg")
             }
 
             headers = self._get_auth_headers()
@@ -2125,8 +2130,7 @@ class FaceRecognitionApp(QMainWindow):
 
                 frame_count += 1
                 if frame_count % 30 == 0:  # Process every 30 frames
-                    _, buffer = cv2.imencode(".jpg", frame)
-                    files = {"image": ("frame.jpg", buffer.tobytes(), "image/jpeg")}
+                    files = {"image": ("frame.jpg", encode_frame(frame), "image/jpeg")}
 
                     try:
                         response = requests.post(
@@ -2420,8 +2424,7 @@ class VideoEnrollDialog(QDialog):
 
                 if len(faces) > 0 and processed_count % 30 == 0:  # Every 30 frames
                     # Enroll this frame
-                    _, buffer = cv2.imencode(".jpg", frame)
-                    files = {"image": ("frame.jpg", buffer.tobytes(), "image/jpeg")}
+                    files = {"image": ("frame.jpg", encode_frame(frame), "image/jpeg")}
                     data = {
                         "user_name": user_name,
                         "gender": self.gender_combo.currentText(),
@@ -21,6 +21,9 @@ from fastapi import (
     Form,
 )
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 from prometheus_fastapi_instrumentator import Instrumentator
 from pydantic import BaseModel
 from typing import Any, Dict, List, Optional
@@ -28,8 +31,12 @@ import uvicorn
 from datetime import datetime, timezone
 import psutil
 
+import asyncio
+import json
+import shutil
 import sys
 import os
+import tempfile
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
@@ -41,10 +48,16 @@ from backend.aws.rekognition_client import RekognitionClient  # noqa: E402
 from backend.aws.dynamodb_client import DynamoDBClient  # noqa: E402
 from backend.utils.config import settings  # noqa: E402
 from backend.utils.logger import setup_logger  # noqa: E402
+from backend.utils.validators import FileValidator  # noqa: E402
+from backend.api.uploads import normalize_image_bytes, read_image_upload  # noqa: E402
 from .schemas import (  # noqa: E402
     EnrollmentResponse,
     IdentificationResponse,
+    BatchIdentificationResponse,
+    BatchImageResult,
+    DatabaseStats,
     FaceMatch,
+    PersonMatchesResponse,
 )
 
 xray_enabled = False
@@ -117,9 +130,11 @@ Instrumentator().instrument(app).expose(app)
 # Import dependencies module for shared services
 from .dependencies import (
     initialize_clients,
+    shutdown_clients,
     get_enrollment_service,
     get_identification_service,
     get_database_manager,
+    get_match_recorder,
 )
 
 # Startup event to initialize shared AWS clients
@@ -130,6 +145,12 @@ async def startup_event():
     initialize_clients()
     logger.info("✅ Application startup complete")
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared AWS resources on application shutdown."""
+    shutdown_clients()
+
 # Legacy variables for backward compatibility with inline endpoints
 # These will be populated after startup event
 enrollment_service = None
@@ -297,7 +318,7 @@ async def readiness_check():
             return {"status": "degraded", "database": "unavailable"}
 
         # Perform a lightweight health check
-        db_health = db_manager.check_health()
+        db_health = await db_manager.check_health_async()
 
         if db_health["status"] != "ok":
             raise HTTPException(
@@ -305,11 +326,17 @@ async def readiness_check():
                 detail=f"Database not ready: {db_health.get('error', 'Unknown error')}",
             )
 
-        return {
+        response = {
             "status": "ready",
             "database": db_health,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
+
+        match_recorder = get_match_recorder()
+        if match_recorder is not None:
+            response["match_recorder"] = match_recorder.stats()
+
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -361,10 +388,10 @@ async def enroll_face(
                 detail="⚠️ AWS services not configured. Please set AWS_S3_BUCKET, AWS_REKOGNITION_COLLECTION, and AWS_DYNAMODB tables in .env file."
             )
         
-        image_bytes = await image.read()
+        image_bytes = await read_image_upload(image)
 
         # Enroll face
-        result = enrollment_service.enroll_face(
+        result = await enrollment_service.enroll_face_async(
             image_bytes=image_bytes, **enrollment_data.model_dump()
         )
         processing_time = (datetime.now() - start_time).total_seconds() * 1000
@@ -404,12 +431,14 @@ async def enroll_face(
 async def identify_face(
     image: UploadFile = File(...),
     threshold: float = 0.6,
+    site_id: Optional[str] = None,
 ):
     """
     Identify faces in an image. No authentication required.
 
     - **image**: Image file containing face(s)
     - **threshold**: Recognition threshold (0.0-1.0, lower = more strict)
+    - **site_id**: Site/camera the image came from (per-site statistics)
     """
 
     start_time = datetime.now()
@@ -421,13 +450,13 @@ async def identify_face(
                 detail="⚠️ AWS services not configured. Please set AWS_REKOGNITION_COLLECTION and AWS_DYNAMODB tables in .env file."
             )
         
-        image_bytes = await image.read()
+        image_bytes = await read_image_upload(image)
 
         # Convert threshold from 0-1 to 0-100 for Rekognition
         rekognition_threshold = threshold * 100
 
-        result = identification_service.identify_face(
-            image_bytes=image_bytes, confidence_threshold=rekognition_threshold
+        result = await identification_service.identify_face_async(
+            image_bytes=image_bytes, confidence_threshold=rekognition_threshold, site_id=site_id
         )
         processing_time = (datetime.now() - start_time).total_seconds() * 1000
 
@@ -447,6 +476,143 @@ async def identify_face(
         )
 
 
+@app.post("/api/v1/identify/batch", response_model=BatchIdentificationResponse)
+async def identify_faces_batch(
+    images: List[UploadFile] = File(...),
+    threshold: float = 0.6,
+    site_id: Optional[str] = None,
+):
+    """
+    Identify faces in several images with one request. No authentication required.
+
+    - **images**: Image files, each containing face(s)
+    - **threshold**: Recognition threshold (0.0-1.0, lower = more strict)
+    - **site_id**: Site/camera the images came from (per-site statistics)
+    """
+
+    start_time = datetime.now()
+    try:
+        if identification_service is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="⚠️ AWS services not configured. Please set AWS_REKOGNITION_COLLECTION and AWS_DYNAMODB tables in .env file."
+            )
+
+        if len(images) > settings.identify_batch_max_images:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Too many images: {len(images)} (max {settings.identify_batch_max_images})",
+            )
+
+        raw_images = [await image.read() for image in images]
+        images_bytes = list(
+            await asyncio.gather(*(normalize_image_bytes(data) for data in raw_images))
+        )
+
+        result = await identification_service.identify_faces_batch_async(
+            images=images_bytes, confidence_threshold=threshold * 100, site_id=site_id
+        )
+        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+
+        logger.info(
+            f"Batch identification: {result['faces_detected']} faces detected in {len(images_bytes)} images"
+        )
+
+        return BatchIdentificationResponse(
+            success=result["success"],
+            total_images=result["total_images"],
+            faces_detected=result["faces_detected"],
+            processing_time_ms=processing_time,
+            results=[
+                BatchImageResult(
+                    image_index=idx,
+                    success=image_result["success"],
+                    faces_detected=image_result["faces_detected"],
+                    faces=image_result["faces"],
+                    message=image_result.get("message", ""),
+                    cache_hit=image_result.get("cache_hit", False),
+                )
+                for idx, image_result in enumerate(result["results"])
+            ],
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch identification error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+
+
+def _ndjson_video_events(video_path: str, confidence_threshold: float):
+    """Serialize video identification events as NDJSON."""
+    try:
+        for event in identification_service.stream_video_identification(
+            video_path, confidence_threshold=confidence_threshold
+        ):
+            yield json.dumps(event, default=str) + "\n"
+    except Exception as e:
+        logger.error(f"Video identification error: {e}")
+        yield json.dumps({"type": "error", "message": str(e)}) + "\n"
+
+
+def _remove_upload(path: str) -> None:
+    """Delete a temporary upload (idempotent)."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+@app.post("/api/v1/identify/video")
+async def identify_faces_in_video(
+    video: UploadFile = File(...),
+    threshold: float = 0.6,
+):
+    """
+    Identify faces in a video, streamed as NDJSON. No authentication required.
+
+    Emits one ``frame`` event per sampled frame with matches, then a
+    ``summary`` event with per-person first/last-seen intervals.
+
+    - **video**: Video file (.mp4, .avi, .mov)
+    - **threshold**: Recognition threshold (0.0-1.0, lower = more strict)
+    """
+
+    if identification_service is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="⚠️ AWS services not configured. Please set AWS_REKOGNITION_COLLECTION and AWS_DYNAMODB tables in .env file."
+        )
+
+    suffix = os.path.splitext(video.filename or "")[1].lower()
+    if suffix not in FileValidator.ALLOWED_VIDEO_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid extension. Allowed: {sorted(FileValidator.ALLOWED_VIDEO_EXTENSIONS)}",
+        )
+
+    # OpenCV needs a file path; copy the spooled upload off the event loop
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        await run_in_threadpool(shutil.copyfileobj, video.file, tmp)
+        video_path = tmp.name
+
+    if os.path.getsize(video_path) > settings.identify_video_max_size_mb * 1024 * 1024:
+        os.unlink(video_path)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Video too large (max {settings.identify_video_max_size_mb}MB)",
+        )
+
+    # Runs once the response is over, even if the stream was never consumed
+    return StreamingResponse(
+        _ndjson_video_events(video_path, threshold * 100),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(_remove_upload, video_path),
+    )
+
+
 # ============================================
 # Telemetry Endpoint
 # ============================================
@@ -474,12 +640,60 @@ async def get_telemetry() -> TelemetryResponse:
 
 
 @app.get("/api/v1/people")
-def list_people():
-    """Get list of all enrolled people. No authentication required."""
-    # Simplified version - return empty list for now
-    # Desktop app will show "No people enrolled yet"
-    logger.info("GET /api/v1/people - Returning empty list (AWS not configured)")
-    return []
+async def list_people(limit: int = 100, cursor: Optional[str] = None):
+    """
+    Get one page of enrolled people. No authentication required.
+
+    - **limit**: People per page (1-1000)
+    - **cursor**: `next_cursor` from the previous page
+    """
+    if db_manager is None:
+        # Desktop app will show "No people enrolled yet"
+        logger.info("GET /api/v1/people - Returning empty page (AWS not configured)")
+        return {"total": 0, "people": [], "next_cursor": None}
+
+    if not 1 <= limit <= 1000:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="limit must be between 1 and 1000"
+        )
+
+    try:
+        page = await db_manager.list_people_page_async(limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not page["success"]:
+        logger.error(f"Error listing people: {page.get('error')}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=page.get("error")
+        )
+
+    people = []
+    for person in page["people"]:
+        # Map person_id to folder_name for compatibility
+        person.setdefault("folder_name", person.get("person_id"))
+        if "embedding_count" in person:
+            person["embedding_count"] = int(person["embedding_count"])
+        people.append(person)
+
+    return {"total": len(people), "people": people, "next_cursor": page["next_cursor"]}
+
+
+@app.get("/api/v1/stats", response_model=DatabaseStats)
+async def get_stats():
+    """
+    Get database statistics from the aggregate counters. No authentication required.
+    """
+    if db_manager is None:
+        return DatabaseStats(total_people=0, total_embeddings=0)
+
+    stats = await db_manager.get_statistics_async()
+    if stats is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Statistics unavailable"
+        )
+    return DatabaseStats(**stats)
+
 
 @app.get("/api/v1/test")
 def test_endpoint():
@@ -497,7 +711,7 @@ async def get_person(folder_name: str):
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Database service not available",
             )
-        person = db_manager.get_person(folder_name)
+        person = await db_manager.get_person_async(folder_name)
         if not person:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -519,12 +733,59 @@ async def get_person(folder_name: str):
         )
 
 
+@app.get("/api/v1/people/{folder_name}/matches", response_model=PersonMatchesResponse)
+async def get_person_matches(
+    folder_name: str,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> PersonMatchesResponse:
+    """
+    Get a person's match history, newest first. No authentication required.
+
+    - **since** / **until**: ISO date or timestamp bounds (default: last 30 days)
+    - **limit**: Matches per page (1-1000)
+    - **cursor**: `next_cursor` from the previous page
+    """
+    if identification_service is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Identification service not available",
+        )
+
+    if not 1 <= limit <= 1000:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="limit must be between 1 and 1000"
+        )
+
+    try:
+        page = await identification_service.get_person_matches_async(
+            folder_name, since=since, until=until, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not page["success"]:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=page.get("error")
+        )
+
+    return PersonMatchesResponse(
+        person_id=folder_name,
+        total=len(page["matches"]),
+        matches=page["matches"],
+        next_cursor=page["next_cursor"],
+        daily_counts=page["daily_counts"],
+    )
+
+
 @app.delete("/api/v1/people/{folder_name}", response_model=DeletePersonResponse)
 async def delete_person(folder_name: str) -> DeletePersonResponse:
     """Delete a person from the database. No authentication required."""
     
     try:
-        result = db_manager.delete_person(folder_name)
+        result = await db_manager.delete_person_async(folder_name)
         if result["success"]:
             logger.info(f"Deleted person: {folder_name}")
             return DeletePersonResponse(
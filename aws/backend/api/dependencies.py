@@ -5,15 +5,19 @@ to avoid creating new connections on every request.
 """
 
 import logging
-from typing import Optional
+from typing import Optional, Union
 
+from ..aws import client_factory
 from ..aws.s3_client import S3Client
 from ..aws.rekognition_client import RekognitionClient
 from ..aws.dynamodb_client import DynamoDBClient
-from ..aws.redis_client import RedisClient
+from ..aws.sqlite_client import SQLiteClient
+from ..aws.redis_client import RedisClient, TwoTierRedisClient
 from ..core.enrollment_service import EnrollmentService
 from ..core.identification_service import IdentificationService
 from ..core.database_manager import DatabaseManager
+from ..core.executor import configure_executor, shutdown_executor
+from ..core.match_recorder import MatchRecorder
 from ..utils.config import settings
 
 logger = logging.getLogger(__name__)
@@ -21,20 +25,31 @@ logger = logging.getLogger(__name__)
 # Global shared instances (created once at startup)
 _s3_client: Optional[S3Client] = None
 _rekognition_client: Optional[RekognitionClient] = None
-_dynamodb_client: Optional[DynamoDBClient] = None
+_dynamodb_client: Optional[Union[DynamoDBClient, SQLiteClient]] = None
 _redis_client: Optional[RedisClient] = None
 _enrollment_service: Optional[EnrollmentService] = None
 _identification_service: Optional[IdentificationService] = None
 _database_manager: Optional[DatabaseManager] = None
+_match_recorder: Optional[MatchRecorder] = None
 
 
 def initialize_clients():
     """Initialize all AWS clients and services at application startup."""
     global _s3_client, _rekognition_client, _dynamodb_client, _redis_client
     global _enrollment_service, _identification_service, _database_manager
+    global _match_recorder
 
     logger.info("🔧 Initializing shared AWS clients...")
 
+    # Blocking boto3 calls from async routes run on this pool
+    configure_executor(settings.aws_executor_max_workers)
+    # One pooled client per service, sized for the executor above
+    client_factory.configure(
+        max_pool_connections=settings.aws_max_pool_connections,
+        max_attempts=settings.aws_max_attempts,
+        retry_mode=settings.aws_retry_mode,
+    )
+
     try:
         # Initialize AWS clients
         _s3_client = S3Client(
@@ -47,32 +62,83 @@ def initialize_clients():
             region=settings.aws_region
         )
         
-        _dynamodb_client = DynamoDBClient(
-            region=settings.aws_region,
-            people_table=settings.aws_dynamodb_people_table,
-            embeddings_table=settings.aws_dynamodb_embeddings_table,
-            matches_table=settings.aws_dynamodb_matches_table,
-        )
+        # Metadata store: DynamoDB, or the embedded SQLite drop-in
+        if settings.storage_backend == "sqlite":
+            _dynamodb_client = SQLiteClient(
+                path=settings.sqlite_path,
+                name_index_ttl=settings.people_search_index_ttl,
+            )
+        elif settings.storage_backend == "dynamodb":
+            _dynamodb_client = DynamoDBClient(
+                region=settings.aws_region,
+                people_table=settings.aws_dynamodb_people_table,
+                embeddings_table=settings.aws_dynamodb_embeddings_table,
+                matches_table=settings.aws_dynamodb_matches_table,
+                name_index_ttl=settings.people_search_index_ttl,
+                stats_table=settings.aws_dynamodb_stats_table,
+                image_hashes_table=settings.aws_dynamodb_image_hashes_table,
+            )
+        else:
+            raise ValueError(f"Unknown STORAGE_BACKEND: {settings.storage_backend}")
 
         # Initialize Redis client (optional)
         if settings.redis_enabled:
             try:
-                _redis_client = RedisClient(
+                redis_kwargs = dict(
                     host=settings.redis_host,
                     port=settings.redis_port,
                     db=settings.redis_db,
                     password=settings.redis_password if settings.redis_password else None,
                     enabled=settings.redis_enabled,
                 )
+                if settings.redis_local_cache_enabled:
+                    _redis_client = TwoTierRedisClient(
+                        local_max_entries=settings.redis_local_cache_max_entries,
+                        local_ttl=settings.redis_local_cache_ttl,
+                        **redis_kwargs,
+                    )
+                else:
+                    _redis_client = RedisClient(**redis_kwargs)
             except Exception as e:
                 logger.warning(f"⚠️ Redis initialization failed: {e}")
                 _redis_client = None
 
+        # Near-duplicate frame cache (optional, needs OpenCV)
+        near_duplicate_cache = None
+        if settings.phash_cache_enabled:
+            try:
+                from ..utils.perceptual_hash import NearDuplicateCache
+
+                near_duplicate_cache = NearDuplicateCache(
+                    max_distance=settings.phash_cache_max_distance,
+                    ttl=settings.phash_cache_ttl,
+                    max_entries=settings.phash_cache_max_entries,
+                )
+            except ImportError as e:
+                logger.warning(f"⚠️ Perceptual hash cache unavailable: {e}")
+
+        # Persist match results off the request path
+        if settings.match_recorder_enabled:
+            _match_recorder = MatchRecorder(
+                dynamodb_client=_dynamodb_client,
+                s3_client=_s3_client,
+                max_queue_size=settings.match_recorder_queue_size,
+                batch_size=settings.match_recorder_batch_size,
+                flush_interval=settings.match_recorder_flush_interval,
+                upload_workers=settings.match_recorder_upload_workers,
+            )
+            _match_recorder.start()
+
         # Initialize services with clients
         _enrollment_service = EnrollmentService(
             s3_client=_s3_client,
             rekognition_client=_rekognition_client,
             dynamodb_client=_dynamodb_client,
+            best_shot_count=settings.enroll_best_shot_count,
+            scoring_workers=settings.enroll_scoring_workers,
+            index_concurrency=settings.enroll_index_concurrency,
+            redis_client=_redis_client,
+            person_cache_ttl=settings.redis_ttl_user,
         )
 
         _identification_service = IdentificationService(
@@ -80,11 +146,18 @@ def initialize_clients():
             dynamodb_client=_dynamodb_client,
             s3_client=_s3_client,
             redis_client=_redis_client,
+            batch_max_workers=settings.identify_batch_max_workers,
+            near_duplicate_cache=near_duplicate_cache,
+            person_cache_ttl=settings.redis_ttl_user,
+            match_recorder=_match_recorder,
         )
 
         _database_manager = DatabaseManager(
             aws_dynamodb_client=_dynamodb_client,
             aws_s3_client=_s3_client,
+            redis_client=_redis_client,
+            person_cache_ttl=settings.redis_ttl_user,
+            stats_cache_ttl=settings.stats_cache_ttl,
         )
 
         logger.info("✅ Shared AWS clients initialized successfully")
@@ -100,6 +173,18 @@ def initialize_clients():
         _database_manager = None
 
 
+def shutdown_clients():
+    """Release shared resources at application shutdown."""
+    # Flush queued matches before the clients they write through go away
+    if _match_recorder is not None:
+        _match_recorder.stop()
+    shutdown_executor(wait=True)
+    if _redis_client is not None:
+        _redis_client.close()
+    if isinstance(_dynamodb_client, SQLiteClient):
+        _dynamodb_client.close()
+
+
 def get_s3_client() -> S3Client:
     """Get shared S3 client instance."""
     if _s3_client is None:
@@ -114,8 +199,8 @@ def get_rekognition_client() -> RekognitionClient:
     return _rekognition_client
 
 
-def get_dynamodb_client() -> DynamoDBClient:
-    """Get shared DynamoDB client instance."""
+def get_dynamodb_client() -> Union[DynamoDBClient, SQLiteClient]:
+    """Get shared metadata store (DynamoDB, or SQLite when STORAGE_BACKEND=sqlite)."""
     if _dynamodb_client is None:
         raise RuntimeError("DynamoDB client not initialized. Call initialize_clients() first.")
     return _dynamodb_client
@@ -126,6 +211,11 @@ def get_redis_client() -> Optional[RedisClient]:
     return _redis_client
 
 
+def get_match_recorder() -> Optional[MatchRecorder]:
+    """Get shared MatchRecorder instance (may be None if disabled)."""
+    return _match_recorder
+
+
 def get_enrollment_service() -> EnrollmentService:
     """Get shared EnrollmentService instance."""
     if _enrollment_service is None:
@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, s
 from ...core.enrollment_service import EnrollmentService
 from ..schemas import EnrollmentResponse
 from ..dependencies import get_enrollment_service
+from ..uploads import read_image_upload
 
 router = APIRouter()
 logger = logging.getLogger("api.enroll")
@@ -28,10 +29,10 @@ async def enroll_face(
     start_time = time.time()
 
     try:
-        image_bytes = await image.read()
+        image_bytes = await read_image_upload(image)
 
         # The EnrollmentService is now injected and can be mocked in tests
-        result = enrollment_service.enroll_face(
+        result = await enrollment_service.enroll_face_async(
             image_bytes=image_bytes,
             user_name=user_name,
             gender=gender or "",
@@ -57,6 +58,7 @@ async def enroll_face(
                 duplicate_info=result.get("duplicate_info"),
                 image_url=result.get("image_url"),
                 quality_score=result.get("quality_score"),
+                already_enrolled=result.get("already_enrolled", False),
                 processing_time_ms=processing_time,
             )
         else:
@@ -2,12 +2,14 @@
 
 import logging
 import time
+from typing import Optional
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 
 from ...core.identification_service import IdentificationService
 from ..schemas import IdentificationResponse
 from ..dependencies import get_identification_service
+from ..uploads import read_image_upload
 
 router = APIRouter()
 logger = logging.getLogger("api.identify")
@@ -19,16 +21,19 @@ async def identify_face(
     threshold: float = Form(
         default=90.0, description="Recognition confidence threshold (0-100)"
     ),
+    site_id: Optional[str] = Form(
+        default=None, description="Site/camera the image came from (per-site statistics)"
+    ),
     identification_service: IdentificationService = Depends(get_identification_service),
 ):
     """Identify faces in an image using the AWS Rekognition backend."""
     start_time = time.time()
 
     try:
-        image_bytes = await image.read()
+        image_bytes = await read_image_upload(image)
 
-        result = identification_service.identify_face(
-            image_bytes=image_bytes, confidence_threshold=threshold
+        result = await identification_service.identify_face_async(
+            image_bytes=image_bytes, confidence_threshold=threshold, site_id=site_id
         )
 
         processing_time = (time.time() - start_time) * 1000
@@ -3,28 +3,47 @@
 import logging
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path as PathParam, status
+from fastapi import APIRouter, Depends, HTTPException, Path as PathParam, Query, status
 
 from ...core.database_manager import DatabaseManager
-from ...aws.dynamodb_client import DynamoDBClient
-from ..schemas import DatabaseStats, PeopleListResponse, PersonResponse, PersonUpdate
+from ..dependencies import get_database_manager
+from ..schemas import (
+    DatabaseStats,
+    PeopleListResponse,
+    PersonMatchesResponse,
+    PersonResponse,
+    PersonUpdate,
+)
 
 router = APIRouter()
 logger = logging.getLogger("api.people")
 
 def get_db_manager() -> DatabaseManager:
     """Dependency provider for the DatabaseManager."""
-    # In a real application, this might be a singleton or managed differently.
-    dynamodb_client = DynamoDBClient()
-    return DatabaseManager(aws_dynamodb_client=dynamodb_client)
+    # Shared instance: Redis person cache and the stats cache survive requests
+    return get_database_manager()
 
 
 @router.get("/people", response_model=PeopleListResponse)
-async def list_people(db_manager: DatabaseManager = Depends(get_db_manager)):
-    """Get list of all people in database."""
+async def list_people(
+    limit: int = Query(100, ge=1, le=1000, description="People per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db_manager: DatabaseManager = Depends(get_db_manager),
+):
+    """Get one page of people in the database."""
+    try:
+        page = await db_manager.list_people_page_async(limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     try:
-        people = db_manager.get_all_people()
-        return PeopleListResponse(total=len(people), people=people)
+        if not page["success"]:
+            raise RuntimeError(page.get("error"))
+        people = page["people"]
+        for person in people:
+            # Map person_id to folder_name for compatibility
+            person.setdefault("folder_name", person.get("person_id"))
+        return PeopleListResponse(total=len(people), people=people, next_cursor=page["next_cursor"])
     except Exception as e:
         logger.error(f"Error listing people: {e}", exc_info=True)
         raise HTTPException(
@@ -40,7 +59,7 @@ async def get_person(
 ):
     """Get detailed information about a specific person."""
     try:
-        person = db_manager.get_person(person_id)
+        person = await db_manager.get_person_async(person_id)
         if not person:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -57,32 +76,73 @@ async def get_person(
         )
 
 
+@router.get("/people/{person_id}/matches", response_model=PersonMatchesResponse)
+async def get_person_matches(
+    person_id: str = PathParam(..., description="Person's unique ID"),
+    since: Optional[str] = Query(None, description="ISO date/timestamp lower bound (default: 30 days ago)"),
+    until: Optional[str] = Query(None, description="ISO date/timestamp upper bound (default: now)"),
+    limit: int = Query(100, ge=1, le=1000, description="Matches per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db_manager: DatabaseManager = Depends(get_db_manager),
+):
+    """Get a person's match history, newest first."""
+    try:
+        page = await db_manager.get_person_matches_async(
+            person_id, since=since, until=until, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not page["success"]:
+        logger.error(f"Error getting matches: {page.get('error')}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get matches: {page.get('error')}",
+        )
+    return PersonMatchesResponse(
+        person_id=person_id,
+        total=len(page["matches"]),
+        matches=page["matches"],
+        next_cursor=page["next_cursor"],
+        daily_counts=page["daily_counts"],
+    )
+
+
 @router.put("/people/{person_id}", response_model=PersonResponse)
 async def update_person(
     person_update: PersonUpdate,
     person_id: str = PathParam(..., description="Person's unique ID"),
     db_manager: DatabaseManager = Depends(get_db_manager),
 ):
-    """Update person's information."""
+    """Update person's information (one conditional write, returns the new item)."""
     try:
-        if not db_manager.get_person(person_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Person not found: {person_id}",
-            )
-
         update_data = person_update.dict(exclude_unset=True)
-        if update_data:
-            db_manager.update_person(person_id, update_data)
-
-        updated_person = db_manager.get_person(person_id)
-        if not updated_person:
-            # This case should ideally not happen if the update is successful
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Person '{person_id}' not found after update",
+        expected_version = update_data.pop("expected_version", None)
+        if not update_data:
+            person = await db_manager.get_person_async(person_id)
+            if not person:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Person not found: {person_id}",
+                )
+        else:
+            result = await db_manager.update_person_async(
+                person_id, update_data, expected_version=expected_version
             )
-        return updated_person
+            if result.get("not_found"):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Person not found: {person_id}",
+                )
+            if result.get("conflict"):
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=result["error"])
+            if not result["success"]:
+                raise RuntimeError(result.get("error"))
+            person = result["person"]
+
+        # Map person_id to folder_name for compatibility
+        person.setdefault("folder_name", person_id)
+        return person
     except HTTPException:
         raise
     except Exception as e:
@@ -100,13 +160,13 @@ async def delete_person(
 ):
     """Delete a person from the database."""
     try:
-        if not db_manager.get_person(person_id):
+        if not await db_manager.get_person_async(person_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Person not found: {person_id}",
             )
 
-        db_manager.delete_person(person_id)
+        await db_manager.delete_person_async(person_id)
 
         logger.info(f"Person deleted: {person_id}")
         return {"success": True, "message": f"Person deleted: {person_id}"}
@@ -124,13 +184,10 @@ async def delete_person(
 async def get_database_stats(db_manager: DatabaseManager = Depends(get_db_manager)):
     """Get database statistics."""
     try:
-        people = db_manager.get_all_people()
-        # In a real scenario, these would be calculated or aggregated differently
-        return DatabaseStats(
-            total_people=len(people),
-            total_embeddings=sum(p.get('embedding_count', 0) for p in people),
-            storage_size_mb=0.0,  # Placeholder
-        )
+        stats = await db_manager.get_statistics_async()
+        if stats is None:
+            raise RuntimeError("statistics unavailable")
+        return DatabaseStats(**stats)
     except Exception as e:
         logger.error(f"Error getting stats: {e}", exc_info=True)
         raise HTTPException(
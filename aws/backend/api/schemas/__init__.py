@@ -27,7 +27,7 @@ class TokenResponse(BaseModel):
     expires_in: int
 
 
-from typing import List, Optional, Any
+from typing import Any, Dict, List, Optional
 
 class EnrollmentResponse(BaseModel):
     """Enrollment response model - matches app.py implementation."""
@@ -40,6 +40,7 @@ class EnrollmentResponse(BaseModel):
     duplicate_info: Optional[dict] = None
     image_url: Optional[str] = None
     quality_score: Optional[float] = None
+    already_enrolled: bool = False
     processing_time_ms: float
 
 
@@ -68,10 +69,31 @@ class IdentificationResponse(BaseModel):
     faces: List[Any]  # Can be List[dict] from service or List[FaceMatch]
 
 
+class BatchImageResult(BaseModel):
+    """Identification result for a single image of a batch."""
+    image_index: int
+    success: bool
+    faces_detected: int
+    faces: List[Any]
+    message: str = ""
+    cache_hit: bool = False
+
+
+class BatchIdentificationResponse(BaseModel):
+    """Batch identification response model - results keep the upload order."""
+    success: bool
+    total_images: int
+    faces_detected: int
+    processing_time_ms: float
+    results: List[BatchImageResult]
+
+
 class PersonUpdate(BaseModel):
     """Schema for updating a person's information."""
     user_name: Optional[str] = None
     metadata: Optional[dict] = None
+    # Optimistic concurrency: reject the update if the stored version differs
+    expected_version: Optional[int] = None
 
 
 class PersonResponse(BaseModel):
@@ -84,18 +106,46 @@ class PersonResponse(BaseModel):
     hometown: Optional[str] = None
     residence: Optional[str] = None
     embedding_count: int = 0
+    version: int = 0
     created_at: str
     updated_at: str
 
 
 class PeopleListResponse(BaseModel):
-    """Response for listing all people."""
+    """Response for listing people (one page)."""
     total: int
     people: List[PersonResponse]
+    next_cursor: Optional[str] = None
+
+
+class MatchRecord(BaseModel):
+    """One identification match of a person."""
+    match_id: str
+    person_id: str
+    timestamp: str
+    confidence: Optional[float] = None
+    similarity: Optional[float] = None
+    image_url: Optional[str] = None
+    face_id: Optional[str] = None
+    site_id: Optional[str] = None
+
+
+class PersonMatchesResponse(BaseModel):
+    """Response for a person's match history (one page, newest first)."""
+    person_id: str
+    total: int
+    matches: List[MatchRecord]
+    next_cursor: Optional[str] = None
+    daily_counts: Dict[str, int] = {}
 
 
 class DatabaseStats(BaseModel):
     """Schema for database statistics."""
     total_people: int
     total_embeddings: int
-    storage_size_mb: float
+    storage_size_mb: float = 0.0
+    total_matches: int = 0
+    matches_today: int = 0
+    matches_per_day: Dict[str, int] = {}
+    matches_per_site: Dict[str, int] = {}
+    last_updated: Optional[str] = None
@@ -0,0 +1,29 @@
+"""Image upload ingest shared by the enroll and identify endpoints."""
+
+from fastapi import UploadFile
+
+from ..core.executor import run_blocking
+from ..utils.config import settings
+from ..utils.image_normalizer import normalize_image
+
+
+async def normalize_image_bytes(image_bytes: bytes) -> bytes:
+    """Normalize raw upload bytes off the event loop (see utils.image_normalizer)."""
+    if not settings.image_normalize_enabled:
+        return image_bytes
+    normalized = await run_blocking(
+        normalize_image,
+        image_bytes,
+        settings.image_max_dimension,
+        settings.image_jpeg_quality,
+    )
+    return normalized.data
+
+
+async def read_image_upload(upload: UploadFile) -> bytes:
+    """Read an uploaded image and return its normalized bytes.
+
+    The result is what gets uploaded to S3, sent to Rekognition and
+    quality-checked, so every upload path pays for the pixels only once.
+    """
+    return await normalize_image_bytes(await upload.read())
@@ -0,0 +1,197 @@
+"""
+Shared, pooled boto3 clients.
+
+Every AWS wrapper and Lambda module gets its clients from here instead of
+calling ``boto3.client`` directly, so the process uses one Session and one
+client per (service, region, endpoint) with:
+
+- ``max_pool_connections`` sized for the request thread pool (the botocore
+  default of 10 causes "Connection pool is full" warnings under load)
+- TCP keep-alive, so idle pooled connections survive between requests
+  instead of paying a new TLS handshake
+- adaptive retry mode (client-side rate limiting on throttling errors)
+- per-service connect/read timeouts
+
+boto3 clients are thread-safe and are shared freely. This module only
+depends on boto3 so the Lambda layer can ship it as a top-level module.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+# (connect_timeout, read_timeout) in seconds
+SERVICE_TIMEOUTS: Dict[str, Tuple[float, float]] = {
+    "dynamodb": (2.0, 10.0),
+    "rekognition": (3.0, 30.0),
+    "s3": (3.0, 60.0),
+    "secretsmanager": (2.0, 5.0),
+    "ssm": (2.0, 5.0),
+}
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.0, 30.0)
+
+_settings = {
+    "max_pool_connections": int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50")),
+    "max_attempts": int(os.getenv("AWS_MAX_ATTEMPTS", "5")),
+    "retry_mode": os.getenv("AWS_RETRY_MODE", "adaptive"),
+}
+
+_lock = threading.Lock()
+_session: Optional[boto3.session.Session] = None
+_clients: Dict[tuple, Any] = {}
+_resources: Dict[tuple, Any] = {}
+_tables: Dict[tuple, Any] = {}
+
+
+def configure(
+    max_pool_connections: Optional[int] = None,
+    max_attempts: Optional[int] = None,
+    retry_mode: Optional[str] = None,
+) -> None:
+    """Override the pool/retry settings (call before the first client is built).
+
+    Already-built clients are dropped so the new settings apply to every
+    client created afterwards.
+
+    Args:
+        max_pool_connections: HTTP connections kept per client
+        max_attempts: Total attempts per call, including the first one
+        retry_mode: botocore retry mode ("adaptive", "standard" or "legacy")
+    """
+    with _lock:
+        if max_pool_connections is not None:
+            _settings["max_pool_connections"] = max(1, max_pool_connections)
+        if max_attempts is not None:
+            _settings["max_attempts"] = max(1, max_attempts)
+        if retry_mode is not None:
+            _settings["retry_mode"] = retry_mode
+        _clients.clear()
+        _resources.clear()
+        _tables.clear()
+
+
+def reset() -> None:
+    """Drop the session and every cached client (tests, credential rotation)."""
+    global _session
+    with _lock:
+        _session = None
+        _clients.clear()
+        _resources.clear()
+        _tables.clear()
+
+
+def get_session() -> boto3.session.Session:
+    """Return the process-wide boto3 Session."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = boto3.session.Session()
+    return _session
+
+
+def build_config(service_name: str, **overrides) -> Config:
+    """Build the botocore Config used for a service.
+
+    Args:
+        service_name: AWS service name (e.g. "s3")
+        **overrides: Config arguments replacing the defaults
+
+    Returns:
+        botocore Config
+    """
+    connect_timeout, read_timeout = SERVICE_TIMEOUTS.get(service_name, DEFAULT_TIMEOUT)
+    options = {
+        "max_pool_connections": _settings["max_pool_connections"],
+        "connect_timeout": connect_timeout,
+        "read_timeout": read_timeout,
+        "tcp_keepalive": True,
+        "retries": {"mode": _settings["retry_mode"], "max_attempts": _settings["max_attempts"]},
+    }
+    options.update(overrides)
+    return Config(**options)
+
+
+def get_client(
+    service_name: str,
+    region_name: Optional[str] = None,
+    endpoint_url: Optional[str] = None,
+    **config_overrides,
+):
+    """Return the shared client for a service.
+
+    Args:
+        service_name: AWS service name (e.g. "rekognition")
+        region_name: AWS region (None = session default)
+        endpoint_url: Custom endpoint (e.g. API Gateway management API)
+        **config_overrides: botocore Config arguments for this client
+
+    Returns:
+        boto3 client
+    """
+    key = (service_name, region_name, endpoint_url, tuple(sorted(config_overrides.items())))
+    client = _clients.get(key)
+    if client is None:
+        session = get_session()
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                # Session.client() is not thread-safe; build under the lock
+                client = session.client(
+                    service_name,
+                    region_name=region_name,
+                    endpoint_url=endpoint_url,
+                    config=build_config(service_name, **config_overrides),
+                )
+                _clients[key] = client
+                logger.debug(f"Created pooled {service_name} client (region={region_name})")
+    return client
+
+
+def get_resource(service_name: str, region_name: Optional[str] = None):
+    """Return the shared resource for a service (e.g. DynamoDB).
+
+    Args:
+        service_name: AWS service name
+        region_name: AWS region (None = session default)
+
+    Returns:
+        boto3 service resource
+    """
+    key = (service_name, region_name)
+    resource = _resources.get(key)
+    if resource is None:
+        session = get_session()
+        with _lock:
+            resource = _resources.get(key)
+            if resource is None:
+                resource = session.resource(
+                    service_name,
+                    region_name=region_name,
+                    config=build_config(service_name),
+                )
+                _resources[key] = resource
+    return resource
+
+
+def get_table(table_name: str, region_name: Optional[str] = None):
+    """Return a cached DynamoDB Table handle.
+
+    Args:
+        table_name: DynamoDB table name
+        region_name: AWS region (None = session default)
+
+    Returns:
+        boto3 DynamoDB Table
+    """
+    key = (table_name, region_name)
+    table = _tables.get(key)
+    if table is None:
+        table = _tables.setdefault(key, get_resource("dynamodb", region_name).Table(table_name))
+    return table
@@ -1,19 +1,41 @@
 """DynamoDB Client wrapper for metadata storage."""
 
+import base64
+import json
 import logging
-from datetime import datetime, timezone
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-import boto3
-from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
+
+from ..utils.name_index import NameSearchIndex
+from .client_factory import get_resource, get_table
 
 logger = logging.getLogger(__name__)
 
+_SEGMENT_DONE = object()
+
 
 class DynamoDBClient:
     """DynamoDB client for managing face recognition metadata."""
 
+    BATCH_GET_LIMIT = 100  # BatchGetItem keys per request
+    BATCH_WRITE_LIMIT = 25  # BatchWriteItem items per request
+    TRANSACT_WRITE_LIMIT = 100  # TransactWriteItems items per request
+    MAX_BACKOFF = 2.0  # seconds
+    STATS_ID = "global"  # stat_id of the aggregate counters item
+    STATS_RETENTION_DAYS = 400  # monthly counter items expire (TTL) this long after their month
+    MATCH_BUCKET_INDEX = "person_day-index"  # GSI: person_day (HASH), timestamp (RANGE)
+    DEFAULT_MATCH_RANGE_DAYS = 30  # history window when `since` is omitted
+    MAX_MATCH_RANGE_DAYS = 366  # longest since..until range per query
+
     def __init__(
         self,
         region: str,
@@ -21,6 +43,9 @@ class DynamoDBClient:
         embeddings_table: str,
         matches_table: str,
         enabled: bool = True,
+        name_index_ttl: float = 300.0,
+        stats_table: Optional[str] = None,
+        image_hashes_table: Optional[str] = None,
     ):
         """Initialize DynamoDB client.
 
@@ -30,19 +55,33 @@ class DynamoDBClient:
             embeddings_table: Name of the Embeddings table
             matches_table: Name of the Matches table
             enabled: Enable AWS operations (False for local-only mode)
+            name_index_ttl: Seconds before the in-process name search index
+                is rebuilt from the table (picks up other workers' writes)
+            stats_table: Name of the Stats table holding aggregate counters
+                (None disables counter maintenance)
+            image_hashes_table: Name of the table mapping image content hashes
+                to enrolled faces (None disables idempotent enrollment)
         """
         self.region = region
         self.enabled = enabled
 
+        # Name search index, built lazily on first search
+        self.name_index = NameSearchIndex()
+        self.name_index_ttl = name_index_ttl
+        self._name_index_built_at: Optional[float] = None
+        self._name_index_lock = threading.Lock()
+
         # Table names
         self.people_table = people_table
         self.embeddings_table = embeddings_table
         self.matches_table = matches_table
+        self.stats_table = stats_table
+        self.image_hashes_table = image_hashes_table
 
         self.dynamodb = None
         if self.enabled:
             try:
-                self.dynamodb = boto3.resource("dynamodb", region_name=region)
+                self.dynamodb = get_resource("dynamodb", region)
                 logger.info(f"✅ DynamoDB Client initialized: region={region}")
             except Exception as e:
                 logger.warning(f"⚠️ Failed to initialize DynamoDB client: {e}")
@@ -78,7 +117,7 @@ class DynamoDBClient:
             return result
 
         try:
-            table = self.dynamodb.Table(self.people_table)
+            table = get_table(self.people_table, self.region)
 
             # Convert floats to Decimal
             item = self._convert_floats_to_decimal(person_data)
@@ -89,7 +128,11 @@ class DynamoDBClient:
             if "updated_at" not in item:
                 item["updated_at"] = datetime.now(timezone.utc).isoformat()
 
-            table.put_item(Item=item)
+            response = table.put_item(Item=item, **self._return_old())
+            if self._name_index_built_at is not None:
+                self.name_index.upsert(item["person_id"], item.get("user_name"))
+            if self.stats_table and not response.get("Attributes"):
+                self._record_stats({"people": 1})
 
             logger.info(
                 f"✅ Saved person to DynamoDB: {item.get('person_id')} - {item.get('user_name')}"
@@ -102,41 +145,96 @@ class DynamoDBClient:
 
         return result
 
-    def update_person(self, person_id: str, updates: Dict) -> Dict:
-        """Update person attributes in DynamoDB.
+    def update_person(
+        self, person_id: str, updates: Dict, expected_version: Optional[int] = None
+    ) -> Dict:
+        """Update person attributes in one conditional UpdateItem.
+
+        The update only applies to an existing person (no upsert) and returns
+        the updated item (ReturnValues=ALL_NEW), so callers need no extra
+        reads. Every update bumps the item's ``version``; pass
+        ``expected_version`` for optimistic concurrency control (items
+        written before versioning count as version 0).
 
         Args:
             person_id: The ID of the person to update.
             updates: A dictionary of attributes to update.
+            expected_version: Only update if the stored version matches.
 
         Returns:
-            Dict with success status.
+            Dict with success status, the updated ``person``, and
+            ``not_found`` / ``conflict`` flags when the condition failed
+            (on a conflict ``person`` holds the current item).
         """
-        result = {"success": False, "error": None}
+        result = {
+            "success": False,
+            "error": None,
+            "person": None,
+            "not_found": False,
+            "conflict": False,
+        }
 
         if not self.enabled:
             result["error"] = "DynamoDB not enabled"
             return result
 
-        try:
-            table = self.dynamodb.Table(self.people_table)
-
-            # Build the update expression
-            update_expression = "SET " + ", ".join(f"#{k} = :{k}" for k in updates.keys())
-            expression_attribute_names = {f"#{k}": k for k in updates.keys()}
-            expression_attribute_values = {f":{k}": v for k, v in updates.items()}
+        # The key and the version counter are managed here
+        updates = {k: v for k, v in updates.items() if k not in ("person_id", "version")}
 
-            table.update_item(
+        try:
+            table = get_table(self.people_table, self.region)
+
+            names = {"#pk": "person_id", "#version": "version"}
+            values: Dict[str, Any] = {":zero": 0, ":one": 1}
+            assignments = ["#version = if_not_exists(#version, :zero) + :one"]
+            for i, (name, value) in enumerate(updates.items()):
+                names[f"#u{i}"] = name
+                values[f":u{i}"] = value
+                assignments.append(f"#u{i} = :u{i}")
+
+            condition = "attribute_exists(#pk)"
+            if expected_version is not None:
+                values[":expected"] = expected_version
+                version_check = "#version = :expected"
+                if expected_version == 0:
+                    version_check = f"(attribute_not_exists(#version) OR {version_check})"
+                condition = f"{condition} AND {version_check}"
+
+            response = table.update_item(
                 Key={"person_id": person_id},
-                UpdateExpression=update_expression,
-                ExpressionAttributeNames=expression_attribute_names,
-                ExpressionAttributeValues=self._convert_floats_to_decimal(
-                    expression_attribute_values
-                ),
+                UpdateExpression="SET " + ", ".join(assignments),
+                ConditionExpression=condition,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=self._convert_floats_to_decimal(values),
+                ReturnValues="ALL_NEW",
+                # A failed condition returns the current item: tells 404 from 409
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
             )
 
+            if "user_name" in updates and self._name_index_built_at is not None:
+                self.name_index.upsert(person_id, updates["user_name"])
+
             logger.info(f"✅ Updated person in DynamoDB: {person_id}")
             result["success"] = True
+            result["person"] = response.get("Attributes")
+
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                logger.error(f"❌ DynamoDB update_person failed: {e}")
+                result["error"] = str(e)
+                return result
+            current = e.response.get("Item")
+            if not current:
+                result["not_found"] = True
+                result["error"] = f"Person not found: {person_id}"
+            else:
+                result["conflict"] = True
+                result["person"] = current
+                result["error"] = (
+                    f"Version conflict: expected {expected_version}, "
+                    f"found {int(current.get('version', 0))}"
+                )
+            logger.warning(f"⚠️ DynamoDB update_person rejected: {result['error']}")
 
         except Exception as e:
             logger.error(f"❌ DynamoDB update_person failed: {e}")
@@ -160,7 +258,7 @@ class DynamoDBClient:
             return result
 
         try:
-            table = self.dynamodb.Table(self.people_table)
+            table = get_table(self.people_table, self.region)
             table.update_item(
                 Key={"person_id": person_id},
                 UpdateExpression="SET embedding_count = if_not_exists(embedding_count, :start) + :inc",
@@ -186,7 +284,7 @@ class DynamoDBClient:
             return None
 
         try:
-            table = self.dynamodb.Table(self.people_table)
+            table = get_table(self.people_table, self.region)
             response = table.get_item(Key={"person_id": person_id})
 
             if "Item" in response:
@@ -197,16 +295,78 @@ class DynamoDBClient:
 
         return None
 
-    def get_people_batch(self, person_ids: List[str]) -> Dict:
+    def _build_projection(self, attributes: Optional[List[str]]) -> Dict:
+        """Build ProjectionExpression arguments (placeholders avoid reserved words)."""
+        if not attributes:
+            return {}
+        # The key is always needed to join results back to the request
+        attributes = list(dict.fromkeys(["person_id", *attributes]))
+        names = {f"#p{i}": attr for i, attr in enumerate(attributes)}
+        return {
+            "ProjectionExpression": ", ".join(names),
+            "ExpressionAttributeNames": names,
+        }
+
+    def _batch_get_chunk(
+        self,
+        keys: List[Dict],
+        projection: Dict,
+        max_retries: int,
+        backoff_base: float,
+        table_name: Optional[str] = None,
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """BatchGetItem one chunk (<= 100 keys) of a table, retrying UnprocessedKeys.
+
+        Args:
+            table_name: Table to read (default: People table)
+
+        Returns:
+            Tuple of (items, keys still unprocessed after max_retries)
+        """
+        table_name = table_name or self.people_table
+        items: List[Dict] = []
+        attempt = 0
+        while keys:
+            response = self.dynamodb.batch_get_item(
+                RequestItems={table_name: {"Keys": keys, **projection}}
+            )
+            items.extend(response.get("Responses", {}).get(table_name, []))
+            keys = response.get("UnprocessedKeys", {}).get(table_name, {}).get("Keys", [])
+
+            if keys:
+                if attempt >= max_retries:
+                    break
+                # Full jitter so parallel chunks don't retry in lockstep
+                time.sleep(random.uniform(0, min(self.MAX_BACKOFF, backoff_base * (2 ** attempt))))
+                attempt += 1
+        return items, keys
+
+    def get_people_batch(
+        self,
+        person_ids: List[str],
+        attributes: Optional[List[str]] = None,
+        max_retries: int = 8,
+        backoff_base: float = 0.05,
+        max_workers: int = 4,
+    ) -> Dict:
         """Get multiple people by a list of IDs using BatchGetItem.
 
+        Keys are de-duplicated and split into chunks of 100 (the BatchGetItem
+        limit) that are fetched concurrently. UnprocessedKeys are retried
+        with jittered exponential backoff.
+
         Args:
             person_ids: A list of person IDs.
+            attributes: Only return these attributes (ProjectionExpression).
+            max_retries: Retries per chunk for unprocessed keys.
+            backoff_base: Initial backoff in seconds (doubled per retry).
+            max_workers: Maximum chunks fetched concurrently.
 
         Returns:
-            Dict with success status and a list of people.
+            Dict with success status, a list of people and any person IDs
+            still unprocessed after the retries.
         """
-        result = {"success": False, "error": None, "people": []}
+        result = {"success": False, "error": None, "people": [], "unprocessed": []}
 
         if not self.enabled:
             result["error"] = "DynamoDB not enabled"
@@ -217,47 +377,105 @@ class DynamoDBClient:
             return result
 
         try:
-            keys = [{"person_id": pid} for pid in person_ids]
-            response = self.dynamodb.batch_get_item(
-                RequestItems={self.people_table: {"Keys": keys}}
-            )
-
-            people = response.get("Responses", {}).get(self.people_table, [])
-            result["people"] = people
+            # BatchGetItem rejects duplicate keys in one request
+            keys = [{"person_id": pid} for pid in dict.fromkeys(person_ids)]
+            chunks = [
+                keys[i:i + self.BATCH_GET_LIMIT]
+                for i in range(0, len(keys), self.BATCH_GET_LIMIT)
+            ]
+            projection = self._build_projection(attributes)
+
+            def fetch(chunk):
+                return self._batch_get_chunk(chunk, projection, max_retries, backoff_base)
+
+            if len(chunks) == 1:
+                chunk_results = [fetch(chunks[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                    chunk_results = list(executor.map(fetch, chunks))
+
+            for people, unprocessed in chunk_results:
+                result["people"].extend(people)
+                result["unprocessed"].extend(k["person_id"] for k in unprocessed)
+
+            if result["unprocessed"]:
+                logger.warning(
+                    f"⚠️ {len(result['unprocessed'])} key(s) unprocessed in batch get after {max_retries} retries"
+                )
             result["success"] = True
 
-            # Basic handling for unprocessed keys, can be made more robust
-            unprocessed_keys = response.get("UnprocessedKeys", {}).get(self.people_table)
-            if unprocessed_keys:
-                logger.warning(f"Unprocessed keys in batch get: {len(unprocessed_keys['Keys'])}")
-
         except Exception as e:
             logger.error(f"❌ DynamoDB get_people_batch failed: {e}")
             result["error"] = str(e)
 
         return result
 
-    def list_people(self, limit: int = 100) -> Dict:
-        """List all people from DynamoDB.
+    @staticmethod
+    def encode_cursor(last_evaluated_key: Optional[Dict]) -> Optional[str]:
+        """Encode a LastEvaluatedKey as an opaque, URL-safe cursor token."""
+        if not last_evaluated_key:
+            return None
+        raw = json.dumps(last_evaluated_key, default=str, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]) -> Optional[Dict]:
+        """Decode a cursor token back into an ExclusiveStartKey.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        if not cursor:
+            return None
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {e}") from e
+        if not isinstance(key, dict) or not key:
+            raise ValueError("Invalid cursor")
+        return key
+
+    def list_people(self, limit: int = 100, cursor: Optional[str] = None) -> Dict:
+        """List one page of people from DynamoDB.
 
         Args:
             limit: Maximum number of items to return
+            cursor: Opaque token from a previous page's next_cursor
 
         Returns:
-            Dict with success status and list of people
+            Dict with success status, list of people and next_cursor
+            (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        result = {"success": False, "error": None, "people": []}
+        result = {"success": False, "error": None, "people": [], "next_cursor": None}
         
         if not self.enabled:
             result["error"] = "DynamoDB not enabled"
             return result
 
+        start_key = self.decode_cursor(cursor)
+
         try:
-            table = self.dynamodb.Table(self.people_table)
-            response = table.scan(Limit=limit)
+            table = get_table(self.people_table, self.region)
+            people: List[Dict] = []
+
+            # A scan page can return fewer items than asked (1 MB cap), so keep going
+            while True:
+                scan_kwargs = {"Limit": limit - len(people)}
+                if start_key:
+                    scan_kwargs["ExclusiveStartKey"] = start_key
+                response = table.scan(**scan_kwargs)
+                people.extend(response.get("Items", []))
+                start_key = response.get("LastEvaluatedKey")
+                if not start_key or len(people) >= limit:
+                    break
 
             result["success"] = True
-            result["people"] = response.get("Items", [])
+            result["people"] = people
+            result["next_cursor"] = self.encode_cursor(start_key)
             return result
 
         except Exception as e:
@@ -265,15 +483,137 @@ class DynamoDBClient:
             result["error"] = str(e)
             return result
 
+    def _scan_segment(
+        self,
+        segment: int,
+        total_segments: int,
+        page_size: int,
+        projection: Dict,
+        pages: "queue.Queue",
+        stop: threading.Event,
+    ) -> None:
+        """Scan one segment, putting each page of items on the queue."""
+        try:
+            table = get_table(self.people_table, self.region)
+            scan_kwargs = {
+                "Segment": segment,
+                "TotalSegments": total_segments,
+                "Limit": page_size,
+                **projection,
+            }
+            while not stop.is_set():
+                response = table.scan(**scan_kwargs)
+                items = response.get("Items", [])
+                if items:
+                    pages.put(items)
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    break
+                scan_kwargs["ExclusiveStartKey"] = last_key
+            pages.put(_SEGMENT_DONE)
+        except Exception as e:
+            pages.put(e)
+
+    def iter_people(
+        self,
+        total_segments: int = 4,
+        page_size: int = 1000,
+        attributes: Optional[List[str]] = None,
+        max_buffered_pages: int = 8,
+    ) -> Iterator[Dict]:
+        """Stream every person using a parallel segmented scan.
+
+        Segments are scanned on separate threads; pages are handed over
+        through a bounded queue so memory stays flat regardless of table size.
+        Items are yielded in no particular order.
+
+        Args:
+            total_segments: Number of parallel scan segments (TotalSegments)
+            page_size: Items per scan request
+            attributes: Only return these attributes (ProjectionExpression)
+            max_buffered_pages: Pages buffered ahead of the consumer
+
+        Yields:
+            Person data dicts
+
+        Raises:
+            RuntimeError: If DynamoDB is disabled or a segment scan fails
+        """
+        if not self.enabled:
+            raise RuntimeError("DynamoDB not enabled")
+
+        total_segments = max(1, total_segments)
+        pages: "queue.Queue" = queue.Queue(maxsize=max(1, max_buffered_pages))
+        stop = threading.Event()
+        projection = self._build_projection(attributes)
+        workers = [
+            threading.Thread(
+                target=self._scan_segment,
+                args=(segment, total_segments, page_size, projection, pages, stop),
+                name=f"people-scan-{segment}",
+                daemon=True,
+            )
+            for segment in range(total_segments)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            remaining = total_segments
+            while remaining:
+                page = pages.get()
+                if page is _SEGMENT_DONE:
+                    remaining -= 1
+                elif isinstance(page, Exception):
+                    logger.error(f"❌ DynamoDB segmented scan failed: {page}")
+                    raise RuntimeError(f"Segmented scan failed: {page}") from page
+                else:
+                    yield from page
+        finally:
+            # Unblock producers if the consumer stopped early
+            stop.set()
+            while any(worker.is_alive() for worker in workers):
+                try:
+                    pages.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+
+    def _ensure_name_index(self) -> None:
+        """Build the name index on first use and refresh it after name_index_ttl."""
+        built_at = self._name_index_built_at
+        if built_at is not None and time.monotonic() - built_at < self.name_index_ttl:
+            return
+
+        # Only the first build blocks; a refresh in progress keeps serving the old index
+        if not self._name_index_lock.acquire(blocking=built_at is None):
+            return
+        try:
+            built_at = self._name_index_built_at
+            if built_at is not None and time.monotonic() - built_at < self.name_index_ttl:
+                return
+            started = time.perf_counter()
+            self.name_index.rebuild(self.iter_people(attributes=["person_id", "user_name"]))
+            self._name_index_built_at = time.monotonic()
+            logger.info(
+                f"✅ Built name search index: {len(self.name_index)} people "
+                f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+            )
+        finally:
+            self._name_index_lock.release()
+
     def search_people(self, query: str, limit: int = 100) -> Dict:
-        """Search for people by name in DynamoDB.
+        """Search for people by name.
+
+        Uses the in-process accent-folded n-gram index (case- and
+        diacritic-insensitive prefix/substring match), then fetches the
+        matching records with BatchGetItem.
 
         Args:
             query: The search string for the user_name.
             limit: Maximum number of items to return.
 
         Returns:
-            Dict with success status and a list of people.
+            Dict with success status and a list of people (best matches first).
         """
         result = {"success": False, "error": None, "people": []}
 
@@ -282,20 +622,18 @@ class DynamoDBClient:
             return result
 
         try:
-            table = self.dynamodb.Table(self.people_table)
+            self._ensure_name_index()
+            person_ids = self.name_index.search(query, limit=limit)
 
-            # Case-insensitive search is not directly supported by contains.
-            # A more advanced approach would involve a search service like OpenSearch/Elasticsearch.
-            # For now, we perform a case-sensitive scan.
-            response = table.scan(
-                FilterExpression=Attr("user_name").contains(query),
-                Limit=limit
-            )
+            if person_ids:
+                batch = self.get_people_batch(person_ids)
+                if not batch["success"]:
+                    raise RuntimeError(batch["error"])
+                by_id = {p["person_id"]: p for p in batch["people"]}
+                result["people"] = [by_id[pid] for pid in person_ids if pid in by_id]
 
-            people = response.get("Items", [])
-            result["people"] = people
             result["success"] = True
-            logger.info(f"✅ DynamoDB scan for '{query}' found {len(people)} items.")
+            logger.info(f"✅ Name search for '{query}' found {len(result['people'])} items.")
 
         except Exception as e:
             logger.error(f"❌ DynamoDB search_people failed: {e}")
@@ -325,7 +663,7 @@ class DynamoDBClient:
             return result
 
         try:
-            table = self.dynamodb.Table(self.embeddings_table)
+            table = get_table(self.embeddings_table, self.region)
 
             # Convert floats to Decimal
             item = self._convert_floats_to_decimal(embedding_data)
@@ -334,7 +672,9 @@ class DynamoDBClient:
             if "created_at" not in item:
                 item["created_at"] = datetime.now(timezone.utc).isoformat()
 
-            table.put_item(Item=item)
+            response = table.put_item(Item=item, **self._return_old())
+            if self.stats_table and not response.get("Attributes"):
+                self._record_stats({"embeddings": 1})
 
             logger.info(
                 f"✅ Saved embedding to DynamoDB: {item.get('embedding_id')} for person {item.get('person_id')}"
@@ -347,6 +687,259 @@ class DynamoDBClient:
 
         return result
 
+    def save_person_with_embedding(
+        self, person_data: Dict, embedding_data: Dict, image_hash: Optional[Dict] = None
+    ) -> Dict:
+        """Create a person and their first embedding in one transaction.
+
+        Uses TransactWriteItems so both records are written or neither is;
+        the person Put is conditioned on the person_id not existing yet.
+        With ``image_hash`` the content-hash record is written in the same
+        transaction, conditioned on the hash being new, so two concurrent
+        enrollments of the same image cannot both succeed.
+
+        Args:
+            person_data: Person data (same shape as save_person)
+            embedding_data: Embedding data (same shape as save_embedding)
+            image_hash: Optional record for save_image_hash
+
+        Returns:
+            Dict with success status
+        """
+        result = {"success": False, "error": None}
+
+        if not self.enabled:
+            result["error"] = "DynamoDB not enabled"
+            return result
+
+        try:
+            now = datetime.now(timezone.utc).isoformat()
+            person = self._convert_floats_to_decimal(person_data)
+            person.setdefault("created_at", now)
+            person.setdefault("updated_at", now)
+            embedding = self._convert_floats_to_decimal(embedding_data)
+            embedding.setdefault("created_at", now)
+
+            serializer = TypeSerializer()
+            hash_puts = []
+            if image_hash is not None and self.image_hashes_table:
+                record = self._convert_floats_to_decimal(image_hash)
+                record.setdefault("created_at", now)
+                hash_puts.append(
+                    {
+                        "Put": {
+                            "TableName": self.image_hashes_table,
+                            "Item": {k: serializer.serialize(v) for k, v in record.items()},
+                            "ConditionExpression": "attribute_not_exists(content_hash)",
+                        }
+                    }
+                )
+            self.dynamodb.meta.client.transact_write_items(
+                TransactItems=[
+                    *hash_puts,
+                    {
+                        "Put": {
+                            "TableName": self.people_table,
+                            "Item": {k: serializer.serialize(v) for k, v in person.items()},
+                            "ConditionExpression": "attribute_not_exists(person_id)",
+                        }
+                    },
+                    {
+                        "Put": {
+                            "TableName": self.embeddings_table,
+                            "Item": {k: serializer.serialize(v) for k, v in embedding.items()},
+                        }
+                    },
+                ]
+            )
+
+            if self._name_index_built_at is not None:
+                self.name_index.upsert(person["person_id"], person.get("user_name"))
+            self._record_stats({"people": 1, "embeddings": 1})
+
+            logger.info(
+                f"✅ Saved person {person['person_id']} with embedding {embedding.get('embedding_id')}"
+            )
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ DynamoDB save_person_with_embedding failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def get_image_hashes(self, content_hashes: List[str]) -> Dict:
+        """Look up enrolled images by content hash (BatchGetItem).
+
+        Args:
+            content_hashes: Image content hashes
+
+        Returns:
+            Dict with success status and ``records`` mapping each known hash
+            to its record (person_id, face_id, embedding_id, image_url, ...)
+        """
+        result = {"success": False, "error": None, "records": {}}
+
+        if not self.enabled or not self.image_hashes_table:
+            result["error"] = "Image hash index not enabled"
+            return result
+
+        try:
+            keys = [{"content_hash": h} for h in dict.fromkeys(content_hashes)]
+            for i in range(0, len(keys), self.BATCH_GET_LIMIT):
+                items, unprocessed = self._batch_get_chunk(
+                    keys[i:i + self.BATCH_GET_LIMIT], {}, 8, 0.05, table_name=self.image_hashes_table
+                )
+                if unprocessed:
+                    raise RuntimeError(f"{len(unprocessed)} image hash key(s) unprocessed")
+                result["records"].update({item["content_hash"]: item for item in items})
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ DynamoDB get_image_hashes failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def claim_image_hashes(self, records: List[Dict]) -> Dict:
+        """Claim content hashes before their images are indexed (all or none).
+
+        Every record is put in one TransactWriteItems call, each conditioned
+        on its hash being new, so of two concurrent enrollments of the same
+        images exactly one gets to index them.
+
+        Args:
+            records: Claim records (content_hash, person_id, ...), at most
+                TRANSACT_WRITE_LIMIT
+
+        Returns:
+            Dict with success status; ``exists`` is True when some hash was
+            already recorded or claimed (nothing is written then)
+        """
+        result = {"success": False, "error": None, "exists": False}
+
+        if not self.enabled or not self.image_hashes_table:
+            result["error"] = "Image hash index not enabled"
+            return result
+        if len(records) > self.TRANSACT_WRITE_LIMIT:
+            result["error"] = f"At most {self.TRANSACT_WRITE_LIMIT} image hashes per claim"
+            return result
+
+        try:
+            now = datetime.now(timezone.utc).isoformat()
+            serializer = TypeSerializer()
+            puts = []
+            for record in records:
+                item = self._convert_floats_to_decimal(record)
+                item.setdefault("created_at", now)
+                puts.append(
+                    {
+                        "Put": {
+                            "TableName": self.image_hashes_table,
+                            "Item": {k: serializer.serialize(v) for k, v in item.items()},
+                            "ConditionExpression": "attribute_not_exists(content_hash)",
+                        }
+                    }
+                )
+            self.dynamodb.meta.client.transact_write_items(TransactItems=puts)
+            result["success"] = True
+
+        except ClientError as e:
+            reasons = e.response.get("CancellationReasons") or []
+            if any(reason.get("Code") == "ConditionalCheckFailed" for reason in reasons):
+                result["exists"] = True
+            else:
+                logger.error(f"❌ DynamoDB claim_image_hashes failed: {e}")
+            result["error"] = str(e)
+        except Exception as e:
+            logger.error(f"❌ DynamoDB claim_image_hashes failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def save_image_hash(self, record: Dict) -> Dict:
+        """Record an enrolled image's content hash.
+
+        Only written if the hash is new or claimed for the same person
+        (claim_image_hashes), so another person's record is never replaced.
+
+        Args:
+            record: content_hash (required), person_id, face_id,
+                embedding_id, image_url
+
+        Returns:
+            Dict with success status; ``exists`` is True when the hash was
+            already recorded for another person (the record is not overwritten)
+        """
+        result = {"success": False, "error": None, "exists": False}
+
+        if not self.enabled or not self.image_hashes_table:
+            result["error"] = "Image hash index not enabled"
+            return result
+
+        try:
+            item = self._convert_floats_to_decimal(record)
+            item.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+            get_table(self.image_hashes_table, self.region).put_item(
+                Item=item,
+                ConditionExpression="attribute_not_exists(content_hash) OR person_id = :person_id",
+                ExpressionAttributeValues={":person_id": item.get("person_id")},
+            )
+            result["success"] = True
+
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                result["exists"] = True
+            else:
+                logger.error(f"❌ DynamoDB save_image_hash failed: {e}")
+            result["error"] = str(e)
+        except Exception as e:
+            logger.error(f"❌ DynamoDB save_image_hash failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def delete_image_hash(self, content_hash: str, only_pending: bool = False) -> Dict:
+        """Delete a content-hash record (e.g. one pointing at a deleted person).
+
+        Args:
+            content_hash: Image content hash
+            only_pending: Only delete a pending claim (claim_image_hashes),
+                never a record its enrollment has finalized meanwhile
+
+        Returns:
+            Dict with success status; with ``only_pending``, ``finalized`` is
+            True when the record was no longer a pending claim (nothing deleted)
+        """
+        result = {"success": False, "error": None, "finalized": False}
+
+        if not self.enabled or not self.image_hashes_table:
+            result["error"] = "Image hash index not enabled"
+            return result
+
+        try:
+            condition = {}
+            if only_pending:
+                condition = {
+                    "ConditionExpression": "pending = :pending",
+                    "ExpressionAttributeValues": {":pending": True},
+                }
+            get_table(self.image_hashes_table, self.region).delete_item(
+                Key={"content_hash": content_hash}, **condition
+            )
+            result["success"] = True
+        except ClientError as e:
+            if only_pending and e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                result["finalized"] = True
+            else:
+                logger.error(f"❌ DynamoDB delete_image_hash failed: {e}")
+            result["error"] = str(e)
+        except Exception as e:
+            logger.error(f"❌ DynamoDB delete_image_hash failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
     def get_embeddings_by_person(self, person_id: str) -> List[Dict]:
         """Get all embeddings for a person.
 
@@ -360,7 +953,7 @@ class DynamoDBClient:
             return []
 
         try:
-            table = self.dynamodb.Table(self.embeddings_table)
+            table = get_table(self.embeddings_table, self.region)
 
             # Query using GSI person_id-index
             response = table.query(
@@ -396,7 +989,7 @@ class DynamoDBClient:
             return result
 
         try:
-            table = self.dynamodb.Table(self.matches_table)
+            table = get_table(self.matches_table, self.region)
 
             # Convert floats to Decimal
             item = self._convert_floats_to_decimal(match_data)
@@ -404,8 +997,10 @@ class DynamoDBClient:
             # Add timestamp if not present
             if "timestamp" not in item:
                 item["timestamp"] = datetime.now(timezone.utc).isoformat()
+            self._add_match_bucket(item)
 
             table.put_item(Item=item)
+            self._record_match_stats([item])
 
             logger.info(
                 "✅ Saved match to DynamoDB: %s - person %s (confidence: %s)",
@@ -421,36 +1016,638 @@ class DynamoDBClient:
 
         return result
 
+    def _write_chunk(
+        self,
+        table_name: str,
+        items: List[Dict],
+        key_attr: str,
+        max_retries: int,
+        backoff_base: float,
+    ) -> Tuple[List[str], Optional[str]]:
+        """BatchWriteItem one chunk (<= 25 items), retrying UnprocessedItems.
+
+        Returns:
+            Tuple of (keys of items not written, error message or None)
+        """
+        requests = [{"PutRequest": {"Item": item}} for item in items]
+        attempt = 0
+        try:
+            while requests:
+                response = self.dynamodb.batch_write_item(RequestItems={table_name: requests})
+                requests = response.get("UnprocessedItems", {}).get(table_name, [])
+
+                if requests:
+                    if attempt >= max_retries:
+                        break
+                    # Full jitter so parallel chunks don't retry in lockstep
+                    time.sleep(random.uniform(0, min(self.MAX_BACKOFF, backoff_base * (2 ** attempt))))
+                    attempt += 1
+        except Exception as e:
+            return [r["PutRequest"]["Item"][key_attr] for r in requests], str(e)
+
+        if requests:
+            return (
+                [r["PutRequest"]["Item"][key_attr] for r in requests],
+                f"unprocessed after {max_retries} retries",
+            )
+        return [], None
+
+    def _batch_write(
+        self,
+        table_name: str,
+        items: List[Dict],
+        key_attr: str,
+        max_retries: int,
+        backoff_base: float,
+        max_workers: int,
+    ) -> Dict[str, str]:
+        """Write items in 25-item chunks, running chunks concurrently.
+
+        Items sharing a key are collapsed (last one wins) because
+        BatchWriteItem rejects duplicate keys in one request.
+
+        Returns:
+            Dict mapping the key of every item that was not written to its error
+        """
+        unique = list({item[key_attr]: item for item in items}.values())
+        chunks = [
+            unique[i:i + self.BATCH_WRITE_LIMIT]
+            for i in range(0, len(unique), self.BATCH_WRITE_LIMIT)
+        ]
+
+        def write(chunk):
+            return self._write_chunk(table_name, chunk, key_attr, max_retries, backoff_base)
+
+        if len(chunks) <= 1 or max_workers <= 1:
+            chunk_results = [write(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                chunk_results = list(executor.map(write, chunks))
+
+        failed: Dict[str, str] = {}
+        for keys, error in chunk_results:
+            for key in keys:
+                failed[key] = error
+        return failed
+
+    def _save_bulk(
+        self,
+        table_name: str,
+        key_attr: str,
+        records: List[Dict],
+        timestamp_fields: Tuple[str, ...],
+        max_retries: int,
+        backoff_base: float,
+        max_workers: int,
+    ) -> Dict:
+        """Shared implementation of save_people_bulk / save_embeddings_bulk."""
+        result = {"success": False, "error": None, "saved": 0, "failed": 0, "results": []}
+
+        if not self.enabled:
+            result["error"] = "DynamoDB not enabled"
+            return result
+
+        if not records:
+            result["success"] = True
+            return result
+
+        now = datetime.now(timezone.utc).isoformat()
+        items = []
+        for record in records:
+            item = self._convert_floats_to_decimal(record)
+            for field in timestamp_fields:
+                item.setdefault(field, now)
+            items.append(item)
+
+        valid = [item for item in items if item.get(key_attr)]
+        try:
+            failed = self._batch_write(
+                table_name, valid, key_attr, max_retries, backoff_base, max_workers
+            )
+        except Exception as e:
+            logger.error(f"❌ DynamoDB bulk write to {table_name} failed: {e}")
+            failed = {item[key_attr]: str(e) for item in valid}
+
+        for item in items:
+            key = item.get(key_attr)
+            if not key:
+                error = f"missing {key_attr}"
+            else:
+                error = failed.get(key)
+            result["results"].append({key_attr: key, "success": error is None, "error": error})
+
+        result["saved"] = sum(1 for r in result["results"] if r["success"])
+        result["failed"] = len(items) - result["saved"]
+        result["success"] = result["failed"] == 0
+        if not result["success"]:
+            result["error"] = f"{result['failed']} item(s) not written"
+            logger.warning(
+                f"⚠️ Bulk write to {table_name}: {result['failed']}/{len(items)} item(s) failed"
+            )
+        logger.info(f"✅ Saved {result['saved']} item(s) to {table_name} in bulk")
+        return result
+
+    def save_people_bulk(
+        self,
+        people: List[Dict],
+        max_retries: int = 8,
+        backoff_base: float = 0.05,
+        max_workers: int = 4,
+    ) -> Dict:
+        """Save many people with BatchWriteItem.
+
+        Items are written in chunks of 25 (the BatchWriteItem limit) that run
+        concurrently; UnprocessedItems are retried with jittered exponential
+        backoff.
+
+        Args:
+            people: Person data dicts (same shape as save_person)
+            max_retries: Retries per chunk for unprocessed items
+            backoff_base: Initial backoff in seconds (doubled per retry)
+            max_workers: Maximum chunks written concurrently
+
+        Returns:
+            Dict with success status, saved/failed counts and per-item
+            ``results`` ({person_id, success, error}) in input order
+        """
+        result = self._save_bulk(
+            self.people_table,
+            "person_id",
+            people,
+            ("created_at", "updated_at"),
+            max_retries,
+            backoff_base,
+            max_workers,
+        )
+
+        # BatchWriteItem cannot report overwrites; bulk saves are new people
+        self._record_stats({"people": result["saved"]})
+
+        if self._name_index_built_at is not None:
+            names = {p.get("person_id"): p.get("user_name") for p in people}
+            for item in result["results"]:
+                if item["success"]:
+                    self.name_index.upsert(item["person_id"], names[item["person_id"]])
+
+        return result
+
+    def save_embeddings_bulk(
+        self,
+        embeddings: List[Dict],
+        max_retries: int = 8,
+        backoff_base: float = 0.05,
+        max_workers: int = 4,
+    ) -> Dict:
+        """Save many face embeddings with BatchWriteItem.
+
+        Args:
+            embeddings: Embedding data dicts (same shape as save_embedding)
+            max_retries: Retries per chunk for unprocessed items
+            backoff_base: Initial backoff in seconds (doubled per retry)
+            max_workers: Maximum chunks written concurrently
+
+        Returns:
+            Dict with success status, saved/failed counts and per-item
+            ``results`` ({embedding_id, success, error}) in input order
+        """
+        result = self._save_bulk(
+            self.embeddings_table,
+            "embedding_id",
+            embeddings,
+            ("created_at",),
+            max_retries,
+            backoff_base,
+            max_workers,
+        )
+        self._record_stats({"embeddings": result["saved"]})
+        return result
+
+    def save_matches_batch(
+        self,
+        matches: List[Dict],
+        max_retries: int = 5,
+        backoff_base: float = 0.05,
+    ) -> Dict:
+        """Save several match results with BatchWriteItem.
+
+        Items are written in chunks of 25 (the BatchWriteItem limit) and
+        UnprocessedItems are retried with exponential backoff. Chunks are
+        written sequentially; this runs on the match recorder's worker.
+
+        Args:
+            matches: Match data dicts (same shape as save_match)
+            max_retries: Retries per chunk for unprocessed items
+            backoff_base: Initial backoff in seconds (doubled per retry)
+
+        Returns:
+            Dict with success status, saved count and unprocessed count
+        """
+        result = {"success": False, "error": None, "saved": 0, "unprocessed": 0}
+
+        if not self.enabled:
+            result["error"] = "DynamoDB not enabled"
+            return result
+
+        if not matches:
+            result["success"] = True
+            return result
+
+        try:
+            now = datetime.now(timezone.utc).isoformat()
+            items = []
+            for match_data in matches:
+                item = self._convert_floats_to_decimal(match_data)
+                item.setdefault("timestamp", now)
+                self._add_match_bucket(item)
+                items.append(item)
+
+            failed = self._batch_write(
+                self.matches_table, items, "match_id", max_retries, backoff_base, max_workers=1
+            )
+            result["unprocessed"] = len(failed)
+            result["saved"] = len(items) - len(failed)
+            self._record_match_stats([item for item in items if item["match_id"] not in failed])
+
+            if failed:
+                logger.warning(
+                    f"⚠️ {len(failed)} match item(s) unprocessed after {max_retries} retries"
+                )
+                result["error"] = f"{len(failed)} item(s) unprocessed"
+            result["success"] = not failed
+            logger.info(f"✅ Saved {result['saved']} match(es) to DynamoDB in batch")
+
+        except Exception as e:
+            logger.error(f"❌ DynamoDB save_matches_batch failed: {e}")
+            result["error"] = str(e)
+            result["unprocessed"] = len(matches) - result["saved"]
+
+        return result
+
     def query_matches_by_person(self, person_id: str, limit: int = 100) -> List[Dict]:
-        """Query matches for a specific person.
+        """Query the most recent matches for a specific person.
 
         Args:
             person_id: Person ID
             limit: Maximum number of results
 
         Returns:
-            List of match data dicts
+            List of match data dicts, newest first
         """
         if not self.enabled:
             return []
 
         try:
-            table = self.dynamodb.Table(self.matches_table)
+            table = get_table(self.matches_table, self.region)
+            matches: List[Dict] = []
+            query_kwargs = {
+                "IndexName": "person_id-index",
+                "KeyConditionExpression": "person_id = :pid",
+                "ExpressionAttributeValues": {":pid": person_id},
+                "ScanIndexForward": False,  # Sort by timestamp descending
+            }
 
-            response = table.query(
-                IndexName="person_id-index",
-                KeyConditionExpression="person_id = :pid",
-                ExpressionAttributeValues={":pid": person_id},
-                Limit=limit,
-                ScanIndexForward=False,  # Sort by timestamp descending
-            )
+            # A query page stops at 1 MB, so follow LastEvaluatedKey up to limit
+            while True:
+                response = table.query(Limit=limit - len(matches), **query_kwargs)
+                matches.extend(response.get("Items", []))
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key or len(matches) >= limit:
+                    break
+                query_kwargs["ExclusiveStartKey"] = last_key
 
-            return response.get("Items", [])
+            return matches
 
         except Exception as e:
             logger.error(f"❌ DynamoDB query_matches_by_person failed: {e}")
             return []
 
+    @staticmethod
+    def utc_timestamp(value: str) -> str:
+        """Normalize an ISO timestamp to UTC with an explicit offset.
+
+        Match timestamps are compared as strings (sort keys, day buckets,
+        range bounds), so every stored value must use the same clock. Naive
+        timestamps, written before match records carried an offset, are
+        local time. Bare dates (YYYY-MM-DD) are returned unchanged.
+
+        Raises:
+            ValueError: If the value is not ISO 8601
+        """
+        value = str(value)
+        if len(value) == 10:
+            datetime.fromisoformat(value)
+            return value
+        return datetime.fromisoformat(value).astimezone(timezone.utc).isoformat()
+
+    @classmethod
+    def match_bucket(cls, person_id: str, timestamp: str) -> str:
+        """Partition key of a person's matches for one UTC day (``<person_id>#YYYY-MM-DD``)."""
+        return f"{person_id}#{cls.utc_timestamp(timestamp)[:10]}"
+
+    def _add_match_bucket(self, item: Dict) -> None:
+        """Normalize the timestamp to UTC and set the person/day bucket attribute."""
+        if item.get("timestamp"):
+            item["timestamp"] = self.utc_timestamp(item["timestamp"])
+        if item.get("person_id") and item.get("timestamp"):
+            item.setdefault("person_day", self.match_bucket(item["person_id"], item["timestamp"]))
+
+    @classmethod
+    def _match_range(
+        cls, since: Optional[str], until: Optional[str]
+    ) -> Tuple[str, str, List[str]]:
+        """Resolve a since/until range into sort-key bounds and day buckets.
+
+        Timestamps are normalized to UTC (see utc_timestamp) and bare dates
+        are UTC days, matching how match timestamps are stored.
+
+        Args:
+            since: ISO date or timestamp (None = DEFAULT_MATCH_RANGE_DAYS before until)
+            until: ISO date or timestamp (None = now)
+
+        Returns:
+            (lower bound, upper bound, UTC days newest first as YYYY-MM-DD)
+
+        Raises:
+            ValueError: If a bound is not ISO 8601 or the range is invalid
+        """
+        try:
+            until = cls.utc_timestamp(until or datetime.now(timezone.utc).isoformat())
+            since = cls.utc_timestamp(since) if since else None
+            until_day = datetime.fromisoformat(until[:10]).date()
+            since_day = (
+                datetime.fromisoformat(since[:10]).date()
+                if since
+                else until_day - timedelta(days=cls.DEFAULT_MATCH_RANGE_DAYS - 1)
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid since/until: {e}") from e
+        since = since or since_day.isoformat()
+
+        span = (until_day - since_day).days + 1
+        if span < 1:
+            raise ValueError("since must not be after until")
+        if span > cls.MAX_MATCH_RANGE_DAYS:
+            raise ValueError(f"Range must not exceed {cls.MAX_MATCH_RANGE_DAYS} days")
+
+        # "~" sorts after every character of an ISO timestamp, so a bare
+        # date as the upper bound covers the whole day
+        if len(until) == 10:
+            until = f"{until}~"
+        days = [(until_day - timedelta(days=i)).isoformat() for i in range(span)]
+        return since, until, days
+
+    def get_person_match_counts(
+        self, person_id: str, since: Optional[str] = None, until: Optional[str] = None
+    ) -> Dict:
+        """Read a person's per-day match counts with one BatchGetItem.
+
+        Counts live on the person's monthly ``person#<person_id>#YYYY-MM``
+        items of the Stats table and are maintained by the match write paths.
+
+        Args:
+            person_id: Person ID
+            since: ISO date or timestamp (optional)
+            until: ISO date or timestamp (optional)
+
+        Returns:
+            Dict with success status and ``counts`` (YYYY-MM-DD -> count,
+            days without matches omitted)
+
+        Raises:
+            ValueError: If since/until are invalid
+        """
+        result = {"success": False, "error": None, "counts": {}}
+
+        if not self.enabled or not self.stats_table:
+            result["error"] = "Stats table not configured"
+            return result
+
+        days = set(self._match_range(since, until)[2])
+        months = sorted({day[:7] for day in days})
+
+        try:
+            # At most 13 months (MAX_MATCH_RANGE_DAYS), well within one request
+            items, unprocessed = self._batch_get_chunk(
+                [{"stat_id": f"person#{person_id}#{month}"} for month in months],
+                {},
+                max_retries=8,
+                backoff_base=0.05,
+                table_name=self.stats_table,
+            )
+            if unprocessed:
+                raise RuntimeError(f"{len(unprocessed)} counter item(s) unprocessed")
+            result["counts"] = {
+                k[len("day#"):]: int(v)
+                for item in items
+                for k, v in item.items()
+                if k.startswith("day#") and k[len("day#"):] in days and v
+            }
+            result["counts"] = dict(sorted(result["counts"].items()))
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ DynamoDB get_person_match_counts failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def query_person_matches(
+        self,
+        person_id: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """Query one page of a person's matches in a time range, newest first.
+
+        When the range has per-day counts, matches are read from
+        MATCH_BUCKET_INDEX one person/day bucket at a time, skipping days
+        without matches (rebuild_stats repairs drift), so a busy person never
+        concentrates on one index partition. Without counts the range is read
+        with a single Query on person_id-index instead of one per day.
+
+        Args:
+            person_id: Person ID
+            since: ISO date or timestamp, inclusive (None = 30 days before until)
+            until: ISO date or timestamp, inclusive (None = now)
+            limit: Maximum matches per page
+            cursor: Opaque token from a previous page's next_cursor
+
+        Returns:
+            Dict with success status, matches, next_cursor (None on the last
+            page) and daily_counts for the range (empty without a Stats table)
+
+        Raises:
+            ValueError: If since/until or the cursor are invalid
+        """
+        result = {
+            "success": False,
+            "error": None,
+            "matches": [],
+            "next_cursor": None,
+            "daily_counts": {},
+        }
+
+        if not self.enabled:
+            result["error"] = "DynamoDB not enabled"
+            return result
+
+        since_key, until_key, days = self._match_range(since, until)
+        position = self.decode_cursor(cursor)
+        if position and "day" in position:
+            if position["day"] not in days:
+                raise ValueError("Cursor does not belong to this range")
+            days = days[days.index(position["day"]):]
+        elif position and "key" not in position:
+            raise ValueError("Invalid cursor")
+
+        try:
+            counts = {}
+            if self.stats_table:
+                response = self.get_person_match_counts(person_id, since, until)
+                if response["success"]:
+                    counts = response["counts"]
+                    result["daily_counts"] = counts
+
+            # A cursor keeps the mode of the page that issued it
+            if (position and "day" not in position) or (not position and not counts):
+                matches, next_position = self._query_match_range(
+                    person_id, since_key, until_key, limit, position and position["key"]
+                )
+            else:
+                days = [
+                    day for day in days
+                    if day in counts or (position and day == position["day"])
+                ]
+                matches, next_position = self._query_match_buckets(
+                    person_id, since_key, until_key, days, limit, position and position.get("key")
+                )
+
+            result["success"] = True
+            result["matches"] = matches
+            result["next_cursor"] = self.encode_cursor(next_position)
+
+        except Exception as e:
+            logger.error(f"❌ DynamoDB query_person_matches failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def _query_match_range(
+        self,
+        person_id: str,
+        since_key: str,
+        until_key: str,
+        limit: int,
+        start_key: Optional[Dict],
+    ) -> Tuple[List[Dict], Optional[Dict]]:
+        """Read one page of a person's range from person_id-index (one Query per 1 MB page)."""
+        table = get_table(self.matches_table, self.region)
+        matches: List[Dict] = []
+        query_kwargs = {
+            "IndexName": "person_id-index",
+            "KeyConditionExpression": "person_id = :pid AND #ts BETWEEN :since AND :until",
+            "ExpressionAttributeNames": {"#ts": "timestamp"},
+            "ExpressionAttributeValues": {
+                ":pid": person_id,
+                ":since": since_key,
+                ":until": until_key,
+            },
+            "ScanIndexForward": False,
+        }
+        while True:
+            if start_key:
+                query_kwargs["ExclusiveStartKey"] = start_key
+            response = table.query(Limit=limit - len(matches), **query_kwargs)
+            matches.extend(response.get("Items", []))
+            start_key = response.get("LastEvaluatedKey")
+            if not start_key or len(matches) >= limit:
+                break
+        return matches, {"key": start_key} if start_key else None
+
+    def _query_match_buckets(
+        self,
+        person_id: str,
+        since_key: str,
+        until_key: str,
+        days: List[str],
+        limit: int,
+        start_key: Optional[Dict],
+    ) -> Tuple[List[Dict], Optional[Dict]]:
+        """Read one page of a person's range from the person/day buckets of ``days``."""
+        table = get_table(self.matches_table, self.region)
+        matches: List[Dict] = []
+        for i, day in enumerate(days):
+            while True:
+                query_kwargs = {
+                    "IndexName": self.MATCH_BUCKET_INDEX,
+                    "KeyConditionExpression": (
+                        "person_day = :bucket AND #ts BETWEEN :since AND :until"
+                    ),
+                    "ExpressionAttributeNames": {"#ts": "timestamp"},
+                    "ExpressionAttributeValues": {
+                        ":bucket": self.match_bucket(person_id, day),
+                        ":since": since_key,
+                        ":until": until_key,
+                    },
+                    "Limit": limit - len(matches),
+                    "ScanIndexForward": False,
+                }
+                if start_key:
+                    query_kwargs["ExclusiveStartKey"] = start_key
+                response = table.query(**query_kwargs)
+                matches.extend(response.get("Items", []))
+                start_key = response.get("LastEvaluatedKey")
+                if not start_key or len(matches) >= limit:
+                    break
+
+            if len(matches) >= limit:
+                if start_key:
+                    return matches, {"day": day, "key": start_key}
+                if i + 1 < len(days):
+                    return matches, {"day": days[i + 1]}
+                break
+        return matches, None
+
+    def backfill_match_buckets(self) -> Dict:
+        """Add the person_day attribute to matches written before it existed.
+
+        Returns:
+            Dict with success status and the number of updated matches
+        """
+        result = {"success": False, "error": None, "updated": 0}
+
+        if not self.enabled:
+            result["error"] = "DynamoDB not enabled"
+            return result
+
+        try:
+            pending: List[Dict] = []
+            for page in self._count_items(
+                self.matches_table, FilterExpression="attribute_not_exists(person_day)"
+            ):
+                for item in page.get("Items", []):
+                    self._add_match_bucket(item)
+                    if "person_day" in item:
+                        pending.append(item)
+
+            failed = self._batch_write(
+                self.matches_table, pending, "match_id", max_retries=8, backoff_base=0.05,
+                max_workers=4,
+            )
+            result["updated"] = len(pending) - len(failed)
+            result["success"] = not failed
+            if failed:
+                result["error"] = f"{len(failed)} item(s) unprocessed"
+            logger.info(f"✅ Backfilled person_day on {result['updated']} match(es)")
+
+        except Exception as e:
+            logger.error(f"❌ DynamoDB backfill_match_buckets failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
     def delete_person(self, person_id: str) -> Dict:
         """Delete person from DynamoDB.
 
@@ -467,8 +1664,11 @@ class DynamoDBClient:
             return result
 
         try:
-            table = self.dynamodb.Table(self.people_table)
-            table.delete_item(Key={"person_id": person_id})
+            table = get_table(self.people_table, self.region)
+            response = table.delete_item(Key={"person_id": person_id}, **self._return_old())
+            self.name_index.remove(person_id)
+            if self.stats_table and response.get("Attributes"):
+                self._record_stats({"people": -1})
 
             logger.info(f"✅ Deleted person from DynamoDB: {person_id}")
             result["success"] = True
@@ -479,6 +1679,259 @@ class DynamoDBClient:
 
         return result
 
+    def _return_old(self) -> Dict:
+        """Ask for the previous item only when it feeds the counters."""
+        return {"ReturnValues": "ALL_OLD"} if self.stats_table else {}
+
+    @classmethod
+    def _match_counters(cls, matches: List[Dict]) -> Dict[str, Dict[str, int]]:
+        """Counter deltas for written match items, keyed by stats item id.
+
+        Totals and per-site counts go to the global item; ``day#YYYY-MM-DD``
+        counts go to monthly ``month#YYYY-MM`` and ``person#<id>#YYYY-MM``
+        items so no item grows without bound.
+        """
+        counters: Dict[str, Dict[str, int]] = {cls.STATS_ID: {"matches": len(matches)}}
+
+        def add(stat_id: str, name: str) -> None:
+            item = counters.setdefault(stat_id, {})
+            item[name] = item.get(name, 0) + 1
+
+        for match in matches:
+            site_id = match.get("site_id")
+            if site_id:
+                add(cls.STATS_ID, f"site#{site_id}")
+            if not match.get("timestamp"):
+                continue
+            day = cls.utc_timestamp(match["timestamp"])[:10]
+            add(f"month#{day[:7]}", f"day#{day}")
+            if match.get("person_id"):
+                add(f"person#{match['person_id']}#{day[:7]}", f"day#{day}")
+        return counters
+
+    @classmethod
+    def _stats_expiry(cls, stat_id: str) -> Optional[int]:
+        """TTL (epoch seconds) of a monthly counter item, None for the global item."""
+        if stat_id == cls.STATS_ID:
+            return None
+        year, month = (int(v) for v in stat_id.rsplit("#", 1)[1].split("-"))
+        month_end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+        return int((month_end + timedelta(days=cls.STATS_RETENTION_DAYS)).timestamp())
+
+    def increment_stats(
+        self,
+        counters: Dict[str, int],
+        stat_id: Optional[str] = None,
+        expires_at: Optional[int] = None,
+    ) -> Dict:
+        """Atomically ADD deltas to a statistics item.
+
+        Global counters live on one item so the statistics endpoint is a
+        single read: ``people``, ``embeddings``, ``matches`` and
+        ``site#<site_id>``. Daily match counts (``day#YYYY-MM-DD``) live on
+        monthly ``month#YYYY-MM`` items, per person on
+        ``person#<person_id>#YYYY-MM`` items; both expire via TTL.
+
+        Args:
+            counters: Attribute name -> delta (negative to decrement)
+            stat_id: Item to update (None = the global STATS_ID item)
+            expires_at: TTL of the item in epoch seconds (optional)
+
+        Returns:
+            Dict with success status
+        """
+        result = {"success": False, "error": None}
+
+        if not self.enabled or not self.stats_table:
+            result["error"] = "Stats table not configured"
+            return result
+
+        counters = {name: delta for name, delta in counters.items() if delta}
+        if not counters:
+            result["success"] = True
+            return result
+
+        try:
+            names = {"#updated": "updated_at"}
+            values: Dict[str, Any] = {":now": datetime.now(timezone.utc).isoformat()}
+            sets = ["#updated = :now"]
+            if expires_at:
+                names["#expires"] = "expires_at"
+                values[":expires"] = expires_at
+                sets.append("#expires = :expires")
+            adds = []
+            for i, (name, delta) in enumerate(sorted(counters.items())):
+                names[f"#c{i}"] = name
+                values[f":c{i}"] = delta
+                adds.append(f"#c{i} :c{i}")
+
+            get_table(self.stats_table, self.region).update_item(
+                Key={"stat_id": stat_id or self.STATS_ID},
+                UpdateExpression=f"SET {', '.join(sets)} ADD {', '.join(adds)}",
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+            )
+            result["success"] = True
+
+        except Exception as e:
+            logger.warning(f"⚠️ DynamoDB increment_stats failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def _record_stats(self, counters: Dict[str, int]) -> None:
+        """Best-effort counter update on a write path (never fails the write)."""
+        if self.stats_table:
+            self.increment_stats(counters)
+
+    def _record_match_stats(self, matches: List[Dict]) -> None:
+        """Best-effort global, monthly and per-person counter updates for written matches."""
+        if not self.stats_table or not matches:
+            return
+        for stat_id, counters in self._match_counters(matches).items():
+            self.increment_stats(counters, stat_id=stat_id, expires_at=self._stats_expiry(stat_id))
+
+    def get_stats(self) -> Dict:
+        """Read the aggregate counters with one BatchGetItem.
+
+        Reads the global item and the current and previous month's items,
+        so ``matches_per_day`` covers this month and the last.
+
+        Returns:
+            Dict with success status and ``stats``: total_people,
+            total_embeddings, total_matches, matches_per_day,
+            matches_per_site and last_updated
+        """
+        result = {"success": False, "error": None, "stats": None}
+
+        if not self.enabled or not self.stats_table:
+            result["error"] = "Stats table not configured"
+            return result
+
+        try:
+            this_month = datetime.now(timezone.utc).date().replace(day=1)
+            last_month = (this_month - timedelta(days=1)).replace(day=1)
+            items, unprocessed = self._batch_get_chunk(
+                [
+                    {"stat_id": self.STATS_ID},
+                    {"stat_id": f"month#{this_month:%Y-%m}"},
+                    {"stat_id": f"month#{last_month:%Y-%m}"},
+                ],
+                {},
+                max_retries=8,
+                backoff_base=0.05,
+                table_name=self.stats_table,
+            )
+            if unprocessed:
+                raise RuntimeError(f"{len(unprocessed)} counter item(s) unprocessed")
+            item = next((i for i in items if i["stat_id"] == self.STATS_ID), {})
+            per_day = {
+                k[len("day#"):]: int(v)
+                for month_item in items
+                for k, v in month_item.items()
+                if k.startswith("day#")
+            }
+
+            result["stats"] = {
+                "total_people": int(item.get("people", 0)),
+                "total_embeddings": int(item.get("embeddings", 0)),
+                "total_matches": int(item.get("matches", 0)),
+                "matches_per_day": dict(sorted(per_day.items())),
+                "matches_per_site": {
+                    k[len("site#"):]: int(v) for k, v in item.items() if k.startswith("site#")
+                },
+                "last_updated": item.get("updated_at"),
+            }
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ DynamoDB get_stats failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def _count_items(self, table_name: str, **scan_kwargs) -> Iterator[Dict]:
+        """Paginate a scan of a whole table (offline maintenance jobs only)."""
+        table = get_table(table_name, self.region)
+        while True:
+            response = table.scan(**scan_kwargs)
+            yield response
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                break
+            scan_kwargs["ExclusiveStartKey"] = last_key
+
+    def rebuild_stats(self) -> Dict:
+        """Recompute the aggregate counters from the tables (full scans).
+
+        Used to seed the counters for existing data or to repair drift;
+        writes that happen while it runs may be lost, so run it offline.
+
+        Returns:
+            Dict with success status and the rebuilt ``stats``
+        """
+        result = {"success": False, "error": None, "stats": None}
+
+        if not self.enabled or not self.stats_table:
+            result["error"] = "Stats table not configured"
+            return result
+
+        try:
+            people = sum(
+                page.get("Count", 0) for page in self._count_items(self.people_table, Select="COUNT")
+            )
+            embeddings = sum(
+                page.get("Count", 0)
+                for page in self._count_items(self.embeddings_table, Select="COUNT")
+            )
+            matches: List[Dict] = []
+            for page in self._count_items(
+                self.matches_table,
+                ProjectionExpression="#ts, site_id, person_id",
+                ExpressionAttributeNames={"#ts": "timestamp"},
+            ):
+                matches.extend(page.get("Items", []))
+
+            now = datetime.now(timezone.utc).isoformat()
+            counters = self._match_counters(matches)
+            item = {
+                "stat_id": self.STATS_ID,
+                "people": people,
+                "embeddings": embeddings,
+                "updated_at": now,
+                **counters.pop(self.STATS_ID),
+            }
+            get_table(self.stats_table, self.region).put_item(Item=item)
+            monthly_items = [
+                {
+                    "stat_id": stat_id,
+                    "updated_at": now,
+                    "expires_at": self._stats_expiry(stat_id),
+                    **month_counters,
+                }
+                for stat_id, month_counters in counters.items()
+                # Months past retention would only be removed again by the TTL
+                if self._stats_expiry(stat_id) > time.time()
+            ]
+            failed = self._batch_write(
+                self.stats_table, monthly_items, "stat_id", max_retries=8, backoff_base=0.05,
+                max_workers=4,
+            )
+            if failed:
+                raise RuntimeError(f"{len(failed)} monthly counter item(s) unprocessed")
+
+            logger.info(
+                f"📊 Rebuilt stats: {people} people, {embeddings} embeddings, {len(matches)} matches"
+            )
+            result["success"] = True
+            result["stats"] = self.get_stats()["stats"]
+
+        except Exception as e:
+            logger.error(f"❌ DynamoDB rebuild_stats failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
     def check_health(self) -> Dict:
         """Check if DynamoDB tables are accessible."""
         if not self.enabled:
@@ -486,7 +1939,7 @@ class DynamoDBClient:
 
         try:
             # Check the status of the main 'people' table
-            table = self.dynamodb.Table(self.people_table)
+            table = get_table(self.people_table, self.region)
             table.load()  # This makes a describe_table call
             return {
                 "status": "ok",
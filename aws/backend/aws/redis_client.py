@@ -9,12 +9,15 @@ Provides caching for:
 Target: Reduce latency from 500ms to <50ms
 """
 
+import copy
 import logging
 import json
 import pickle
 from typing import Any, Dict, List, Optional
 from datetime import timedelta
 
+from ..utils.local_cache import LocalTTLCache
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -139,6 +142,53 @@ class RedisClient:
             logger.warning(f"⚠️ Redis DELETE error for key {key}: {e}")
             return False
 
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values in one round trip (MGET).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of key -> value for the keys that were found
+        """
+        if not self.enabled or not keys:
+            return {}
+
+        try:
+            values = self.client.mget(keys)
+            return {
+                key: pickle.loads(value)
+                for key, value in zip(keys, values)
+                if value
+            }
+        except Exception as e:
+            logger.warning(f"⚠️ Redis MGET error for {len(keys)} key(s): {e}")
+            return {}
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values in one pipelined round trip.
+
+        Args:
+            items: Dict of key -> value
+            ttl: Time to live in seconds (None = default_ttl)
+
+        Returns:
+            True if successful
+        """
+        if not self.enabled or not items:
+            return False
+
+        try:
+            ttl = ttl or self.default_ttl
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(key, ttl, pickle.dumps(value))
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Redis pipelined SET error for {len(items)} key(s): {e}")
+            return False
+
     def get_embedding(self, user_id: str) -> Optional[Dict]:
         """Get cached embedding for user.
 
@@ -201,6 +251,36 @@ class RedisClient:
         key = self._make_key("user", user_id)
         return self.set(key, user_data, ttl)
 
+    def get_user_metadata_many(self, user_ids: List[str]) -> Dict[str, Dict]:
+        """Get cached metadata for several users in one round trip.
+
+        Args:
+            user_ids: User IDs
+
+        Returns:
+            Dict of user_id -> cached user data (misses omitted)
+        """
+        keys = {self._make_key("user", user_id): user_id for user_id in user_ids}
+        found = self.get_many(list(keys))
+        return {keys[key]: value for key, value in found.items()}
+
+    def set_user_metadata_many(
+        self,
+        users: Dict[str, Dict],
+        ttl: int = 1800,
+    ) -> bool:
+        """Cache metadata for several users in one round trip.
+
+        Args:
+            users: Dict of user_id -> user data
+            ttl: Time to live in seconds
+
+        Returns:
+            True if successful
+        """
+        items = {self._make_key("user", user_id): data for user_id, data in users.items()}
+        return self.set_many(items, ttl)
+
     def get_search_result(self, image_hash: str) -> Optional[Dict]:
         """Get cached search result.
 
@@ -314,3 +394,193 @@ class RedisClient:
                 logger.info("✅ Redis connection closed")
             except Exception as e:
                 logger.warning(f"⚠️ Error closing Redis connection: {e}")
+
+
+class TwoTierRedisClient(RedisClient):
+    """Redis client with an in-process LRU/TTL tier for hot keys.
+
+    User metadata and search results are served from worker memory when
+    warm, skipping the network round trip and unpickling. Deletes and
+    invalidations are broadcast on a pub/sub channel so every worker evicts
+    its local copy; the short local TTL bounds staleness if a message is lost.
+    """
+
+    INVALIDATION_CHANNEL = "facerecog:invalidate"
+    LOCAL_PREFIXES = ("facerecog:user:", "facerecog:search:")
+
+    def __init__(
+        self,
+        *args,
+        local_max_entries: int = 2048,
+        local_ttl: float = 30.0,
+        **kwargs,
+    ):
+        """Initialize two-tier Redis client.
+
+        Args:
+            *args: RedisClient positional arguments
+            local_max_entries: Maximum entries in the local tier
+            local_ttl: Local tier TTL in seconds (capped by the Redis TTL)
+            **kwargs: RedisClient keyword arguments
+        """
+        super().__init__(*args, **kwargs)
+        self.local = LocalTTLCache(max_entries=local_max_entries, default_ttl=local_ttl)
+        self.local_ttl = local_ttl
+        self._pubsub = None
+        self._listener = None
+
+        if self.enabled:
+            self._start_invalidation_listener()
+
+    def _is_local(self, key: str) -> bool:
+        return key.startswith(self.LOCAL_PREFIXES)
+
+    def _start_invalidation_listener(self):
+        """Subscribe to the invalidation channel on a background thread."""
+        try:
+            self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{self.INVALIDATION_CHANNEL: self._handle_invalidation})
+            self._listener = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            logger.info(f"✅ Subscribed to cache invalidation channel: {self.INVALIDATION_CHANNEL}")
+        except Exception as e:
+            # Without invalidation messages the local tier could serve stale data
+            logger.warning(f"⚠️ Cache invalidation subscribe failed, local tier disabled: {e}")
+            self._pubsub = None
+            self._listener = None
+
+    def _local_enabled(self) -> bool:
+        return self.enabled and self._pubsub is not None
+
+    def _handle_invalidation(self, message: Dict[str, Any]):
+        """Apply an invalidation message published by any worker."""
+        try:
+            payload = json.loads(message["data"])
+            keys = payload.get("keys") or []
+            if keys:
+                self.local.delete(keys)
+            pattern = payload.get("pattern")
+            if pattern:
+                self.local.delete_pattern(pattern)
+        except Exception as e:
+            logger.warning(f"⚠️ Invalid cache invalidation message: {e}")
+
+    def _publish_invalidation(self, keys: Optional[List[str]] = None, pattern: Optional[str] = None):
+        """Evict locally and tell the other workers to do the same."""
+        if keys:
+            self.local.delete(keys)
+        if pattern:
+            self.local.delete_pattern(pattern)
+
+        if not self.enabled:
+            return
+
+        try:
+            payload = {"keys": keys or [], "pattern": pattern}
+            self.client.publish(self.INVALIDATION_CHANNEL, json.dumps(payload))
+        except Exception as e:
+            logger.warning(f"⚠️ Cache invalidation publish error: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from the local tier, falling back to Redis."""
+        if not self._local_enabled() or not self._is_local(key):
+            return super().get(key)
+
+        value = self.local.get(key)
+        if value is not None:
+            # Callers annotate cached results, so never hand out the shared object
+            return copy.deepcopy(value)
+
+        value = super().get(key)
+        if value is not None:
+            self.local.set(key, value)
+        return copy.deepcopy(value) if value is not None else None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Set value in Redis and, for hot keys, the local tier."""
+        stored = super().set(key, value, ttl)
+        if stored and self._local_enabled() and self._is_local(key):
+            local_ttl = min(self.local_ttl, ttl or self.default_ttl)
+            self.local.set(key, copy.deepcopy(value), local_ttl)
+        return stored
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values, fetching only local-tier misses from Redis."""
+        if not self._local_enabled():
+            return super().get_many(keys)
+
+        found: Dict[str, Any] = {}
+        remote = []
+        for key in keys:
+            value = self.local.get(key) if self._is_local(key) else None
+            if value is not None:
+                found[key] = value
+            else:
+                remote.append(key)
+
+        for key, value in super().get_many(remote).items():
+            if self._is_local(key):
+                self.local.set(key, value)
+            found[key] = value
+
+        return {key: copy.deepcopy(value) for key, value in found.items()}
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values in Redis and, for hot keys, the local tier."""
+        stored = super().set_many(items, ttl)
+        if stored and self._local_enabled():
+            local_ttl = min(self.local_ttl, ttl or self.default_ttl)
+            for key, value in items.items():
+                if self._is_local(key):
+                    self.local.set(key, copy.deepcopy(value), local_ttl)
+        return stored
+
+    def delete(self, key: str) -> bool:
+        """Delete key from Redis and from every worker's local tier."""
+        deleted = super().delete(key)
+        if self._is_local(key):
+            self._publish_invalidation(keys=[key])
+        return deleted
+
+    def invalidate_user(self, user_id: str) -> bool:
+        """Invalidate a user's cache entries on every worker."""
+        invalidated = super().invalidate_user(user_id)
+        self._publish_invalidation(keys=[
+            self._make_key("embedding", user_id),
+            self._make_key("user", user_id),
+        ])
+        return invalidated
+
+    def clear_pattern(self, pattern: str) -> int:
+        """Clear matching keys in Redis and every worker's local tier."""
+        count = super().clear_pattern(pattern)
+        self._publish_invalidation(pattern=pattern)
+        return count
+
+    def health_check(self) -> Dict[str, Any]:
+        """Check Redis health, including local tier statistics."""
+        result = super().health_check()
+        result["local_tier"] = self.local.stats()
+        result["local_tier"]["subscribed"] = self._pubsub is not None
+        return result
+
+    def close(self):
+        """Stop the invalidation listener and close Redis connection."""
+        if self._listener is not None:
+            try:
+                self._listener.stop()
+            except Exception as e:
+                logger.warning(f"⚠️ Error stopping invalidation listener: {e}")
+            self._listener = None
+        if self._pubsub is not None:
+            try:
+                self._pubsub.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Error closing pub/sub connection: {e}")
+            self._pubsub = None
+        self.local.clear()
+        super().close()
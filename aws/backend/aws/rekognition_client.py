@@ -2,9 +2,10 @@
 
 import logging
 import os
-import boto3
 from typing import Dict, List, Optional
 
+from .client_factory import get_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,7 +32,7 @@ class RekognitionClient:
         self.client = None
         if self.enabled:
             try:
-                self.client = boto3.client("rekognition", region_name=region)
+                self.client = get_client("rekognition", region)
                 logger.info(
                     f"✅ Rekognition Client initialized: collection={self.collection_id}"
                 )
@@ -251,6 +252,29 @@ class RekognitionClient:
 
         return result
 
+    def get_collection_stats(self) -> Dict:
+        """Get the face count of the collection (DescribeCollection, no listing).
+
+        Returns:
+            Dict with success status, collection_id and face_count
+        """
+        result = {"success": False, "collection_id": self.collection_id, "face_count": 0, "error": None}
+
+        if not self.enabled:
+            result["error"] = "Rekognition not enabled"
+            return result
+
+        try:
+            response = self.client.describe_collection(CollectionId=self.collection_id)
+            result["face_count"] = response.get("FaceCount", 0)
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ Rekognition describe_collection failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
     def list_faces(self, max_results: int = 100) -> Dict:
         """List all faces in the collection.
 
@@ -5,7 +5,7 @@ import os
 from pathlib import Path
 from typing import Dict, Optional
 
-import boto3
+from .client_factory import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +33,7 @@ class S3Client:
         self.client = None
         if self.enabled:
             try:
-                self.client = boto3.client("s3", region_name=region)
+                self.client = get_client("s3", region)
                 logger.info(f"✅ S3 Client initialized: bucket={self.bucket_name}")
             except Exception as e:
                 logger.warning(f"⚠️ Failed to initialize S3 client: {e}")
@@ -8,10 +8,10 @@ import json
 from functools import lru_cache
 from typing import Any, Dict, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
 from ..utils.logger import get_logger
+from .client_factory import get_client
 
 LOGGER = get_logger(__name__)
 
@@ -28,8 +28,7 @@ def get_secret(secret_name: str, region_name: str) -> Optional[Dict[str, Any]]:
     Returns:
         A dictionary containing the secret keys and values, or None if an error occurs.
     """
-    session = boto3.session.Session()
-    client = session.client(service_name="secretsmanager", region_name=region_name)
+    client = get_client("secretsmanager", region_name)
 
     LOGGER.info(f"Attempting to retrieve secret: {secret_name}")
 
@@ -0,0 +1,1035 @@
+"""Embedded SQLite storage backend with the DynamoDBClient interface.
+
+Used on sites without cloud connectivity and for throughput benchmarks
+without AWS in the loop. Records are stored as JSON documents (schemaless,
+like DynamoDB items) next to indexed key columns:
+
+- people(person_id PK, user_name)
+- embeddings(embedding_id PK, person_id) + index on person_id
+- matches(match_id PK, person_id, timestamp, site_id)
+  + index on (person_id, timestamp, match_id) for range queries
+
+The database runs in WAL mode so readers never block the writer. Each
+thread gets its own connection, closed when the thread exits (callers
+use short-lived thread pools); writes from this process are serialized
+on a lock and grouped into explicit transactions (bulk writes commit in
+chunks instead of once per row).
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..utils.name_index import NameSearchIndex
+from .dynamodb_client import DynamoDBClient
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS people (
+    person_id TEXT PRIMARY KEY,
+    user_name TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS embeddings (
+    embedding_id TEXT PRIMARY KEY,
+    person_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_person ON embeddings (person_id);
+CREATE TABLE IF NOT EXISTS matches (
+    match_id TEXT PRIMARY KEY,
+    person_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    site_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_matches_person_ts ON matches (person_id, timestamp, match_id);
+CREATE INDEX IF NOT EXISTS idx_matches_ts ON matches (timestamp);
+CREATE TABLE IF NOT EXISTS image_hashes (
+    content_hash TEXT PRIMARY KEY,
+    person_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize Decimals coming from DynamoDB-shaped records."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return str(value)
+
+
+def _dumps(record: Dict) -> str:
+    return json.dumps(record, default=_json_default, separators=(",", ":"))
+
+
+class _ThreadConnection:
+    """Holds one thread's connection; it is closed when the holder is collected."""
+
+    __slots__ = ("conn", "close", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.close = weakref.finalize(self, conn.close)
+
+
+class SQLiteClient:
+    """Drop-in replacement for DynamoDBClient backed by a local SQLite file."""
+
+    WRITE_CHUNK = 500  # rows per transaction in bulk writes
+    READ_CHUNK = 500  # keys per IN (...) lookup (below SQLITE_MAX_VARIABLE_NUMBER)
+
+    # Cursor helpers are shared so tokens look the same on both backends
+    encode_cursor = staticmethod(DynamoDBClient.encode_cursor)
+    decode_cursor = staticmethod(DynamoDBClient.decode_cursor)
+
+    def __init__(
+        self,
+        path: str,
+        name_index_ttl: float = 300.0,
+        busy_timeout_ms: int = 5000,
+    ):
+        """Initialize SQLite client.
+
+        Args:
+            path: Database file (created with its parent directory if missing)
+            name_index_ttl: Seconds before the in-process name search index
+                is rebuilt from the table (picks up other processes' writes)
+            busy_timeout_ms: How long a connection waits on another
+                process's write lock before failing
+        """
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.enabled = True
+
+        # Same table names as the DynamoDB backend reports in check_health
+        self.people_table = "people"
+        self.embeddings_table = "embeddings"
+        self.matches_table = "matches"
+
+        self.name_index = NameSearchIndex()
+        self.name_index_ttl = name_index_ttl
+        self._name_index_built_at: Optional[float] = None
+        self._name_index_lock = threading.Lock()
+
+        # Only the thread-local keeps a holder alive, so a thread's connection
+        # is closed when the thread exits; the WeakSet lets close() reach the rest
+        self._local = threading.local()
+        self._connections: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
+        self._connections_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        logger.info(f"✅ SQLite Client initialized: {path}")
+
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection (sqlite3 connections are per-thread)."""
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            # Autocommit; transactions are opened explicitly in _transaction().
+            # Only this thread uses it; other threads may only close() it.
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            # WAL + NORMAL: durable across app crashes, fsync only at checkpoints
+            conn.execute("PRAGMA synchronous=NORMAL")
+            holder = _ThreadConnection(conn)
+            self._local.holder = holder
+            with self._connections_lock:
+                self._connections.add(holder)
+        return holder.conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction (BEGIN IMMEDIATE takes the write lock up front)."""
+        conn = self._conn()
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close every connection still open (threads that exited already closed theirs)."""
+        with self._connections_lock:
+            for holder in list(self._connections):
+                holder.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    @staticmethod
+    def _project(record: Dict, attributes: Optional[List[str]]) -> Dict:
+        """Apply a DynamoDB-style projection (the key is always kept)."""
+        if not attributes:
+            return record
+        keep = {"person_id", *attributes}
+        return {k: v for k, v in record.items() if k in keep}
+
+    # ============================================
+    # People
+    # ============================================
+
+    def _person_row(self, person_data: Dict, now: str) -> tuple:
+        item = dict(person_data)
+        item.setdefault("created_at", now)
+        item.setdefault("updated_at", now)
+        return item["person_id"], item.get("user_name"), _dumps(item)
+
+    def save_person(self, person_data: Dict) -> Dict:
+        """Save (insert or replace) a person.
+
+        Args:
+            person_data: Person data (same shape as DynamoDBClient.save_person)
+
+        Returns:
+            Dict with success status
+        """
+        result = {"success": False, "error": None}
+
+        try:
+            row = self._person_row(person_data, self._now())
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO people (person_id, user_name, data) VALUES (?, ?, ?)",
+                    row,
+                )
+            if self._name_index_built_at is not None:
+                self.name_index.upsert(row[0], row[1])
+
+            logger.info(f"✅ Saved person to SQLite: {row[0]} - {row[1]}")
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite save_person failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def update_person(
+        self, person_id: str, updates: Dict, expected_version: Optional[int] = None
+    ) -> Dict:
+        """Update an existing person (same contract as DynamoDBClient.update_person).
+
+        Args:
+            person_id: The ID of the person to update.
+            updates: A dictionary of attributes to update.
+            expected_version: Only update if the stored version matches.
+
+        Returns:
+            Dict with success status, the updated ``person`` and
+            ``not_found`` / ``conflict`` flags.
+        """
+        result = {
+            "success": False,
+            "error": None,
+            "person": None,
+            "not_found": False,
+            "conflict": False,
+        }
+
+        try:
+            with self._transaction() as conn:
+                row = conn.execute(
+                    "SELECT data FROM people WHERE person_id = ?", (person_id,)
+                ).fetchone()
+                if row is None:
+                    result["not_found"] = True
+                    result["error"] = f"Person not found: {person_id}"
+                    return result
+
+                item = json.loads(row["data"])
+                version = int(item.get("version", 0))
+                if expected_version is not None and version != expected_version:
+                    result["conflict"] = True
+                    result["person"] = item
+                    result["error"] = (
+                        f"Version conflict: expected {expected_version}, found {version}"
+                    )
+                    return result
+
+                item.update(
+                    {k: v for k, v in updates.items() if k not in ("person_id", "version")}
+                )
+                item["version"] = version + 1
+                conn.execute(
+                    "UPDATE people SET user_name = ?, data = ? WHERE person_id = ?",
+                    (item.get("user_name"), _dumps(item), person_id),
+                )
+
+            if "user_name" in updates and self._name_index_built_at is not None:
+                self.name_index.upsert(person_id, updates["user_name"])
+
+            logger.info(f"✅ Updated person in SQLite: {person_id}")
+            result["success"] = True
+            result["person"] = item
+
+        except Exception as e:
+            logger.error(f"❌ SQLite update_person failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def increment_embedding_count(self, person_id: str) -> Dict:
+        """Atomically increment the embedding_count for a person.
+
+        Args:
+            person_id: The ID of the person to update.
+
+        Returns:
+            A dictionary with the result of the update operation.
+        """
+        result = {"success": False, "error": None}
+
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO people (person_id, data)
+                    VALUES (?, json_object('person_id', ?, 'embedding_count', 1))
+                    ON CONFLICT (person_id) DO UPDATE SET data = json_set(
+                        data, '$.embedding_count',
+                        COALESCE(json_extract(data, '$.embedding_count'), 0) + 1
+                    )
+                    """,
+                    (person_id, person_id),
+                )
+            result["success"] = True
+        except Exception as e:
+            logger.error(f"❌ SQLite increment_embedding_count failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def get_person(self, person_id: str) -> Optional[Dict]:
+        """Get person by ID.
+
+        Args:
+            person_id: Person ID
+
+        Returns:
+            Person data dict or None
+        """
+        try:
+            row = self._conn().execute(
+                "SELECT data FROM people WHERE person_id = ?", (person_id,)
+            ).fetchone()
+            if row:
+                return json.loads(row["data"])
+        except Exception as e:
+            logger.error(f"❌ SQLite get_person failed: {e}")
+
+        return None
+
+    def get_people_batch(
+        self,
+        person_ids: List[str],
+        attributes: Optional[List[str]] = None,
+        **_batch_options,
+    ) -> Dict:
+        """Get multiple people by ID.
+
+        Args:
+            person_ids: A list of person IDs.
+            attributes: Only return these attributes.
+            **_batch_options: DynamoDB retry/concurrency options (ignored)
+
+        Returns:
+            Dict with success status, a list of people and an always-empty
+            ``unprocessed`` list (kept for interface parity).
+        """
+        result = {"success": False, "error": None, "people": [], "unprocessed": []}
+
+        try:
+            ids = list(dict.fromkeys(person_ids))
+            conn = self._conn()
+            for i in range(0, len(ids), self.READ_CHUNK):
+                chunk = ids[i:i + self.READ_CHUNK]
+                rows = conn.execute(
+                    f"SELECT data FROM people WHERE person_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                result["people"].extend(
+                    self._project(json.loads(row["data"]), attributes) for row in rows
+                )
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite get_people_batch failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def list_people(self, limit: int = 100, cursor: Optional[str] = None) -> Dict:
+        """List one page of people ordered by person_id (keyset pagination).
+
+        Args:
+            limit: Maximum number of items to return
+            cursor: Opaque token from a previous page's next_cursor
+
+        Returns:
+            Dict with success status, list of people and next_cursor
+            (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        result = {"success": False, "error": None, "people": [], "next_cursor": None}
+
+        start_key = self.decode_cursor(cursor)
+        after = start_key.get("person_id", "") if start_key else ""
+
+        try:
+            # One extra row tells whether another page exists
+            rows = self._conn().execute(
+                "SELECT data FROM people WHERE person_id > ? ORDER BY person_id LIMIT ?",
+                (after, limit + 1),
+            ).fetchall()
+            people = [json.loads(row["data"]) for row in rows[:limit]]
+
+            result["success"] = True
+            result["people"] = people
+            if len(rows) > limit:
+                result["next_cursor"] = self.encode_cursor({"person_id": people[-1]["person_id"]})
+            return result
+
+        except Exception as e:
+            logger.error(f"❌ SQLite list_people failed: {e}")
+            result["error"] = str(e)
+            return result
+
+    def iter_people(
+        self,
+        total_segments: int = 4,
+        page_size: int = 1000,
+        attributes: Optional[List[str]] = None,
+        max_buffered_pages: int = 8,
+    ) -> Iterator[Dict]:
+        """Stream every person from one cursor, page_size rows at a time.
+
+        ``total_segments`` and ``max_buffered_pages`` are accepted for
+        interface parity; a local cursor does not need parallel segments.
+
+        Yields:
+            Person data dicts
+        """
+        cursor = self._conn().execute("SELECT data FROM people")
+        while True:
+            rows = cursor.fetchmany(page_size)
+            if not rows:
+                break
+            for row in rows:
+                yield self._project(json.loads(row["data"]), attributes)
+
+    def _ensure_name_index(self) -> None:
+        """Build the name index on first use and refresh it after name_index_ttl."""
+        built_at = self._name_index_built_at
+        if built_at is not None and time.monotonic() - built_at < self.name_index_ttl:
+            return
+
+        # Only the first build blocks; a refresh in progress keeps serving the old index
+        if not self._name_index_lock.acquire(blocking=built_at is None):
+            return
+        try:
+            built_at = self._name_index_built_at
+            if built_at is not None and time.monotonic() - built_at < self.name_index_ttl:
+                return
+            rows = self._conn().execute("SELECT person_id, user_name FROM people").fetchall()
+            self.name_index.rebuild(
+                {"person_id": row["person_id"], "user_name": row["user_name"]} for row in rows
+            )
+            self._name_index_built_at = time.monotonic()
+        finally:
+            self._name_index_lock.release()
+
+    def search_people(self, query: str, limit: int = 100) -> Dict:
+        """Search for people by name (accent-folded n-gram index, best first).
+
+        Args:
+            query: The search string for the user_name.
+            limit: Maximum number of items to return.
+
+        Returns:
+            Dict with success status and a list of people (best matches first).
+        """
+        result = {"success": False, "error": None, "people": []}
+
+        try:
+            self._ensure_name_index()
+            person_ids = self.name_index.search(query, limit=limit)
+
+            if person_ids:
+                batch = self.get_people_batch(person_ids)
+                if not batch["success"]:
+                    raise RuntimeError(batch["error"])
+                by_id = {p["person_id"]: p for p in batch["people"]}
+                result["people"] = [by_id[pid] for pid in person_ids if pid in by_id]
+
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite search_people failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def delete_person(self, person_id: str) -> Dict:
+        """Delete a person.
+
+        Args:
+            person_id: Person ID
+
+        Returns:
+            Dict with success status
+        """
+        result = {"success": False, "error": None}
+
+        try:
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM people WHERE person_id = ?", (person_id,))
+            self.name_index.remove(person_id)
+
+            logger.info(f"✅ Deleted person from SQLite: {person_id}")
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite delete_person failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    # ============================================
+    # Embeddings
+    # ============================================
+
+    def _embedding_row(self, embedding_data: Dict, now: str) -> tuple:
+        item = dict(embedding_data)
+        item.setdefault("created_at", now)
+        return item["embedding_id"], item["person_id"], _dumps(item)
+
+    def save_embedding(self, embedding_data: Dict) -> Dict:
+        """Save a face embedding record.
+
+        Args:
+            embedding_data: Embedding data (same shape as DynamoDBClient.save_embedding)
+
+        Returns:
+            Dict with success status
+        """
+        result = {"success": False, "error": None}
+
+        try:
+            row = self._embedding_row(embedding_data, self._now())
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO embeddings (embedding_id, person_id, data) VALUES (?, ?, ?)",
+                    row,
+                )
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite save_embedding failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def save_person_with_embedding(
+        self, person_data: Dict, embedding_data: Dict, image_hash: Optional[Dict] = None
+    ) -> Dict:
+        """Create a person and their first embedding (and content hash) in one transaction.
+
+        Returns:
+            Dict with success status (fails if the person or hash already exists)
+        """
+        result = {"success": False, "error": None}
+
+        try:
+            now = self._now()
+            person_row = self._person_row(person_data, now)
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT INTO people (person_id, user_name, data) VALUES (?, ?, ?)", person_row
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO embeddings (embedding_id, person_id, data) VALUES (?, ?, ?)",
+                    self._embedding_row(embedding_data, now),
+                )
+                if image_hash is not None:
+                    conn.execute(
+                        "INSERT INTO image_hashes (content_hash, person_id, data) VALUES (?, ?, ?)",
+                        self._image_hash_row(image_hash, now),
+                    )
+            if self._name_index_built_at is not None:
+                self.name_index.upsert(person_row[0], person_row[1])
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite save_person_with_embedding failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def get_embeddings_by_person(self, person_id: str) -> List[Dict]:
+        """Get all embeddings for a person.
+
+        Args:
+            person_id: Person ID
+
+        Returns:
+            List of embedding data dicts
+        """
+        try:
+            rows = self._conn().execute(
+                "SELECT data FROM embeddings WHERE person_id = ?", (person_id,)
+            )
+            return [json.loads(row["data"]) for row in rows]
+        except Exception as e:
+            logger.error(f"❌ SQLite get_embeddings_by_person failed: {e}")
+            return []
+
+    # ============================================
+    # Image content hashes (idempotent enrollment)
+    # ============================================
+
+    def _image_hash_row(self, record: Dict, now: str) -> tuple:
+        item = dict(record)
+        item.setdefault("created_at", now)
+        return item["content_hash"], item["person_id"], _dumps(item)
+
+    def get_image_hashes(self, content_hashes: List[str]) -> Dict:
+        """Look up enrolled images by content hash.
+
+        Returns:
+            Dict with success status and ``records`` keyed by content hash
+        """
+        result = {"success": False, "error": None, "records": {}}
+
+        try:
+            hashes = list(dict.fromkeys(content_hashes))
+            conn = self._conn()
+            for i in range(0, len(hashes), self.READ_CHUNK):
+                chunk = hashes[i:i + self.READ_CHUNK]
+                rows = conn.execute(
+                    f"SELECT data FROM image_hashes WHERE content_hash IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for row in rows:
+                    record = json.loads(row["data"])
+                    result["records"][record["content_hash"]] = record
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite get_image_hashes failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def claim_image_hashes(self, records: List[Dict]) -> Dict:
+        """Claim content hashes before their images are indexed (all or none).
+
+        Returns:
+            Dict with success status and ``exists`` when some hash was already
+            recorded or claimed (nothing is written then)
+        """
+        result = {"success": False, "error": None, "exists": False}
+
+        try:
+            now = self._now()
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT INTO image_hashes (content_hash, person_id, data) VALUES (?, ?, ?)",
+                    [self._image_hash_row(record, now) for record in records],
+                )
+            result["success"] = True
+
+        except sqlite3.IntegrityError as e:
+            result["exists"] = True
+            result["error"] = str(e)
+        except Exception as e:
+            logger.error(f"❌ SQLite claim_image_hashes failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def save_image_hash(self, record: Dict) -> Dict:
+        """Record an enrolled image's content hash (if new or claimed for the same person).
+
+        Returns:
+            Dict with success status and ``exists`` when recorded for another person
+        """
+        result = {"success": False, "error": None, "exists": False}
+
+        try:
+            with self._transaction() as conn:
+                cursor = conn.execute(
+                    "INSERT INTO image_hashes (content_hash, person_id, data) VALUES (?, ?, ?) "
+                    "ON CONFLICT (content_hash) DO UPDATE SET data = excluded.data "
+                    "WHERE image_hashes.person_id = excluded.person_id",
+                    self._image_hash_row(record, self._now()),
+                )
+            if cursor.rowcount:
+                result["success"] = True
+            else:
+                result["exists"] = True
+                result["error"] = "Image hash already recorded"
+
+        except Exception as e:
+            logger.error(f"❌ SQLite save_image_hash failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def delete_image_hash(self, content_hash: str, only_pending: bool = False) -> Dict:
+        """Delete a content-hash record (with ``only_pending``, only a pending claim).
+
+        Returns:
+            Dict with success status and ``finalized`` when ``only_pending``
+            found no pending claim (nothing deleted)
+        """
+        result = {"success": False, "error": None, "finalized": False}
+
+        try:
+            query = "DELETE FROM image_hashes WHERE content_hash = ?"
+            if only_pending:
+                query += " AND json_extract(data, '$.pending') = 1"
+            with self._transaction() as conn:
+                cursor = conn.execute(query, (content_hash,))
+            if only_pending and not cursor.rowcount:
+                result["finalized"] = True
+                result["error"] = "Image hash is not a pending claim"
+            else:
+                result["success"] = True
+        except Exception as e:
+            logger.error(f"❌ SQLite delete_image_hash failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    # ============================================
+    # Bulk writes
+    # ============================================
+
+    def _save_bulk(self, sql: str, key_attr: str, records: List[Dict], to_row) -> Dict:
+        """Insert rows in WRITE_CHUNK-sized transactions, reporting per-item results."""
+        result = {"success": False, "error": None, "saved": 0, "failed": 0, "results": []}
+
+        now = self._now()
+        rows = []
+        errors: Dict[int, str] = {}
+        for i, record in enumerate(records):
+            if not record.get(key_attr):
+                errors[i] = f"missing {key_attr}"
+                continue
+            try:
+                rows.append((i, to_row(record, now)))
+            except (KeyError, TypeError, ValueError) as e:
+                errors[i] = f"invalid record: {e}"
+
+        for start in range(0, len(rows), self.WRITE_CHUNK):
+            chunk = rows[start:start + self.WRITE_CHUNK]
+            try:
+                with self._transaction() as conn:
+                    conn.executemany(sql, [row for _, row in chunk])
+            except Exception as e:
+                logger.error(f"❌ SQLite bulk write failed: {e}")
+                for i, _ in chunk:
+                    errors[i] = str(e)
+
+        for i, record in enumerate(records):
+            error = errors.get(i)
+            result["results"].append(
+                {key_attr: record.get(key_attr), "success": error is None, "error": error}
+            )
+
+        result["saved"] = len(records) - len(errors)
+        result["failed"] = len(errors)
+        result["success"] = not errors
+        if errors:
+            result["error"] = f"{len(errors)} item(s) not written"
+        return result
+
+    def save_people_bulk(self, people: List[Dict], **_batch_options) -> Dict:
+        """Save many people in chunked transactions.
+
+        Returns:
+            Dict with success status, saved/failed counts and per-item
+            ``results`` ({person_id, success, error}) in input order
+        """
+        result = self._save_bulk(
+            "INSERT OR REPLACE INTO people (person_id, user_name, data) VALUES (?, ?, ?)",
+            "person_id",
+            people,
+            self._person_row,
+        )
+        if self._name_index_built_at is not None:
+            for person, item in zip(people, result["results"]):
+                if item["success"]:
+                    self.name_index.upsert(item["person_id"], person.get("user_name"))
+        logger.info(f"✅ Saved {result['saved']} people to SQLite in bulk")
+        return result
+
+    def save_embeddings_bulk(self, embeddings: List[Dict], **_batch_options) -> Dict:
+        """Save many face embeddings in chunked transactions.
+
+        Returns:
+            Dict with success status, saved/failed counts and per-item
+            ``results`` ({embedding_id, success, error}) in input order
+        """
+        result = self._save_bulk(
+            "INSERT OR REPLACE INTO embeddings (embedding_id, person_id, data) VALUES (?, ?, ?)",
+            "embedding_id",
+            embeddings,
+            self._embedding_row,
+        )
+        logger.info(f"✅ Saved {result['saved']} embedding(s) to SQLite in bulk")
+        return result
+
+    # ============================================
+    # Matches
+    # ============================================
+
+    @staticmethod
+    def _match_row(match_data: Dict, now: str) -> tuple:
+        item = dict(match_data)
+        item["timestamp"] = DynamoDBClient.utc_timestamp(item.get("timestamp") or now)
+        return (
+            item["match_id"],
+            item["person_id"],
+            str(item["timestamp"]),
+            item.get("site_id"),
+            _dumps(item),
+        )
+
+    _MATCH_INSERT = (
+        "INSERT OR REPLACE INTO matches (match_id, person_id, timestamp, site_id, data) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+
+    def save_match(self, match_data: Dict) -> Dict:
+        """Save an identification match result.
+
+        Returns:
+            Dict with success status
+        """
+        result = {"success": False, "error": None}
+
+        try:
+            row = self._match_row(match_data, self._now())
+            with self._transaction() as conn:
+                conn.execute(self._MATCH_INSERT, row)
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite save_match failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def save_matches_batch(self, matches: List[Dict], **_batch_options) -> Dict:
+        """Save several match results in one transaction.
+
+        Returns:
+            Dict with success status, saved count and unprocessed count
+        """
+        result = {"success": False, "error": None, "saved": 0, "unprocessed": 0}
+
+        try:
+            now = self._now()
+            rows = [self._match_row(match, now) for match in matches]
+            with self._transaction() as conn:
+                conn.executemany(self._MATCH_INSERT, rows)
+            result["saved"] = len(rows)
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite save_matches_batch failed: {e}")
+            result["error"] = str(e)
+            result["unprocessed"] = len(matches)
+
+        return result
+
+    def query_matches_by_person(self, person_id: str, limit: int = 100) -> List[Dict]:
+        """Query the most recent matches for a specific person.
+
+        Returns:
+            List of match data dicts, newest first
+        """
+        try:
+            rows = self._conn().execute(
+                "SELECT data FROM matches WHERE person_id = ? "
+                "ORDER BY timestamp DESC, match_id DESC LIMIT ?",
+                (person_id, limit),
+            )
+            return [json.loads(row["data"]) for row in rows]
+        except Exception as e:
+            logger.error(f"❌ SQLite query_matches_by_person failed: {e}")
+            return []
+
+    def get_person_match_counts(
+        self, person_id: str, since: Optional[str] = None, until: Optional[str] = None
+    ) -> Dict:
+        """Count a person's matches per day in a range.
+
+        Returns:
+            Dict with success status and ``counts`` (YYYY-MM-DD -> count)
+
+        Raises:
+            ValueError: If since/until are invalid
+        """
+        result = {"success": False, "error": None, "counts": {}}
+        since_key, until_key, _ = DynamoDBClient._match_range(since, until)
+
+        try:
+            rows = self._conn().execute(
+                "SELECT substr(timestamp, 1, 10) AS day, COUNT(*) AS n FROM matches "
+                "WHERE person_id = ? AND timestamp BETWEEN ? AND ? GROUP BY day ORDER BY day",
+                (person_id, since_key, until_key),
+            )
+            result["counts"] = {row["day"]: row["n"] for row in rows}
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite get_person_match_counts failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def query_person_matches(
+        self,
+        person_id: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """Query one page of a person's matches in a time range, newest first.
+
+        Same range defaults and validation as DynamoDBClient; pages are
+        keyset-paginated on (timestamp, match_id) over idx_matches_person_ts.
+
+        Returns:
+            Dict with success status, matches, next_cursor (None on the last
+            page) and daily_counts for the range
+
+        Raises:
+            ValueError: If since/until or the cursor are invalid
+        """
+        result = {
+            "success": False,
+            "error": None,
+            "matches": [],
+            "next_cursor": None,
+            "daily_counts": {},
+        }
+
+        since_key, until_key, _ = DynamoDBClient._match_range(since, until)
+        position = self.decode_cursor(cursor)
+        if position and not {"timestamp", "match_id"} <= position.keys():
+            raise ValueError("Invalid cursor")
+
+        try:
+            sql = "SELECT data FROM matches WHERE person_id = ? AND timestamp BETWEEN ? AND ?"
+            params: List[Any] = [person_id, since_key, until_key]
+            if position:
+                sql += " AND (timestamp < ? OR (timestamp = ? AND match_id < ?))"
+                params += [position["timestamp"], position["timestamp"], position["match_id"]]
+            sql += " ORDER BY timestamp DESC, match_id DESC LIMIT ?"
+            params.append(limit + 1)
+
+            rows = self._conn().execute(sql, params).fetchall()
+            matches = [json.loads(row["data"]) for row in rows[:limit]]
+            if len(rows) > limit:
+                last = matches[-1]
+                result["next_cursor"] = self.encode_cursor(
+                    {"timestamp": str(last["timestamp"]), "match_id": last["match_id"]}
+                )
+
+            counts = self.get_person_match_counts(person_id, since, until)
+            result["daily_counts"] = counts["counts"]
+            result["matches"] = matches
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite query_person_matches failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    # ============================================
+    # Statistics and health
+    # ============================================
+
+    def get_stats(self) -> Dict:
+        """Compute the aggregate statistics with indexed COUNT queries.
+
+        Returns:
+            Dict with success status and ``stats`` in the same shape as
+            DynamoDBClient.get_stats
+        """
+        result = {"success": False, "error": None, "stats": None}
+
+        try:
+            conn = self._conn()
+            totals = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("people", "embeddings", "matches")
+            }
+            per_day = conn.execute(
+                "SELECT substr(timestamp, 1, 10) AS day, COUNT(*) AS n FROM matches "
+                "GROUP BY day ORDER BY day"
+            )
+            per_site = conn.execute(
+                "SELECT site_id, COUNT(*) AS n FROM matches WHERE site_id IS NOT NULL GROUP BY site_id"
+            )
+            result["stats"] = {
+                "total_people": totals["people"],
+                "total_embeddings": totals["embeddings"],
+                "total_matches": totals["matches"],
+                "matches_per_day": {row["day"]: row["n"] for row in per_day},
+                "matches_per_site": {row["site_id"]: row["n"] for row in per_site},
+                "last_updated": self._now(),
+            }
+            result["success"] = True
+
+        except Exception as e:
+            logger.error(f"❌ SQLite get_stats failed: {e}")
+            result["error"] = str(e)
+
+        return result
+
+    def rebuild_stats(self) -> Dict:
+        """Statistics are always computed from the tables; returns get_stats()."""
+        return self.get_stats()
+
+    def check_health(self) -> Dict:
+        """Check the database file is readable."""
+        try:
+            self._conn().execute("SELECT 1 FROM people LIMIT 1").fetchall()
+            return {
+                "status": "ok",
+                "tables": [self.people_table, self.embeddings_table, self.matches_table],
+                "path": self.path,
+            }
+        except Exception as e:
+            logger.error(f"❌ SQLite health check failed: {e}")
+            return {"status": "error", "error": str(e)}
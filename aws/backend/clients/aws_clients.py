@@ -4,13 +4,16 @@ AWS Service Clients
 - RekognitionClient: For face recognition operations
 - DynamoDBClient: For database operations
 
-This module centralizes all boto3 interactions.
+This module centralizes all boto3 interactions; the underlying clients come
+from the shared pooled client factory.
 """
 
 import logging
 import boto3
 from botocore.exceptions import ClientError
 
+from ..aws.client_factory import get_client, get_resource, get_table
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +23,7 @@ class S3Client:
     def __init__(self, bucket_name: str, region_name: str = 'us-east-1'):
         if not bucket_name:
             raise ValueError("S3 bucket name is required.")
-        self.s3 = boto3.client('s3', region_name=region_name)
+        self.s3 = get_client('s3', region_name)
         self.bucket_name = bucket_name
         self.region_name = region_name
         logger.info(f"S3Client initialized for bucket: {self.bucket_name}")
@@ -43,7 +46,7 @@ class RekognitionClient:
     def __init__(self, collection_id: str, region_name: str = 'us-east-1'):
         if not collection_id:
             raise ValueError("Rekognition collection ID is required.")
-        self.rekognition = boto3.client('rekognition', region_name=region_name)
+        self.rekognition = get_client('rekognition', region_name)
         self.collection_id = collection_id
         logger.info(f"RekognitionClient initialized for collection: {self.collection_id}")
 
@@ -99,9 +102,9 @@ class DynamoDBClient:
     def __init__(self, people_table: str, embeddings_table: str, region_name: str = 'us-east-1'):
         if not people_table or not embeddings_table:
             raise ValueError("DynamoDB table names are required.")
-        self.dynamodb = boto3.resource('dynamodb', region_name=region_name)
-        self.people_table = self.dynamodb.Table(people_table)
-        self.embeddings_table = self.dynamodb.Table(embeddings_table)
+        self.dynamodb = get_resource('dynamodb', region_name)
+        self.people_table = get_table(people_table, region_name)
+        self.embeddings_table = get_table(embeddings_table, region_name)
         logger.info(f"DynamoDBClient initialized for tables: {people_table}, {embeddings_table}")
 
     def save_person(self, person_data: dict) -> dict:
@@ -10,10 +10,12 @@ AWS Services:
 """
 
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional
 
 from .auth_utils import is_admin
+from .executor import run_blocking
+from ..utils.local_cache import LocalTTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +23,34 @@ logger = logging.getLogger(__name__)
 class DatabaseManager:
     """AWS Cloud-only Database Manager for Face Recognition"""
 
-    def __init__(self, aws_dynamodb_client, aws_s3_client=None):
+    def __init__(
+        self,
+        aws_dynamodb_client,
+        aws_s3_client=None,
+        redis_client=None,
+        person_cache_ttl: int = 1800,
+        scan_segments: int = 4,
+        stats_cache_ttl: float = 10.0,
+    ):
         """
         Args:
             aws_dynamodb_client: DynamoDB client instance (required)
             aws_s3_client: S3 client instance (optional)
+            redis_client: Redis client instance (optional, read-through
+                cache for person metadata)
+            person_cache_ttl: TTL in seconds for cached person metadata
+            scan_segments: Parallel segments for full-table scans
+            stats_cache_ttl: Seconds the aggregate statistics are cached
         """
         if not aws_dynamodb_client:
             raise ValueError("AWS DynamoDB client is required for cloud-only mode")
 
         self.dynamodb = aws_dynamodb_client
         self.s3 = aws_s3_client
+        self.redis = redis_client
+        self.person_cache_ttl = person_cache_ttl
+        self.scan_segments = max(1, scan_segments)
+        self._stats_cache = LocalTTLCache(max_entries=1, default_ttl=stats_cache_ttl)
 
         logger.info("DatabaseManager initialized: AWS Cloud Only")
 
@@ -94,6 +113,132 @@ class DatabaseManager:
                 "message": f"❌ Failed to create profile: {result.get('error')}",
             }
 
+    def create_person_with_embedding(
+        self,
+        person_id: str,
+        user_name: str,
+        face_id: str,
+        image_url: str,
+        quality_score: float = 0.0,
+        gender: str = "",
+        birth_year: str = "",
+        hometown: str = "",
+        residence: str = "",
+        content_hash: Optional[str] = None,
+    ) -> Dict:
+        """
+        Create a person profile and their first embedding in one write
+
+        Args:
+            person_id: Person ID
+            user_name: Person name (required)
+            face_id: Rekognition Face ID
+            image_url: S3 image URL
+            quality_score: Face quality score
+            gender: Gender
+            birth_year: Birth year
+            hometown: Hometown
+            residence: Current residence
+            content_hash: Image content hash, recorded in the same write so a
+                retried upload maps back to this person and face
+
+        Returns:
+            Dict with success, person_id, embedding_id and message
+        """
+        import uuid
+
+        now = datetime.now().isoformat()
+        embedding_id = f"emb_{uuid.uuid4().hex[:12]}"
+        person_data = {
+            "person_id": person_id,
+            "user_name": user_name,
+            "gender": gender,
+            "birth_year": birth_year,
+            "hometown": hometown,
+            "residence": residence,
+            "created_at": now,
+            "updated_at": now,
+            "embedding_count": 1,
+        }
+        embedding_data = {
+            "embedding_id": embedding_id,
+            "person_id": person_id,
+            "face_id": face_id,
+            "image_url": image_url,
+            "quality_score": quality_score,
+            "created_at": now,
+        }
+
+        image_hash = None
+        if content_hash:
+            image_hash = self._image_hash_record(content_hash, embedding_data)
+
+        result = self.dynamodb.save_person_with_embedding(
+            person_data, embedding_data, image_hash=image_hash
+        )
+
+        if result["success"]:
+            logger.info(f"✅ Created person {person_id} with embedding {embedding_id}")
+            return {
+                "success": True,
+                "person_id": person_id,
+                "embedding_id": embedding_id,
+                "message": f"✅ Created profile: {user_name} (ID: {person_id})",
+            }
+        logger.error(f"❌ Failed to create person with embedding: {result.get('error')}")
+        return {
+            "success": False,
+            "person_id": person_id,
+            "embedding_id": None,
+            "message": f"❌ Failed to create profile: {result.get('error')}",
+        }
+
+    def create_people_bulk(self, people: List[Dict]) -> Dict:
+        """
+        Create many person profiles with DynamoDB BatchWriteItem
+
+        Args:
+            people: Dicts with user_name (required) and optional gender,
+                birth_year, hometown, residence and person_id
+
+        Returns:
+            Dict with success status, saved/failed counts and per-item
+            ``results`` ({person_id, success, error}) in input order
+        """
+        import uuid
+
+        now = datetime.now().isoformat()
+        records = [
+            {
+                "person_id": person.get("person_id") or f"person_{uuid.uuid4().hex[:12]}",
+                "user_name": person["user_name"],
+                "gender": person.get("gender", ""),
+                "birth_year": person.get("birth_year", ""),
+                "hometown": person.get("hometown", ""),
+                "residence": person.get("residence", ""),
+                "created_at": now,
+                "updated_at": now,
+                "embedding_count": 0,
+            }
+            for person in people
+        ]
+
+        result = self.dynamodb.save_people_bulk(records)
+
+        # Caller-supplied IDs may overwrite cached profiles
+        for item in result.get("results", []):
+            if item["success"]:
+                self._invalidate_person_cache(item["person_id"])
+
+        if result["success"]:
+            logger.info(f"✅ Created {result['saved']} person(s) in DynamoDB")
+        else:
+            logger.error(
+                f"❌ Failed to create {result.get('failed', len(records))} of {len(records)} "
+                f"person(s): {result.get('error')}"
+            )
+        return result
+
     def get_person(self, person_id: str) -> Optional[Dict]:
         """
         Get person info from DynamoDB
@@ -107,48 +252,148 @@ class DatabaseManager:
         # dynamodb.get_person() returns Optional[Dict] directly
         return self.dynamodb.get_person(person_id)
 
-    def get_people_batch(self, person_ids: List[str]) -> List[Dict]:
+    def _person_cache_enabled(self) -> bool:
+        return bool(self.redis and self.redis.enabled)
+
+    def _invalidate_person_cache(self, person_id: str) -> None:
+        if self._person_cache_enabled():
+            self.redis.invalidate_user(person_id)
+
+    def get_people_batch(
+        self, person_ids: List[str], attributes: Optional[List[str]] = None
+    ) -> List[Dict]:
         """Get multiple people by a list of IDs from DynamoDB.
 
+        With a Redis client, cached people are read in one multi-get and only
+        the misses are fetched from DynamoDB (then written back). Full records
+        are cached so any caller can reuse them; ``attributes`` is applied to
+        the returned dicts.
+
         Args:
             person_ids: A list of person IDs.
+            attributes: Only return these attributes (None = all).
 
         Returns:
             A list of person data dicts.
         """
-        result = self.dynamodb.get_people_batch(person_ids)
-        if result["success"]:
-            return result["people"]
-        return []
+        if not self._person_cache_enabled():
+            result = self.dynamodb.get_people_batch(person_ids, attributes=attributes)
+            if result["success"]:
+                return result["people"]
+            return []
+
+        unique_ids = list(dict.fromkeys(person_ids))
+        cached = self.redis.get_user_metadata_many(unique_ids)
+        people = list(cached.values())
+
+        missing = [person_id for person_id in unique_ids if person_id not in cached]
+        if missing:
+            result = self.dynamodb.get_people_batch(missing)
+            if result["success"]:
+                fetched = result["people"]
+                people.extend(fetched)
+                if fetched:
+                    self.redis.set_user_metadata_many(
+                        {p["person_id"]: p for p in fetched}, ttl=self.person_cache_ttl
+                    )
+
+        logger.debug(
+            f"Person metadata: {len(cached)} cached, {len(missing)} fetched from DynamoDB"
+        )
+        if attributes:
+            wanted = {"person_id", *attributes}
+            people = [{k: v for k, v in p.items() if k in wanted} for p in people]
+        return people
+
+    def lookup_people(self, person_ids: List[str], attributes: Optional[List[str]] = None) -> Dict:
+        """
+        Get multiple people straight from DynamoDB, with the lookup status
+
+        Unlike get_people_batch (cached, returns just the people found), a
+        caller can tell a missing person from a failed or incomplete read.
+
+        Args:
+            person_ids: A list of person IDs.
+            attributes: Only return these attributes (None = all).
+
+        Returns:
+            Dict with success, people and ``unprocessed`` person IDs (neither
+            found nor known to be missing)
+        """
+        result = self.dynamodb.get_people_batch(person_ids, attributes=attributes)
+        result.setdefault("unprocessed", [])
+        return result
 
     def get_all_people(self) -> List[Dict]:
         """
-        Get all people from DynamoDB
+        Get all people from DynamoDB (parallel segmented scan)
+
+        Loads every person into memory; prefer iter_people or
+        list_people_page for large tables.
 
         Returns:
             List of person dicts
         """
-        result = self.dynamodb.list_people()
-        if result["success"]:
-            return result["people"]
-        return []
+        try:
+            return list(self.iter_people())
+        except Exception as e:
+            logger.error(f"❌ Failed to list people: {e}")
+            return []
+
+    def iter_people(self, attributes: Optional[List[str]] = None) -> Iterator[Dict]:
+        """
+        Stream all people from DynamoDB without loading them into memory
 
-    def update_person(self, person_id: str, updates: Dict) -> Dict:
+        Args:
+            attributes: Only return these attributes (None = all)
+
+        Yields:
+            Person dicts (unordered)
+        """
+        return self.dynamodb.iter_people(
+            total_segments=self.scan_segments, attributes=attributes
+        )
+
+    def list_people_page(self, limit: int = 100, cursor: Optional[str] = None) -> Dict:
         """
-        Update person info in DynamoDB
+        Get one page of people
+
+        Args:
+            limit: Maximum people per page
+            cursor: Opaque cursor from the previous page (None = first page)
+
+        Returns:
+            Dict with success, people and next_cursor (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return self.dynamodb.list_people(limit=limit, cursor=cursor)
+
+    def update_person(
+        self, person_id: str, updates: Dict, expected_version: Optional[int] = None
+    ) -> Dict:
+        """
+        Update person info in DynamoDB (one conditional write)
 
         Args:
             person_id: Person ID
             updates: Dict with fields to update
+            expected_version: Only update if the stored version matches
+                (optimistic concurrency; None = last write wins)
 
         Returns:
-            Update result dict
+            Update result dict with the updated ``person`` and
+            ``not_found`` / ``conflict`` flags
         """
         updates["updated_at"] = datetime.now().isoformat()
-        result = self.dynamodb.update_person(person_id, updates)
+        result = self.dynamodb.update_person(person_id, updates, expected_version=expected_version)
 
         if result["success"]:
+            self._invalidate_person_cache(person_id)
             logger.info(f"✅ Updated person in DynamoDB: {person_id}")
+        elif result.get("not_found") or result.get("conflict"):
+            logger.warning(f"⚠️ Person update rejected: {result.get('error')}")
         else:
             logger.error(f"❌ Failed to update person: {result.get('error')}")
 
@@ -168,6 +413,7 @@ class DatabaseManager:
         result = self.dynamodb.delete_person(person_id)
 
         if result["success"]:
+            self._invalidate_person_cache(person_id)
             logger.info(f"✅ Deleted person from DynamoDB: {person_id}")
         else:
             logger.error(f"❌ Failed to delete person: {result.get('error')}")
@@ -175,7 +421,12 @@ class DatabaseManager:
         return result
 
     def add_embedding(
-        self, person_id: str, face_id: str, image_url: str, quality_score: float = 0.0
+        self,
+        person_id: str,
+        face_id: str,
+        image_url: str,
+        quality_score: float = 0.0,
+        content_hash: Optional[str] = None,
     ) -> Dict:
         """
         Add embedding record to DynamoDB
@@ -185,6 +436,7 @@ class DatabaseManager:
             face_id: Rekognition Face ID
             image_url: S3 image URL
             quality_score: Face quality score
+            content_hash: Image content hash to record for idempotent enrollment
 
         Returns:
             Add result dict
@@ -205,7 +457,12 @@ class DatabaseManager:
         result = self.dynamodb.save_embedding(embedding_data)
 
         if result["success"]:
-
+            if content_hash:
+                hash_result = self.dynamodb.save_image_hash(
+                    self._image_hash_record(content_hash, embedding_data)
+                )
+                if not hash_result["success"] and not hash_result.get("exists"):
+                    logger.warning(f"⚠️ Failed to record image hash: {hash_result.get('error')}")
 
             logger.info(f"✅ Added embedding to DynamoDB: {embedding_id}")
         else:
@@ -213,6 +470,111 @@ class DatabaseManager:
 
         return result
 
+    @staticmethod
+    def _image_hash_record(content_hash: str, embedding_data: Dict) -> Dict:
+        return {
+            "content_hash": content_hash,
+            "person_id": embedding_data["person_id"],
+            "face_id": embedding_data["face_id"],
+            "embedding_id": embedding_data["embedding_id"],
+            "image_url": embedding_data["image_url"],
+            "quality_score": embedding_data.get("quality_score", 0.0),
+        }
+
+    def find_enrolled_images(self, content_hashes: List[str]) -> Dict[str, Dict]:
+        """
+        Look up already-enrolled images by content hash
+
+        Args:
+            content_hashes: Image content hashes
+
+        Returns:
+            Dict mapping each known hash to its record (person_id, face_id,
+            embedding_id, image_url, quality_score); empty when the hash
+            index is not configured
+        """
+        if not content_hashes:
+            return {}
+        result = self.dynamodb.get_image_hashes(content_hashes)
+        if not result["success"]:
+            logger.debug(f"Image hash lookup unavailable: {result.get('error')}")
+            return {}
+        return result["records"]
+
+    def claim_images(self, content_hashes: List[str], person_id: str) -> Dict:
+        """
+        Claim content hashes for a person before their images are indexed
+
+        The claim records are marked ``pending`` until add_embedding replaces
+        them with the enrolled image's record; a concurrent enrollment of the
+        same images fails its claim instead of indexing them again.
+
+        Args:
+            content_hashes: Image content hashes
+            person_id: Person the images will be enrolled under
+
+        Returns:
+            Claim result dict (``exists`` when another enrollment holds a hash)
+        """
+        return self.dynamodb.claim_image_hashes(
+            [
+                {"content_hash": content_hash, "person_id": person_id, "pending": True}
+                for content_hash in content_hashes
+            ]
+        )
+
+    def forget_enrolled_image(self, content_hash: str, only_pending: bool = False) -> Dict:
+        """
+        Remove a content-hash record (e.g. its person was deleted)
+
+        Args:
+            content_hash: Image content hash
+            only_pending: Only remove a pending claim (see claim_images); a
+                record finalized meanwhile is kept and reported ``finalized``
+
+        Returns:
+            Delete result dict
+        """
+        return self.dynamodb.delete_image_hash(content_hash, only_pending=only_pending)
+
+    def add_embeddings_bulk(self, embeddings: List[Dict]) -> Dict:
+        """
+        Add many embedding records with DynamoDB BatchWriteItem
+
+        Args:
+            embeddings: Dicts with person_id, face_id, image_url and
+                optional quality_score
+
+        Returns:
+            Dict with success status, saved/failed counts and per-item
+            ``results`` ({embedding_id, success, error}) in input order
+        """
+        import uuid
+
+        now = datetime.now().isoformat()
+        records = [
+            {
+                "embedding_id": f"emb_{uuid.uuid4().hex[:12]}",
+                "person_id": embedding["person_id"],
+                "face_id": embedding["face_id"],
+                "image_url": embedding["image_url"],
+                "quality_score": embedding.get("quality_score", 0.0),
+                "created_at": now,
+            }
+            for embedding in embeddings
+        ]
+
+        result = self.dynamodb.save_embeddings_bulk(records)
+
+        if result["success"]:
+            logger.info(f"✅ Added {result['saved']} embedding(s) to DynamoDB")
+        else:
+            logger.error(
+                f"❌ Failed to add {result.get('failed', len(records))} of {len(records)} "
+                f"embedding(s): {result.get('error')}"
+            )
+        return result
+
     def get_embeddings(self, person_id: str) -> List[Dict]:
         """
         Get all embeddings for a person
@@ -228,7 +590,8 @@ class DatabaseManager:
 
     def search_people(self, query: str) -> List[Dict]:
         """
-        Search people by name using DynamoDB's scan capabilities.
+        Search people by name (case- and diacritic-insensitive prefix or
+        substring match via the DynamoDB client's name index).
 
         Args:
             query: Search query for the user_name.
@@ -244,6 +607,61 @@ class DatabaseManager:
             logger.error(f"❌ Failed to search people: {result.get('error')}")
             return []
 
+    def get_statistics(self) -> Optional[Dict]:
+        """
+        Get aggregate statistics from the maintained counters (one read)
+
+        Results are cached in-process for ``stats_cache_ttl`` seconds so
+        dashboards polling the endpoint do not hit DynamoDB every refresh.
+
+        Returns:
+            Dict with total_people, total_embeddings, total_matches,
+            matches_today, matches_per_day, matches_per_site and
+            last_updated, or None on error
+        """
+        cached = self._stats_cache.get("stats")
+        if cached is not None:
+            return cached
+
+        result = self.dynamodb.get_stats()
+        if not result["success"]:
+            logger.error(f"❌ Failed to get statistics: {result.get('error')}")
+            return None
+
+        stats = result["stats"]
+        today = datetime.now(timezone.utc).date().isoformat()
+        stats["matches_today"] = stats["matches_per_day"].get(today, 0)
+        self._stats_cache.set("stats", stats)
+        return stats
+
+    def get_person_matches(
+        self,
+        person_id: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """
+        Get one page of a person's match history, newest first
+
+        Args:
+            person_id: Person ID
+            since: ISO date or timestamp, inclusive (None = last 30 days)
+            until: ISO date or timestamp, inclusive (None = now)
+            limit: Maximum matches per page
+            cursor: Opaque cursor from the previous page (None = first page)
+
+        Returns:
+            Dict with success, matches, next_cursor and daily_counts
+
+        Raises:
+            ValueError: If since/until or the cursor are invalid
+        """
+        return self.dynamodb.query_person_matches(
+            person_id, since=since, until=until, limit=limit, cursor=cursor
+        )
+
     def check_health(self) -> Dict:
         """
         Check database connectivity and health.
@@ -253,3 +671,82 @@ class DatabaseManager:
         """
         # This will be implemented in the DynamoDBClient
         return self.dynamodb.check_health()
+
+    # ============================================
+    # Async variants (run on the shared AWS executor)
+    # ============================================
+
+    async def create_person_async(self, user_name: str, **kwargs) -> Dict:
+        """Async variant of create_person."""
+        return await run_blocking(self.create_person, user_name, **kwargs)
+
+    async def create_people_bulk_async(self, people: List[Dict]) -> Dict:
+        """Async variant of create_people_bulk."""
+        return await run_blocking(self.create_people_bulk, people)
+
+    async def get_person_async(self, person_id: str) -> Optional[Dict]:
+        """Async variant of get_person."""
+        return await run_blocking(self.get_person, person_id)
+
+    async def get_people_batch_async(
+        self, person_ids: List[str], attributes: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """Async variant of get_people_batch."""
+        return await run_blocking(self.get_people_batch, person_ids, attributes)
+
+    async def list_people_page_async(self, limit: int = 100, cursor: Optional[str] = None) -> Dict:
+        """Async variant of list_people_page."""
+        return await run_blocking(self.list_people_page, limit, cursor)
+
+    async def get_all_people_async(self) -> List[Dict]:
+        """Async variant of get_all_people."""
+        return await run_blocking(self.get_all_people)
+
+    async def update_person_async(
+        self, person_id: str, updates: Dict, expected_version: Optional[int] = None
+    ) -> Dict:
+        """Async variant of update_person."""
+        return await run_blocking(self.update_person, person_id, updates, expected_version)
+
+    async def delete_person_async(self, person_id: str) -> Dict:
+        """Async variant of delete_person."""
+        return await run_blocking(self.delete_person, person_id)
+
+    async def add_embedding_async(
+        self, person_id: str, face_id: str, image_url: str, quality_score: float = 0.0
+    ) -> Dict:
+        """Async variant of add_embedding."""
+        return await run_blocking(
+            self.add_embedding, person_id, face_id, image_url, quality_score
+        )
+
+    async def add_embeddings_bulk_async(self, embeddings: List[Dict]) -> Dict:
+        """Async variant of add_embeddings_bulk."""
+        return await run_blocking(self.add_embeddings_bulk, embeddings)
+
+    async def get_embeddings_async(self, person_id: str) -> List[Dict]:
+        """Async variant of get_embeddings."""
+        return await run_blocking(self.get_embeddings, person_id)
+
+    async def search_people_async(self, query: str) -> List[Dict]:
+        """Async variant of search_people."""
+        return await run_blocking(self.search_people, query)
+
+    async def get_statistics_async(self) -> Optional[Dict]:
+        """Async variant of get_statistics."""
+        return await run_blocking(self.get_statistics)
+
+    async def get_person_matches_async(
+        self,
+        person_id: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """Async variant of get_person_matches."""
+        return await run_blocking(self.get_person_matches, person_id, since, until, limit, cursor)
+
+    async def check_health_async(self) -> Dict:
+        """Async variant of check_health."""
+        return await run_blocking(self.check_health)
@@ -8,14 +8,19 @@ Features:
 3. Store metadata in DynamoDB
 4. High-quality reference images
 5. Real-time face quality validation with anti-spoofing
+6. Idempotent retries (images keyed by content hash)
 """
 
+import hashlib
 import logging
 import uuid
-from typing import Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .database_manager import DatabaseManager
 from .auth_utils import is_admin
+from .executor import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -34,17 +39,31 @@ except ImportError:
 class EnrollmentService:
     """AWS Cloud-only Enrollment Service"""
 
+    CLAIM_TIMEOUT_SECONDS = 900  # a pending image hash claim older than this is abandoned
+
     def __init__(
         self,
         s3_client,
         rekognition_client,
         dynamodb_client,
+        best_shot_count: int = 5,
+        scoring_workers: int = 4,
+        index_concurrency: int = 4,
+        redis_client=None,
+        person_cache_ttl: int = 1800,
     ):
         """
         Args:
             s3_client: S3 client instance (required)
             rekognition_client: Rekognition client instance (required)
             dynamodb_client: DynamoDB client instance (required)
+            best_shot_count: Images kept per person by parallel multi-image enrollment
+            scoring_workers: Threads scoring images locally in that mode
+            index_concurrency: Max concurrent Rekognition calls (indexing and
+                bulk duplicate checks)
+            redis_client: Redis client instance (optional, caches the person
+                metadata used by duplicate checks)
+            person_cache_ttl: TTL in seconds for cached person metadata
         """
         if not s3_client or not rekognition_client or not dynamodb_client:
             raise ValueError("All AWS clients (S3, Rekognition, DynamoDB) are required")
@@ -52,8 +71,14 @@ class EnrollmentService:
         self.s3 = s3_client
         self.rekognition = rekognition_client
         self.db = DatabaseManager(
-            aws_dynamodb_client=dynamodb_client, aws_s3_client=s3_client
+            aws_dynamodb_client=dynamodb_client,
+            aws_s3_client=s3_client,
+            redis_client=redis_client,
+            person_cache_ttl=person_cache_ttl,
         )
+        self.best_shot_count = max(1, best_shot_count)
+        self.scoring_workers = max(1, scoring_workers)
+        self.index_concurrency = max(1, index_concurrency)
 
         logger.info("EnrollmentService initialized: AWS Cloud Only")
 
@@ -95,6 +120,7 @@ class EnrollmentService:
             "message": "",
             "duplicate_found": False,
             "duplicate_info": None,
+            "already_enrolled": False,
         }
 
         # Check if AWS services are configured
@@ -108,117 +134,129 @@ class EnrollmentService:
             logger.error(f"AWS configuration check failed: {e}")
             return result
 
+        # A retried upload of the same image returns the enrollment it already
+        # produced instead of creating another person and face vector
+        content_hash = self._content_hash(image_bytes)
+        existing = self._find_enrolled([content_hash]).get(content_hash)
+        if existing:
+            return self._replay_result(result, existing)
+
+        # Steps run as a small dependency graph:
+        #   1. detect_faces (+ quality check) || duplicate search   (read-only)
+        #   2. S3 upload || Rekognition index_face                 (side effects)
+        #   3. person + embedding records in one transactional write
+        # Every side effect that succeeds registers an undo; any later failure
+        # runs them so a failed enrollment leaves nothing behind.
+        person_id = f"person_{uuid.uuid4().hex[:12]}"
+        image_key = f"enrollments/{user_name.lower().replace(' ', '_')}_{uuid.uuid4().hex[:8]}.jpg"
+        compensations: List[Tuple[str, Callable[[], Dict]]] = []
+
         try:
-            # Step 0: Validate image quality (anti-spoofing)
-            if QUALITY_VALIDATOR_AVAILABLE:
-                logger.info("🔍 Validating image quality...")
-                validator = get_validator()
-                
-                # First detect face to get face details
-                detect_result = self.rekognition.detect_faces(image_bytes)
-                
-                face_details = None
-                if detect_result.get("success") and detect_result.get("faces"):
-                    face_details = detect_result["faces"][0]
-                
-                quality_result = validator.validate_image_quality(
-                    image_bytes, 
-                    face_details
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="enroll") as pool:
+                # Step 1: quality validation and duplicate check, concurrently
+                detect_future = (
+                    pool.submit(self.rekognition.detect_faces, image_bytes)
+                    if QUALITY_VALIDATOR_AVAILABLE
+                    else None
                 )
-                
-                if not quality_result["valid"]:
-                    result["message"] = f"⚠️ Image quality validation failed: {', '.join(quality_result['warnings'])}"
-                    result["quality_check"] = quality_result
-                    logger.warning(result["message"])
-                    return result
-                
-                logger.info("✅ Image quality validation passed")
-                result["quality_check"] = quality_result
-            
-            # Step 1: Check duplicate (optional)
-            if check_duplicate:
-                logger.info("🔍 Checking for duplicate faces...")
-                duplicate_result = self._check_duplicate(
-                    image_bytes, duplicate_threshold
+                duplicate_future = (
+                    pool.submit(self._check_duplicate, image_bytes, duplicate_threshold)
+                    if check_duplicate
+                    else None
                 )
 
-                if duplicate_result["duplicate_found"]:
-                    result["duplicate_found"] = True
-                    result["duplicate_info"] = duplicate_result["matches"]
-                    result["message"] = "⚠️ Found duplicate faces in collection"
-                    logger.warning(
-                        f"Found {len(duplicate_result['matches'])} duplicate(s)"
+                if detect_future is not None:
+                    logger.info("🔍 Validating image quality...")
+                    detect_result = detect_future.result()
+                    face_details = None
+                    if detect_result.get("success") and detect_result.get("faces"):
+                        face_details = detect_result["faces"][0]
+
+                    quality_result = get_validator().validate_image_quality(
+                        image_bytes, face_details
                     )
-                    return result
+                    result["quality_check"] = quality_result
+                    if not quality_result["valid"]:
+                        result["message"] = (
+                            f"⚠️ Image quality validation failed: {', '.join(quality_result['warnings'])}"
+                        )
+                        logger.warning(result["message"])
+                        return result
+                    logger.info("✅ Image quality validation passed")
+
+                if duplicate_future is not None:
+                    logger.info("🔍 Checking for duplicate faces...")
+                    duplicate_result = duplicate_future.result()
+                    if duplicate_result["duplicate_found"]:
+                        result["duplicate_found"] = True
+                        result["duplicate_info"] = duplicate_result["matches"]
+                        result["message"] = "⚠️ Found duplicate faces in collection"
+                        logger.warning(
+                            f"Found {len(duplicate_result['matches'])} duplicate(s)"
+                        )
+                        return result
+
+                # Step 2: upload to S3 while indexing the face
+                logger.info("📤 Uploading image to S3 and indexing face in Rekognition...")
+                upload_future = pool.submit(self.s3.upload_bytes, image_bytes, image_key)
+                index_future = pool.submit(
+                    self.rekognition.index_face,
+                    image=image_bytes,
+                    external_image_id=person_id,
+                    max_faces=1,
+                )
+                s3_result = self._step_result(upload_future)
+                rekog_result = self._step_result(index_future)
 
-            # Step 2: Upload image to S3
-            logger.info("📤 Uploading image to S3...")
-            image_key = f"enrollments/{user_name.lower().replace(' ', '_')}_{uuid.uuid4().hex[:8]}.jpg"
-            s3_result = self.s3.upload_bytes(image_bytes, image_key)
+            if s3_result["success"]:
+                compensations.append(
+                    (f"S3 object {image_key}", lambda: self.s3.delete_image(image_key))
+                )
+            if rekog_result["success"]:
+                face_id = rekog_result["face_id"]
+                compensations.append(
+                    (f"Rekognition face {face_id}", lambda: self.rekognition.delete_faces([face_id]))
+                )
 
             if not s3_result["success"]:
-                result["message"] = (
-                    f"❌ Failed to upload image: {s3_result.get('error')}"
-                )
+                self._rollback(compensations)
+                result["message"] = f"❌ Failed to upload image: {s3_result.get('error')}"
+                return result
+            if not rekog_result["success"]:
+                self._rollback(compensations)
+                result["message"] = f"❌ Failed to index face: {rekog_result.get('error')}"
                 return result
 
             image_url = s3_result["s3_url"]
+            quality_score = rekog_result.get("quality_score", 0.0)
             logger.info(f"✅ Image uploaded: {image_url}")
+            logger.info(f"✅ Face indexed: {face_id} (quality: {quality_score:.2f})")
 
-            # Step 3: Create person in DynamoDB first
-            logger.info("💾 Creating person profile in DynamoDB...")
-            person_id = f"person_{uuid.uuid4().hex[:12]}"
-
-            person_result = self.db.create_person(
+            # Step 3: person and embedding records, written together
+            logger.info("💾 Saving person profile and embedding metadata...")
+            person_result = self.db.create_person_with_embedding(
+                person_id=person_id,
                 user_name=user_name,
+                face_id=face_id,
+                image_url=image_url,
+                quality_score=quality_score,
                 gender=gender,
                 birth_year=birth_year,
                 hometown=hometown,
                 residence=residence,
-                person_id=person_id,
+                content_hash=content_hash,
             )
-
             if not person_result["success"]:
+                self._rollback(compensations)
+                # A concurrent retry of the same image may have committed first
+                existing = self._find_enrolled([content_hash]).get(content_hash)
+                if existing:
+                    return self._replay_result(result, existing)
                 result["message"] = (
                     f"❌ Failed to create person: {person_result.get('message')}"
                 )
                 return result
 
-            # Step 4: Index face in Rekognition
-            logger.info("🤖 Indexing face in Rekognition collection...")
-            rekog_result = self.rekognition.index_face(
-                image=image_bytes,
-                external_image_id=person_id,
-                max_faces=1,
-            )
-
-            if not rekog_result["success"]:
-                # Rollback: Delete person from DynamoDB
-                self.db.delete_person(person_id)
-                result["message"] = (
-                    f"❌ Failed to index face: {rekog_result.get('error')}"
-                )
-                return result
-
-            face_id = rekog_result["face_id"]
-            quality_score = rekog_result.get("quality_score", 0.0)
-            logger.info(f"✅ Face indexed: {face_id} (quality: {quality_score:.2f})")
-
-            # Step 5: Save embedding metadata to DynamoDB
-            logger.info("💾 Saving embedding metadata...")
-            embedding_result = self.db.add_embedding(
-                person_id=person_id,
-                face_id=face_id,
-                image_url=image_url,
-                quality_score=quality_score,
-            )
-
-            if not embedding_result["success"]:
-                logger.warning(
-                    f"⚠️ Failed to save embedding metadata: {embedding_result.get('error')}"
-                )
-                # Continue anyway, face is already indexed
-
             # Success!
             result["success"] = True
             result["person_id"] = person_id
@@ -234,9 +272,145 @@ class EnrollmentService:
 
         except Exception as e:
             logger.error(f"❌ Enrollment error: {e}", exc_info=True)
+            self._rollback(compensations)
             result["message"] = f"❌ Enrollment failed: {str(e)}"
             return result
 
+    @staticmethod
+    def _content_hash(image_bytes: bytes) -> str:
+        """Idempotency key of an (already normalized) image."""
+        return hashlib.sha256(image_bytes).hexdigest()
+
+    def _find_enrolled(self, content_hashes: List[str]) -> Dict[str, Dict]:
+        """
+        Enrolled images by content hash, skipping people deleted since
+
+        Records pointing at a deleted person are removed from the hash index
+        so the image can be enrolled again. A record is only dropped when a
+        complete person lookup confirms the person is gone; if the lookup
+        fails or leaves the person unprocessed, the record is kept and
+        returned as enrolled.
+        """
+        try:
+            records = self.db.find_enrolled_images(content_hashes)
+            if not records:
+                return {}
+            person_ids = list(
+                dict.fromkeys(r["person_id"] for r in records.values() if not r.get("pending"))
+            )
+            lookup = self.db.lookup_people(person_ids, attributes=["user_name"])
+        except Exception as e:
+            logger.warning(f"⚠️ Image hash lookup failed: {e}")
+            return {}
+
+        people = {person["person_id"]: person for person in lookup.get("people") or []}
+        if lookup["success"]:
+            unconfirmed = set(lookup.get("unprocessed") or [])
+        else:
+            logger.warning(f"⚠️ Person lookup for image hashes failed: {lookup.get('error')}")
+            unconfirmed = set(person_ids)
+
+        found = {}
+        for content_hash, record in records.items():
+            if record.get("pending"):
+                # Claimed by an enrollment still indexing the image; a claim
+                # left behind by a crashed one is released after a while
+                if self._claim_expired(record):
+                    logger.warning(f"⚠️ Releasing expired claim on image hash for {record['person_id']}")
+                    self.db.forget_enrolled_image(content_hash, only_pending=True)
+                continue
+            person = people.get(record["person_id"])
+            if person:
+                found[content_hash] = {**record, "user_name": person.get("user_name")}
+            elif record["person_id"] in unconfirmed:
+                # Cannot tell whether the person still exists: keep the record
+                found[content_hash] = {**record, "user_name": None}
+            else:
+                logger.warning(
+                    f"⚠️ Dropping stale image hash of deleted person {record['person_id']}"
+                )
+                self.db.forget_enrolled_image(content_hash)
+        return found
+
+    def _claim_expired(self, record: Dict) -> bool:
+        """Whether a pending claim is older than CLAIM_TIMEOUT_SECONDS."""
+        try:
+            claimed_at = datetime.fromisoformat(record["created_at"])
+        except (KeyError, TypeError, ValueError):
+            return True
+        if claimed_at.tzinfo is None:
+            claimed_at = claimed_at.astimezone()
+        return (datetime.now(timezone.utc) - claimed_at).total_seconds() > self.CLAIM_TIMEOUT_SECONDS
+
+    def _release_claims(self, content_hashes: List[str]) -> None:
+        """Give back image hash claims of images that were not enrolled."""
+        for content_hash in content_hashes:
+            outcome = self.db.forget_enrolled_image(content_hash, only_pending=True)
+            if not outcome.get("success") and not outcome.get("finalized"):
+                logger.error(f"❌ Failed to release image hash claim: {outcome.get('error')}")
+
+    @staticmethod
+    def _replay_result(result: Dict, record: Dict) -> Dict:
+        """Fill an enroll_face result from an existing enrollment of the image."""
+        result["success"] = True
+        result["already_enrolled"] = True
+        result["person_id"] = record["person_id"]
+        result["face_id"] = record["face_id"]
+        result["image_url"] = record.get("image_url")
+        result["quality_score"] = float(record.get("quality_score", 0.0))
+        result["message"] = (
+            f"✅ Already enrolled: {record.get('user_name') or result['user_name']} "
+            f"(ID: {record['person_id']})"
+        )
+        logger.info(f"♻️ Image already enrolled -> {record['person_id']}, skipping")
+        return result
+
+    @staticmethod
+    def _step_result(future: Future) -> Dict:
+        """Result dict of a pipeline step; an exception becomes a failed result."""
+        try:
+            return future.result()
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    @staticmethod
+    def _rollback(compensations: List[Tuple[str, Callable[[], Dict]]]) -> None:
+        """Undo completed side effects, newest first (best-effort, logs leftovers)."""
+        for name, undo in reversed(compensations):
+            try:
+                outcome = undo()
+                if outcome.get("success"):
+                    logger.warning(f"⚠️ Rolled back {name}")
+                else:
+                    logger.error(f"❌ Rollback of {name} failed: {outcome.get('error')}")
+            except Exception as e:
+                logger.error(f"❌ Rollback of {name} failed: {e}")
+        compensations.clear()
+
+    async def enroll_face_async(
+        self,
+        image_bytes: bytes,
+        user_name: str,
+        gender: str = "",
+        birth_year: str = "",
+        hometown: str = "",
+        residence: str = "",
+        check_duplicate: bool = True,
+        duplicate_threshold: float = 95.0,
+    ) -> Dict:
+        """Async variant of enroll_face, run on the shared AWS executor."""
+        return await run_blocking(
+            self.enroll_face,
+            image_bytes=image_bytes,
+            user_name=user_name,
+            gender=gender,
+            birth_year=birth_year,
+            hometown=hometown,
+            residence=residence,
+            check_duplicate=check_duplicate,
+            duplicate_threshold=duplicate_threshold,
+        )
+
     def _check_duplicate(self, image_bytes: bytes, threshold: float) -> Dict:
         """
         Check if face already exists in Rekognition collection
@@ -249,39 +423,103 @@ class EnrollmentService:
             Dict with duplicate check result
         """
         try:
-            search_result = self.rekognition.search_faces(
-                image=image_bytes,
-                max_faces=5,
-                face_match_threshold=threshold,
-            )
+            candidates = self._search_duplicate_candidates(image_bytes, threshold)
+            return self._resolve_duplicates([candidates])[0]
 
-            if search_result["success"] and search_result["matches"]:
-                # Found potential duplicates
-                matches = []
-                for match in search_result["matches"]:
-                    person_id = match.get("external_image_id")
-                    if person_id:
-                        person = self.db.get_person(person_id)
-                        if person:
-                            matches.append(
-                                {
-                                    "person_id": person_id,
-                                    "user_name": person.get("user_name", "Unknown"),
-                                    "similarity": match.get("similarity", 0.0),
-                                    "face_id": match.get("face_id"),
-                                }
-                            )
+        except Exception as e:
+            logger.error(f"❌ Duplicate check error: {e}")
+            return {"duplicate_found": False, "matches": []}
 
-                return {
-                    "duplicate_found": len(matches) > 0,
-                    "matches": matches,
-                }
+    def check_duplicates(self, images: List[bytes], threshold: float = 95.0) -> List[Dict]:
+        """
+        Check many images for faces already in the collection
 
-            return {"duplicate_found": False, "matches": []}
+        Runs one Rekognition search per image concurrently (at most
+        ``index_concurrency`` at a time), then resolves every matched
+        person with a single batched metadata lookup.
 
+        Args:
+            images: List of image bytes
+            threshold: Similarity threshold (0-100)
+
+        Returns:
+            One duplicate check result per image, in input order
+        """
+        if not images:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.index_concurrency, len(images)),
+            thread_name_prefix="enroll-dup",
+        ) as pool:
+            futures = [
+                pool.submit(self._search_duplicate_candidates, image_bytes, threshold)
+                for image_bytes in images
+            ]
+            candidates = []
+            for idx, future in enumerate(futures, 1):
+                try:
+                    candidates.append(future.result())
+                except Exception as e:
+                    logger.error(f"❌ Duplicate check error (image {idx}): {e}")
+                    candidates.append([])
+
+        try:
+            return self._resolve_duplicates(candidates)
         except Exception as e:
             logger.error(f"❌ Duplicate check error: {e}")
-            return {"duplicate_found": False, "matches": []}
+            return [{"duplicate_found": False, "matches": []} for _ in images]
+
+    async def check_duplicates_async(
+        self, images: List[bytes], threshold: float = 95.0
+    ) -> List[Dict]:
+        """Async variant of check_duplicates, run on the shared AWS executor."""
+        return await run_blocking(self.check_duplicates, images, threshold)
+
+    def _search_duplicate_candidates(self, image_bytes: bytes, threshold: float) -> List[Dict]:
+        """Rekognition matches for one image (empty if the search failed)."""
+        search_result = self.rekognition.search_faces(
+            image=image_bytes,
+            max_faces=5,
+            face_match_threshold=threshold,
+        )
+        if search_result["success"]:
+            return search_result["matches"] or []
+        return []
+
+    def _resolve_duplicates(self, candidate_lists: List[List[Dict]]) -> List[Dict]:
+        """Attach person metadata to Rekognition matches with one batch lookup."""
+        person_ids = list(
+            dict.fromkeys(
+                match["external_image_id"]
+                for candidates in candidate_lists
+                for match in candidates
+                if match.get("external_image_id")
+            )
+        )
+        people = {}
+        if person_ids:
+            people = {
+                person["person_id"]: person
+                for person in self.db.get_people_batch(person_ids, attributes=["user_name"])
+            }
+
+        results = []
+        for candidates in candidate_lists:
+            matches = []
+            for match in candidates:
+                person = people.get(match.get("external_image_id"))
+                if person:
+                    matches.append(
+                        {
+                            "person_id": person["person_id"],
+                            "user_name": person.get("user_name", "Unknown"),
+                            "similarity": match.get("similarity", 0.0),
+                            "face_id": match.get("face_id"),
+                        }
+                    )
+            results.append({"duplicate_found": len(matches) > 0, "matches": matches})
+        return results
 
     def enroll_multiple_faces(
         self,
@@ -292,10 +530,21 @@ class EnrollmentService:
         birth_year: str = "",
         hometown: str = "",
         residence: str = "",
+        parallel: bool = False,
+        top_k: Optional[int] = None,
     ) -> Dict:
         """
         Enroll multiple faces for the same person
 
+        Images already enrolled (same content hash) are not uploaded or
+        indexed again; if they belong to an existing person, the new images
+        are added to that person instead of creating another one.
+
+        In parallel mode every image is scored locally first (quality and
+        appearance diversity, see ImageQualityValidator.select_best_shots)
+        and only the best ``top_k`` are uploaded and indexed, concurrently
+        but at most ``index_concurrency`` at a time.
+
         Args:
             event: Lambda event for authorization
             image_bytes_list: List of image bytes
@@ -304,6 +553,8 @@ class EnrollmentService:
             birth_year: Birth year
             hometown: Hometown
             residence: Current residence
+            parallel: Select best shots and enroll them concurrently
+            top_k: Images to keep in parallel mode (default best_shot_count)
 
         Returns:
             Dict with enrollment results
@@ -324,93 +575,114 @@ class EnrollmentService:
             "total_images": len(image_bytes_list),
             "enrolled_count": 0,
             "failed_count": 0,
+            "skipped_count": 0,
+            "already_enrolled": False,
             "results": [],
         }
 
-        # Create person first (only once)
-        person_id = f"person_{uuid.uuid4().hex[:12]}"
-        person_result = self.db.create_person(
-            user_name=user_name,
-            gender=gender,
-            birth_year=birth_year,
-            hometown=hometown,
-            residence=residence,
-            person_id=person_id,
-        )
-
-        if not person_result["success"]:
-            results["message"] = "❌ Failed to create person profile"
+        # Pick the images to enroll before anything is written
+        selected = list(range(1, len(image_bytes_list) + 1))
+        if parallel:
+            selected = self._select_best_shots(image_bytes_list, top_k or self.best_shot_count)
+            if not selected:
+                results["message"] = "❌ No usable images to enroll"
+                return results
+            results["skipped_count"] = len(image_bytes_list) - len(selected)
+
+        # Split off images enrolled before (retries) and repeats within the request
+        hashes = {idx: self._content_hash(image_bytes_list[idx - 1]) for idx in selected}
+        known = self._find_enrolled(list(dict.fromkeys(hashes.values())))
+        known_people = {record["person_id"] for record in known.values()}
+        if len(known_people) > 1:
+            results["message"] = "❌ Images are already enrolled under different people"
             return results
 
-        results["person_id"] = person_id
-
-        # Enroll each face
-        for idx, image_bytes in enumerate(image_bytes_list, 1):
-            logger.info("📸 Enrolling face %s/%s...", idx, len(image_bytes_list))
-
-            try:
-                # Upload to S3
-                image_key = (
-                    f"enrollments/{person_id}/face_{idx}_{uuid.uuid4().hex[:8]}.jpg"
-                )
-                s3_result = self.s3.upload_bytes(image_bytes, image_key)
-
-                if not s3_result["success"]:
-                    results["failed_count"] += 1
-                    results["results"].append(
-                        {
-                            "image_index": idx,
-                            "success": False,
-                            "error": "S3 upload failed",
-                        }
-                    )
-                    continue
-
-                # Index face in Rekognition
-                rekog_result = self.rekognition.index_face(
-                    image=image_bytes,
-                    external_image_id=person_id,
-                    max_faces=1,
-                )
-
-                if not rekog_result["success"]:
-                    results["failed_count"] += 1
-                    results["results"].append(
-                        {
-                            "image_index": idx,
-                            "success": False,
-                            "error": "Rekognition indexing failed",
-                        }
-                    )
-                    continue
-
-                # Save embedding metadata
-                self.db.add_embedding(
-                    person_id=person_id,
-                    face_id=rekog_result["face_id"],
-                    image_url=s3_result["url"],
-                    quality_score=rekog_result.get("quality_score", 0.0),
-                )
-
-                results["enrolled_count"] += 1
-                results["results"].append(
+        face_results = []
+        pending = []
+        seen = set()
+        for idx in selected:
+            content_hash = hashes[idx]
+            if content_hash in seen:
+                results["skipped_count"] += 1
+                continue
+            seen.add(content_hash)
+            if content_hash in known:
+                face_results.append(
                     {
                         "image_index": idx,
                         "success": True,
-                        "face_id": rekog_result["face_id"],
+                        "face_id": known[content_hash]["face_id"],
+                        "already_enrolled": True,
                     }
                 )
+            else:
+                pending.append(idx)
+
+        enrolled_before = bool(known_people)
+        person_id = known_people.pop() if enrolled_before else f"person_{uuid.uuid4().hex[:12]}"
+
+        # Claim the new images before anything is created or indexed: of two
+        # concurrent retries only one gets them, the other writes nothing
+        claimed = False
+        if pending:
+            claim = self.db.claim_images([hashes[idx] for idx in pending], person_id)
+            if claim["success"]:
+                claimed = True
+            elif claim.get("exists"):
+                results["message"] = "⚠️ Images are being enrolled by another request, retry later"
+                logger.warning(results["message"])
+                return results
+            else:
+                logger.debug(f"Image hash claim unavailable: {claim.get('error')}")
+
+        if enrolled_before:
+            results["already_enrolled"] = True
+            logger.info(f"♻️ {len(face_results)} image(s) already enrolled -> {person_id}")
+        else:
+            # Create person first (only once)
+            person_result = self.db.create_person(
+                user_name=user_name,
+                gender=gender,
+                birth_year=birth_year,
+                hometown=hometown,
+                residence=residence,
+                person_id=person_id,
+            )
 
-            except Exception as e:
-                logger.error(f"❌ Error enrolling face {idx}: {e}")
+            if not person_result["success"]:
+                if claimed:
+                    self._release_claims([hashes[idx] for idx in pending])
+                results["message"] = "❌ Failed to create person profile"
+                return results
+
+        results["person_id"] = person_id
+
+        def enroll(idx: int) -> Dict:
+            return self._enroll_image(
+                person_id, idx, image_bytes_list[idx - 1], len(image_bytes_list), hashes[idx]
+            )
+
+        if parallel and pending:
+            with ThreadPoolExecutor(
+                max_workers=min(self.index_concurrency, len(pending)),
+                thread_name_prefix="enroll-index",
+            ) as pool:
+                face_results.extend(pool.map(enroll, pending))
+        else:
+            face_results.extend(enroll(idx) for idx in pending)
+
+        if claimed:
+            # Failed images give their claim back so a retry can enroll them
+            self._release_claims(
+                [hashes[r["image_index"]] for r in face_results if not r["success"]]
+            )
+
+        for face_result in sorted(face_results, key=lambda r: r["image_index"]):
+            if face_result["success"]:
+                results["enrolled_count"] += 1
+            else:
                 results["failed_count"] += 1
-                results["results"].append(
-                    {
-                        "image_index": idx,
-                        "success": False,
-                        "error": str(e),
-                    }
-                )
+            results["results"].append(face_result)
 
         results["success"] = results["enrolled_count"] > 0
         results["message"] = (
@@ -418,3 +690,108 @@ class EnrollmentService:
         )
 
         return results
+
+    def _select_best_shots(self, image_bytes_list: List[bytes], top_k: int) -> List[int]:
+        """Score images locally on a worker pool; return 1-based indices to enroll."""
+        if not QUALITY_VALIDATOR_AVAILABLE:
+            logger.warning("⚠️ Quality validator unavailable, enrolling the first images as-is")
+            return list(range(1, min(top_k, len(image_bytes_list)) + 1))
+
+        validator = get_validator()
+        # OpenCV releases the GIL, so threads score images in parallel
+        with ThreadPoolExecutor(
+            max_workers=min(self.scoring_workers, max(1, len(image_bytes_list))),
+            thread_name_prefix="enroll-score",
+        ) as pool:
+            scores = list(pool.map(validator.score_enrollment_image, image_bytes_list))
+
+        chosen = validator.select_best_shots(scores, top_k)
+        logger.info(
+            f"📊 Selected {len(chosen)}/{len(image_bytes_list)} images: "
+            + ", ".join(f"#{i + 1} ({scores[i]['quality_score']:.2f})" for i in chosen)
+        )
+        return sorted(i + 1 for i in chosen)
+
+    def _enroll_image(
+        self,
+        person_id: str,
+        idx: int,
+        image_bytes: bytes,
+        total: int,
+        content_hash: Optional[str] = None,
+    ) -> Dict:
+        """Upload, index and record one image of a multi-image enrollment.
+
+        A failed step undoes the earlier ones (see _rollback), so a failed
+        image leaves no S3 object or Rekognition face without an embedding.
+        """
+        logger.info("📸 Enrolling face %s/%s...", idx, total)
+        compensations: List[Tuple[str, Callable[[], Dict]]] = []
+
+        try:
+            # Upload to S3
+            image_key = (
+                f"enrollments/{person_id}/face_{idx}_{uuid.uuid4().hex[:8]}.jpg"
+            )
+            s3_result = self.s3.upload_bytes(image_bytes, image_key)
+
+            if not s3_result["success"]:
+                return {
+                    "image_index": idx,
+                    "success": False,
+                    "error": "S3 upload failed",
+                }
+            compensations.append(
+                (f"S3 object {image_key}", lambda: self.s3.delete_image(image_key))
+            )
+
+            # Index face in Rekognition
+            rekog_result = self.rekognition.index_face(
+                image=image_bytes,
+                external_image_id=person_id,
+                max_faces=1,
+            )
+
+            if not rekog_result["success"]:
+                self._rollback(compensations)
+                return {
+                    "image_index": idx,
+                    "success": False,
+                    "error": "Rekognition indexing failed",
+                }
+            face_id = rekog_result["face_id"]
+            compensations.append(
+                (f"Rekognition face {face_id}", lambda: self.rekognition.delete_faces([face_id]))
+            )
+
+            # Save embedding metadata (also finalizes the image's hash claim)
+            embedding_result = self.db.add_embedding(
+                person_id=person_id,
+                face_id=face_id,
+                image_url=s3_result["s3_url"],
+                quality_score=rekog_result.get("quality_score", 0.0),
+                content_hash=content_hash,
+            )
+
+            if not embedding_result["success"]:
+                self._rollback(compensations)
+                return {
+                    "image_index": idx,
+                    "success": False,
+                    "error": f"Failed to save embedding: {embedding_result.get('error')}",
+                }
+
+            return {
+                "image_index": idx,
+                "success": True,
+                "face_id": face_id,
+            }
+
+        except Exception as e:
+            logger.error(f"❌ Error enrolling face {idx}: {e}")
+            self._rollback(compensations)
+            return {
+                "image_index": idx,
+                "success": False,
+                "error": str(e),
+            }
@@ -0,0 +1,82 @@
+"""
+Shared executor for blocking AWS SDK calls.
+
+boto3 is synchronous, so calling it from an ``async def`` route blocks the
+uvicorn event loop for the full Rekognition/DynamoDB round trip. The async
+service variants hand that work to this dedicated, sized thread pool instead
+of the loop's default executor, so its capacity can be tuned per worker
+(AWS_EXECUTOR_MAX_WORKERS) without affecting anything else.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 32
+
+_executor: Optional[ThreadPoolExecutor] = None
+_max_workers: int = DEFAULT_MAX_WORKERS
+_lock = threading.Lock()
+
+
+def configure_executor(max_workers: int) -> None:
+    """Set the executor size. Replaces an idle executor if already created.
+
+    Args:
+        max_workers: Maximum number of concurrent blocking calls
+    """
+    global _executor, _max_workers
+
+    with _lock:
+        _max_workers = max(1, max_workers)
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+    logger.info(f"AWS executor configured: max_workers={_max_workers}")
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the shared executor, creating it on first use."""
+    global _executor
+
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_max_workers, thread_name_prefix="aws-io"
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking callable on the shared executor and await its result.
+
+    Args:
+        func: Synchronous callable (typically a boto3-backed service method)
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    """Shut down the shared executor (called on application shutdown)."""
+    global _executor
+
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
+            logger.info("✅ AWS executor shut down")
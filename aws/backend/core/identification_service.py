@@ -9,18 +9,28 @@ Features:
 4. Save match results to DynamoDB
 5. Support for video stream identification
 6. Redis caching for sub-50ms latency
+7. Perceptual-hash cache for near-identical consecutive frames
+8. Batch identification with concurrent Rekognition searches
+9. Write-behind persistence of match results
+10. Streaming video identification with scene-change sampling
 """
 
 import logging
 import uuid
 import hashlib
-from datetime import datetime
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional
 
 from .database_manager import DatabaseManager
+from .executor import run_blocking
+from .match_recorder import build_match_items
 
 logger = logging.getLogger(__name__)
 
+# Person fields returned in identification results (DynamoDB projection)
+PERSON_ATTRIBUTES = ["person_id", "user_name", "gender", "birth_year", "hometown", "residence"]
+
 
 class IdentificationService:
     """AWS Cloud-only Identification Service with Redis Caching"""
@@ -31,6 +41,10 @@ class IdentificationService:
         dynamodb_client,
         s3_client=None,
         redis_client=None,
+        batch_max_workers: int = 8,
+        near_duplicate_cache=None,
+        person_cache_ttl: int = 1800,
+        match_recorder=None,
     ):
         """
         Args:
@@ -38,6 +52,12 @@ class IdentificationService:
             dynamodb_client: DynamoDB client instance (required)
             s3_client: S3 client instance (optional, for saving results)
             redis_client: Redis client instance (optional, for caching)
+            batch_max_workers: Maximum concurrent Rekognition searches per batch
+            near_duplicate_cache: NearDuplicateCache instance (optional, reuses
+                results for near-identical frames)
+            person_cache_ttl: TTL in seconds for person metadata cached in Redis
+            match_recorder: MatchRecorder instance (optional, persists match
+                results off the request path)
         """
         if not rekognition_client or not dynamodb_client:
             raise ValueError("Rekognition and DynamoDB clients are required")
@@ -45,8 +65,14 @@ class IdentificationService:
         self.rekognition = rekognition_client
         self.s3 = s3_client
         self.redis = redis_client
+        self.batch_max_workers = max(1, batch_max_workers)
+        self.near_duplicate_cache = near_duplicate_cache
+        self.match_recorder = match_recorder
         self.db = DatabaseManager(
-            aws_dynamodb_client=dynamodb_client, aws_s3_client=s3_client
+            aws_dynamodb_client=dynamodb_client,
+            aws_s3_client=s3_client,
+            redis_client=redis_client,
+            person_cache_ttl=person_cache_ttl,
         )
         
         cache_status = "enabled" if redis_client and redis_client.enabled else "disabled"
@@ -63,6 +89,7 @@ class IdentificationService:
         confidence_threshold: float = 80.0,  # Rekognition uses 0-100
         save_result: bool = True,
         use_cache: bool = True,
+        site_id: Optional[str] = None,
     ) -> Dict:
         """
         Identify faces from image using AWS Rekognition with Redis caching
@@ -73,6 +100,7 @@ class IdentificationService:
             confidence_threshold: Minimum confidence threshold (0-100)
             save_result: Save match result to DynamoDB
             use_cache: Use Redis cache for faster lookups
+            site_id: Site/camera the image came from (stored on the matches)
 
         Returns:
             Dict with identification result (with cache_hit indicator)
@@ -86,6 +114,19 @@ class IdentificationService:
             "cache_hit": False,
         }
 
+        # Near-identical frame seen recently? (local, no network hop)
+        phash = None
+        if use_cache and self.near_duplicate_cache is not None:
+            phash = self.near_duplicate_cache.hash_image(image_bytes)
+            cached_result = self.near_duplicate_cache.get(phash)
+            if cached_result:
+                logger.info("✅ Near-duplicate cache hit")
+                cached_result["cache_hit"] = True
+                # The person was seen in this frame too, so the match is recorded
+                if save_result and cached_result["faces"]:
+                    self._save_match_results(image_bytes, cached_result["faces"], site_id)
+                return cached_result
+
         # Try cache first
         if use_cache and self.redis and self.redis.enabled:
             image_hash = self._compute_image_hash(image_bytes)
@@ -130,36 +171,10 @@ class IdentificationService:
                 return result
 
             logger.info(f"📊 Retrieving metadata for {len(person_ids)} match(es) in a single batch...")
-            people_data = self.db.get_people_batch(person_ids)
+            people_data = self.db.get_people_batch(person_ids, attributes=PERSON_ATTRIBUTES)
             people_map = {p["person_id"]: p for p in people_data}
 
-            faces = []
-            for match in matches:
-                person_id = match.get("external_image_id")
-                if not person_id:
-                    continue
-
-                person = people_map.get(person_id)
-                if person:
-                    similarity = match.get("similarity", 0.0)
-                    face_info = {
-                        "person_id": person_id,
-                        "user_name": person.get("user_name", "Unknown"),
-                        "gender": person.get("gender", ""),
-                        "birth_year": person.get("birth_year", ""),
-                        "hometown": person.get("hometown", ""),
-                        "residence": person.get("residence", ""),
-                        "confidence": similarity / 100.0,  # Convert to 0-1 scale
-                        "similarity": similarity,
-                        "face_id": match.get("face_id"),
-                        "match_time": datetime.now().isoformat(),
-                    }
-                    faces.append(face_info)
-                    logger.info(
-                        f"✅ Match: {person.get('user_name')} (confidence: {similarity:.1f}%)"
-                    )
-                else:
-                    logger.warning(f"⚠️ Person not found in DynamoDB (batch query): {person_id}")
+            faces = self._build_faces(matches, people_map)
 
             result["faces"] = faces
             result["success"] = len(faces) > 0
@@ -172,9 +187,12 @@ class IdentificationService:
                 self.redis.set_search_result(image_hash, result, ttl=300)
                 logger.info(f"✅ Cached search result for {image_hash}")
 
+            if phash is not None and faces:
+                self.near_duplicate_cache.set(phash, result)
+
             # Save match results to DynamoDB
             if save_result and faces:
-                self._save_match_results(image_bytes, faces)
+                self._save_match_results(image_bytes, faces, site_id)
 
             return result
 
@@ -183,6 +201,291 @@ class IdentificationService:
             result["message"] = f"❌ Identification failed: {str(e)}"
             return result
 
+    async def identify_face_async(
+        self,
+        image_bytes: bytes,
+        max_results: int = 5,
+        confidence_threshold: float = 80.0,
+        save_result: bool = True,
+        use_cache: bool = True,
+        site_id: Optional[str] = None,
+    ) -> Dict:
+        """Async variant of identify_face, run on the shared AWS executor."""
+        return await run_blocking(
+            self.identify_face,
+            image_bytes=image_bytes,
+            max_results=max_results,
+            confidence_threshold=confidence_threshold,
+            save_result=save_result,
+            use_cache=use_cache,
+            site_id=site_id,
+        )
+
+    def _build_faces(self, matches: List[Dict], people_map: Dict[str, Dict]) -> List[Dict]:
+        """
+        Join Rekognition matches with person metadata
+
+        Args:
+            matches: Matches returned by RekognitionClient.search_faces
+            people_map: Person records keyed by person_id
+
+        Returns:
+            List of face info dicts (matches without metadata are skipped)
+        """
+        faces = []
+        for match in matches:
+            person_id = match.get("external_image_id")
+            if not person_id:
+                continue
+
+            person = people_map.get(person_id)
+            if person:
+                similarity = match.get("similarity", 0.0)
+                face_info = {
+                    "person_id": person_id,
+                    "user_name": person.get("user_name", "Unknown"),
+                    "gender": person.get("gender", ""),
+                    "birth_year": person.get("birth_year", ""),
+                    "hometown": person.get("hometown", ""),
+                    "residence": person.get("residence", ""),
+                    "confidence": similarity / 100.0,  # Convert to 0-1 scale
+                    "similarity": similarity,
+                    "face_id": match.get("face_id"),
+                    "match_time": datetime.now().isoformat(),
+                }
+                faces.append(face_info)
+                logger.info(
+                    f"✅ Match: {person.get('user_name')} (confidence: {similarity:.1f}%)"
+                )
+            else:
+                logger.warning(f"⚠️ Person not found in DynamoDB (batch query): {person_id}")
+
+        return faces
+
+    def identify_faces_batch(
+        self,
+        images: List[bytes],
+        max_results: int = 5,
+        confidence_threshold: float = 80.0,
+        save_result: bool = True,
+        use_cache: bool = True,
+        site_id: Optional[str] = None,
+    ) -> Dict:
+        """
+        Identify faces in several images at once
+
+        Rekognition searches run concurrently on a bounded thread pool, then
+        every matched person is resolved with a single de-duplicated
+        BatchGetItem call.
+
+        Args:
+            images: List of image bytes
+            max_results: Maximum number of results per image
+            confidence_threshold: Minimum confidence threshold (0-100)
+            save_result: Save match results to DynamoDB
+            use_cache: Use Redis cache for faster lookups
+            site_id: Site/camera the images came from (stored on the matches)
+
+        Returns:
+            Dict with one identification result per image, in input order
+        """
+        batch_result = {
+            "success": False,
+            "total_images": len(images),
+            "faces_detected": 0,
+            "results": [],
+            "message": "",
+        }
+
+        if not images:
+            batch_result["message"] = "❌ No images provided"
+            return batch_result
+
+        cache_enabled = use_cache and self.redis and self.redis.enabled
+        near_dup_enabled = use_cache and self.near_duplicate_cache is not None
+        results: List[Optional[Dict]] = [None] * len(images)
+        image_hashes: List[Optional[str]] = [None] * len(images)
+        phashes: List[Optional[tuple]] = [None] * len(images)  # FrameKey
+
+        # Serve what we can from the cache before touching Rekognition
+        pending = []
+        for idx, image_bytes in enumerate(images):
+            if near_dup_enabled:
+                phashes[idx] = self.near_duplicate_cache.hash_image(image_bytes)
+                cached_result = self.near_duplicate_cache.get(phashes[idx])
+                if cached_result:
+                    cached_result["cache_hit"] = True
+                    if save_result and cached_result["faces"]:
+                        self._save_match_results(image_bytes, cached_result["faces"], site_id)
+                    results[idx] = cached_result
+                    continue
+            if cache_enabled:
+                image_hashes[idx] = self._compute_image_hash(image_bytes)
+                cached_result = self.redis.get_search_result(image_hashes[idx])
+                if cached_result:
+                    cached_result["cache_hit"] = True
+                    results[idx] = cached_result
+                    continue
+            pending.append(idx)
+
+        # Fan out the Rekognition searches
+        search_results: Dict[int, Dict] = {}
+        if pending:
+            workers = min(self.batch_max_workers, len(pending))
+            logger.info(
+                f"🔍 Searching {len(pending)} image(s) in Rekognition with {workers} worker(s)..."
+            )
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    idx: executor.submit(
+                        self.rekognition.search_faces,
+                        image=images[idx],
+                        max_faces=max_results,
+                        face_match_threshold=confidence_threshold,
+                    )
+                    for idx in pending
+                }
+                for idx, future in futures.items():
+                    try:
+                        search_results[idx] = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Batch search error for image {idx}: {e}")
+                        search_results[idx] = {"success": False, "error": str(e)}
+
+        # Resolve all matched people in one round trip
+        person_ids = {
+            m.get("external_image_id")
+            for search_result in search_results.values()
+            if search_result.get("success")
+            for m in search_result.get("matches", [])
+            if m.get("external_image_id")
+        }
+        people_map: Dict[str, Dict] = {}
+        if person_ids:
+            logger.info(f"📊 Retrieving metadata for {len(person_ids)} unique person(s) in a single batch...")
+            try:
+                people_map = {
+                    p["person_id"]: p
+                    for p in self.db.get_people_batch(sorted(person_ids), attributes=PERSON_ATTRIBUTES)
+                }
+            except Exception as e:
+                logger.error(f"❌ Batch metadata lookup failed: {e}")
+
+        for idx in pending:
+            search_result = search_results[idx]
+            result = {
+                "success": False,
+                "faces_detected": 0,
+                "faces": [],
+                "message": "",
+                "method": "rekognition",
+                "cache_hit": False,
+            }
+
+            if not search_result.get("success"):
+                result["message"] = (
+                    f"❌ Face search failed: {search_result.get('error')}"
+                )
+                results[idx] = result
+                continue
+
+            matches = search_result.get("matches", [])
+            result["faces_detected"] = len(matches)
+            if not matches:
+                result["success"] = True
+                result["message"] = "✅ No matching faces found"
+                results[idx] = result
+                continue
+
+            faces = self._build_faces(matches, people_map)
+            result["faces"] = faces
+            result["success"] = len(faces) > 0
+            result["message"] = f"✅ Found {len(faces)} matching face(s)"
+
+            if cache_enabled and faces:
+                self.redis.set_search_result(image_hashes[idx], result, ttl=300)
+            if phashes[idx] is not None and faces:
+                self.near_duplicate_cache.set(phashes[idx], result)
+
+            if save_result and faces:
+                self._save_match_results(images[idx], faces, site_id)
+
+            results[idx] = result
+
+        batch_result["results"] = results
+        batch_result["faces_detected"] = sum(r["faces_detected"] for r in results)
+        matched_images = sum(1 for r in results if r["faces"])
+        batch_result["success"] = any(r["success"] for r in results)
+        batch_result["message"] = (
+            f"✅ Identified faces in {matched_images}/{len(images)} image(s)"
+        )
+        return batch_result
+
+    async def identify_faces_batch_async(
+        self,
+        images: List[bytes],
+        max_results: int = 5,
+        confidence_threshold: float = 80.0,
+        save_result: bool = True,
+        use_cache: bool = True,
+        site_id: Optional[str] = None,
+    ) -> Dict:
+        """Async variant of identify_faces_batch, run on the shared AWS executor."""
+        return await run_blocking(
+            self.identify_faces_batch,
+            images=images,
+            max_results=max_results,
+            confidence_threshold=confidence_threshold,
+            save_result=save_result,
+            use_cache=use_cache,
+            site_id=site_id,
+        )
+
+    def stream_video_identification(
+        self,
+        video_path: str,
+        max_results: int = 5,
+        confidence_threshold: float = 80.0,
+        probe_interval: int = 5,
+        scene_threshold: float = 8.0,
+        max_sample_gap: float = 5.0,
+    ) -> Iterator[Dict]:
+        """
+        Identify faces in a video as a stream of events
+
+        Frames are decoded on a separate thread, sampled on scene changes and
+        identified concurrently. Yields ``frame`` events for frames with
+        matches and a final ``summary`` event with per-person intervals.
+
+        Args:
+            video_path: Video file path
+            max_results: Maximum matches per frame
+            confidence_threshold: Minimum confidence (0-100)
+            probe_interval: Check every N-th frame for a scene change
+            scene_threshold: Thumbnail difference (0-255) counted as a scene change
+            max_sample_gap: Identify at least every N seconds in static scenes
+
+        Returns:
+            Iterator of event dicts
+        """
+        from .video_pipeline import VideoFrameSampler, VideoIdentificationPipeline
+
+        pipeline = VideoIdentificationPipeline(
+            identify_fn=lambda image_bytes: self.identify_face(
+                image_bytes=image_bytes,
+                max_results=max_results,
+                confidence_threshold=confidence_threshold,
+                save_result=False,
+            ),
+            workers=self.batch_max_workers,
+            sampler=VideoFrameSampler(
+                probe_interval=probe_interval,
+                scene_threshold=scene_threshold,
+                max_sample_gap=max_sample_gap,
+            ),
+        )
+        return pipeline.run(video_path)
+
     def identify_faces_in_video(
         self,
         video_path: str,
@@ -193,9 +496,11 @@ class IdentificationService:
         """
         Identify faces from video frames
 
+        Collects stream_video_identification into a single result.
+
         Args:
             video_path: Video file path
-            frame_interval: Process every N frames
+            frame_interval: Check every N frames for a scene change
             max_results: Maximum matches per frame
             confidence_threshold: Minimum confidence (0-100)
 
@@ -206,73 +511,30 @@ class IdentificationService:
             "success": False,
             "frames_processed": 0,
             "total_matches": 0,
-            "unique_persons": set(),
+            "unique_persons": [],
+            "persons": [],
             "frame_results": [],
             "message": "",
         }
 
         try:
-            import cv2
-
-            cap = cv2.VideoCapture(video_path)
-            if not cap.isOpened():
-                result["message"] = f"❌ Failed to open video: {video_path}"
-                return result
-
-            frame_count = 0
-            processed_count = 0
-
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                frame_count += 1
-
-                # Process every N frames
-                if frame_count % frame_interval != 0:
-                    continue
-
-                processed_count += 1
-
-                # Encode frame to bytes to process in-memory
-                ret, frame_buffer = cv2.imencode(".jpg", frame)
-                if not ret:
-                    logger.warning(f"Failed to encode frame {frame_count}")
-                    continue
-
-                # Identify faces in frame
-                frame_result = self.identify_face(
-                    image_bytes=frame_buffer.tobytes(),
-                    max_results=max_results,
-                    confidence_threshold=confidence_threshold,
-                    save_result=False,
-                )
-
-                if frame_result["success"] and frame_result["faces"]:
-                    result["total_matches"] += len(frame_result["faces"])
-
-                    for face in frame_result["faces"]:
-                        result["unique_persons"].add(face["person_id"])
-
+            for event in self.stream_video_identification(
+                video_path,
+                max_results=max_results,
+                confidence_threshold=confidence_threshold,
+                probe_interval=frame_interval,
+            ):
+                if event["type"] == "frame":
                     result["frame_results"].append(
                         {
-                            "frame_number": frame_count,
-                            "timestamp": frame_count / cap.get(cv2.CAP_PROP_FPS),
-                            "faces": frame_result["faces"],
+                            "frame_number": event["frame_number"],
+                            "timestamp": event["timestamp"],
+                            "faces": event["faces"],
                         }
                     )
-
-                logger.info(f"📹 Processed frame {processed_count}/{frame_count}")
-
-            cap.release()
-
-            result["frames_processed"] = processed_count
-            result["success"] = result["total_matches"] > 0
-            result["unique_persons"] = list(result["unique_persons"])
-            result["message"] = (
-                f"✅ Found {len(result['unique_persons'])} unique person(s) in {processed_count} frames"
-            )
+                    logger.info(f"📹 Matches in frame {event['frame_number']}")
+                else:
+                    result.update({k: v for k, v in event.items() if k != "type"})
 
             return result
 
@@ -343,40 +605,38 @@ class IdentificationService:
             result["message"] = f"❌ Face comparison failed: {str(e)}"
             return result
 
-    def _save_match_results(self, image_bytes: bytes, faces: List[Dict]) -> None:
+    def _save_match_results(
+        self, image_bytes: bytes, faces: List[Dict], site_id: Optional[str] = None
+    ) -> None:
         """
         Save match results to DynamoDB
 
+        With a match recorder the results are queued and persisted in the
+        background; otherwise the payloads are only prepared inline.
+
         Args:
             image_bytes: Source image bytes
             faces: List of matched faces
+            site_id: Site/camera the image came from (optional)
         """
+        if self.match_recorder is not None:
+            self.match_recorder.record(image_bytes, faces, site_id=site_id)
+            return
+
         try:
             # Upload image to S3 (optional)
             image_url = None
             if self.s3:
-                image_key = f"identifications/{datetime.now().strftime('%Y/%m/%d')}/{uuid.uuid4().hex}.jpg"
+                image_key = f"identifications/{datetime.now(timezone.utc):%Y/%m/%d}/{uuid.uuid4().hex}.jpg"
                 s3_result = self.s3.upload_bytes(image_bytes, image_key)
                 if s3_result["success"]:
                     image_url = s3_result.get("s3_url")
 
-            # Save each match to DynamoDB
-            for face in faces:
-                match_data = {
-                    "match_id": f"match_{uuid.uuid4().hex[:12]}",
-                    "person_id": face["person_id"],
-                    "timestamp": datetime.now().isoformat(),
-                    "confidence": face["confidence"],
-                    "similarity": face["similarity"],
-                    "image_url": image_url,
-                    "face_id": face.get("face_id"),
-                }
+            for face, match_data in zip(
+                faces,
+                build_match_items(faces, image_url, datetime.now(timezone.utc).isoformat(), site_id),
+            ):
                 logger.debug("Match payload prepared: %s", match_data)
-
-                # Save to DynamoDB Matches table
-                # Note: This requires a Matches table in DynamoDB
-                # self.db.save_match(match_data)
-
                 logger.info(
                     "💾 Prepared match result payload for %s (%s confidence)",
                     face["user_name"],
@@ -386,56 +646,80 @@ class IdentificationService:
         except Exception as e:
             logger.error(f"❌ Error saving match results: {e}")
 
-    def get_person_matches(self, person_id: str, limit: int = 10) -> List[Dict]:
+    def get_person_matches(
+        self,
+        person_id: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+    ) -> Dict:
         """
-        Get recent matches for a person
+        Get one page of matches for a person in a time range
 
         Args:
             person_id: Person ID
+            since: ISO date or timestamp, inclusive (None = last 30 days)
+            until: ISO date or timestamp, inclusive (None = now)
             limit: Maximum number of results
+            cursor: next_cursor from the previous page
 
         Returns:
-            List of match records
-        """
-        try:
-            # Query DynamoDB Matches table by person_id
-            # This requires implementing get_matches_by_person in DatabaseManager
-            # matches = self.db.get_matches_by_person(person_id, limit)
-            # return matches
+            Dict with success, matches (newest first), next_cursor and
+            daily_counts
 
-            logger.info(f"📊 Retrieving matches for person: {person_id}")
-            return []
+        Raises:
+            ValueError: If since/until or the cursor are invalid
+        """
+        logger.info(f"📊 Retrieving matches for person: {person_id}")
+        result = self.db.get_person_matches(
+            person_id, since=since, until=until, limit=limit, cursor=cursor
+        )
+        if not result["success"]:
+            logger.error(f"❌ Error retrieving matches: {result.get('error')}")
+        return result
 
-        except Exception as e:
-            logger.error(f"❌ Error retrieving matches: {e}")
-            return []
+    async def get_person_matches_async(
+        self,
+        person_id: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """Async variant of get_person_matches, run on the shared AWS executor."""
+        return await run_blocking(self.get_person_matches, person_id, since, until, limit, cursor)
 
     def get_statistics(self) -> Dict:
         """
         Get system statistics
 
+        People/embedding totals come from the maintained aggregate counters
+        (one cached read) rather than a scan of the People table.
+
         Returns:
             Dict with statistics
         """
         try:
-            people = self.db.get_all_people()
-
-            total_people = len(people)
-            total_embeddings = sum(p.get("embedding_count", 0) for p in people)
+            counters = self.db.get_statistics()
+            if counters is None:
+                raise RuntimeError("aggregate counters unavailable")
 
-            # Get collection stats from Rekognition
+            # DescribeCollection: O(1), no face listing
             collection_stats = self.rekognition.get_collection_stats()
 
             stats = {
-                "total_people": total_people,
-                "total_embeddings": total_embeddings,
+                "total_people": counters["total_people"],
+                "total_embeddings": counters["total_embeddings"],
+                "total_matches": counters["total_matches"],
+                "matches_today": counters["matches_today"],
                 "rekognition_faces": collection_stats.get("face_count", 0),
                 "collection_id": collection_stats.get("collection_id", ""),
                 "timestamp": datetime.now().isoformat(),
             }
 
             logger.info(
-                f"📊 Statistics: {total_people} people, {total_embeddings} embeddings"
+                f"📊 Statistics: {stats['total_people']} people, {stats['total_embeddings']} embeddings"
             )
             return stats
 
@@ -0,0 +1,278 @@
+"""
+Write-behind recorder for identification match results.
+
+Identification requests only enqueue the match; a background worker uploads
+the snapshots to S3 concurrently and flushes match records to the Matches
+table with BatchWriteItem. The queue is bounded: when it is full new matches
+are dropped (and counted) instead of slowing down identification.
+"""
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def build_match_items(
+    faces: List[Dict],
+    image_url: Optional[str],
+    timestamp: str,
+    site_id: Optional[str] = None,
+) -> List[Dict]:
+    """Build Matches table items for one identified image.
+
+    Args:
+        faces: Matched faces from IdentificationService
+        image_url: S3 URL of the snapshot (None if not uploaded)
+        timestamp: ISO timestamp of the identification
+        site_id: Site/camera the image came from (optional, per-site stats)
+
+    Returns:
+        List of match records
+    """
+    items = [
+        {
+            "match_id": f"match_{uuid.uuid4().hex[:12]}",
+            "person_id": face["person_id"],
+            "timestamp": timestamp,
+            "confidence": face["confidence"],
+            "similarity": face["similarity"],
+            "image_url": image_url,
+            "face_id": face.get("face_id"),
+        }
+        for face in faces
+    ]
+    if site_id:
+        for item in items:
+            item["site_id"] = site_id
+    return items
+
+
+class MatchRecorder:
+    """Bounded queue + background worker persisting match results."""
+
+    def __init__(
+        self,
+        dynamodb_client,
+        s3_client=None,
+        max_queue_size: int = 1000,
+        batch_size: int = 25,
+        flush_interval: float = 1.0,
+        upload_workers: int = 4,
+    ):
+        """
+        Args:
+            dynamodb_client: DynamoDB client instance (required)
+            s3_client: S3 client instance (optional, for snapshots)
+            max_queue_size: Maximum queued identifications before dropping
+            batch_size: Maximum identifications written per flush
+            flush_interval: Maximum seconds a match waits before being flushed
+            upload_workers: Concurrent S3 snapshot uploads
+        """
+        if not dynamodb_client:
+            raise ValueError("DynamoDB client is required")
+
+        self.dynamodb = dynamodb_client
+        self.s3 = s3_client
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_queue_size = max(1, max_queue_size)
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=self.max_queue_size)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._uploader = (
+            ThreadPoolExecutor(max_workers=max(1, upload_workers), thread_name_prefix="match-upload")
+            if s3_client
+            else None
+        )
+
+        self._lock = threading.Lock()
+        self._metrics = {
+            "enqueued": 0,
+            "dropped": 0,
+            "matches_written": 0,
+            "matches_failed": 0,
+            "snapshots_uploaded": 0,
+            "snapshots_failed": 0,
+            "batches": 0,
+            "queue_high_water": 0,
+            "last_flush_ms": 0.0,
+        }
+
+    def start(self) -> None:
+        """Start the background worker."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="match-recorder", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"✅ Match recorder started (queue={self.max_queue_size}, batch={self.batch_size})"
+        )
+
+    def record(self, image_bytes: bytes, faces: List[Dict], site_id: Optional[str] = None) -> bool:
+        """Queue an identification for persistence without blocking.
+
+        Args:
+            image_bytes: Source image bytes (uploaded as the snapshot)
+            faces: Matched faces
+            site_id: Site/camera the image came from (optional)
+
+        Returns:
+            True if queued, False if dropped because the queue is full
+        """
+        if not faces:
+            return True
+
+        job = {
+            "image_bytes": image_bytes,
+            "faces": faces,
+            # UTC with offset, like every other timestamp the clients write
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "site_id": site_id,
+        }
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self._metrics["dropped"] += 1
+                dropped = self._metrics["dropped"]
+            logger.warning(f"⚠️ Match recorder queue full, dropped match ({dropped} total)")
+            return False
+
+        with self._lock:
+            self._metrics["enqueued"] += 1
+            depth = self._queue.qsize()
+            if depth > self._metrics["queue_high_water"]:
+                self._metrics["queue_high_water"] = depth
+        return True
+
+    def _next_batch(self) -> List[Dict[str, Any]]:
+        """Collect up to batch_size jobs, waiting at most flush_interval."""
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop.is_set():
+                # On shutdown take whatever is already queued without waiting
+                remaining = 0
+            try:
+                if remaining:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _upload_snapshot(self, image_bytes: bytes) -> Optional[str]:
+        image_key = f"identifications/{datetime.now(timezone.utc):%Y/%m/%d}/{uuid.uuid4().hex}.jpg"
+        s3_result = self.s3.upload_bytes(image_bytes, image_key)
+        if s3_result["success"]:
+            return s3_result.get("s3_url")
+        raise RuntimeError(s3_result.get("error") or "upload failed")
+
+    def _process(self, batch: List[Dict[str, Any]]) -> None:
+        """Upload snapshots concurrently, then write all matches in one batch."""
+        started = time.perf_counter()
+        uploaded = failed_uploads = 0
+
+        image_urls: List[Optional[str]] = [None] * len(batch)
+        if self._uploader is not None:
+            futures = [self._uploader.submit(self._upload_snapshot, job["image_bytes"]) for job in batch]
+            for idx, future in enumerate(futures):
+                try:
+                    image_urls[idx] = future.result()
+                    uploaded += 1
+                except Exception as e:
+                    failed_uploads += 1
+                    logger.warning(f"⚠️ Snapshot upload failed: {e}")
+
+        items = []
+        for job, image_url in zip(batch, image_urls):
+            items.extend(
+                build_match_items(job["faces"], image_url, job["timestamp"], job.get("site_id"))
+            )
+
+        try:
+            result = self.dynamodb.save_matches_batch(items)
+            written = result.get("saved", 0)
+        except Exception as e:
+            logger.error(f"❌ Match batch write failed: {e}")
+            written = 0
+
+        with self._lock:
+            self._metrics["batches"] += 1
+            self._metrics["matches_written"] += written
+            self._metrics["matches_failed"] += len(items) - written
+            self._metrics["snapshots_uploaded"] += uploaded
+            self._metrics["snapshots_failed"] += failed_uploads
+            self._metrics["last_flush_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+        logger.info(f"💾 Recorded {written}/{len(items)} match(es) from {len(batch)} identification(s)")
+
+    def _run(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            try:
+                self._process(batch)
+            except Exception as e:
+                logger.error(f"❌ Match recorder error: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued match has been processed.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if the queue was drained
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            if self._thread is None or not self._thread.is_alive():
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush pending matches and stop the worker (application shutdown)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning(
+                    f"⚠️ Match recorder stopped with {self._queue.qsize()} match(es) unflushed"
+                )
+            self._thread = None
+        if self._uploader is not None:
+            self._uploader.shutdown(wait=True)
+        logger.info("✅ Match recorder stopped")
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and throughput counters (back-pressure metrics)."""
+        with self._lock:
+            stats = dict(self._metrics)
+        stats["queue_depth"] = self._queue.qsize()
+        stats["max_queue_size"] = self.max_queue_size
+        stats["running"] = self._thread is not None and self._thread.is_alive()
+        return stats
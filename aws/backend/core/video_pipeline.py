@@ -0,0 +1,340 @@
+"""
+Streaming video identification pipeline.
+
+Three stages connected by bounded queues:
+
+1. Decoder thread: ``grab()`` advances through the video without converting
+   frames; only every ``probe_interval``-th frame is retrieved and compared
+   to the last sampled frame on a small grayscale thumbnail.
+2. Scene-change sampling: a probe is sent for identification when the scene
+   changed, or when ``max_sample_gap`` seconds passed without a sample.
+3. Identify stage: sampled frames are identified concurrently; results are
+   yielded in frame order as soon as they are ready.
+
+Memory use is bounded by the queue sizes rather than the video length; only
+the per-person presence intervals are accumulated.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import cv2
+import numpy as np
+
+from ..utils.image_normalizer import DEFAULT_JPEG_QUALITY, DEFAULT_MAX_DIMENSION, encode_frame
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+class VideoFrameSampler:
+    """Decode a video and yield the frames worth identifying."""
+
+    def __init__(
+        self,
+        probe_interval: int = 5,
+        scene_threshold: float = 8.0,
+        min_sample_gap: float = 0.5,
+        max_sample_gap: float = 5.0,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+        thumb_size: tuple = (64, 36),
+        max_dimension: int = DEFAULT_MAX_DIMENSION,
+    ):
+        """
+        Args:
+            probe_interval: Retrieve and compare every N-th frame
+            scene_threshold: Mean absolute thumbnail difference (0-255) that
+                counts as a scene change
+            min_sample_gap: Minimum seconds between samples
+            max_sample_gap: Maximum seconds between samples (static scenes)
+            jpeg_quality: JPEG quality of sampled frames
+            thumb_size: Thumbnail size used for scene-change detection
+            max_dimension: Longest side of sampled frames (downscaled before encoding)
+        """
+        self.probe_interval = max(1, probe_interval)
+        self.scene_threshold = scene_threshold
+        self.min_sample_gap = min_sample_gap
+        self.max_sample_gap = max_sample_gap
+        self.jpeg_quality = jpeg_quality
+        self.thumb_size = thumb_size
+        self.max_dimension = max_dimension
+
+        self.stats = {"frames_decoded": 0, "frames_probed": 0, "frames_sampled": 0, "fps": 0.0}
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        return cv2.resize(gray, self.thumb_size, interpolation=cv2.INTER_AREA)
+
+    def frames(self, video_path: str, stop: Optional[threading.Event] = None) -> Iterator[Dict]:
+        """Yield sampled frames as dicts with frame_number, timestamp and image_bytes.
+
+        Args:
+            video_path: Video file path
+            stop: Event that aborts decoding when set
+
+        Raises:
+            IOError: If the video cannot be opened
+        """
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise IOError(f"Failed to open video: {video_path}")
+
+        fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+        self.stats["fps"] = fps
+
+        last_thumb = None
+        last_sample_ts = None
+        frame_number = 0
+
+        try:
+            while stop is None or not stop.is_set():
+                # grab() skips the colour conversion/copy of frames we never look at
+                if not cap.grab():
+                    break
+                frame_number += 1
+                self.stats["frames_decoded"] = frame_number
+
+                if frame_number % self.probe_interval != 0:
+                    continue
+
+                ret, frame = cap.retrieve()
+                if not ret:
+                    continue
+                self.stats["frames_probed"] += 1
+
+                if fps > 0:
+                    timestamp = frame_number / fps
+                else:
+                    timestamp = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+
+                thumb = self._thumbnail(frame)
+                if last_sample_ts is not None:
+                    elapsed = timestamp - last_sample_ts
+                    if elapsed < self.min_sample_gap:
+                        continue
+                    changed = float(cv2.absdiff(thumb, last_thumb).mean()) >= self.scene_threshold
+                    if not changed and elapsed < self.max_sample_gap:
+                        continue
+
+                try:
+                    image_bytes = encode_frame(frame, self.max_dimension, self.jpeg_quality)
+                except ValueError:
+                    logger.warning(f"Failed to encode frame {frame_number}")
+                    continue
+
+                last_thumb = thumb
+                last_sample_ts = timestamp
+                self.stats["frames_sampled"] += 1
+
+                yield {
+                    "frame_number": frame_number,
+                    "timestamp": round(timestamp, 3),
+                    "image_bytes": image_bytes,
+                }
+        finally:
+            cap.release()
+
+
+class PresenceTracker:
+    """Merge per-frame detections into per-person presence intervals."""
+
+    def __init__(self, max_gap: float = 10.0):
+        """
+        Args:
+            max_gap: Detections further apart than this (seconds) start a new interval
+        """
+        self.max_gap = max_gap
+        self._people: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, timestamp: float, faces: List[Dict]) -> None:
+        """Record the faces identified at a timestamp."""
+        for face in faces:
+            person_id = face["person_id"]
+            person = self._people.get(person_id)
+            if person is None:
+                person = self._people[person_id] = {
+                    "person_id": person_id,
+                    "user_name": face.get("user_name", "Unknown"),
+                    "first_seen": timestamp,
+                    "last_seen": timestamp,
+                    "detections": 0,
+                    "max_similarity": 0.0,
+                    "intervals": [[timestamp, timestamp]],
+                }
+
+            person["detections"] += 1
+            person["max_similarity"] = max(person["max_similarity"], face.get("similarity", 0.0))
+            person["first_seen"] = min(person["first_seen"], timestamp)
+            person["last_seen"] = max(person["last_seen"], timestamp)
+
+            # Results arrive in frame order, so only the last interval can grow
+            current = person["intervals"][-1]
+            if timestamp - current[1] <= self.max_gap:
+                current[1] = max(current[1], timestamp)
+            else:
+                person["intervals"].append([timestamp, timestamp])
+
+    def summary(self) -> List[Dict]:
+        """Per-person presence, ordered by first appearance."""
+        people = sorted(self._people.values(), key=lambda p: p["first_seen"])
+        return [
+            {
+                **person,
+                "intervals": [{"start": start, "end": end} for start, end in person["intervals"]],
+            }
+            for person in people
+        ]
+
+
+class VideoIdentificationPipeline:
+    """Decoder thread -> scene-change sampler -> concurrent identify stage."""
+
+    def __init__(
+        self,
+        identify_fn: Callable[[bytes], Dict],
+        workers: int = 4,
+        queue_size: int = 16,
+        sampler: Optional[VideoFrameSampler] = None,
+        interval_gap: Optional[float] = None,
+    ):
+        """
+        Args:
+            identify_fn: Callable identifying one JPEG frame (identify_face result shape)
+            workers: Concurrent identify calls
+            queue_size: Decoded frames buffered ahead of the identify stage
+            sampler: Frame sampler (default VideoFrameSampler())
+            interval_gap: Max seconds between detections in one presence
+                interval (default 2 x the sampler's max_sample_gap)
+        """
+        self.identify_fn = identify_fn
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.sampler = sampler or VideoFrameSampler()
+        self.interval_gap = interval_gap or 2 * self.sampler.max_sample_gap
+
+    @staticmethod
+    def _put(frames: "queue.Queue", item: Any, stop: threading.Event) -> bool:
+        """Put without blocking past a stopped consumer; False if stopped first."""
+        while not stop.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _decode(self, video_path: str, frames: "queue.Queue", stop: threading.Event) -> None:
+        try:
+            for frame in self.sampler.frames(video_path, stop):
+                if not self._put(frames, frame, stop):
+                    return
+        except Exception as e:
+            self._put(frames, e, stop)
+            return
+        self._put(frames, _END, stop)
+
+    def _identify(self, frame: Dict) -> Dict:
+        try:
+            return self.identify_fn(frame["image_bytes"])
+        except Exception as e:
+            logger.warning(f"⚠️ Frame {frame['frame_number']} identification failed: {e}")
+            return {"success": False, "faces": [], "message": str(e)}
+
+    def run(self, video_path: str) -> Iterator[Dict]:
+        """Identify faces in a video, yielding events as they become available.
+
+        Yields ``{"type": "frame", ...}`` for every sampled frame with matches
+        (in frame order) and a final ``{"type": "summary", ...}`` with
+        per-person first/last-seen intervals.
+
+        Args:
+            video_path: Video file path
+        """
+        started = time.perf_counter()
+        frames: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        tracker = PresenceTracker(max_gap=self.interval_gap)
+        frames_processed = 0
+        total_matches = 0
+        error: Optional[str] = None
+
+        decoder = threading.Thread(
+            target=self._decode, args=(video_path, frames, stop), name="video-decoder", daemon=True
+        )
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="video-identify")
+        in_flight: deque = deque()
+
+        def finished(frame: Dict, frame_result: Dict) -> Optional[Dict]:
+            nonlocal frames_processed, total_matches
+            frames_processed += 1
+            faces = frame_result.get("faces") or []
+            if not (frame_result.get("success") and faces):
+                return None
+            total_matches += len(faces)
+            tracker.add(frame["timestamp"], faces)
+            return {
+                "type": "frame",
+                "frame_number": frame["frame_number"],
+                "timestamp": frame["timestamp"],
+                "faces": faces,
+            }
+
+        decoder.start()
+        try:
+            while True:
+                item = frames.get()
+                if item is _END:
+                    break
+                if isinstance(item, Exception):
+                    error = str(item)
+                    logger.error(f"❌ Video decode error: {item}")
+                    break
+
+                in_flight.append((item, executor.submit(self._identify, item)))
+
+                # Yield finished results in order; block only when the window is full
+                while in_flight and (in_flight[0][1].done() or len(in_flight) >= 2 * self.workers):
+                    frame, future = in_flight.popleft()
+                    event = finished(frame, future.result())
+                    if event:
+                        yield event
+
+            while in_flight:
+                frame, future = in_flight.popleft()
+                event = finished(frame, future.result())
+                if event:
+                    yield event
+
+            persons = tracker.summary()
+            stats = self.sampler.stats
+            fps = stats["fps"]
+            yield {
+                "type": "summary",
+                "success": error is None and total_matches > 0,
+                "frames_decoded": stats["frames_decoded"],
+                "frames_sampled": stats["frames_sampled"],
+                "frames_processed": frames_processed,
+                "total_matches": total_matches,
+                "unique_persons": [p["person_id"] for p in persons],
+                "persons": persons,
+                "duration_seconds": round(stats["frames_decoded"] / fps, 3) if fps else None,
+                "processing_seconds": round(time.perf_counter() - started, 3),
+                "message": (
+                    f"❌ Video identification failed: {error}"
+                    if error
+                    else f"✅ Found {len(persons)} unique person(s) in {frames_processed} frames"
+                ),
+            }
+        finally:
+            # Also runs when the consumer stops early (e.g. client disconnect)
+            stop.set()
+            for _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+            decoder.join(timeout=1.0)
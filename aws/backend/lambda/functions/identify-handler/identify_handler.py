@@ -21,6 +21,7 @@ logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 from core.identification_service import IdentificationService
 from aws.rekognition_client import RekognitionClient
 from aws.dynamodb_client import DynamoDBClient
+from aws.client_factory import get_table
 
 # --- Service Initialization ---
 
@@ -36,14 +37,12 @@ if not all([REKOGNITION_COLLECTION_ID, PERSON_TABLE_NAME, CACHE_TABLE_NAME]):
 
 # Initialize services
 try:
-    import boto3
     rekognition_client = RekognitionClient(collection_id=REKOGNITION_COLLECTION_ID, region=AWS_REGION)
     dynamodb_client = DynamoDBClient(table_name=PERSON_TABLE_NAME, region=AWS_REGION)
     identification_service = IdentificationService(rekognition_client=rekognition_client, dynamodb_client=dynamodb_client)
     
     # Client for the cache table
-    dynamodb_resource = boto3.resource('dynamodb', region_name=AWS_REGION)
-    cache_table = dynamodb_resource.Table(CACHE_TABLE_NAME)
+    cache_table = get_table(CACHE_TABLE_NAME, AWS_REGION)
     
     logger.info("Services initialized successfully.")
 except Exception as e:
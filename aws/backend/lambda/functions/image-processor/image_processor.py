@@ -10,7 +10,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-import boto3
+from client_factory import get_client, get_resource
 
 # Configure logging
 logger = logging.getLogger()
@@ -18,9 +18,9 @@ logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 
 # --- AWS Clients ---
 try:
-    s3_client = boto3.client("s3")
-    rekognition_client = boto3.client("rekognition")
-    dynamodb_resource = boto3.resource("dynamodb")
+    s3_client = get_client("s3")
+    rekognition_client = get_client("rekognition")
+    dynamodb_resource = get_resource("dynamodb")
 except Exception as e:
     logger.fatal(f"Failed to initialize AWS clients: {e}", exc_info=True)
     s3_client = rekognition_client = dynamodb_resource = None
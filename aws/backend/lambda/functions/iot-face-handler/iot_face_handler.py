@@ -8,15 +8,15 @@ import json
 import os
 import base64
 from datetime import datetime, timezone
-import boto3
 import numpy as np
 from typing import Dict, Any, Optional
 
+from client_factory import get_client, get_table
+
 # AWS clients
-iot_data = boto3.client("iot-data")
-sagemaker_runtime = boto3.client("sagemaker-runtime")
-rekognition = boto3.client("rekognition")
-dynamodb = boto3.resource("dynamodb")
+iot_data = get_client("iot-data")
+sagemaker_runtime = get_client("sagemaker-runtime")
+rekognition = get_client("rekognition")
 
 # Environment variables
 EMBEDDINGS_TABLE = os.environ["EMBEDDINGS_TABLE"]
@@ -24,8 +24,8 @@ MATCH_HISTORY_TABLE = os.environ["MATCH_HISTORY_TABLE"]
 SAGEMAKER_ENDPOINT = os.environ["SAGEMAKER_ENDPOINT"]
 
 # DynamoDB tables
-embeddings_table = dynamodb.Table(EMBEDDINGS_TABLE)
-match_history_table = dynamodb.Table(MATCH_HISTORY_TABLE)
+embeddings_table = get_table(EMBEDDINGS_TABLE)
+match_history_table = get_table(MATCH_HISTORY_TABLE)
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Optional[Dict[str, Any]]:
@@ -9,7 +9,7 @@ import os
 import logging
 from typing import Any, Dict, List
 
-import boto3
+from client_factory import get_client, get_resource
 
 # Configure logging
 logger = logging.getLogger()
@@ -17,8 +17,8 @@ logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 
 # --- AWS Clients ---
 try:
-    dynamodb_resource = boto3.resource("dynamodb")
-    rekognition_client = boto3.client("rekognition")
+    dynamodb_resource = get_resource("dynamodb")
+    rekognition_client = get_client("rekognition")
 except Exception as e:
     logger.fatal(f"Failed to initialize AWS clients: {e}", exc_info=True)
     dynamodb_resource = rekognition_client = None
@@ -7,12 +7,13 @@ Triggered by DynamoDB Streams
 import json
 import os
 from datetime import datetime, timezone
-import boto3
 from typing import Dict, Any, List
 
+from client_factory import get_client
+
 # AWS clients
 apigateway_management = None  # Initialized dynamically
-sns = boto3.client("sns")
+sns = get_client("sns")
 
 # Environment variables
 WEBSOCKET_ENDPOINT = os.environ.get("WEBSOCKET_ENDPOINT", "")
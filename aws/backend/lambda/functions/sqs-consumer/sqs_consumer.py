@@ -8,13 +8,13 @@ import json
 import os
 import base64
 from datetime import datetime, timezone
-import boto3
 from typing import Dict, Any, List
 
+from client_factory import get_client, get_table
+
 # AWS clients
-dynamodb = boto3.resource("dynamodb")
-rekognition = boto3.client("rekognition")
-eventbridge = boto3.client("events")
+rekognition = get_client("rekognition")
+eventbridge = get_client("events")
 
 # Environment variables
 EMBEDDINGS_TABLE = os.environ["EMBEDDINGS_TABLE"]
@@ -23,8 +23,8 @@ EVENT_BUS_NAME = os.environ["EVENT_BUS_NAME"]
 ENVIRONMENT = os.environ["ENVIRONMENT"]
 
 # DynamoDB tables
-embeddings_table = dynamodb.Table(EMBEDDINGS_TABLE)
-match_history_table = dynamodb.Table(MATCH_HISTORY_TABLE)
+embeddings_table = get_table(EMBEDDINGS_TABLE)
+match_history_table = get_table(MATCH_HISTORY_TABLE)
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
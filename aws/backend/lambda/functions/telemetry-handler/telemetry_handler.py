@@ -10,10 +10,9 @@ from datetime import datetime, timezone
 from typing import Any, Dict
 from decimal import Decimal
 
-import boto3
+from client_factory import get_table
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["TELEMETRY_TABLE"])
+table = get_table(os.environ["TELEMETRY_TABLE"])
 
 ALLOWED_FIELDS = {
     "client_id",
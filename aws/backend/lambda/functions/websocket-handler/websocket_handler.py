@@ -15,14 +15,15 @@ import os
 import contextlib
 from typing import Any, Dict, Optional
 
-import boto3
 from aws_xray_sdk.core import xray_recorder
 from jwt import InvalidTokenError, PyJWKClient, decode as jwt_decode
 
+from client_factory import get_client
+
 LOGGER = logging.getLogger()
 LOGGER.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 
-lambda_client = boto3.client("lambda")
+lambda_client = get_client("lambda")
 
 IDENTIFY_LAMBDA_ARN = os.environ.get("IDENTIFY_LAMBDA_ARN", "")
 API_KEY_VALUE = os.environ.get("API_KEY_VALUE", "")
@@ -206,7 +207,7 @@ def _management_client(event: Dict[str, Any]):
     domain = event["requestContext"]["domainName"]
     stage = event["requestContext"]["stage"]
     endpoint_url = f"https://{domain}/{stage}"
-    return boto3.client("apigatewaymanagementapi", endpoint_url=endpoint_url)
+    return get_client("apigatewaymanagementapi", endpoint_url=endpoint_url)
 
 
 def _send_message(
@@ -27,6 +27,9 @@ redis==5.2.0
 Write-Host "Installing dependencies..." -ForegroundColor Yellow
 pip install -r requirements.txt -t "$layerDir\python\" --no-cache-dir
 
+# Shared pooled boto3 client factory (imported as `client_factory`)
+Copy-Item "$PSScriptRoot\..\..\aws\client_factory.py" "$layerDir\python\"
+
 # Create deployment package
 Write-Host "Creating ZIP..." -ForegroundColor Yellow
 Compress-Archive -Path "$layerDir\*" -DestinationPath $outputZip -Force
@@ -3,6 +3,8 @@
 
 echo "📦 Building Lambda Layer..."
 
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+
 cd services/lambda-serverless/layers/python-deps
 
 # Remove old build
@@ -12,6 +14,9 @@ mkdir -p python/
 # Install dependencies
 pip install -r requirements.txt -t python/
 
+# Shared pooled boto3 client factory (imported as `client_factory`)
+cp "$SCRIPT_DIR/../../aws/client_factory.py" python/
+
 # Create deployment package
 zip -r python-deps-layer.zip python/
 
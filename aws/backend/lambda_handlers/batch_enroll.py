@@ -5,17 +5,17 @@ Xử lý batch enrollment từ SQS queue với Kinesis streaming (theo báo cáo
 
 import os
 import json
-import boto3
 import logging
 from typing import Dict, Any, List
 from datetime import datetime
 
+from backend.aws.client_factory import get_client, get_table
+
 # Khởi tạo AWS clients
-sqs = boto3.client('sqs')
-kinesis = boto3.client('kinesis')
-s3 = boto3.client('s3')
-rekognition = boto3.client('rekognition')
-dynamodb = boto3.resource('dynamodb')
+sqs = get_client('sqs')
+kinesis = get_client('kinesis')
+s3 = get_client('s3')
+rekognition = get_client('rekognition')
 
 # Cấu hình từ environment
 QUEUE_URL = os.environ['ENROLLMENT_QUEUE_URL']
@@ -106,7 +106,7 @@ def lambda_handler(event, context):
                             face_ids.append(face_id)
                             
                             # Lưu embedding vào DynamoDB
-                            embeddings_table = dynamodb.Table(EMBEDDINGS_TABLE)
+                            embeddings_table = get_table(EMBEDDINGS_TABLE)
                             embeddings_table.put_item(Item={
                                 'embedding_id': face_id,
                                 'user_id': user_id,
@@ -126,7 +126,7 @@ def lambda_handler(event, context):
                 
                 # Cập nhật user record
                 if face_ids:
-                    users_table = dynamodb.Table(USERS_TABLE)
+                    users_table = get_table(USERS_TABLE)
                     users_table.update_item(
                         Key={'user_id': user_id},
                         UpdateExpression='SET embedding_count = :count, updated_at = :updated, #status = :status',
@@ -3,13 +3,14 @@
 import json
 import logging
 import base64
-import boto3
 from typing import Dict, Any
 
+from backend.aws.client_factory import get_client
+
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-rekognition = boto3.client('rekognition')
+rekognition = get_client('rekognition')
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
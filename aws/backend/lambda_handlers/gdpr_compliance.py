@@ -5,17 +5,17 @@ Right-to-delete, data retention automation, consent management (báo cáo 3.1.2,
 
 import os
 import json
-import boto3
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from backend.aws.client_factory import get_client, get_table
+
 # AWS clients
-s3 = boto3.client('s3')
-dynamodb = boto3.resource('dynamodb')
-rekognition = boto3.client('rekognition')
-sns = boto3.client('sns')
+s3 = get_client('s3')
+rekognition = get_client('rekognition')
+sns = get_client('sns')
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -38,10 +38,10 @@ class GDPRComplianceManager:
     """Quản lý GDPR compliance: right-to-delete, retention, consent"""
     
     def __init__(self):
-        self.users_table = dynamodb.Table(USERS_TABLE)
-        self.embeddings_table = dynamodb.Table(EMBEDDINGS_TABLE)
-        self.logs_table = dynamodb.Table(ACCESS_LOGS_TABLE)
-        self.consent_table = dynamodb.Table(CONSENT_TABLE)
+        self.users_table = get_table(USERS_TABLE)
+        self.embeddings_table = get_table(EMBEDDINGS_TABLE)
+        self.logs_table = get_table(ACCESS_LOGS_TABLE)
+        self.consent_table = get_table(CONSENT_TABLE)
     
     def right_to_be_forgotten(self, user_id: str, requester: str) -> Dict:
         """
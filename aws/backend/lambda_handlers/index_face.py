@@ -2,15 +2,16 @@
 
 import json
 import logging
-import boto3
 import os
 from typing import Dict, Any
 
+from backend.aws.client_factory import get_client
+
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-rekognition = boto3.client('rekognition')
-s3 = boto3.client('s3')
+rekognition = get_client('rekognition')
+s3 = get_client('s3')
 COLLECTION_ID = os.environ.get('REKOGNITION_COLLECTION_ID', 'face-recognition-collection')
 
 
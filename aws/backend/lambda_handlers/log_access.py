@@ -2,16 +2,16 @@
 
 import json
 import logging
-import boto3
 import os
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
+from backend.aws.client_factory import get_table
+
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-dynamodb = boto3.resource('dynamodb')
 ACCESS_LOGS_TABLE = os.environ.get('ACCESS_LOGS_TABLE', 'face-recognition-access-logs')
 
 
@@ -28,7 +28,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     try:
         logger.info("Logging access event")
         
-        table = dynamodb.Table(ACCESS_LOGS_TABLE)
+        table = get_table(ACCESS_LOGS_TABLE)
         
         # Extract event details
         event_type = event.get('event_type', 'identification')
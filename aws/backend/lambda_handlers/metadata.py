@@ -2,14 +2,14 @@
 
 import json
 import logging
-import boto3
 import os
 from typing import Dict, Any, List
 
+from backend.aws.client_factory import get_table
+
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-dynamodb = boto3.resource('dynamodb')
 PEOPLE_TABLE = os.environ.get('PEOPLE_TABLE', 'face-recognition-people')
 
 
@@ -35,7 +35,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'user_count': 0
             }
         
-        table = dynamodb.Table(PEOPLE_TABLE)
+        table = get_table(PEOPLE_TABLE)
         users = []
         
         # Batch get items
@@ -3,14 +3,15 @@
 import json
 import logging
 import base64
-import boto3
 import os
 from typing import Dict, Any
 
+from backend.aws.client_factory import get_client
+
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-rekognition = boto3.client('rekognition')
+rekognition = get_client('rekognition')
 COLLECTION_ID = os.environ.get('REKOGNITION_COLLECTION_ID', 'face-recognition-collection')
 
 
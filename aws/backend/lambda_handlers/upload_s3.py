@@ -3,15 +3,16 @@
 import json
 import logging
 import base64
-import boto3
 import os
 import uuid
 from typing import Dict, Any
 
+from backend.aws.client_factory import get_client
+
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-s3 = boto3.client('s3')
+s3 = get_client('s3')
 BUCKET_NAME = os.environ.get('RAW_IMAGES_BUCKET', 'face-recognition-images')
 
 
@@ -4,14 +4,14 @@ WebSocket Handler for Realtime PyQt App Sync (báo cáo 5.1)
 
 import os
 import json
-import boto3
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from backend.aws.client_factory import get_client, get_table
+
 # AWS clients
 apigateway_management = None  # Initialized per connection
-dynamodb = boto3.resource('dynamodb')
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -25,10 +25,10 @@ class WebSocketManager:
     """Quản lý WebSocket connections cho realtime updates"""
     
     def __init__(self, endpoint_url: Optional[str] = None):
-        self.connections_table = dynamodb.Table(CONNECTIONS_TABLE)
+        self.connections_table = get_table(CONNECTIONS_TABLE)
         
         if endpoint_url:
-            self.api_client = boto3.client(
+            self.api_client = get_client(
                 'apigatewaymanagementapi',
                 endpoint_url=endpoint_url
             )
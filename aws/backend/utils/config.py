@@ -31,6 +31,10 @@ try:
         api_host: str = Field(default="0.0.0.0", env="API_HOST")
         api_port: int = Field(default=8000, env="API_PORT")
         api_workers: int = Field(default=4, env="API_WORKERS")
+        aws_executor_max_workers: int = Field(default=32, env="AWS_EXECUTOR_MAX_WORKERS")
+        aws_max_pool_connections: int = Field(default=64, env="AWS_MAX_POOL_CONNECTIONS")
+        aws_max_attempts: int = Field(default=5, env="AWS_MAX_ATTEMPTS")
+        aws_retry_mode: str = Field(default="adaptive", env="AWS_RETRY_MODE")
         app_secrets_name: str = Field(default="face-recognition/secrets", env="APP_SECRETS_NAME")
         api_secret_key: str = Field(default="", env="API_SECRET_KEY")
 
@@ -79,6 +83,18 @@ try:
         aws_dynamodb_matches_table: str = Field(
             default="face-recognition-matches-dev", env="AWS_DYNAMODB_MATCHES_TABLE"
         )
+        aws_dynamodb_stats_table: str = Field(
+            default="face-recognition-stats-dev", env="AWS_DYNAMODB_STATS_TABLE"
+        )
+        # Content-hash index making enrollment retries idempotent
+        aws_dynamodb_image_hashes_table: str = Field(
+            default="face-recognition-image-hashes-dev",
+            env="AWS_DYNAMODB_IMAGE_HASHES_TABLE",
+        )
+
+        # Metadata storage backend: "dynamodb" or "sqlite" (on-prem / benchmarks)
+        storage_backend: str = Field(default="dynamodb", env="STORAGE_BACKEND")
+        sqlite_path: str = Field(default="data/face_recognition.db", env="SQLITE_PATH")
 
         # AWS Rekognition (Required)
         aws_rekognition_collection: str = Field(
@@ -91,6 +107,23 @@ try:
             default=5, env="AWS_REKOGNITION_MAX_FACES"
         )
 
+        # Batch identification
+        identify_batch_max_images: int = Field(default=16, env="IDENTIFY_BATCH_MAX_IMAGES")
+        identify_batch_max_workers: int = Field(default=8, env="IDENTIFY_BATCH_MAX_WORKERS")
+        identify_video_max_size_mb: int = Field(default=512, env="IDENTIFY_VIDEO_MAX_SIZE_MB")
+        people_search_index_ttl: float = Field(default=300.0, env="PEOPLE_SEARCH_INDEX_TTL")
+        stats_cache_ttl: float = Field(default=10.0, env="STATS_CACHE_TTL")
+
+        # Multi-image enrollment (best-shot selection)
+        enroll_best_shot_count: int = Field(default=5, env="ENROLL_BEST_SHOT_COUNT")
+        enroll_scoring_workers: int = Field(default=4, env="ENROLL_SCORING_WORKERS")
+        enroll_index_concurrency: int = Field(default=4, env="ENROLL_INDEX_CONCURRENCY")
+
+        # Upload normalization (decode once, orient, downscale, re-encode)
+        image_normalize_enabled: bool = Field(default=True, env="IMAGE_NORMALIZE_ENABLED")
+        image_max_dimension: int = Field(default=1600, env="IMAGE_MAX_DIMENSION")
+        image_jpeg_quality: int = Field(default=85, env="IMAGE_JPEG_QUALITY")
+
         # AWS SQS (for async processing)
         aws_sqs_queue_url: str = Field(default="", env="AWS_SQS_QUEUE_URL")
 
@@ -110,6 +143,22 @@ try:
         redis_ttl_embedding: int = Field(default=3600, env="REDIS_TTL_EMBEDDING")  # 1 hour
         redis_ttl_user: int = Field(default=1800, env="REDIS_TTL_USER")  # 30 min
         redis_ttl_search: int = Field(default=300, env="REDIS_TTL_SEARCH")  # 5 min
+        redis_local_cache_enabled: bool = Field(default=True, env="REDIS_LOCAL_CACHE_ENABLED")
+        redis_local_cache_max_entries: int = Field(default=2048, env="REDIS_LOCAL_CACHE_MAX_ENTRIES")
+        redis_local_cache_ttl: float = Field(default=30.0, env="REDIS_LOCAL_CACHE_TTL")
+
+        # Perceptual-hash cache for near-identical frames (in-process, opt-in)
+        phash_cache_enabled: bool = Field(default=False, env="PHASH_CACHE_ENABLED")
+        phash_cache_ttl: float = Field(default=10.0, env="PHASH_CACHE_TTL")
+        phash_cache_max_distance: int = Field(default=6, env="PHASH_CACHE_MAX_DISTANCE")
+        phash_cache_max_entries: int = Field(default=1024, env="PHASH_CACHE_MAX_ENTRIES")
+
+        # Write-behind match recorder
+        match_recorder_enabled: bool = Field(default=True, env="MATCH_RECORDER_ENABLED")
+        match_recorder_queue_size: int = Field(default=1000, env="MATCH_RECORDER_QUEUE_SIZE")
+        match_recorder_batch_size: int = Field(default=25, env="MATCH_RECORDER_BATCH_SIZE")
+        match_recorder_flush_interval: float = Field(default=1.0, env="MATCH_RECORDER_FLUSH_INTERVAL")
+        match_recorder_upload_workers: int = Field(default=4, env="MATCH_RECORDER_UPLOAD_WORKERS")
 
         # Image Quality Validation (NEW - anti-spoofing)
         quality_check_enabled: bool = Field(default=True, env="QUALITY_CHECK_ENABLED")
@@ -138,6 +187,10 @@ except Exception:
             self.api_host = "0.0.0.0"
             self.api_port = 8000
             self.api_workers = 4
+            self.aws_executor_max_workers = int(os.getenv("AWS_EXECUTOR_MAX_WORKERS", "32"))
+            self.aws_max_pool_connections = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "64"))
+            self.aws_max_attempts = int(os.getenv("AWS_MAX_ATTEMPTS", "5"))
+            self.aws_retry_mode = os.getenv("AWS_RETRY_MODE", "adaptive")
             self.api_secret_key = os.getenv("API_SECRET_KEY", "")
 
             # Storage
@@ -174,6 +227,22 @@ except Exception:
             self.redis_ttl_embedding = int(os.getenv("REDIS_TTL_EMBEDDING", "3600"))
             self.redis_ttl_user = int(os.getenv("REDIS_TTL_USER", "1800"))
             self.redis_ttl_search = int(os.getenv("REDIS_TTL_SEARCH", "300"))
+            self.redis_local_cache_enabled = os.getenv("REDIS_LOCAL_CACHE_ENABLED", "true").lower() == "true"
+            self.redis_local_cache_max_entries = int(os.getenv("REDIS_LOCAL_CACHE_MAX_ENTRIES", "2048"))
+            self.redis_local_cache_ttl = float(os.getenv("REDIS_LOCAL_CACHE_TTL", "30"))
+
+            # Perceptual-hash cache for near-identical frames (in-process, opt-in)
+            self.phash_cache_enabled = os.getenv("PHASH_CACHE_ENABLED", "false").lower() == "true"
+            self.phash_cache_ttl = float(os.getenv("PHASH_CACHE_TTL", "10"))
+            self.phash_cache_max_distance = int(os.getenv("PHASH_CACHE_MAX_DISTANCE", "6"))
+            self.phash_cache_max_entries = int(os.getenv("PHASH_CACHE_MAX_ENTRIES", "1024"))
+
+            # Write-behind match recorder
+            self.match_recorder_enabled = os.getenv("MATCH_RECORDER_ENABLED", "true").lower() == "true"
+            self.match_recorder_queue_size = int(os.getenv("MATCH_RECORDER_QUEUE_SIZE", "1000"))
+            self.match_recorder_batch_size = int(os.getenv("MATCH_RECORDER_BATCH_SIZE", "25"))
+            self.match_recorder_flush_interval = float(os.getenv("MATCH_RECORDER_FLUSH_INTERVAL", "1"))
+            self.match_recorder_upload_workers = int(os.getenv("MATCH_RECORDER_UPLOAD_WORKERS", "4"))
 
             # Image Quality Validation
             self.quality_check_enabled = os.getenv("QUALITY_CHECK_ENABLED", "true").lower() == "true"
@@ -207,6 +276,16 @@ except Exception:
             self.aws_dynamodb_matches_table = os.getenv(
                 "AWS_DYNAMODB_MATCHES_TABLE", "face-recognition-matches-dev"
             )
+            self.aws_dynamodb_stats_table = os.getenv(
+                "AWS_DYNAMODB_STATS_TABLE", "face-recognition-stats-dev"
+            )
+            self.aws_dynamodb_image_hashes_table = os.getenv(
+                "AWS_DYNAMODB_IMAGE_HASHES_TABLE", "face-recognition-image-hashes-dev"
+            )
+
+            # Metadata storage backend
+            self.storage_backend = os.getenv("STORAGE_BACKEND", "dynamodb")
+            self.sqlite_path = os.getenv("SQLITE_PATH", "data/face_recognition.db")
 
             # AWS Rekognition
             self.aws_rekognition_collection = os.getenv(
@@ -219,6 +298,23 @@ except Exception:
                 os.getenv("AWS_REKOGNITION_MAX_FACES", "5")
             )
 
+            # Batch identification
+            self.identify_batch_max_images = int(os.getenv("IDENTIFY_BATCH_MAX_IMAGES", "16"))
+            self.identify_batch_max_workers = int(os.getenv("IDENTIFY_BATCH_MAX_WORKERS", "8"))
+            self.identify_video_max_size_mb = int(os.getenv("IDENTIFY_VIDEO_MAX_SIZE_MB", "512"))
+            self.people_search_index_ttl = float(os.getenv("PEOPLE_SEARCH_INDEX_TTL", "300"))
+            self.stats_cache_ttl = float(os.getenv("STATS_CACHE_TTL", "10"))
+
+            # Multi-image enrollment (best-shot selection)
+            self.enroll_best_shot_count = int(os.getenv("ENROLL_BEST_SHOT_COUNT", "5"))
+            self.enroll_scoring_workers = int(os.getenv("ENROLL_SCORING_WORKERS", "4"))
+            self.enroll_index_concurrency = int(os.getenv("ENROLL_INDEX_CONCURRENCY", "4"))
+
+            # Upload normalization (decode once, orient, downscale, re-encode)
+            self.image_normalize_enabled = os.getenv("IMAGE_NORMALIZE_ENABLED", "true").lower() == "true"
+            self.image_max_dimension = int(os.getenv("IMAGE_MAX_DIMENSION", "1600"))
+            self.image_jpeg_quality = int(os.getenv("IMAGE_JPEG_QUALITY", "85"))
+
             # AWS SQS
             self.aws_sqs_queue_url = os.getenv("AWS_SQS_QUEUE_URL", "")
 
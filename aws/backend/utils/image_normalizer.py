@@ -0,0 +1,160 @@
+"""Normalize images once at ingest, before they reach S3 or Rekognition.
+
+Uploads are decoded once with EXIF orientation applied, downscaled to the
+resolution Rekognition needs (it asks for faces of ~40px+ and gains nothing
+from 12 MP phone photos) and re-encoded as JPEG at a tuned quality. The
+normalized buffer is then used for S3 uploads, Rekognition calls and quality
+validation alike.
+
+Only depends on OpenCV/NumPy so the desktop GUI and realtime client can
+import it too (``encode_frame`` for frames they already hold as arrays).
+"""
+
+import logging
+import struct
+from dataclasses import dataclass
+from typing import Optional
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DIMENSION = 1600
+DEFAULT_JPEG_QUALITY = 85
+# A JPEG that needs no resize/rotation is kept as-is unless it is heavier than
+# this many bytes per pixel (q85 photos are typically well under 0.25).
+PASSTHROUGH_MAX_BYTES_PER_PIXEL = 0.25
+
+
+@dataclass
+class NormalizedImage:
+    """Result of normalize_image."""
+
+    data: bytes
+    image: Optional[np.ndarray]  # decoded, oriented, resized BGR (None if undecodable)
+    width: int = 0
+    height: int = 0
+    original_size: int = 0
+    resized: bool = False
+    reencoded: bool = False
+
+
+def jpeg_exif_orientation(data: bytes) -> int:
+    """EXIF orientation tag of a JPEG (1 = upright, also when absent)."""
+    if data[:2] != b"\xff\xd8":
+        return 1
+    pos = 2
+    while pos + 4 <= len(data) and data[pos] == 0xFF:
+        marker = data[pos + 1]
+        length = struct.unpack(">H", data[pos + 2:pos + 4])[0]
+        if marker == 0xDA:  # start of scan: no more metadata
+            break
+        segment = data[pos + 4:pos + 2 + length]
+        if marker == 0xE1 and segment[:6] == b"Exif\x00\x00":
+            tiff = segment[6:]
+            endian = "<" if tiff[:2] == b"II" else ">"
+            try:
+                ifd = struct.unpack(endian + "I", tiff[4:8])[0]
+                (count,) = struct.unpack(endian + "H", tiff[ifd:ifd + 2])
+                for i in range(count):
+                    entry = ifd + 2 + i * 12
+                    tag, _, _, value = struct.unpack(endian + "HHIH", tiff[entry:entry + 10])
+                    if tag == 0x0112:
+                        return value
+            except struct.error:
+                return 1
+            return 1
+        pos += 2 + length
+    return 1
+
+
+def _scale_to_fit(image: np.ndarray, max_dimension: int) -> np.ndarray:
+    height, width = image.shape[:2]
+    scale = max_dimension / max(height, width)
+    if scale >= 1:
+        return image
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def encode_frame(
+    frame: np.ndarray,
+    max_dimension: int = DEFAULT_MAX_DIMENSION,
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+) -> bytes:
+    """Downscale a decoded frame and encode it as JPEG.
+
+    Args:
+        frame: BGR image
+        max_dimension: Longest side in pixels after downscaling
+        jpeg_quality: JPEG quality (0-100)
+
+    Returns:
+        JPEG bytes
+
+    Raises:
+        ValueError: If the frame cannot be encoded
+    """
+    ok, buffer = cv2.imencode(
+        ".jpg", _scale_to_fit(frame, max_dimension), [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality]
+    )
+    if not ok:
+        raise ValueError("Failed to encode frame as JPEG")
+    return buffer.tobytes()
+
+
+def normalize_image(
+    image_bytes: bytes,
+    max_dimension: int = DEFAULT_MAX_DIMENSION,
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+) -> NormalizedImage:
+    """Decode, orient, downscale and re-encode an uploaded image.
+
+    Small, upright, already-compact JPEGs are passed through unchanged to
+    avoid a generation of JPEG loss; undecodable input is passed through
+    too (``image`` is None) so downstream error handling is unchanged.
+
+    Args:
+        image_bytes: Uploaded image bytes (JPEG, PNG, ...)
+        max_dimension: Longest side in pixels after downscaling
+        jpeg_quality: JPEG quality (0-100) for re-encoded images
+
+    Returns:
+        NormalizedImage
+    """
+    original_size = len(image_bytes)
+    # IMREAD_COLOR applies the EXIF orientation while decoding
+    image = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        logger.warning("⚠️ Image normalization skipped: failed to decode image")
+        return NormalizedImage(data=image_bytes, image=None, original_size=original_size)
+
+    resized_image = _scale_to_fit(image, max_dimension)
+    resized = resized_image is not image
+    height, width = resized_image.shape[:2]
+
+    is_jpeg = image_bytes[:2] == b"\xff\xd8"
+    upright = not is_jpeg or jpeg_exif_orientation(image_bytes) == 1
+    compact = original_size <= width * height * PASSTHROUGH_MAX_BYTES_PER_PIXEL
+    if is_jpeg and upright and not resized and compact:
+        return NormalizedImage(
+            data=image_bytes, image=image, width=width, height=height, original_size=original_size
+        )
+
+    data = encode_frame(resized_image, max_dimension, jpeg_quality)
+    if is_jpeg and upright and not resized and len(data) >= original_size:
+        data = image_bytes  # re-encoding would not save anything
+
+    logger.debug(
+        f"Normalized image: {original_size} -> {len(data)} bytes, {width}x{height}"
+    )
+    return NormalizedImage(
+        data=data,
+        image=resized_image,
+        width=width,
+        height=height,
+        original_size=original_size,
+        resized=resized,
+        reencoded=data is not image_bytes,
+    )
@@ -9,12 +9,193 @@ Implements quality checks mentioned in the report:
 """
 
 import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cached_property, lru_cache
+from multiprocessing import get_context, shared_memory
 import cv2
 import numpy as np
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# Face crops smaller than this (either side) are too small to analyze alone
+MIN_REGION_SIZE = 32
+# Depth (FFT) analysis runs on a copy downscaled to this longest side
+DEPTH_ANALYSIS_SIZE = 256
+# Radius of the low-frequency disc excluded from depth analysis (x min side)
+DEPTH_CENTER_RATIO = 0.3
+
+
+@lru_cache(maxsize=32)
+def high_frequency_mask(
+    shape: Tuple[int, int], real: bool = False, center_ratio: float = DEPTH_CENTER_RATIO
+) -> np.ndarray:
+    """Spectrum bins outside the central low-frequency disc (cached per shape).
+
+    Args:
+        shape: (height, width) of the transformed image
+        real: Mask an rfft2 spectrum (columns are frequencies 0..width//2)
+            instead of a fftshift-ed fft2 spectrum
+        center_ratio: Disc radius as a fraction of the shorter side
+
+    Returns:
+        Read-only boolean mask with the spectrum's shape
+    """
+    height, width = shape
+    y = (np.arange(height) - height // 2)[:, None]
+    if real:
+        x = np.arange(width // 2 + 1)[None, :]
+    else:
+        x = (np.arange(width) - width // 2)[None, :]
+    mask = (y ** 2 + x ** 2) > (min(height, width) * center_ratio) ** 2
+    mask.flags.writeable = False
+    return mask
+
+
+def face_bounding_box(face_details: Optional[Dict]) -> Optional[Dict[str, float]]:
+    """Bounding box of Rekognition face details (raw FaceDetail or our wrapper)."""
+    if not face_details:
+        return None
+    return face_details.get("BoundingBox") or face_details.get("bounding_box") or None
+
+
+class QualityContext:
+    """Decoded image plus every quality/liveness metric, each computed once.
+
+    The image is decoded and converted to grayscale once; the metrics
+    (brightness, contrast, Laplacian variance, Canny edge density, FFT
+    spectrum) are computed lazily from that shared grayscale buffer. When a
+    face bounding box is known they are computed on the face crop only.
+    """
+
+    def __init__(self, image: np.ndarray, bounding_box: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            image: Decoded image (BGR or grayscale)
+            bounding_box: Face bounding box (Rekognition relative format)
+        """
+        self.image = image
+        self.height, self.width = image.shape[:2]
+        self.region = self._crop(image, bounding_box) if bounding_box else image
+        self._analysis: Dict[int, Tuple[np.ndarray, float]] = {}
+        self._spectra: Dict[Tuple[int, bool, bool], np.ndarray] = {}
+
+    @classmethod
+    def from_bytes(
+        cls, image_bytes: bytes, bounding_box: Optional[Dict[str, float]] = None
+    ) -> Optional["QualityContext"]:
+        """Decode image bytes into a context (None if they cannot be decoded)."""
+        if not len(image_bytes):
+            return None
+        image = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            return None
+        return cls(image, bounding_box)
+
+    def _crop(self, image: np.ndarray, bounding_box: Dict[str, float]) -> np.ndarray:
+        left = max(0, int(bounding_box.get("Left", 0) * self.width))
+        top = max(0, int(bounding_box.get("Top", 0) * self.height))
+        right = min(self.width, left + int(bounding_box.get("Width", 0) * self.width))
+        bottom = min(self.height, top + int(bounding_box.get("Height", 0) * self.height))
+        if right - left < MIN_REGION_SIZE or bottom - top < MIN_REGION_SIZE:
+            return image
+        return image[top:bottom, left:right]
+
+    @cached_property
+    def gray(self) -> np.ndarray:
+        if self.region.ndim == 3:
+            return cv2.cvtColor(self.region, cv2.COLOR_BGR2GRAY)
+        return self.region
+
+    @cached_property
+    def _mean_std(self) -> Tuple[float, float]:
+        # One pass over the pixels for both statistics
+        mean, std = cv2.meanStdDev(self.gray)
+        return float(mean[0, 0]), float(std[0, 0])
+
+    @property
+    def brightness(self) -> float:
+        """Mean intensity (0-1)."""
+        return self._mean_std[0] / 255.0
+
+    @property
+    def contrast(self) -> float:
+        """Intensity standard deviation."""
+        return self._mean_std[1]
+
+    @cached_property
+    def laplacian_variance(self) -> float:
+        _, std = cv2.meanStdDev(cv2.Laplacian(self.gray, cv2.CV_64F))
+        return float(std[0, 0]) ** 2
+
+    @cached_property
+    def edge_density(self) -> float:
+        """Fraction of Canny edge pixels."""
+        return cv2.countNonZero(cv2.Canny(self.gray, 100, 200)) / self.gray.size
+
+    def _analysis_gray(self, max_dimension: int) -> Tuple[np.ndarray, float]:
+        """Grayscale region downscaled to ``max_dimension`` (0 = as is), and the factor."""
+        if max_dimension not in self._analysis:
+            gray = self.gray
+            height, width = gray.shape
+            factor = max(height, width) / max_dimension if max_dimension else 1.0
+            if factor > 1:
+                size = (max(1, round(width / factor)), max(1, round(height / factor)))
+                gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+            else:
+                factor = 1.0
+            self._analysis[max_dimension] = (gray, factor)
+        return self._analysis[max_dimension]
+
+    def magnitude_spectrum(
+        self, max_dimension: int = 0, real: bool = False, float32: bool = False
+    ) -> np.ndarray:
+        """Log-magnitude FFT spectrum (dB-like scale), zero frequency centered.
+
+        Magnitudes of a downscaled region are multiplied by the square root
+        of the downscale factor. No single factor makes every image match
+        its full-resolution spectrum (detail above the smaller image's
+        Nyquist frequency is gone), so it is calibrated where the depth
+        check decides: on smooth, low-detail images whose high-frequency
+        energy is near the liveness threshold it matches the full-resolution
+        energy within ~2 (mean error ~0) from 640x480 to 4000x3000; see
+        tests/load_tests/depth_estimation_benchmark.py. Detailed images read
+        lower than at full resolution but stay far above the threshold.
+
+        Args:
+            max_dimension: Longest side to analyze at (0 = full resolution)
+            real: Use rfft2; only columns for frequencies 0..width//2 are
+                returned (the rest mirror them for a real image)
+            float32: Compute in single precision
+
+        Returns:
+            Spectrum array (see high_frequency_mask for its layout)
+        """
+        key = (max_dimension, real, float32)
+        if key not in self._spectra:
+            gray, factor = self._analysis_gray(max_dimension)
+            data = gray.astype(np.float32 if float32 else np.float64)
+            if real:
+                shifted = np.fft.fftshift(np.fft.rfft2(data), axes=0)
+            else:
+                shifted = np.fft.fftshift(np.fft.fft2(data))
+            magnitude = np.abs(shifted)
+            if factor != 1.0:
+                magnitude *= np.sqrt(factor)
+            self._spectra[key] = 20 * np.log(magnitude + 1)
+        return self._spectra[key]
+
+    def high_frequency_energy(
+        self, max_dimension: int = 0, real: bool = False, float32: bool = False
+    ) -> float:
+        """Mean log-magnitude outside the low-frequency disc (see magnitude_spectrum)."""
+        spectrum = self.magnitude_spectrum(max_dimension, real, float32)
+        gray, _ = self._analysis_gray(max_dimension)
+        return float(spectrum[high_frequency_mask(gray.shape, real)].mean())
+
 
 class ImageQualityValidator:
     """Validates image quality for anti-spoofing."""
@@ -27,6 +208,9 @@ class ImageQualityValidator:
         min_face_size: int = 100,
         max_head_pose: float = 30.0,
         min_images_enrollment: int = 5,
+        depth_analysis_size: int = DEPTH_ANALYSIS_SIZE,
+        depth_use_rfft: bool = True,
+        depth_float32: bool = False,
     ):
         """Initialize quality validator.
 
@@ -37,6 +221,10 @@ class ImageQualityValidator:
             min_face_size: Minimum face width/height in pixels
             max_head_pose: Maximum head pose angle in degrees
             min_images_enrollment: Minimum images required for enrollment
+            depth_analysis_size: Longest side the depth FFT runs at
+                (0 = full resolution)
+            depth_use_rfft: Use a real FFT for depth analysis (half the work)
+            depth_float32: Compute the depth FFT in single precision
         """
         self.min_brightness = min_brightness
         self.max_brightness = max_brightness
@@ -44,6 +232,21 @@ class ImageQualityValidator:
         self.min_face_size = min_face_size
         self.max_head_pose = max_head_pose
         self.min_images_enrollment = min_images_enrollment
+        self.depth_analysis_size = depth_analysis_size
+        self.depth_use_rfft = depth_use_rfft
+        self.depth_float32 = depth_float32
+        # Constructor arguments, so pool workers can build the same validator
+        self._config = {
+            "min_brightness": min_brightness,
+            "max_brightness": max_brightness,
+            "min_contrast": min_contrast,
+            "min_face_size": min_face_size,
+            "max_head_pose": max_head_pose,
+            "min_images_enrollment": min_images_enrollment,
+            "depth_analysis_size": depth_analysis_size,
+            "depth_use_rfft": depth_use_rfft,
+            "depth_float32": depth_float32,
+        }
 
     def calculate_brightness(self, image: np.ndarray) -> float:
         """Calculate image brightness (0-1 scale).
@@ -54,15 +257,7 @@ class ImageQualityValidator:
         Returns:
             Brightness value between 0 and 1
         """
-        if len(image.shape) == 3:
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = image
-
-        # Calculate mean brightness
-        brightness = np.mean(gray) / 255.0
-        return brightness
+        return QualityContext(image).brightness
 
     def calculate_contrast(self, image: np.ndarray) -> float:
         """Calculate image contrast.
@@ -73,14 +268,8 @@ class ImageQualityValidator:
         Returns:
             Contrast value (higher is better)
         """
-        if len(image.shape) == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = image
-
-        # Calculate standard deviation as contrast measure
-        contrast = np.std(gray)
-        return contrast
+        # Standard deviation as contrast measure
+        return QualityContext(image).contrast
 
     def check_face_size(
         self,
@@ -147,13 +336,16 @@ class ImageQualityValidator:
 
     def validate_image_quality(
         self,
-        image_bytes: bytes,
+        image_bytes: Union[bytes, QualityContext],
         face_details: Optional[Dict] = None,
     ) -> Dict:
         """Validate image quality for anti-spoofing.
 
+        Brightness and contrast are measured on the face crop when
+        ``face_details`` carries a bounding box.
+
         Args:
-            image_bytes: Image bytes
+            image_bytes: Image bytes, or a QualityContext already built for them
             face_details: Face details from Rekognition (optional)
 
         Returns:
@@ -172,18 +364,16 @@ class ImageQualityValidator:
         }
 
         try:
-            # Decode image
-            nparr = np.frombuffer(image_bytes, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-
-            if image is None:
+            bounding_box = face_bounding_box(face_details)
+            context = self._context(image_bytes, bounding_box)
+            if context is None:
                 result["errors"].append("Failed to decode image")
                 return result
 
-            height, width = image.shape[:2]
+            height, width = context.height, context.width
 
             # Check brightness
-            brightness = self.calculate_brightness(image)
+            brightness = context.brightness
             result["checks"]["brightness"]["value"] = round(brightness, 3)
             if self.min_brightness <= brightness <= self.max_brightness:
                 result["checks"]["brightness"]["passed"] = True
@@ -193,7 +383,7 @@ class ImageQualityValidator:
                 )
 
             # Check contrast
-            contrast = self.calculate_contrast(image)
+            contrast = context.contrast
             result["checks"]["contrast"]["value"] = round(contrast, 2)
             if contrast >= self.min_contrast:
                 result["checks"]["contrast"]["passed"] = True
@@ -205,7 +395,6 @@ class ImageQualityValidator:
             # Check face size and head pose if face details provided
             if face_details:
                 # Face size
-                bounding_box = face_details.get("BoundingBox", {})
                 if bounding_box:
                     is_valid, face_width, face_height = self.check_face_size(
                         bounding_box, width, height
@@ -260,6 +449,157 @@ class ImageQualityValidator:
 
         return result
 
+    def validate_batch(
+        self,
+        images: List[Union[bytes, np.ndarray]],
+        face_details: Optional[List[Optional[Dict]]] = None,
+        liveness: bool = True,
+    ) -> List[Dict]:
+        """Validate quality (and liveness) of many images on a process pool.
+
+        Images are copied once into a shared-memory block that the workers
+        (one per host core, see get_process_pool) read in place, instead of
+        pickling every image per task. Concurrent calls (e.g. from several
+        enrollment threads) share the pool. Falls back to validating
+        in-process where process pools or POSIX shared memory are
+        unavailable (e.g. AWS Lambda has no /dev/shm).
+
+        Args:
+            images: Encoded image bytes or decoded BGR/grayscale arrays
+            face_details: Rekognition face details per image (optional)
+            liveness: Also run detect_liveness on each image
+
+        Returns:
+            One dict per image, in input order, with ``quality``
+            (validate_image_quality result) and ``liveness``
+            (detect_liveness result, None if skipped or undecodable)
+        """
+        if not images:
+            return []
+        face_details = face_details or [None] * len(images)
+
+        results = _validate_on_pool(self._config, images, face_details, liveness)
+        if results is not None:
+            return results
+
+        return [
+            self._assess(image, details, liveness)
+            for image, details in zip(images, face_details)
+        ]
+
+    def _assess(
+        self,
+        image: Union[bytes, np.ndarray],
+        face_details: Optional[Dict],
+        liveness: bool,
+    ) -> Dict:
+        """Quality and liveness of one image, sharing a single QualityContext."""
+        context = self._context(image, face_bounding_box(face_details))
+        if context is None:
+            # Reports "Failed to decode image"
+            return {"quality": self.validate_image_quality(b"", face_details), "liveness": None}
+
+        return {
+            "quality": self.validate_image_quality(context, face_details),
+            "liveness": self.detect_liveness(context, face_details) if liveness else None,
+        }
+
+    def score_enrollment_image(self, image_bytes: bytes) -> Dict:
+        """Score an image locally for best-shot selection (no AWS calls).
+
+        Args:
+            image_bytes: Image bytes
+
+        Returns:
+            Dict with valid (brightness/contrast checks), quality_score (0-1),
+            signature (normalized 16x16 grayscale thumbnail, None if the
+            image cannot be decoded) and warnings
+        """
+        result = {"valid": False, "quality_score": 0.0, "signature": None, "warnings": []}
+
+        try:
+            context = QualityContext.from_bytes(image_bytes)
+            if context is None:
+                result["warnings"].append("Failed to decode image")
+                return result
+
+            brightness = context.brightness
+            contrast = context.contrast
+            if not self.min_brightness <= brightness <= self.max_brightness:
+                result["warnings"].append(f"Brightness {brightness:.2f} outside range")
+            if contrast < self.min_contrast:
+                result["warnings"].append(f"Contrast {contrast:.1f} below minimum")
+
+            thumb = cv2.resize(context.gray, (16, 16), interpolation=cv2.INTER_AREA).astype(np.float32).ravel()
+            thumb -= thumb.mean()
+            norm = np.linalg.norm(thumb)
+
+            result["valid"] = not result["warnings"]
+            result["quality_score"] = float(self._compute_quality_score(context))
+            result["signature"] = thumb / norm if norm > 0 else thumb
+
+        except Exception as e:
+            logger.error(f"❌ Enrollment image scoring error: {e}")
+            result["warnings"].append(str(e))
+
+        return result
+
+    def select_best_shots(
+        self,
+        scores: List[Dict],
+        top_k: int,
+        diversity_weight: float = 0.3,
+    ) -> List[int]:
+        """Pick the best ``top_k`` images, trading quality against diversity.
+
+        Greedy: the best valid image first, then repeatedly the image with
+        the highest ``(1 - w) * quality + w * distance`` where distance is
+        how far its thumbnail is from the closest image already picked, so
+        near-identical frames lose to a different angle or expression.
+        Invalid images are only used when there are not enough valid ones;
+        undecodable images are never picked.
+
+        Args:
+            scores: Results of score_enrollment_image, in input order
+            top_k: Number of images to pick
+            diversity_weight: Weight of the diversity term (0-1)
+
+        Returns:
+            Indices into ``scores`` in pick order
+        """
+        candidates = [i for i, s in enumerate(scores) if s.get("signature") is not None]
+        candidates.sort(key=lambda i: (scores[i]["valid"], scores[i]["quality_score"]), reverse=True)
+
+        valid = [i for i in candidates if scores[i]["valid"]]
+        pool = valid if len(valid) >= top_k else candidates
+        if not pool or top_k <= 0:
+            return []
+
+        selected = [pool[0]]
+        remaining = pool[1:]
+        # Distance in [0, 1]: half the L2 distance between unit vectors
+        nearest = {i: self._signature_distance(scores[i], scores[pool[0]]) for i in remaining}
+
+        while remaining and len(selected) < top_k:
+            best = max(
+                remaining,
+                key=lambda i: (
+                    (1 - diversity_weight) * scores[i]["quality_score"]
+                    + diversity_weight * nearest[i]
+                    + (1.0 if scores[i]["valid"] else 0.0)
+                ),
+            )
+            selected.append(best)
+            remaining.remove(best)
+            for i in remaining:
+                nearest[i] = min(nearest[i], self._signature_distance(scores[i], scores[best]))
+
+        return selected
+
+    @staticmethod
+    def _signature_distance(a: Dict, b: Dict) -> float:
+        return float(np.linalg.norm(a["signature"] - b["signature"])) / 2.0
+
     def validate_enrollment_set(
         self,
         image_count: int,
@@ -286,9 +626,20 @@ class ImageQualityValidator:
 
         return result
 
+    @staticmethod
+    def _context(
+        image: Union[bytes, np.ndarray, QualityContext],
+        bounding_box: Optional[Dict[str, float]] = None,
+    ) -> Optional[QualityContext]:
+        if isinstance(image, QualityContext):
+            return image
+        if isinstance(image, (bytes, bytearray, memoryview)):
+            return QualityContext.from_bytes(image, bounding_box)
+        return QualityContext(image, bounding_box)
+
     def detect_liveness(
         self,
-        image: np.ndarray,
+        image: Union[np.ndarray, QualityContext],
         face_details: Optional[Dict] = None,
     ) -> Dict:
         """
@@ -302,7 +653,8 @@ class ImageQualityValidator:
         - Face quality indicators
         
         Args:
-            image: Input image
+            image: Input image, hoặc QualityContext đã tạo cho ảnh đó
+                (phân tích trên vùng mặt nếu có bounding box)
             face_details: Rekognition face details
         
         Returns:
@@ -323,18 +675,20 @@ class ImageQualityValidator:
         }
         
         try:
+            context = self._context(image, face_bounding_box(face_details))
+
             # 1. Texture Analysis - phát hiện ảnh in/màn hình
-            texture_score = self._analyze_texture(image)
+            texture_score = self._analyze_texture(context)
             result["checks"]["texture"]["score"] = texture_score
             result["checks"]["texture"]["passed"] = texture_score > 0.8
             
             # 2. Depth Estimation - phát hiện 2D vs 3D
-            depth_score = self._estimate_depth(image)
+            depth_score = self._estimate_depth(context)
             result["checks"]["depth"]["score"] = depth_score
             result["checks"]["depth"]["passed"] = depth_score > 0.7
             
             # 3. Quality Indicators
-            quality_score = self._compute_quality_score(image)
+            quality_score = self._compute_quality_score(context)
             result["checks"]["quality"]["score"] = quality_score
             result["checks"]["quality"]["passed"] = quality_score > 0.75
             
@@ -377,21 +731,15 @@ class ImageQualityValidator:
         
         return result
     
-    def _analyze_texture(self, image: np.ndarray) -> float:
+    def _analyze_texture(self, context: QualityContext) -> float:
         """
         Phân tích texture để phát hiện ảnh in hoặc màn hình
         Ảnh in/màn hình có texture khác với da người thật
         """
         
-        if len(image.shape) == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = image
-        
-        # Tính Local Binary Pattern variance
         try:
             # Laplacian variance - ảnh in có variance thấp hơn
-            laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
+            laplacian_var = context.laplacian_variance
             
             # Normalize (giá trị cao = texture tốt = người thật)
             # Threshold dựa trên thực nghiệm: >50 là good
@@ -403,34 +751,19 @@ class ImageQualityValidator:
             logger.error(f"Texture analysis error: {e}")
             return 0.5
     
-    def _estimate_depth(self, image: np.ndarray) -> float:
+    def _estimate_depth(self, context: QualityContext) -> float:
         """
         Ước lượng depth để phân biệt 2D (ảnh in/màn hình) vs 3D (người thật)
-        Sử dụng frequency analysis
+        Sử dụng frequency analysis (trên ảnh thu nhỏ về depth_analysis_size)
         """
         
-        if len(image.shape) == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = image
-        
         try:
             # FFT analysis - ảnh in có pattern khác người thật
-            f = np.fft.fft2(gray)
-            fshift = np.fft.fftshift(f)
-            magnitude_spectrum = 20 * np.log(np.abs(fshift) + 1)
-            
             # Tính high-frequency content
             # Người thật có nhiều high-freq detail hơn ảnh in
-            h, w = magnitude_spectrum.shape
-            center_ratio = 0.3
-            mask = np.zeros((h, w), dtype=bool)
-            cy, cx = h // 2, w // 2
-            y, x = np.ogrid[:h, :w]
-            radius = min(h, w) * center_ratio
-            mask = ((y - cy) ** 2 + (x - cx) ** 2) > radius ** 2
-            
-            high_freq_energy = np.mean(magnitude_spectrum[mask])
+            high_freq_energy = context.high_frequency_energy(
+                self.depth_analysis_size, self.depth_use_rfft, self.depth_float32
+            )
             
             # Normalize (giá trị cao = 3D = người thật)
             score = min(high_freq_energy / 50.0, 1.0)
@@ -441,26 +774,20 @@ class ImageQualityValidator:
             logger.error(f"Depth estimation error: {e}")
             return 0.5
     
-    def _compute_quality_score(self, image: np.ndarray) -> float:
+    def _compute_quality_score(self, context: QualityContext) -> float:
         """Tính quality score tổng hợp"""
         
         try:
             # Brightness
-            brightness = self.calculate_brightness(image)
+            brightness = context.brightness
             brightness_score = 1.0 if self.min_brightness <= brightness <= self.max_brightness else 0.5
             
             # Contrast
-            contrast = self.calculate_contrast(image)
+            contrast = context.contrast
             contrast_score = min(contrast / 50.0, 1.0)
             
             # Sharpness (edge density)
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image
-            
-            edges = cv2.Canny(gray, 100, 200)
-            edge_density = np.count_nonzero(edges) / edges.size
+            edge_density = context.edge_density
             sharpness_score = min(edge_density * 10, 1.0)
             
             # Weighted average
@@ -514,6 +841,132 @@ class ImageQualityValidator:
             return 0.5
 
 
+# Process pool for validate_batch (created on first use, like core.executor)
+_process_pool: Optional[ProcessPoolExecutor] = None
+_pool_unavailable = False
+_pool_lock = threading.Lock()
+# Validators built inside pool workers, by configuration
+_worker_validators: Dict[Tuple, "ImageQualityValidator"] = {}
+
+
+def host_cpu_count() -> int:
+    """CPU cores this process may run on (respects affinity/cgroup pinning)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the shared validation process pool (None if unavailable here)."""
+    global _process_pool, _pool_unavailable
+
+    if _process_pool is None and not _pool_unavailable:
+        with _pool_lock:
+            if _process_pool is None and not _pool_unavailable:
+                try:
+                    # spawn: forking a threaded server process is not safe
+                    _process_pool = ProcessPoolExecutor(
+                        max_workers=host_cpu_count(), mp_context=get_context("spawn")
+                    )
+                    logger.info(f"Quality validation pool: {host_cpu_count()} processes")
+                except (OSError, NotImplementedError, ImportError) as e:
+                    _pool_unavailable = True
+                    logger.warning(f"⚠️ Process pool unavailable, validating in-process: {e}")
+    return _process_pool
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """Shut down the shared validation process pool."""
+    global _process_pool
+
+    with _pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=wait)
+            _process_pool = None
+            logger.info("✅ Quality validation pool shut down")
+
+
+def _validate_on_pool(
+    config: Dict,
+    images: List[Union[bytes, np.ndarray]],
+    face_details: List[Optional[Dict]],
+    liveness: bool,
+) -> Optional[List[Dict]]:
+    """Run validate_batch on the process pool; None means fall back to in-process."""
+    global _process_pool
+
+    pool = get_process_pool()
+    if pool is None:
+        return None
+
+    payloads = [
+        np.ascontiguousarray(image) if isinstance(image, np.ndarray) else np.frombuffer(image, np.uint8)
+        for image in images
+    ]
+    try:
+        shm = shared_memory.SharedMemory(create=True, size=max(1, sum(p.nbytes for p in payloads)))
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Shared memory unavailable, validating in-process: {e}")
+        return None
+
+    try:
+        tasks = []
+        offset = 0
+        for image, payload, details in zip(images, payloads, face_details):
+            np.ndarray(payload.shape, payload.dtype, buffer=shm.buf, offset=offset)[...] = payload
+            tasks.append(
+                {
+                    "shm": shm.name,
+                    "offset": offset,
+                    "shape": payload.shape,
+                    "dtype": payload.dtype.str,
+                    "encoded": not isinstance(image, np.ndarray),
+                    "face_details": details,
+                    "liveness": liveness,
+                    "config": config,
+                }
+            )
+            offset += payload.nbytes
+
+        return list(pool.map(_validate_shared, tasks))
+
+    except BrokenProcessPool as e:
+        logger.error(f"❌ Quality validation pool broke, validating in-process: {e}")
+        with _pool_lock:
+            if _process_pool is pool:
+                _process_pool = None
+        return None
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _validate_shared(task: Dict) -> Dict:
+    """Pool worker: validate one image read in place from shared memory."""
+    shm = shared_memory.SharedMemory(name=task["shm"])
+    try:
+        return _validate_buffer(shm.buf, task)
+    finally:
+        shm.close()
+
+
+def _validate_buffer(buffer, task: Dict) -> Dict:
+    key = tuple(sorted(task["config"].items()))
+    validator = _worker_validators.get(key)
+    if validator is None:
+        validator = _worker_validators[key] = ImageQualityValidator(**task["config"])
+
+    view = np.ndarray(task["shape"], np.dtype(task["dtype"]), buffer=buffer, offset=task["offset"])
+    if task["encoded"]:
+        image = cv2.imdecode(view, cv2.IMREAD_COLOR)
+        if image is None:
+            return validator._assess(b"", task["face_details"], task["liveness"])
+    else:
+        image = view
+    return validator._assess(image, task["face_details"], task["liveness"])
+
+
 # Global validator instance
 _validator = None
 
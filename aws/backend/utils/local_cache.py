@@ -0,0 +1,97 @@
+"""In-process LRU cache with per-entry TTL.
+
+Used as the near tier in front of Redis and for short-lived aggregates that
+are cheap to serve from memory but expensive to recompute.
+"""
+
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class LocalTTLCache:
+    """Thread-safe, size-bounded LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 30.0):
+        """Initialize local cache.
+
+        Args:
+            max_entries: Maximum number of entries (least recently used evicted)
+            default_ttl: Default TTL in seconds
+        """
+        self.max_entries = max(1, max_entries)
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds (None = default_ttl)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """Delete keys. Returns the number of entries removed."""
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    removed += 1
+        return removed
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Delete keys matching a glob pattern (Redis KEYS syntax)."""
+        with self._lock:
+            matched = [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]
+            for key in matched:
+                del self._entries[key]
+        return len(matched)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
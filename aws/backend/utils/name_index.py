@@ -0,0 +1,137 @@
+"""Accent-folded n-gram index for person name search.
+
+Names are normalized (case-folded, diacritics removed, "đ" -> "d") so that
+"nguyen van a" finds "Nguyễn Văn A". Every substring of length 1..N of the
+normalized name is indexed, so queries up to N characters are a single
+dictionary lookup and longer queries intersect the posting lists of their
+N-grams before a final substring check.
+"""
+
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+
+GRAM_SIZE = 3
+
+# Letters that do not decompose under NFD
+_EXTRA_FOLDS = str.maketrans({"đ": "d", "Đ": "d", "ð": "d", "ł": "l", "Ł": "l", "ø": "o", "Ø": "o"})
+
+
+def normalize_name(text: Optional[str]) -> str:
+    """Case-fold, strip diacritics and collapse whitespace."""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFD", text.translate(_EXTRA_FOLDS))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.casefold().split())
+
+
+def _grams(text: str, max_size: int = GRAM_SIZE) -> Set[str]:
+    return {
+        text[i:i + size]
+        for size in range(1, max_size + 1)
+        for i in range(len(text) - size + 1)
+    }
+
+
+class NameSearchIndex:
+    """Thread-safe in-process name index: person_id <-> normalized name."""
+
+    def __init__(self, gram_size: int = GRAM_SIZE):
+        """
+        Args:
+            gram_size: Longest indexed substring length
+        """
+        self.gram_size = max(1, gram_size)
+        self._names: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _unlink(self, person_id: str) -> None:
+        name = self._names.pop(person_id, None)
+        if name is None:
+            return
+        for gram in _grams(name, self.gram_size):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(person_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def upsert(self, person_id: str, user_name: Optional[str]) -> None:
+        """Add or rename a person."""
+        name = normalize_name(user_name)
+        with self._lock:
+            if self._names.get(person_id) == name:
+                return
+            self._unlink(person_id)
+            self._names[person_id] = name
+            for gram in _grams(name, self.gram_size):
+                self._postings.setdefault(gram, set()).add(person_id)
+
+    def remove(self, person_id: str) -> None:
+        """Remove a person from the index."""
+        with self._lock:
+            self._unlink(person_id)
+
+    def rebuild(self, people: Iterable[Dict]) -> None:
+        """Replace the index contents with the given person records."""
+        fresh = NameSearchIndex(self.gram_size)
+        for person in people:
+            fresh.upsert(person["person_id"], person.get("user_name"))
+        with self._lock:
+            self._names = fresh._names
+            self._postings = fresh._postings
+
+    def search(self, query: str, limit: int = 100) -> List[str]:
+        """Find person IDs whose name contains the query.
+
+        Results are ranked: full-name prefix, then word prefix, then any
+        substring; ties are ordered by name.
+
+        Args:
+            query: Search text (case and diacritics are ignored)
+            limit: Maximum number of IDs to return
+
+        Returns:
+            Matching person IDs
+        """
+        q = normalize_name(query)
+        if not q:
+            return []
+
+        with self._lock:
+            if len(q) <= self.gram_size:
+                candidates = set(self._postings.get(q, ()))
+            else:
+                postings = []
+                for gram in {q[i:i + self.gram_size] for i in range(len(q) - self.gram_size + 1)}:
+                    posting = self._postings.get(gram)
+                    if not posting:
+                        return []
+                    postings.append(posting)
+                postings.sort(key=len)
+                candidates = set(postings[0])
+                for posting in postings[1:]:
+                    candidates &= posting
+                    if not candidates:
+                        return []
+            matches = [(pid, self._names[pid]) for pid in candidates]
+
+        def rank(item):
+            pid, name = item
+            if name.startswith(q):
+                tier = 0
+            elif f" {q}" in f" {name}":
+                tier = 1
+            elif q in name:
+                tier = 2
+            else:
+                tier = 3  # n-grams matched but not contiguously
+            return (tier, name, pid)
+
+        ranked = sorted(matches, key=rank)
+        return [pid for pid, name in ranked if q in name][:limit]
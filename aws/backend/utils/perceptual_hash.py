@@ -0,0 +1,324 @@
+"""Perceptual hashing for near-duplicate frame detection.
+
+Consecutive camera frames of a still person differ in a few JPEG bits, so an
+exact (SHA-256) cache key never repeats. A difference hash (dHash) over a
+normalized face crop changes by only a few bits between such frames, which
+lets the identify path reuse a recent result for any frame within a small
+Hamming distance whose detected face sits in the same place. Frames without
+a detected face are never cached: a hash of the background alone cannot
+tell two people apart.
+"""
+
+import copy
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+HASH_SIZE = 8  # 8x8 gradients -> 64-bit hash
+
+_CASCADE_FILE = "haarcascade_frontalface_default.xml"
+_local = threading.local()
+
+
+def _get_face_detector() -> Optional["cv2.CascadeClassifier"]:
+    """Per-thread Haar cascade (CascadeClassifier is not thread-safe)."""
+    if not hasattr(_local, "detector"):
+        _local.detector = None
+        try:
+            path = os.path.join(cv2.data.haarcascades, _CASCADE_FILE)
+            if os.path.exists(path):
+                detector = cv2.CascadeClassifier(path)
+                if not detector.empty():
+                    _local.detector = detector
+        except Exception as e:
+            logger.warning(f"⚠️ Face detector unavailable for perceptual hash: {e}")
+    return _local.detector
+
+
+Box = Tuple[int, int, int, int]  # x, y, width, height
+
+
+class FrameKey(NamedTuple):
+    """Near-duplicate cache key: face dHash plus where the face was found."""
+
+    phash: int
+    box: Box
+
+
+def _detect_face(gray: np.ndarray) -> Optional[Box]:
+    """Bounding box of the largest detected face, or None."""
+    detector = _get_face_detector()
+    if detector is None:
+        return None
+    faces = detector.detectMultiScale(
+        gray, scaleFactor=1.2, minNeighbors=4, minSize=(24, 24)
+    )
+    if not len(faces):
+        return None
+    x, y, fw, fh = max(faces, key=lambda f: f[2] * f[3])
+    return int(x), int(y), int(fw), int(fh)
+
+
+def _face_crop(gray: np.ndarray) -> np.ndarray:
+    """Crop the largest detected face, or the central region as a fallback."""
+    box = _detect_face(gray)
+    if box is not None:
+        x, y, fw, fh = box
+        return gray[y:y + fh, x:x + fw]
+
+    # Kiosk framing: the subject is centred, so drop the outer 20% border
+    h, w = gray.shape[:2]
+    my, mx = h // 5, w // 5
+    return gray[my:h - my, mx:w - mx]
+
+
+def _decode_gray(image_bytes: bytes) -> Optional[np.ndarray]:
+    nparr = np.frombuffer(image_bytes, np.uint8)
+    # Reduced decode: the hash only needs a few dozen pixels
+    gray = cv2.imdecode(nparr, cv2.IMREAD_REDUCED_GRAYSCALE_4)
+    if gray is None or gray.size == 0:
+        return None
+    return gray
+
+
+def _dhash(crop: np.ndarray, hash_size: int) -> int:
+    small = cv2.resize(crop, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    diff = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(diff).tobytes(), "big")
+
+
+def compute_dhash(image_bytes: bytes, hash_size: int = HASH_SIZE) -> Optional[int]:
+    """Compute a difference hash over the normalized face region of an image.
+
+    Args:
+        image_bytes: Encoded image bytes (JPEG/PNG)
+        hash_size: Hash grid size (hash has hash_size**2 bits)
+
+    Returns:
+        Hash as an int, or None if the image cannot be decoded
+    """
+    try:
+        gray = _decode_gray(image_bytes)
+        if gray is None:
+            return None
+
+        crop = _face_crop(gray)
+        if crop.size == 0:
+            crop = gray
+        return _dhash(crop, hash_size)
+
+    except Exception as e:
+        logger.warning(f"⚠️ Perceptual hash failed: {e}")
+        return None
+
+
+def compute_face_key(image_bytes: bytes, hash_size: int = HASH_SIZE) -> Optional[FrameKey]:
+    """Compute the near-duplicate cache key of an image.
+
+    Unlike compute_dhash there is no central-region fallback: without a
+    detected face there is no key, so the frame is neither cached nor
+    served from the cache.
+
+    Args:
+        image_bytes: Encoded image bytes (JPEG/PNG)
+        hash_size: Hash grid size (hash has hash_size**2 bits)
+
+    Returns:
+        FrameKey, or None if the image cannot be decoded or has no face
+    """
+    try:
+        gray = _decode_gray(image_bytes)
+        if gray is None:
+            return None
+
+        box = _detect_face(gray)
+        if box is None:
+            return None
+        x, y, fw, fh = box
+        return FrameKey(_dhash(gray[y:y + fh, x:x + fw], hash_size), box)
+
+    except Exception as e:
+        logger.warning(f"⚠️ Perceptual hash failed: {e}")
+        return None
+
+
+def box_iou(a: Box, b: Box) -> float:
+    """Intersection over union of two (x, y, width, height) boxes."""
+    ix = max(0, min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0]))
+    iy = max(0, min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1]))
+    inter = ix * iy
+    union = a[2] * a[3] + b[2] * b[3] - inter
+    return inter / union if union > 0 else 0.0
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateCache:
+    """In-process TTL cache keyed by face hash and box with Hamming-radius lookup.
+
+    A hit needs a hash within ``max_distance`` bits and a face box
+    overlapping the cached one by at least ``min_box_iou``.
+
+    Uses multi-index hashing: the hash is split into ``max_distance + 1``
+    bands. Two hashes within ``max_distance`` bits must agree exactly on at
+    least one band (pigeonhole), so a lookup only compares against entries
+    sharing a band instead of scanning the whole cache.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = 6,
+        ttl: float = 10.0,
+        max_entries: int = 1024,
+        hash_bits: int = HASH_SIZE * HASH_SIZE,
+        min_box_iou: float = 0.7,
+    ):
+        """Initialize near-duplicate cache.
+
+        Args:
+            max_distance: Maximum Hamming distance counted as a hit
+            ttl: Time to live in seconds
+            max_entries: Maximum cached hashes (oldest evicted first)
+            hash_bits: Number of bits in each hash
+            min_box_iou: Minimum face box overlap counted as a hit
+        """
+        self.max_distance = max(0, max_distance)
+        self.min_box_iou = min_box_iou
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+
+        num_bands = min(self.max_distance + 1, hash_bits)
+        base, extra = divmod(hash_bits, num_bands)
+        self._bands: List[Tuple[int, int]] = []  # (shift, mask)
+        shift = 0
+        for i in range(num_bands):
+            width = base + (1 if i < extra else 0)
+            self._bands.append((shift, (1 << width) - 1))
+            shift += width
+
+        self._entries: "OrderedDict[int, Tuple[float, Box, Any]]" = OrderedDict()
+        self._index: List[Dict[int, set]] = [dict() for _ in self._bands]
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def hash_image(self, image_bytes: bytes) -> Optional[FrameKey]:
+        """Compute this cache's key (None when no face is detected)."""
+        return compute_face_key(image_bytes)
+
+    def _band_keys(self, phash: int) -> List[int]:
+        return [(phash >> shift) & mask for shift, mask in self._bands]
+
+    def _remove(self, phash: int) -> None:
+        self._entries.pop(phash, None)
+        for band, key in zip(self._index, self._band_keys(phash)):
+            bucket = band.get(key)
+            if bucket is not None:
+                bucket.discard(phash)
+                if not bucket:
+                    del band[key]
+
+    def _purge_expired(self, now: float) -> None:
+        # Entries are kept in insertion order, so expired ones are at the front
+        while self._entries:
+            phash, (expires_at, _, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            self._remove(phash)
+
+    def get(self, key: Optional[FrameKey]) -> Optional[Any]:
+        """Get the closest cached value within the Hamming radius and box overlap.
+
+        Args:
+            key: Cache key of the query image
+
+        Returns:
+            A copy of the cached value or None
+        """
+        if key is None:
+            return None
+
+        phash, box = key
+        with self._lock:
+            now = time.monotonic()
+            self._purge_expired(now)
+
+            candidates = set()
+            for band, band_key in zip(self._index, self._band_keys(phash)):
+                candidates.update(band.get(band_key, ()))
+
+            best = None
+            best_distance = self.max_distance + 1
+            for candidate in candidates:
+                distance = hamming_distance(phash, candidate)
+                if distance < best_distance and box_iou(box, self._entries[candidate][1]) >= self.min_box_iou:
+                    best, best_distance = candidate, distance
+
+            if best is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            value = self._entries[best][2]
+
+        return copy.deepcopy(value)
+
+    def set(self, key: Optional[FrameKey], value: Any) -> bool:
+        """Cache a value under an image's key.
+
+        Args:
+            key: Cache key of the image
+            value: Value to cache (copied)
+
+        Returns:
+            True if stored
+        """
+        if key is None:
+            return False
+
+        phash, box = key
+        value = copy.deepcopy(value)
+        with self._lock:
+            now = time.monotonic()
+            self._purge_expired(now)
+
+            # Re-insert so the entry moves to the back of the expiry order
+            self._remove(phash)
+            self._entries[phash] = (now + self.ttl, tuple(box), value)
+            for band, band_key in zip(self._index, self._band_keys(phash)):
+                band.setdefault(band_key, set()).add(phash)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+        return True
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            for band in self._index:
+                band.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
@@ -0,0 +1,125 @@
+"""Token-bucket rate limiting for AWS API calls.
+
+Rekognition quotas are per operation (e.g. IndexFaces and SearchFacesByImage
+each have their own TPS limit), so RateLimitedClient keeps one bucket per
+method name and blocks callers until a token is available instead of letting
+them run into ThrottlingException retries.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate`` tokens/s."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second (> 0)
+            capacity: Maximum burst size (None = one second's worth, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available right now, without blocking."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until tokens are available and take them.
+
+        Args:
+            tokens: Number of tokens (must not exceed capacity)
+
+        Returns:
+            Seconds spent waiting
+        """
+        if tokens > self.capacity:
+            raise ValueError("tokens exceeds bucket capacity")
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class RateLimitedClient:
+    """Proxy that rate-limits method calls on a wrapped client.
+
+    Every public method in ``operations`` (all public methods when None)
+    takes a token from its own bucket before running; other attributes are
+    passed through unchanged, so the proxy can stand in for the client.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        rate: float,
+        burst: Optional[float] = None,
+        operations: Optional[Iterable[str]] = None,
+        rates: Optional[Dict[str, float]] = None,
+    ):
+        """Initialize rate-limited proxy.
+
+        Args:
+            client: Client to wrap (e.g. RekognitionClient)
+            rate: Default calls per second for each operation
+            burst: Bucket capacity (None = one second's worth)
+            operations: Method names to limit (None = every public method)
+            rates: Per-operation overrides of ``rate``
+        """
+        self._client = client
+        self._rate = rate
+        self._burst = burst
+        self._operations = set(operations) if operations is not None else None
+        self._rates = dict(rates or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def bucket(self, operation: str) -> TokenBucket:
+        """Bucket for an operation (created on first use)."""
+        with self._lock:
+            bucket = self._buckets.get(operation)
+            if bucket is None:
+                bucket = TokenBucket(self._rates.get(operation, self._rate), self._burst)
+                self._buckets[operation] = bucket
+            return bucket
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        limited = self._operations is None or name in self._operations
+        if not callable(attr) or name.startswith("_") or not limited:
+            return attr
+
+        def call(*args, **kwargs):
+            waited = self.bucket(name).acquire()
+            if waited:
+                with self._lock:
+                    self.waited += waited
+            return attr(*args, **kwargs)
+
+        return call
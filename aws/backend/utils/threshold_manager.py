@@ -5,16 +5,17 @@ Quản lý ngưỡng similarity động từ Parameter Store/Secrets Manager (b
 
 import os
 import json
-import boto3
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 from functools import lru_cache
 
+from ..aws.client_factory import get_client
+
 # AWS clients
-ssm = boto3.client('ssm')
-secrets_manager = boto3.client('secretsmanager')
-cloudwatch = boto3.client('cloudwatch')
+ssm = get_client('ssm')
+secrets_manager = get_client('secretsmanager')
+cloudwatch = get_client('cloudwatch')
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
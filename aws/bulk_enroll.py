@@ -0,0 +1,388 @@
+"""
+Bulk Enroll Script - Đăng ký hàng loạt khuôn mặt qua EnrollmentService
+- Nguồn: thư mục (mỗi thư mục con là một người) hoặc file CSV manifest
+- Giới hạn số luồng đồng thời và TPS Rekognition (token bucket theo từng API)
+- Lưu tiến độ vào file checkpoint (JSONL) để chạy lại không index trùng
+- Tùy chọn kiểm tra chất lượng ảnh trước (process pool, dùng mọi CPU core)
+  để không tốn quota Rekognition cho ảnh hỏng
+- Báo cáo throughput và tổng hợp lỗi
+
+Ví dụ:
+    python bulk_enroll.py ./photos --workers 8 --tps 5
+    python bulk_enroll.py people.csv --checkpoint onboarding.ckpt --best-shot
+    python bulk_enroll.py ./photos --prevalidate
+
+CSV manifest: cột bắt buộc user_name, image_path (tương đối so với file CSV);
+cột tùy chọn person_key (mặc định = user_name), gender, birth_year, hometown,
+residence. Nhiều dòng cùng person_key là nhiều ảnh của cùng một người.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent / "backend"))
+
+from backend.aws import client_factory
+from backend.aws.dynamodb_client import DynamoDBClient
+from backend.aws.rekognition_client import RekognitionClient
+from backend.aws.s3_client import S3Client
+from backend.aws.sqlite_client import SQLiteClient
+from backend.core.enrollment_service import EnrollmentService
+from backend.utils.config import get_settings
+from backend.utils.image_quality import get_validator, shutdown_process_pool
+from backend.utils.rate_limiter import RateLimitedClient
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+METADATA_FIELDS = ("gender", "birth_year", "hometown", "residence")
+# Rekognition APIs gọi trong quá trình enroll (mỗi API có quota TPS riêng)
+REKOGNITION_OPERATIONS = ("detect_faces", "search_faces", "index_face", "delete_faces")
+# Script chạy bằng AWS credentials của operator, tương đương quyền admin
+OPERATOR_EVENT = {"requestContext": {"authorizer": {"claims": {"cognito:groups": "admin"}}}}
+
+
+@dataclass
+class PersonJob:
+    """Một người cần enroll cùng danh sách ảnh."""
+
+    key: str
+    user_name: str
+    images: List[Path] = field(default_factory=list)
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+
+def iter_directory(root: Path) -> Iterator[PersonJob]:
+    """Mỗi thư mục con là một người; ảnh nằm trực tiếp ở thư mục gốc là một người/ảnh."""
+    for entry in sorted(root.iterdir()):
+        if entry.is_dir():
+            images = sorted(
+                p for p in entry.rglob("*") if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS
+            )
+            if images:
+                yield PersonJob(key=entry.name, user_name=entry.name.replace("_", " "), images=images)
+        elif entry.suffix.lower() in IMAGE_EXTENSIONS:
+            yield PersonJob(key=entry.name, user_name=entry.stem.replace("_", " "), images=[entry])
+
+
+def iter_manifest(manifest: Path) -> Iterator[PersonJob]:
+    """Đọc CSV manifest, gom các dòng theo person_key (giữ thứ tự xuất hiện)."""
+    jobs: Dict[str, PersonJob] = {}
+    with open(manifest, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        missing = {"user_name", "image_path"} - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"Manifest thiếu cột: {', '.join(sorted(missing))}")
+
+        for line_no, row in enumerate(reader, 2):
+            user_name = (row.get("user_name") or "").strip()
+            image_path = (row.get("image_path") or "").strip()
+            if not user_name or not image_path:
+                logger.warning(f"⚠️  Bỏ qua dòng {line_no}: thiếu user_name hoặc image_path")
+                continue
+
+            key = (row.get("person_key") or "").strip() or user_name
+            job = jobs.get(key)
+            if job is None:
+                job = jobs[key] = PersonJob(
+                    key=key,
+                    user_name=user_name,
+                    metadata={k: (row.get(k) or "").strip() for k in METADATA_FIELDS},
+                )
+            job.images.append((manifest.parent / image_path).resolve())
+
+    yield from jobs.values()
+
+
+class Checkpoint:
+    """File JSONL ghi tiến độ theo từng người (append + fsync, an toàn khi bị ngắt)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        complete = 0  # số byte của các dòng đầy đủ
+        if path.exists():
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # dòng cuối bị cắt khi process bị kill
+                    complete += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self.entries[entry["key"]] = entry
+
+        self._file = open(path, "a", encoding="utf-8")
+        # Bỏ phần dòng bị cắt để entry ghi tiếp không bị dính vào nó
+        self._file.truncate(complete)
+
+    def is_finished(self, key: str, retry_failed: bool) -> bool:
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        return entry["status"] != "failed" or not retry_failed
+
+    def record(self, entry: Dict) -> None:
+        with self._lock:
+            self.entries[entry["key"]] = entry
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Progress:
+    """Đếm kết quả, in throughput định kỳ và tổng hợp lỗi."""
+
+    def __init__(self, total: int, report_every: float):
+        self.total = total
+        self.report_every = report_every
+        self.started = time.monotonic()
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.images = 0
+        self._last_report = self.started
+        self._lock = threading.Lock()
+
+    def add(self, entry: Dict) -> None:
+        with self._lock:
+            self.statuses[entry["status"]] += 1
+            self.images += entry.get("images_enrolled", 0)
+            if entry["status"] in ("failed", "rejected"):
+                self.errors[entry.get("error") or "unknown"] += 1
+
+            now = time.monotonic()
+            if now - self._last_report >= self.report_every:
+                self._last_report = now
+                self._log(now)
+
+    def _log(self, now: float) -> None:
+        done = sum(self.statuses.values())
+        elapsed = max(now - self.started, 1e-6)
+        rate = done / elapsed
+        eta = (self.total - done) / rate if rate else float("inf")
+        logger.info(
+            f"📊 {done}/{self.total} người | {rate:.2f} người/s | {self.images / elapsed:.2f} ảnh/s | "
+            f"ok={self.statuses['enrolled']} trùng={self.statuses['duplicate']} "
+            f"loại={self.statuses['rejected']} lỗi={self.statuses['failed']} | ETA {eta / 60:.1f} phút"
+        )
+
+    def summary(self) -> None:
+        now = time.monotonic()
+        self._log(now)
+        logger.info(f"⏱️  Tổng thời gian: {now - self.started:.1f}s, {self.images} ảnh đã index")
+        if self.errors:
+            logger.info("❌ Lỗi thường gặp nhất:")
+            for error, count in self.errors.most_common(10):
+                logger.info(f"   {count:>6} × {error}")
+
+
+def enroll_person(service: EnrollmentService, job: PersonJob, args: argparse.Namespace) -> Dict:
+    """Enroll một người, trả về entry checkpoint."""
+    entry = {"key": job.key, "user_name": job.user_name, "images": len(job.images), "ts": time.time()}
+    try:
+        images = [path.read_bytes() for path in job.images]
+
+        if args.prevalidate:
+            # Các thread enroll dùng chung process pool nên việc kiểm tra chạy trên mọi core
+            reports = get_validator().validate_batch(images, liveness=False)
+            kept = [image for image, report in zip(images, reports) if report["quality"]["valid"]]
+            entry["images_rejected"] = len(images) - len(kept)
+            if not kept:
+                quality = reports[0]["quality"]
+                entry["status"] = "rejected"
+                entry["error"] = "; ".join(quality["errors"] or quality["warnings"]) or "Ảnh không đạt chất lượng"
+                return entry
+            images = kept
+
+        if len(images) == 1:
+            result = service.enroll_face(
+                image_bytes=images[0],
+                user_name=job.user_name,
+                check_duplicate=not args.no_duplicate_check,
+                duplicate_threshold=args.duplicate_threshold,
+                **job.metadata,
+            )
+            enrolled = 1 if result["success"] else 0
+        else:
+            result = service.enroll_multiple_faces(
+                OPERATOR_EVENT,
+                images,
+                user_name=job.user_name,
+                parallel=args.best_shot,
+                top_k=args.top_k,
+                **job.metadata,
+            )
+            enrolled = result.get("enrolled_count", 0)
+
+        entry["person_id"] = result.get("person_id")
+        entry["images_enrolled"] = enrolled
+        if result.get("duplicate_found"):
+            entry["status"] = "duplicate"
+            entry["duplicate_of"] = [m["person_id"] for m in result.get("duplicate_info") or []]
+        elif result["success"]:
+            entry["status"] = "enrolled"
+        else:
+            entry["status"] = "failed"
+            entry["error"] = result.get("message", "unknown error")
+
+    except Exception as e:
+        entry["status"] = "failed"
+        entry["error"] = f"{type(e).__name__}: {e}"
+
+    return entry
+
+
+def build_service(args: argparse.Namespace, settings) -> Tuple[EnrollmentService, RateLimitedClient]:
+    """Khởi tạo EnrollmentService với Rekognition client bị giới hạn TPS."""
+    client_factory.configure(
+        max_pool_connections=max(settings.aws_max_pool_connections, args.workers * 4),
+        max_attempts=settings.aws_max_attempts,
+        retry_mode=settings.aws_retry_mode,
+    )
+
+    s3_client = S3Client(bucket_name=settings.aws_s3_bucket, region=settings.aws_region)
+    rekognition_client = RateLimitedClient(
+        RekognitionClient(collection_id=settings.aws_rekognition_collection, region=settings.aws_region),
+        rate=args.tps,
+        burst=max(1.0, args.tps),  # một lần gọi cần ít nhất 1 token, kể cả khi --tps < 1
+        operations=REKOGNITION_OPERATIONS,
+    )
+    if settings.storage_backend == "sqlite":
+        db_client = SQLiteClient(path=settings.sqlite_path)
+    else:
+        db_client = DynamoDBClient(
+            region=settings.aws_region,
+            people_table=settings.aws_dynamodb_people_table,
+            embeddings_table=settings.aws_dynamodb_embeddings_table,
+            matches_table=settings.aws_dynamodb_matches_table,
+            stats_table=settings.aws_dynamodb_stats_table,
+            image_hashes_table=settings.aws_dynamodb_image_hashes_table,
+        )
+
+    service = EnrollmentService(
+        s3_client=s3_client,
+        rekognition_client=rekognition_client,
+        dynamodb_client=db_client,
+        best_shot_count=args.top_k or settings.enroll_best_shot_count,
+        scoring_workers=settings.enroll_scoring_workers,
+        index_concurrency=settings.enroll_index_concurrency,
+    )
+    return service, rekognition_client
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Đăng ký hàng loạt khuôn mặt (có thể chạy tiếp khi bị ngắt)")
+    parser.add_argument("source", type=Path, help="Thư mục ảnh hoặc file CSV manifest")
+    parser.add_argument("--checkpoint", type=Path, default=None,
+                        help="File checkpoint (mặc định: <source>.checkpoint.jsonl)")
+    parser.add_argument("--workers", type=int, default=8, help="Số người enroll đồng thời")
+    parser.add_argument("--tps", type=float, default=5.0,
+                        help="Giới hạn TPS cho mỗi API Rekognition (theo quota của region)")
+    parser.add_argument("--best-shot", action="store_true",
+                        help="Với nhiều ảnh/người: chỉ index các ảnh tốt nhất")
+    parser.add_argument("--top-k", type=int, default=None, help="Số ảnh giữ lại mỗi người với --best-shot")
+    parser.add_argument("--no-duplicate-check", action="store_true", help="Bỏ qua kiểm tra trùng khuôn mặt")
+    parser.add_argument("--duplicate-threshold", type=float, default=95.0, help="Ngưỡng trùng (0-100)")
+    parser.add_argument("--prevalidate", action="store_true",
+                        help="Kiểm tra chất lượng ảnh (song song trên mọi core) trước khi gọi Rekognition")
+    parser.add_argument("--retry-failed", action="store_true", help="Chạy lại các người bị lỗi lần trước")
+    parser.add_argument("--report-every", type=float, default=10.0, help="Chu kỳ báo cáo tiến độ (giây)")
+    parser.add_argument("--dry-run", action="store_true", help="Chỉ liệt kê, không enroll")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> bool:
+    """Main function để enroll hàng loạt."""
+    args = parse_args(argv)
+    settings = get_settings()
+
+    source = args.source.resolve()
+    if source.is_dir():
+        jobs = list(iter_directory(source))
+    elif source.suffix.lower() == ".csv":
+        jobs = list(iter_manifest(source))
+    else:
+        logger.error(f"❌ Nguồn không hợp lệ (cần thư mục hoặc .csv): {source}")
+        return False
+
+    checkpoint = Checkpoint(args.checkpoint or source.with_name(source.name + ".checkpoint.jsonl"))
+    pending = [job for job in jobs if not checkpoint.is_finished(job.key, args.retry_failed)]
+
+    logger.info("=" * 60)
+    logger.info("🚀 BẮT ĐẦU ENROLL HÀNG LOẠT")
+    logger.info("=" * 60)
+    logger.info(f"   - Nguồn: {source} ({len(jobs)} người, {sum(len(j.images) for j in jobs)} ảnh)")
+    logger.info(f"   - Checkpoint: {checkpoint.path} ({len(jobs) - len(pending)} người đã xong)")
+    logger.info(f"   - Workers: {args.workers}, TPS mỗi API Rekognition: {args.tps}")
+
+    if args.dry_run or not pending:
+        checkpoint.close()
+        logger.info("✅ Không có gì cần enroll" if not pending else "ℹ️  Dry run, dừng tại đây")
+        return True
+
+    service, rekognition_client = build_service(args, settings)
+    progress = Progress(total=len(pending), report_every=args.report_every)
+
+    def collect(futures: Iterable) -> None:
+        for future in futures:
+            entry = future.result()
+            checkpoint.record(entry)
+            progress.add(entry)
+
+    # Chỉ giữ tối đa 2×workers job trong hàng đợi để không đọc trước quá nhiều ảnh
+    in_flight = set()
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="bulk-enroll") as pool:
+            for job in pending:
+                in_flight.add(pool.submit(enroll_person, service, job, args))
+                if len(in_flight) >= args.workers * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+            done, in_flight = wait(in_flight)
+            collect(done)
+    except KeyboardInterrupt:
+        # Pool đã đợi các job đang chạy xong; ghi lại để lần sau không index lại
+        logger.warning("⚠️  Bị ngắt: ghi checkpoint cho các người đã enroll xong...")
+        collect(f for f in in_flight if f.done())
+        raise
+    finally:
+        shutdown_process_pool()
+        checkpoint.close()
+        progress.summary()
+        logger.info(f"⏳ Thời gian chờ rate limit Rekognition: {rekognition_client.waited:.1f}s")
+
+    return progress.statuses["failed"] == 0
+
+
+if __name__ == "__main__":
+    try:
+        result = main()
+        sys.exit(0 if result else 1)
+    except KeyboardInterrupt:
+        logger.info("\n❌ Đã hủy bởi người dùng (chạy lại để tiếp tục từ checkpoint)")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"\n❌ Lỗi: {e}", exc_info=True)
+        sys.exit(1)
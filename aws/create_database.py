@@ -3,6 +3,7 @@ Create Database Script - Tạo các bảng DynamoDB và Rekognition collection
 - Tạo bảng People table
 - Tạo bảng Embeddings table
 - Tạo bảng Matches table (optional)
+- Tạo bảng Stats table (bộ đếm tổng hợp cho /api/v1/stats)
 - Tạo Rekognition collection (nếu cấu hình)
 """
 
@@ -16,6 +17,7 @@ from botocore.exceptions import ClientError
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
+from backend.aws.dynamodb_client import DynamoDBClient
 from backend.utils.config import get_settings
 
 logging.basicConfig(
@@ -145,6 +147,25 @@ def create_embeddings_table(dynamodb, table_name, region):
         return False
 
 
+# Lịch sử match theo ngày: partition person_id#YYYY-MM-DD, sort theo timestamp
+PERSON_DAY_INDEX = {
+    'IndexName': DynamoDBClient.MATCH_BUCKET_INDEX,
+    'KeySchema': [
+        {
+            'AttributeName': 'person_day',
+            'KeyType': 'HASH'
+        },
+        {
+            'AttributeName': 'timestamp',
+            'KeyType': 'RANGE'
+        }
+    ],
+    'Projection': {
+        'ProjectionType': 'ALL'
+    }
+}
+
+
 def create_matches_table(dynamodb, table_name, region):
     """Tạo bảng Matches table trong DynamoDB (optional)."""
     logger.info(f"📊 Đang tạo bảng: {table_name}")
@@ -170,6 +191,10 @@ def create_matches_table(dynamodb, table_name, region):
                 {
                     'AttributeName': 'timestamp',
                     'AttributeType': 'S'
+                },
+                {
+                    'AttributeName': 'person_day',
+                    'AttributeType': 'S'
                 }
             ],
             GlobalSecondaryIndexes=[
@@ -188,7 +213,8 @@ def create_matches_table(dynamodb, table_name, region):
                     'Projection': {
                         'ProjectionType': 'ALL'
                     }
-                }
+                },
+                PERSON_DAY_INDEX,
             ],
             BillingMode='PAY_PER_REQUEST',
             Tags=[
@@ -210,6 +236,152 @@ def create_matches_table(dynamodb, table_name, region):
         logger.info(f"✅ Đã tạo thành công bảng: {table_name}")
         return True
         
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceInUseException':
+            logger.info(f"ℹ️  Bảng {table_name} đã tồn tại")
+            return ensure_person_day_index(dynamodb, table_name)
+        else:
+            logger.error(f"❌ Lỗi khi tạo bảng {table_name}: {e}")
+            return False
+    except Exception as e:
+        logger.error(f"❌ Lỗi không mong đợi khi tạo {table_name}: {e}")
+        return False
+
+
+def ensure_person_day_index(dynamodb, table_name):
+    """Thêm GSI person_day-index vào bảng Matches đã tồn tại (nếu chưa có)."""
+    try:
+        table = dynamodb.Table(table_name)
+        table.load()
+        indexes = {gsi['IndexName'] for gsi in table.global_secondary_indexes or []}
+        if PERSON_DAY_INDEX['IndexName'] in indexes:
+            return True
+
+        logger.info(f"📊 Đang thêm index {PERSON_DAY_INDEX['IndexName']} vào {table_name}")
+        dynamodb.meta.client.update_table(
+            TableName=table_name,
+            AttributeDefinitions=[
+                {'AttributeName': 'person_day', 'AttributeType': 'S'},
+                {'AttributeName': 'timestamp', 'AttributeType': 'S'},
+            ],
+            GlobalSecondaryIndexUpdates=[{'Create': PERSON_DAY_INDEX}],
+        )
+        logger.info("✅ Index đang được tạo (DynamoDB backfill chạy nền)")
+        return True
+
+    except ClientError as e:
+        logger.error(f"❌ Lỗi khi thêm index vào {table_name}: {e}")
+        return False
+
+
+def create_stats_table(dynamodb, table_name, region):
+    """Tạo bảng Stats table (aggregate counters) trong DynamoDB."""
+    logger.info(f"📊 Đang tạo bảng: {table_name}")
+
+    try:
+        table = dynamodb.create_table(
+            TableName=table_name,
+            KeySchema=[
+                {
+                    'AttributeName': 'stat_id',
+                    'KeyType': 'HASH'  # Partition key
+                }
+            ],
+            AttributeDefinitions=[
+                {
+                    'AttributeName': 'stat_id',
+                    'AttributeType': 'S'
+                }
+            ],
+            BillingMode='PAY_PER_REQUEST',
+            Tags=[
+                {
+                    'Key': 'Project',
+                    'Value': 'FaceRecognition'
+                },
+                {
+                    'Key': 'Environment',
+                    'Value': 'Development'
+                }
+            ]
+        )
+
+        logger.info(f"⏳ Đợi bảng {table_name} được tạo...")
+        table.wait_until_exists()
+
+        logger.info(f"✅ Đã tạo thành công bảng: {table_name}")
+        return ensure_stats_ttl(dynamodb, table_name)
+
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceInUseException':
+            logger.info(f"ℹ️  Bảng {table_name} đã tồn tại")
+            return ensure_stats_ttl(dynamodb, table_name)
+        else:
+            logger.error(f"❌ Lỗi khi tạo bảng {table_name}: {e}")
+            return False
+    except Exception as e:
+        logger.error(f"❌ Lỗi không mong đợi khi tạo {table_name}: {e}")
+        return False
+
+
+def ensure_stats_ttl(dynamodb, table_name):
+    """Bật TTL (expires_at) cho bảng Stats để các bộ đếm theo tháng tự hết hạn."""
+    try:
+        client = dynamodb.meta.client
+        ttl = client.describe_time_to_live(TableName=table_name)['TimeToLiveDescription']
+        if ttl.get('TimeToLiveStatus') in ('ENABLED', 'ENABLING'):
+            return True
+
+        client.update_time_to_live(
+            TableName=table_name,
+            TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'expires_at'},
+        )
+        logger.info(f"✅ Đã bật TTL (expires_at) cho bảng {table_name}")
+        return True
+
+    except ClientError as e:
+        logger.error(f"❌ Lỗi khi bật TTL cho {table_name}: {e}")
+        return False
+
+
+def create_image_hashes_table(dynamodb, table_name, region):
+    """Tạo bảng Image hashes table (enrollment idempotency) trong DynamoDB."""
+    logger.info(f"📊 Đang tạo bảng: {table_name}")
+
+    try:
+        table = dynamodb.create_table(
+            TableName=table_name,
+            KeySchema=[
+                {
+                    'AttributeName': 'content_hash',
+                    'KeyType': 'HASH'  # Partition key
+                }
+            ],
+            AttributeDefinitions=[
+                {
+                    'AttributeName': 'content_hash',
+                    'AttributeType': 'S'
+                }
+            ],
+            BillingMode='PAY_PER_REQUEST',
+            Tags=[
+                {
+                    'Key': 'Project',
+                    'Value': 'FaceRecognition'
+                },
+                {
+                    'Key': 'Environment',
+                    'Value': 'Development'
+                }
+            ]
+        )
+
+        logger.info(f"⏳ Đợi bảng {table_name} được tạo...")
+        table.wait_until_exists()
+
+        logger.info(f"✅ Đã tạo thành công bảng: {table_name}")
+        return True
+
     except ClientError as e:
         if e.response['Error']['Code'] == 'ResourceInUseException':
             logger.info(f"ℹ️  Bảng {table_name} đã tồn tại")
@@ -313,6 +485,8 @@ def main():
     logger.info(f"   - People Table: {settings.aws_dynamodb_people_table}")
     logger.info(f"   - Embeddings Table: {settings.aws_dynamodb_embeddings_table}")
     logger.info(f"   - Matches Table: {settings.aws_dynamodb_matches_table}")
+    logger.info(f"   - Stats Table: {settings.aws_dynamodb_stats_table}")
+    logger.info(f"   - Image Hashes Table: {settings.aws_dynamodb_image_hashes_table}")
     logger.info(f"   - Rekognition Collection: {settings.aws_rekognition_collection or '(chưa cấu hình)'}")
     logger.info(f"   - S3 Bucket: {settings.aws_s3_bucket or '(chưa cấu hình)'}")
     
@@ -347,6 +521,27 @@ def main():
     # 3. Tạo Matches table (optional)
     if not create_matches_table(dynamodb, settings.aws_dynamodb_matches_table, settings.aws_region):
         success = False
+
+    # 3b. Tạo Stats table và khởi tạo bộ đếm từ dữ liệu hiện có
+    if create_stats_table(dynamodb, settings.aws_dynamodb_stats_table, settings.aws_region):
+        stats_client = DynamoDBClient(
+            region=settings.aws_region,
+            people_table=settings.aws_dynamodb_people_table,
+            embeddings_table=settings.aws_dynamodb_embeddings_table,
+            matches_table=settings.aws_dynamodb_matches_table,
+            stats_table=settings.aws_dynamodb_stats_table,
+        )
+        # Gắn person_day cho các match cũ để person_day-index thấy chúng
+        if not stats_client.backfill_match_buckets()["success"]:
+            logger.warning("⚠️  Không thể cập nhật person_day cho các match cũ")
+        if not stats_client.rebuild_stats()["success"]:
+            logger.warning("⚠️  Không thể khởi tạo bộ đếm thống kê")
+    else:
+        success = False
+
+    # 3c. Tạo Image hashes table (chống enroll trùng khi gửi lại cùng ảnh)
+    if not create_image_hashes_table(dynamodb, settings.aws_dynamodb_image_hashes_table, settings.aws_region):
+        success = False
     
     # 4. Tạo Rekognition collection
     logger.info("\n" + "="*60)
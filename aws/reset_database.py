@@ -49,6 +49,12 @@ def clear_dynamodb_table(dynamodb_client, table_name):
                 elif 'match_id' in item:
                     batch.delete_item(Key={'match_id': item['match_id']})
                     count += 1
+                elif 'content_hash' in item:
+                    batch.delete_item(Key={'content_hash': item['content_hash']})
+                    count += 1
+                elif 'stat_id' in item:
+                    batch.delete_item(Key={'stat_id': item['stat_id']})
+                    count += 1
         
         # Xử lý pagination nếu có nhiều items
         while 'LastEvaluatedKey' in response:
@@ -66,6 +72,12 @@ def clear_dynamodb_table(dynamodb_client, table_name):
                     elif 'match_id' in item:
                         batch.delete_item(Key={'match_id': item['match_id']})
                         count += 1
+                    elif 'content_hash' in item:
+                        batch.delete_item(Key={'content_hash': item['content_hash']})
+                        count += 1
+                    elif 'stat_id' in item:
+                        batch.delete_item(Key={'stat_id': item['stat_id']})
+                        count += 1
         
         logger.info(f"✅ Đã xóa {count} items từ {table_name}")
         return True
@@ -198,6 +210,8 @@ def main():
         people_table=settings.aws_dynamodb_people_table,
         embeddings_table=settings.aws_dynamodb_embeddings_table,
         matches_table=settings.aws_dynamodb_matches_table,
+        stats_table=settings.aws_dynamodb_stats_table,
+        image_hashes_table=settings.aws_dynamodb_image_hashes_table,
         enabled=True
     )
     
@@ -215,7 +229,14 @@ def main():
     
     # Xác nhận
     print("\n⚠️  CẢNH BÁO: Hành động này sẽ xóa TOÀN BỘ dữ liệu!")
-    print(f"   - DynamoDB Tables: {settings.aws_dynamodb_people_table}, {settings.aws_dynamodb_embeddings_table}, {settings.aws_dynamodb_matches_table}")
+    tables = [
+        settings.aws_dynamodb_people_table,
+        settings.aws_dynamodb_embeddings_table,
+        settings.aws_dynamodb_matches_table,
+        settings.aws_dynamodb_stats_table,
+        settings.aws_dynamodb_image_hashes_table,
+    ]
+    print(f"   - DynamoDB Tables: {', '.join(t for t in tables if t)}")
     print(f"   - Rekognition Collection: {settings.aws_rekognition_collection}")
     print(f"   - S3 Bucket: {settings.aws_s3_bucket}/faces/")
     
@@ -234,6 +255,10 @@ def main():
     clear_dynamodb_table(dynamodb_client, settings.aws_dynamodb_people_table)
     clear_dynamodb_table(dynamodb_client, settings.aws_dynamodb_embeddings_table)
     clear_dynamodb_table(dynamodb_client, settings.aws_dynamodb_matches_table)
+    clear_dynamodb_table(dynamodb_client, settings.aws_dynamodb_image_hashes_table)
+    # Đặt lại bộ đếm thống kê về 0 (kể cả các item theo tháng)
+    clear_dynamodb_table(dynamodb_client, settings.aws_dynamodb_stats_table)
+    dynamodb_client.rebuild_stats()
     
     # 2. Xóa Rekognition collection
     logger.info("\n👤 Xóa Rekognition Collection...")
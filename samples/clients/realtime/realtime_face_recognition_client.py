@@ -44,6 +44,13 @@ except ImportError as exc:  # pragma: no cover
 else:
     WS_IMPORT_ERROR = None
 
+# Shared upload encoding (downscale + tuned JPEG) from the backend, when run in-repo
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "aws"))
+try:
+    from backend.utils.image_normalizer import encode_frame  # type: ignore
+except ImportError:  # pragma: no cover
+    encode_frame = None
+
 
 DEFAULT_API_URL = os.getenv("FACE_API_URL", "http://localhost:8000")
 DEFAULT_WS_URL = os.getenv("FACE_WS_URL", "")
@@ -165,8 +172,13 @@ class RealtimeFaceRecognitionClient:
         return f"{trimmed}/api/v1/telemetry"
 
     def _serialize_frame(self, frame: np.ndarray) -> bytes:
+        if encode_frame is not None:
+            try:
+                return encode_frame(frame)
+            except ValueError as exc:
+                raise IdentificationError(str(exc)) from exc
         success, buffer = cv2.imencode(
-            ".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 90]
+            ".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 85]
         )
         if not success:
             raise IdentificationError("Failed to encode frame as JPEG")
@@ -3,7 +3,7 @@ Unit tests for the enrollment API endpoint.
 """
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -21,6 +21,10 @@ class TestEnrollEndpoint(unittest.TestCase):
     def setUp(self):
         self.client = TestClient(app)
         self.mock_enrollment_service = MagicMock()
+        # Routes await the async variant; delegate it to the sync mock
+        self.mock_enrollment_service.enroll_face_async = AsyncMock(
+            side_effect=self.mock_enrollment_service.enroll_face
+        )
 
         # Override the dependency with the mock
         app.dependency_overrides[enroll.get_enrollment_service] = lambda: self.mock_enrollment_service
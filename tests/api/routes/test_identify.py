@@ -3,7 +3,7 @@ Unit tests for the identification API endpoint.
 """
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -21,6 +21,10 @@ class TestIdentifyEndpoint(unittest.TestCase):
     def setUp(self):
         self.client = TestClient(app)
         self.mock_identification_service = MagicMock()
+        # Routes await the async variant; delegate it to the sync mock
+        self.mock_identification_service.identify_face_async = AsyncMock(
+            side_effect=self.mock_identification_service.identify_face
+        )
 
         # Override the dependency with the mock
         app.dependency_overrides[identify.get_identification_service] = lambda: self.mock_identification_service
@@ -90,6 +94,21 @@ class TestIdentifyEndpoint(unittest.TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.json()["detail"], "No faces found in the image.")
 
+    def test_identify_face_passes_site_id(self):
+        """Test the site the image came from reaches the service (per-site stats)."""
+        self.mock_identification_service.identify_face.return_value = {"success": True, "faces": []}
+
+        response = self.client.post(
+            "/identify",
+            files={"image": ("test.jpg", b"fake image data", "image/jpeg")},
+            data={"site_id": "gate-1"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.mock_identification_service.identify_face.call_args.kwargs["site_id"], "gate-1"
+        )
+
     def test_identify_face_unexpected_error(self):
         """Test an unexpected server error during identification."""
         # Arrange
@@ -3,7 +3,7 @@ Unit tests for the people management API endpoints.
 """
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -21,6 +21,21 @@ class TestPeopleEndpoints(unittest.TestCase):
     def setUp(self):
         self.client = TestClient(app)
         self.mock_db_manager = MagicMock()
+        # Routes await the async variants; delegate them to the sync mocks
+        for name in (
+            "get_all_people",
+            "list_people_page",
+            "get_person",
+            "update_person",
+            "delete_person",
+            "get_statistics",
+            "get_person_matches",
+        ):
+            setattr(
+                self.mock_db_manager,
+                f"{name}_async",
+                AsyncMock(side_effect=getattr(self.mock_db_manager, name)),
+            )
 
         # Override the dependency with the mock
         app.dependency_overrides[people.get_db_manager] = lambda: self.mock_db_manager
@@ -30,16 +45,28 @@ class TestPeopleEndpoints(unittest.TestCase):
         app.dependency_overrides.clear()
 
     def test_list_people_success(self):
-        """Test successfully listing all people."""
-        self.mock_db_manager.get_all_people.return_value = [
-            {"person_id": "p-1", "user_name": "John", "created_at": "t1", "embedding_count": 1},
-            {"person_id": "p-2", "user_name": "Jane", "created_at": "t2", "embedding_count": 2},
-        ]
-        response = self.client.get("/people")
+        """Test successfully listing a page of people."""
+        self.mock_db_manager.list_people_page.return_value = {
+            "success": True,
+            "people": [
+                {"person_id": "p-1", "user_name": "John", "created_at": "t1", "updated_at": "t1", "embedding_count": 1},
+                {"person_id": "p-2", "user_name": "Jane", "created_at": "t2", "updated_at": "t2", "embedding_count": 2},
+            ],
+            "next_cursor": "abc",
+        }
+        response = self.client.get("/people?limit=2&cursor=xyz")
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertEqual(data["total"], 2)
         self.assertEqual(len(data["people"]), 2)
+        self.assertEqual(data["next_cursor"], "abc")
+        self.mock_db_manager.list_people_page.assert_called_once_with(limit=2, cursor="xyz")
+
+    def test_list_people_invalid_cursor(self):
+        """Test a malformed cursor returns 400."""
+        self.mock_db_manager.list_people_page.side_effect = ValueError("Invalid cursor")
+        response = self.client.get("/people?cursor=bad")
+        self.assertEqual(response.status_code, 400)
 
     def test_get_person_success(self):
         """Test successfully getting a single person."""
@@ -55,23 +82,39 @@ class TestPeopleEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 404)
 
     def test_update_person_success(self):
-        """Test successfully updating a person."""
-        self.mock_db_manager.get_person.side_effect = [
-            {"person_id": "p-1"},  # First call for existence check
-            {"person_id": "p-1", "user_name": "John Updated", "created_at": "t1", "embedding_count": 1} # Second call to get updated data
-        ]
+        """Test an update is one conditional write returning the new item."""
+        self.mock_db_manager.update_person.return_value = {
+            "success": True,
+            "person": {
+                "person_id": "p-1", "user_name": "John Updated", "created_at": "t1",
+                "updated_at": "t2", "embedding_count": 1, "version": 3,
+            },
+        }
         update_payload = {"user_name": "John Updated"}
         response = self.client.put("/people/p-1", json=update_payload)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["user_name"], "John Updated")
-        self.mock_db_manager.update_person.assert_called_with("p-1", update_payload)
+        self.assertEqual(response.json()["version"], 3)
+        self.mock_db_manager.update_person.assert_called_with("p-1", update_payload, expected_version=None)
+        self.mock_db_manager.get_person.assert_not_called()
 
     def test_update_person_not_found(self):
         """Test updating a person who does not exist."""
-        self.mock_db_manager.get_person.return_value = None
+        self.mock_db_manager.update_person.return_value = {
+            "success": False, "not_found": True, "error": "Person not found: p-404",
+        }
         response = self.client.put("/people/p-404", json={"user_name": "Ghost"})
         self.assertEqual(response.status_code, 404)
 
+    def test_update_person_version_conflict(self):
+        """Test a stale expected_version returns 409."""
+        self.mock_db_manager.update_person.return_value = {
+            "success": False, "conflict": True, "error": "Version conflict: expected 1, found 2",
+        }
+        response = self.client.put("/people/p-1", json={"user_name": "X", "expected_version": 1})
+        self.assertEqual(response.status_code, 409)
+        self.mock_db_manager.update_person.assert_called_with("p-1", {"user_name": "X"}, expected_version=1)
+
     def test_delete_person_success(self):
         """Test successfully deleting a person."""
         self.mock_db_manager.get_person.return_value = {"person_id": "p-1"}
@@ -88,21 +131,62 @@ class TestPeopleEndpoints(unittest.TestCase):
 
     def test_get_database_stats_success(self):
         """Test successfully getting database statistics."""
-        self.mock_db_manager.get_all_people.return_value = [
-            {"embedding_count": 2}, {"embedding_count": 3}
-        ]
+        self.mock_db_manager.get_statistics.return_value = {
+            "total_people": 2,
+            "total_embeddings": 5,
+            "total_matches": 3,
+            "matches_today": 1,
+            "matches_per_day": {"2026-10-17": 1},
+            "matches_per_site": {},
+            "last_updated": "2026-10-17T10:00:00",
+        }
         response = self.client.get("/stats")
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertEqual(data["total_people"], 2)
         self.assertEqual(data["total_embeddings"], 5)
+        self.assertEqual(data["matches_today"], 1)
+        self.mock_db_manager.get_all_people.assert_not_called()
 
     def test_get_database_stats_error(self):
         """Test an error when getting database statistics."""
-        self.mock_db_manager.get_all_people.side_effect = Exception("DB Down")
+        self.mock_db_manager.get_statistics.side_effect = Exception("DB Down")
         response = self.client.get("/stats")
         self.assertEqual(response.status_code, 500)
 
+    def test_get_database_stats_unavailable(self):
+        """Test counters that cannot be read produce an error response."""
+        self.mock_db_manager.get_statistics.return_value = None
+        response = self.client.get("/stats")
+        self.assertEqual(response.status_code, 500)
+
+    def test_get_person_matches_success(self):
+        """Test a page of match history with range and cursor passthrough."""
+        self.mock_db_manager.get_person_matches.return_value = {
+            "success": True,
+            "matches": [
+                {"match_id": "m-1", "person_id": "p-1", "timestamp": "2026-10-17T08:00:00", "confidence": 97.5},
+            ],
+            "next_cursor": "next",
+            "daily_counts": {"2026-10-17": 3},
+        }
+        response = self.client.get("/people/p-1/matches?since=2026-10-01&limit=1&cursor=c1")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["total"], 1)
+        self.assertEqual(data["matches"][0]["match_id"], "m-1")
+        self.assertEqual(data["next_cursor"], "next")
+        self.assertEqual(data["daily_counts"], {"2026-10-17": 3})
+        self.mock_db_manager.get_person_matches.assert_called_once_with(
+            "p-1", since="2026-10-01", until=None, limit=1, cursor="c1"
+        )
+
+    def test_get_person_matches_invalid_range(self):
+        """Test invalid since/until returns 400."""
+        self.mock_db_manager.get_person_matches.side_effect = ValueError("Invalid since/until")
+        response = self.client.get("/people/p-1/matches?since=yesterday")
+        self.assertEqual(response.status_code, 400)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit tests for the shared pooled boto3 client factory.
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from aws.backend.aws import client_factory
+
+
+class TestClientFactory(unittest.TestCase):
+    """Test suite for client_factory."""
+
+    def setUp(self):
+        client_factory.reset()
+        patcher = patch("aws.backend.aws.client_factory.boto3")
+        self.mock_boto3 = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(client_factory.reset)
+        self.mock_session = self.mock_boto3.session.Session.return_value
+        self.mock_session.client.side_effect = lambda *a, **kw: MagicMock()
+        self.mock_session.resource.side_effect = lambda *a, **kw: MagicMock()
+
+    def test_build_config_pool_keepalive_retries(self):
+        """Test the default Config is pooled, keep-alive and adaptive."""
+        config = client_factory.build_config("dynamodb")
+
+        self.assertEqual(config.max_pool_connections, client_factory._settings["max_pool_connections"])
+        self.assertTrue(config.tcp_keepalive)
+        self.assertEqual(config.retries["mode"], client_factory._settings["retry_mode"])
+        self.assertEqual(
+            (config.connect_timeout, config.read_timeout), client_factory.SERVICE_TIMEOUTS["dynamodb"]
+        )
+
+    def test_build_config_unknown_service_uses_default_timeout(self):
+        """Test services without an entry get DEFAULT_TIMEOUT."""
+        config = client_factory.build_config("sns", read_timeout=1)
+
+        self.assertEqual(config.connect_timeout, client_factory.DEFAULT_TIMEOUT[0])
+        self.assertEqual(config.read_timeout, 1)
+
+    def test_get_client_is_shared(self):
+        """Test one client is built per service/region and session is shared."""
+        s3_a = client_factory.get_client("s3", "us-east-1")
+        s3_b = client_factory.get_client("s3", "us-east-1")
+        s3_other_region = client_factory.get_client("s3", "eu-west-1")
+
+        self.assertIs(s3_a, s3_b)
+        self.assertIsNot(s3_a, s3_other_region)
+        self.assertEqual(self.mock_session.client.call_count, 2)
+        self.mock_boto3.session.Session.assert_called_once()
+        _, kwargs = self.mock_session.client.call_args
+        self.assertTrue(kwargs["config"].tcp_keepalive)
+
+    def test_get_client_concurrent_first_use(self):
+        """Test concurrent first calls still build a single client."""
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def worker():
+            barrier.wait()
+            clients.append(client_factory.get_client("rekognition", "us-east-1"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len({id(c) for c in clients}), 1)
+        self.assertEqual(self.mock_session.client.call_count, 1)
+
+    def test_get_table_cached(self):
+        """Test Table handles are built once per table."""
+        people = client_factory.get_table("people", "us-east-1")
+
+        self.assertIs(client_factory.get_table("people", "us-east-1"), people)
+        resource = client_factory.get_resource("dynamodb", "us-east-1")
+        resource.Table.assert_called_once_with("people")
+
+    def test_configure_rebuilds_clients(self):
+        """Test configure() applies to clients created afterwards."""
+        original = dict(client_factory._settings)
+        self.addCleanup(client_factory._settings.update, original)
+        before = client_factory.get_client("s3", "us-east-1")
+
+        client_factory.configure(max_pool_connections=7, retry_mode="standard")
+        after = client_factory.get_client("s3", "us-east-1")
+
+        self.assertIsNot(before, after)
+        _, kwargs = self.mock_session.client.call_args
+        self.assertEqual(kwargs["config"].max_pool_connections, 7)
+        self.assertEqual(kwargs["config"].retries["mode"], "standard")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,23 +2,35 @@
 Unit tests for the DynamoDBClient.
 """
 
+import os
+import time
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 from decimal import Decimal
 
+from botocore.exceptions import ClientError
+
 from aws.backend.aws.dynamodb_client import DynamoDBClient
 
 
 class TestDynamoDBClient(unittest.TestCase):
     """Test suite for DynamoDBClient."""
 
-    @patch("aws.backend.aws.dynamodb_client.boto3")
-    def setUp(self, mock_boto3):
+    @patch("aws.backend.aws.dynamodb_client.get_resource")
+    def setUp(self, mock_get_resource):
         """Set up a mock DynamoDB client before each test."""
         self.mock_dynamodb_resource = MagicMock()
         self.mock_table = MagicMock()
         self.mock_dynamodb_resource.Table.return_value = self.mock_table
-        mock_boto3.resource.return_value = self.mock_dynamodb_resource
+        mock_get_resource.return_value = self.mock_dynamodb_resource
+        # Table handles come from the shared client factory
+        table_patcher = patch(
+            "aws.backend.aws.dynamodb_client.get_table",
+            side_effect=lambda name, region=None: self.mock_dynamodb_resource.Table(name),
+        )
+        self.mock_get_table = table_patcher.start()
+        self.addCleanup(table_patcher.stop)
 
         self.region = "us-east-1"
         self.people_table = "people"
@@ -60,6 +72,7 @@ class TestDynamoDBClient(unittest.TestCase):
 
         # Assert
         self.assertTrue(result["success"])
+        self.mock_get_table.assert_called_with(self.people_table, self.region)
         self.mock_dynamodb_resource.Table.assert_called_with(self.people_table)
         # Check that float is converted to Decimal
         args, kwargs = self.mock_table.put_item.call_args
@@ -79,6 +92,117 @@ class TestDynamoDBClient(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertEqual(result["error"], "DynamoDB Error")
 
+    def test_save_person_with_embedding_is_one_transaction(self):
+        """Test person and embedding are written in a single TransactWriteItems."""
+        transact = self.mock_dynamodb_resource.meta.client.transact_write_items
+
+        result = self.dynamodb_client.save_person_with_embedding(
+            {"person_id": "p-123", "user_name": "John Doe", "embedding_count": 1},
+            {"embedding_id": "emb-1", "person_id": "p-123", "quality_score": 99.5},
+        )
+
+        self.assertTrue(result["success"])
+        transact.assert_called_once()
+        person_put, embedding_put = [item["Put"] for item in transact.call_args.kwargs["TransactItems"]]
+        self.assertEqual(person_put["TableName"], "people")
+        self.assertEqual(person_put["ConditionExpression"], "attribute_not_exists(person_id)")
+        self.assertEqual(person_put["Item"]["person_id"], {"S": "p-123"})
+        self.assertEqual(embedding_put["TableName"], "embeddings")
+        self.assertEqual(embedding_put["Item"]["quality_score"], {"N": "99.5"})
+        self.mock_table.put_item.assert_not_called()
+
+    def test_save_person_with_embedding_cancelled(self):
+        """Test a cancelled transaction is reported as a failure."""
+        self.mock_dynamodb_resource.meta.client.transact_write_items.side_effect = Exception(
+            "TransactionCanceledException"
+        )
+
+        result = self.dynamodb_client.save_person_with_embedding(
+            {"person_id": "p-123", "user_name": "John Doe"},
+            {"embedding_id": "emb-1", "person_id": "p-123"},
+        )
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "TransactionCanceledException")
+
+    def test_save_person_with_embedding_records_image_hash(self):
+        """Test the content hash is claimed conditionally in the same transaction."""
+        self.dynamodb_client.image_hashes_table = "image-hashes"
+        transact = self.mock_dynamodb_resource.meta.client.transact_write_items
+
+        self.dynamodb_client.save_person_with_embedding(
+            {"person_id": "p-123", "user_name": "John Doe"},
+            {"embedding_id": "emb-1", "person_id": "p-123"},
+            image_hash={"content_hash": "abc", "person_id": "p-123", "face_id": "f-1"},
+        )
+
+        hash_put = transact.call_args.kwargs["TransactItems"][0]["Put"]
+        self.assertEqual(hash_put["TableName"], "image-hashes")
+        self.assertEqual(hash_put["ConditionExpression"], "attribute_not_exists(content_hash)")
+        self.assertEqual(hash_put["Item"]["content_hash"], {"S": "abc"})
+        self.assertEqual(len(transact.call_args.kwargs["TransactItems"]), 3)
+
+    def test_image_hash_index(self):
+        """Test hash lookups and that a second save of a hash reports exists."""
+        self.assertEqual(
+            self.dynamodb_client.get_image_hashes(["abc"])["error"], "Image hash index not enabled"
+        )
+        self.dynamodb_client.image_hashes_table = "image-hashes"
+        self.mock_table.put_item.side_effect = [
+            {},
+            ClientError({"Error": {"Code": "ConditionalCheckFailedException"}}, "PutItem"),
+        ]
+
+        first = self.dynamodb_client.save_image_hash({"content_hash": "abc", "person_id": "p-1"})
+        second = self.dynamodb_client.save_image_hash({"content_hash": "abc", "person_id": "p-2"})
+
+        self.assertTrue(first["success"])
+        self.assertFalse(second["success"])
+        self.assertTrue(second["exists"])
+
+    def test_claim_image_hashes(self):
+        """Test hashes are claimed in one conditional transaction and a lost claim reports exists."""
+        self.dynamodb_client.image_hashes_table = "image-hashes"
+        transact = self.mock_dynamodb_resource.meta.client.transact_write_items
+        transact.side_effect = [
+            {},
+            ClientError(
+                {
+                    "Error": {"Code": "TransactionCanceledException"},
+                    "CancellationReasons": [{"Code": "None"}, {"Code": "ConditionalCheckFailed"}],
+                },
+                "TransactWriteItems",
+            ),
+        ]
+        records = [{"content_hash": h, "person_id": "p-1", "pending": True} for h in ("a", "b")]
+
+        first = self.dynamodb_client.claim_image_hashes(records)
+        second = self.dynamodb_client.claim_image_hashes(records)
+
+        self.assertTrue(first["success"])
+        puts = [item["Put"] for item in transact.call_args_list[0].kwargs["TransactItems"]]
+        self.assertEqual([put["Item"]["content_hash"] for put in puts], [{"S": "a"}, {"S": "b"}])
+        self.assertTrue(all(put["ConditionExpression"] == "attribute_not_exists(content_hash)" for put in puts))
+        self.assertFalse(second["success"])
+        self.assertTrue(second["exists"])
+
+    def test_delete_image_hash_only_pending(self):
+        """Test releasing a claim is conditional and a finalized record is reported, not deleted."""
+        self.dynamodb_client.image_hashes_table = "image-hashes"
+        self.mock_table.delete_item.side_effect = [
+            {},
+            ClientError({"Error": {"Code": "ConditionalCheckFailedException"}}, "DeleteItem"),
+        ]
+
+        released = self.dynamodb_client.delete_image_hash("abc", only_pending=True)
+        finalized = self.dynamodb_client.delete_image_hash("abc", only_pending=True)
+
+        self.assertTrue(released["success"])
+        self.assertEqual(
+            self.mock_table.delete_item.call_args.kwargs["ConditionExpression"], "pending = :pending"
+        )
+        self.assertFalse(finalized["success"])
+        self.assertTrue(finalized["finalized"])
 
     def test_get_person_success(self):
         """Test successfully getting a person."""
@@ -116,7 +240,6 @@ class TestDynamoDBClient(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
 
-
     def test_list_people_success(self):
         """Test successfully listing people."""
         # Arrange
@@ -142,24 +265,45 @@ class TestDynamoDBClient(unittest.TestCase):
         # Assert
         self.assertEqual(result, [])
 
-
     def test_search_people_success(self):
-        """Test successfully searching for people."""
+        """Test searching uses the name index and fetches matching records."""
         # Arrange
-        query = "John"
-        expected_items = [{"person_id": "p-1", "user_name": "John Doe"}]
-        self.mock_table.scan.return_value = {"Items": expected_items}
+        self.mock_table.scan.return_value = {
+            "Items": [
+                {"person_id": "p-1", "user_name": "Nguyễn Văn An"},
+                {"person_id": "p-2", "user_name": "Trần Thị Bình"},
+            ]
+        }
+        self.mock_dynamodb_resource.batch_get_item.return_value = {
+            "Responses": {self.people_table: [{"person_id": "p-1", "user_name": "Nguyễn Văn An"}]}
+        }
 
         # Act
-        result = self.dynamodb_client.search_people(query, limit=10)
+        result = self.dynamodb_client.search_people("nguyen van", limit=10)
 
         # Assert
         self.assertTrue(result["success"])
-        self.assertEqual(result["people"], expected_items)
+        self.assertEqual([p["person_id"] for p in result["people"]], ["p-1"])
         self.mock_dynamodb_resource.Table.assert_called_with(self.people_table)
-        # We expect scan to be called, but asserting the FilterExpression is complex.
-        # So we just check that scan was called.
-        self.mock_table.scan.assert_called_once()
+        keys = self.mock_dynamodb_resource.batch_get_item.call_args.kwargs["RequestItems"][self.people_table]["Keys"]
+        self.assertEqual(keys, [{"person_id": "p-1"}])
+
+    def test_search_people_index_reused_and_updated_on_writes(self):
+        """Test the index is built once and kept current by save/delete."""
+        self.mock_table.scan.return_value = {"Items": [{"person_id": "p-1", "user_name": "An"}]}
+        self.mock_dynamodb_resource.batch_get_item.side_effect = lambda RequestItems: {
+            "Responses": {self.people_table: [dict(k) for k in RequestItems[self.people_table]["Keys"]]}
+        }
+        self.dynamodb_client.search_people("an")
+        scans = self.mock_table.scan.call_count
+
+        self.dynamodb_client.save_person({"person_id": "p-2", "user_name": "Đặng Anh"})
+        self.dynamodb_client.delete_person("p-1")
+        result = self.dynamodb_client.search_people("dang")
+
+        self.assertEqual([p["person_id"] for p in result["people"]], ["p-2"])
+        self.assertEqual(self.dynamodb_client.name_index.search("an"), ["p-2"])
+        self.assertEqual(self.mock_table.scan.call_count, scans)
 
     def test_search_people_api_error(self):
         """Test searching for people when the DynamoDB API fails."""
@@ -172,8 +316,7 @@ class TestDynamoDBClient(unittest.TestCase):
         # Assert
         self.assertFalse(result["success"])
         self.assertEqual(result["people"], [])
-        self.assertEqual(result["error"], "DynamoDB Error")
-
+        self.assertIn("DynamoDB Error", result["error"])
 
     def test_save_embedding_success(self):
         """Test successfully saving an embedding."""
@@ -207,7 +350,6 @@ class TestDynamoDBClient(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertEqual(result["error"], "DynamoDB Error")
 
-
     def test_get_embeddings_by_person_success(self):
         """Test successfully getting embeddings for a person."""
         # Arrange
@@ -238,7 +380,6 @@ class TestDynamoDBClient(unittest.TestCase):
         # Assert
         self.assertEqual(result, [])
 
-
     def test_save_match_success(self):
         """Test successfully saving a match."""
         # Arrange
@@ -267,6 +408,41 @@ class TestDynamoDBClient(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertEqual(result["error"], "DynamoDB Error")
 
+    def test_update_person_conditional_all_new(self):
+        """Test an update is one conditional UpdateItem returning ALL_NEW."""
+        updated = {"person_id": "p-1", "user_name": "New", "version": Decimal(4)}
+        self.mock_table.update_item.return_value = {"Attributes": updated}
+
+        result = self.dynamodb_client.update_person("p-1", {"user_name": "New", "version": 99}, expected_version=3)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["person"], updated)
+        kwargs = self.mock_table.update_item.call_args.kwargs
+        self.assertEqual(kwargs["ReturnValues"], "ALL_NEW")
+        self.assertEqual(kwargs["ConditionExpression"], "attribute_exists(#pk) AND #version = :expected")
+        self.assertEqual(kwargs["ExpressionAttributeValues"][":expected"], 3)
+        self.assertIn("#version = if_not_exists(#version, :zero) + :one", kwargs["UpdateExpression"])
+        # The caller cannot overwrite the version counter
+        self.assertNotIn(99, kwargs["ExpressionAttributeValues"].values())
+
+    def test_update_person_not_found_and_conflict(self):
+        """Test a failed condition is reported as not_found or conflict."""
+        def condition_failed(item=None):
+            response = {"Error": {"Code": "ConditionalCheckFailedException", "Message": "failed"}}
+            if item:
+                response["Item"] = item
+            return ClientError(response, "UpdateItem")
+
+        self.mock_table.update_item.side_effect = condition_failed()
+        missing = self.dynamodb_client.update_person("p-404", {"user_name": "X"})
+        self.mock_table.update_item.side_effect = condition_failed({"person_id": "p-1", "version": Decimal(5)})
+        stale = self.dynamodb_client.update_person("p-1", {"user_name": "X"}, expected_version=4)
+
+        self.assertTrue(missing["not_found"])
+        self.assertFalse(missing["conflict"])
+        self.assertTrue(stale["conflict"])
+        self.assertEqual(stale["person"]["version"], 5)
+        self.assertIn("found 5", stale["error"])
 
     def test_query_matches_by_person_success(self):
         """Test successfully querying matches for a person."""
@@ -300,7 +476,6 @@ class TestDynamoDBClient(unittest.TestCase):
         # Assert
         self.assertEqual(result, [])
 
-
     def test_delete_person_success(self):
         """Test successfully deleting a person."""
         # Arrange
@@ -326,7 +501,6 @@ class TestDynamoDBClient(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertEqual(result["error"], "DynamoDB Error")
 
-
     def test_check_health_success(self):
         """Test successful health check."""
         # Arrange
@@ -369,7 +543,518 @@ class TestDynamoDBClient(unittest.TestCase):
         # Assert
         self.assertEqual(result["status"], "disabled")
 
+    @patch("aws.backend.aws.dynamodb_client.time.sleep")
+    def test_save_matches_batch_retries_unprocessed(self, mock_sleep):
+        """Test matches are chunked by 25 and unprocessed items retried."""
+        matches = [{"match_id": f"m{i}", "person_id": "p1", "confidence": 0.9} for i in range(30)]
+        leftover = [{"PutRequest": {"Item": {"match_id": "m0"}}}]
+        self.mock_dynamodb_resource.batch_write_item.side_effect = [
+            {"UnprocessedItems": {self.matches_table: leftover}},
+            {"UnprocessedItems": {}},
+            {},
+        ]
+
+        result = self.dynamodb_client.save_matches_batch(matches)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["saved"], 30)
+        calls = self.mock_dynamodb_resource.batch_write_item.call_args_list
+        self.assertEqual(len(calls[0].kwargs["RequestItems"][self.matches_table]), 25)
+        self.assertEqual(calls[1].kwargs["RequestItems"][self.matches_table], leftover)
+        self.assertEqual(len(calls[2].kwargs["RequestItems"][self.matches_table]), 5)
+        item = calls[0].kwargs["RequestItems"][self.matches_table][0]["PutRequest"]["Item"]
+        self.assertIsInstance(item["confidence"], Decimal)
+        mock_sleep.assert_called_once()
+
+    @patch("aws.backend.aws.dynamodb_client.time.sleep")
+    def test_save_matches_batch_gives_up_after_retries(self, mock_sleep):
+        """Test items still unprocessed after max_retries are reported."""
+        leftover = [{"PutRequest": {"Item": {"match_id": "m0"}}}]
+        self.mock_dynamodb_resource.batch_write_item.return_value = {
+            "UnprocessedItems": {self.matches_table: leftover}
+        }
+
+        result = self.dynamodb_client.save_matches_batch([{"match_id": "m0"}], max_retries=2)
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["unprocessed"], 1)
+        self.assertEqual(self.mock_dynamodb_resource.batch_write_item.call_count, 3)
+
+    @patch("aws.backend.aws.dynamodb_client.time.sleep")
+    def test_save_people_bulk_chunks_and_reports_per_item(self, mock_sleep):
+        """Test people are written in 25-item chunks with per-item results."""
+        people = [{"person_id": f"p{i}", "user_name": f"User {i}"} for i in range(60)]
+        people.append({"user_name": "No ID"})
+
+        def batch_write_item(RequestItems):
+            requests = RequestItems[self.people_table]
+            # p0 is throttled on every attempt
+            leftover = [r for r in requests if r["PutRequest"]["Item"]["person_id"] == "p0"]
+            return {"UnprocessedItems": {self.people_table: leftover}} if leftover else {}
+
+        self.mock_dynamodb_resource.batch_write_item.side_effect = batch_write_item
+
+        result = self.dynamodb_client.save_people_bulk(people, max_retries=2)
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["saved"], 59)
+        self.assertEqual(result["failed"], 2)
+        self.assertEqual(len(result["results"]), 61)
+        self.assertFalse(result["results"][0]["success"])
+        self.assertTrue(result["results"][1]["success"])
+        self.assertEqual(result["results"][-1]["error"], "missing person_id")
+        sizes = sorted(
+            len(c.kwargs["RequestItems"][self.people_table])
+            for c in self.mock_dynamodb_resource.batch_write_item.call_args_list
+        )
+        self.assertEqual(sizes, [1, 1, 10, 25, 25])
+        item = self.mock_dynamodb_resource.batch_write_item.call_args_list[0].kwargs[
+            "RequestItems"
+        ][self.people_table][0]["PutRequest"]["Item"]
+        self.assertIn("created_at", item)
+        self.assertIn("updated_at", item)
+        self.mock_table.put_item.assert_not_called()
+
+    def test_save_people_bulk_updates_built_name_index(self):
+        """Test bulk-saved people become searchable without a rebuild."""
+        self.dynamodb_client._name_index_built_at = time.monotonic()
+        self.mock_dynamodb_resource.batch_write_item.return_value = {}
+
+        self.dynamodb_client.save_people_bulk([{"person_id": "p1", "user_name": "Nguyễn An"}])
+
+        self.assertEqual(self.dynamodb_client.name_index.search("nguyen"), ["p1"])
+
+    def test_save_embeddings_bulk_chunk_error(self):
+        """Test a failing chunk marks only its own items as failed."""
+        embeddings = [{"embedding_id": f"e{i}", "person_id": "p1", "quality_score": 0.5} for i in range(30)]
+
+        def batch_write_item(RequestItems):
+            if len(RequestItems[self.embeddings_table]) == 5:
+                raise Exception("ProvisionedThroughputExceeded")
+            return {}
+
+        self.mock_dynamodb_resource.batch_write_item.side_effect = batch_write_item
+
+        result = self.dynamodb_client.save_embeddings_bulk(embeddings)
+
+        self.assertEqual(result["saved"], 25)
+        self.assertEqual(result["failed"], 5)
+        self.assertEqual(
+            [r["embedding_id"] for r in result["results"] if not r["success"]],
+            [f"e{i}" for i in range(25, 30)],
+        )
+        self.assertEqual(result["results"][-1]["error"], "ProvisionedThroughputExceeded")
+
+    @patch("aws.backend.aws.dynamodb_client.get_resource")
+    def _stats_client(self, mock_get_resource):
+        mock_get_resource.return_value = self.mock_dynamodb_resource
+        return DynamoDBClient(
+            region=self.region,
+            people_table=self.people_table,
+            embeddings_table=self.embeddings_table,
+            matches_table=self.matches_table,
+            stats_table="stats",
+        )
+
+    def _stats_adds(self, stat_id="global"):
+        """Counter deltas from every ADD update sent to a stats item."""
+        adds = []
+        for c in self.mock_table.update_item.call_args_list:
+            if c.kwargs.get("Key") != {"stat_id": stat_id}:
+                continue
+            names, values = c.kwargs["ExpressionAttributeNames"], c.kwargs["ExpressionAttributeValues"]
+            adds.append({names[k]: values[f":{k[1:]}"] for k in names if k.startswith("#c")})
+        return adds
+
+    def _stats_items(self, *items):
+        """Serve Stats table items from BatchGetItem."""
+        self.mock_dynamodb_resource.batch_get_item.return_value = {"Responses": {"stats": list(items)}}
+
+    def test_save_person_counts_only_new_people(self):
+        """Test the people counter is bumped for inserts, not overwrites."""
+        client = self._stats_client()
+        self.mock_table.put_item.return_value = {}
+        client.save_person({"person_id": "p1", "user_name": "A"})
+        self.mock_table.put_item.return_value = {"Attributes": {"person_id": "p1"}}
+        client.save_person({"person_id": "p1", "user_name": "A2"})
+
+        self.assertEqual(self._stats_adds(), [{"people": 1}])
+        self.assertEqual(self.mock_table.put_item.call_args.kwargs["ReturnValues"], "ALL_OLD")
+
+    def test_delete_person_decrements_people(self):
+        """Test deleting an existing person decrements the counter."""
+        client = self._stats_client()
+        self.mock_table.delete_item.return_value = {"Attributes": {"person_id": "p1"}}
+        client.delete_person("p1")
+        self.mock_table.delete_item.return_value = {}
+        client.delete_person("missing")
+
+        self.assertEqual(self._stats_adds(), [{"people": -1}])
+
+    def test_save_matches_batch_counts_per_day_and_site(self):
+        """Test written matches update total, per-day and per-site counters."""
+        client = self._stats_client()
+        self.mock_dynamodb_resource.batch_write_item.return_value = {}
+        matches = [
+            {"match_id": "m1", "timestamp": "2026-10-16T23:59:00", "site_id": "lobby"},
+            {"match_id": "m2", "timestamp": "2026-10-17T08:00:00", "site_id": "lobby"},
+            {"match_id": "m3", "timestamp": "2026-10-17T09:00:00"},
+        ]
+
+        client.save_matches_batch(matches)
+
+        self.assertEqual(self._stats_adds(), [{"matches": 3, "site#lobby": 2}])
+        self.assertEqual(self._stats_adds("month#2026-10"), [{"day#2026-10-16": 1, "day#2026-10-17": 2}])
+
+    def test_daily_counters_roll_over_per_month_with_ttl(self):
+        """Test day counters go to monthly items that expire, not the global item."""
+        client = self._stats_client()
+        client.save_match({"match_id": "m1", "person_id": "p1", "timestamp": "2026-10-31T23:00:00+00:00"})
+        client.save_match({"match_id": "m2", "person_id": "p1", "timestamp": "2026-11-01T01:00:00+00:00"})
+
+        updates = {c.kwargs["Key"]["stat_id"]: c.kwargs for c in self.mock_table.update_item.call_args_list}
+        self.assertEqual(
+            sorted(updates),
+            ["global", "month#2026-10", "month#2026-11", "person#p1#2026-10", "person#p1#2026-11"],
+        )
+        self.assertNotIn(":expires", updates["global"]["ExpressionAttributeValues"])
+        # Kept STATS_RETENTION_DAYS after the end of the month
+        expires = updates["month#2026-10"]["ExpressionAttributeValues"][":expires"]
+        self.assertEqual(
+            datetime.fromtimestamp(expires, timezone.utc),
+            datetime(2026, 11, 1, tzinfo=timezone.utc) + timedelta(days=DynamoDBClient.STATS_RETENTION_DAYS),
+        )
+
+    def test_stats_failure_does_not_fail_write(self):
+        """Test a failing counter update leaves the write successful."""
+        client = self._stats_client()
+        self.mock_table.put_item.return_value = {}
+        self.mock_table.update_item.side_effect = Exception("throttled")
+
+        result = client.save_embedding({"embedding_id": "e1", "person_id": "p1"})
+
+        self.assertTrue(result["success"])
+
+    def test_stats_disabled_without_table(self):
+        """Test counters are not touched when no stats table is configured."""
+        self.mock_table.put_item.return_value = {}
+        self.dynamodb_client.save_person({"person_id": "p1", "user_name": "A"})
+
+        self.mock_table.update_item.assert_not_called()
+        self.assertNotIn("ReturnValues", self.mock_table.put_item.call_args.kwargs)
+        self.assertFalse(self.dynamodb_client.get_stats()["success"])
+
+    def test_get_stats_single_read(self):
+        """Test get_stats parses the aggregate item from one GetItem."""
+        client = self._stats_client()
+        self._stats_items(
+            {
+                "stat_id": "global",
+                "people": Decimal(3),
+                "embeddings": Decimal(9),
+                "matches": Decimal(5),
+                "site#lobby": Decimal(2),
+                "updated_at": "2026-10-17T10:00:00",
+            },
+            {"stat_id": "month#2026-10", "day#2026-10-17": Decimal(4), "day#2026-10-16": Decimal(1)},
+        )
+
+        result = client.get_stats()
+
+        self.assertTrue(result["success"])
+        stats = result["stats"]
+        self.assertEqual((stats["total_people"], stats["total_embeddings"], stats["total_matches"]), (3, 9, 5))
+        self.assertEqual(list(stats["matches_per_day"]), ["2026-10-16", "2026-10-17"])
+        self.assertEqual(stats["matches_per_site"], {"lobby": 2})
+        self.mock_dynamodb_resource.batch_get_item.assert_called_once()
+        keys = self.mock_dynamodb_resource.batch_get_item.call_args.kwargs["RequestItems"]["stats"]["Keys"]
+        self.assertEqual(keys[0], {"stat_id": "global"})
+        self.assertEqual(keys[1], {"stat_id": f"month#{datetime.now(timezone.utc):%Y-%m}"})
+        self.mock_table.scan.assert_not_called()
+
+    def test_save_match_sets_bucket_and_person_counts(self):
+        """Test matches get a person/day bucket and per-person day counters."""
+        client = self._stats_client()
+        client.save_match({"match_id": "m1", "person_id": "p1", "timestamp": "2026-10-17T08:00:00"})
+
+        item = self.mock_table.put_item.call_args.kwargs["Item"]
+        self.assertEqual(item["person_day"], "p1#2026-10-17")
+        person_updates = [
+            c.kwargs for c in self.mock_table.update_item.call_args_list
+            if c.kwargs["Key"] == {"stat_id": "person#p1#2026-10"}
+        ]
+        self.assertEqual(len(person_updates), 1)
+        self.assertEqual(
+            person_updates[0]["ExpressionAttributeNames"]["#c0"], "day#2026-10-17"
+        )
+
+    def test_query_person_matches_walks_day_buckets(self):
+        """Test a range query reads buckets newest first and pages across days."""
+        client = self._stats_client()
+        self._stats_items(
+            {
+                "stat_id": "person#p1#2026-10",
+                "day#2026-10-15": Decimal(1),
+                "day#2026-10-16": Decimal(2),
+                "day#2026-10-17": Decimal(1),
+            }
+        )
+        self.mock_table.query.side_effect = [
+            {"Items": [{"match_id": "m3"}]},
+            {"Items": [{"match_id": "m2"}], "LastEvaluatedKey": {"match_id": "m2"}},
+        ]
+
+        result = client.query_person_matches(
+            "p1", since="2026-10-15", until="2026-10-17", limit=2
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual([m["match_id"] for m in result["matches"]], ["m3", "m2"])
+        calls = self.mock_table.query.call_args_list
+        self.assertEqual(
+            [c.kwargs["ExpressionAttributeValues"][":bucket"] for c in calls],
+            ["p1#2026-10-17", "p1#2026-10-16"],
+        )
+        self.assertEqual(calls[0].kwargs["IndexName"], "person_day-index")
+        self.assertEqual(calls[0].kwargs["ExpressionAttributeValues"][":until"], "2026-10-17~")
+        self.assertFalse(calls[0].kwargs["ScanIndexForward"])
+
+        # The next page resumes inside the 16th, then moves on to the 15th
+        self.mock_table.query.side_effect = [
+            {"Items": [{"match_id": "m1"}]},
+            {"Items": [{"match_id": "m0"}]},
+        ]
+        page2 = client.query_person_matches(
+            "p1", since="2026-10-15", until="2026-10-17", limit=2, cursor=result["next_cursor"]
+        )
+
+        self.assertEqual([m["match_id"] for m in page2["matches"]], ["m1", "m0"])
+        resumed = self.mock_table.query.call_args_list[2].kwargs
+        self.assertEqual(resumed["ExclusiveStartKey"], {"match_id": "m2"})
+        self.assertEqual(
+            self.mock_table.query.call_args_list[3].kwargs["ExpressionAttributeValues"][":bucket"],
+            "p1#2026-10-15",
+        )
+        self.assertIsNone(page2["next_cursor"])
+
+    def test_query_person_matches_skips_days_without_counts(self):
+        """Test per-day counts limit the queries to days that have matches."""
+        client = self._stats_client()
+        self._stats_items(
+            {"stat_id": "person#p1#2026-10", "day#2026-10-10": Decimal(2)},
+            {"stat_id": "person#p1#2026-09", "day#2026-09-01": Decimal(7)},
+        )
+        self.mock_table.query.return_value = {"Items": [{"match_id": "m1"}, {"match_id": "m2"}]}
+
+        result = client.query_person_matches("p1", since="2026-10-01", until="2026-10-17")
+
+        self.assertEqual(result["daily_counts"], {"2026-10-10": 2})
+        self.mock_table.query.assert_called_once()
+        self.assertEqual(
+            self.mock_table.query.call_args.kwargs["ExpressionAttributeValues"][":bucket"],
+            "p1#2026-10-10",
+        )
+
+    def test_query_person_matches_without_counts_reads_one_range(self):
+        """Test a range without per-day counts is one person_id-index Query, not one per day."""
+        self.mock_table.query.side_effect = [
+            {"Items": [{"match_id": "m2"}, {"match_id": "m1"}], "LastEvaluatedKey": {"match_id": "m1"}},
+            {"Items": [{"match_id": "m0"}]},
+        ]
+
+        result = self.dynamodb_client.query_person_matches(
+            "p1", since="2025-10-18", until="2026-10-17", limit=2
+        )
+
+        self.assertEqual([m["match_id"] for m in result["matches"]], ["m2", "m1"])
+        query = self.mock_table.query.call_args.kwargs
+        self.assertEqual(query["IndexName"], "person_id-index")
+        self.assertEqual(query["ExpressionAttributeValues"][":since"], "2025-10-18")
+        self.assertEqual(query["ExpressionAttributeValues"][":until"], "2026-10-17~")
+
+        page2 = self.dynamodb_client.query_person_matches(
+            "p1", since="2025-10-18", until="2026-10-17", limit=2, cursor=result["next_cursor"]
+        )
+
+        self.assertEqual([m["match_id"] for m in page2["matches"]], ["m0"])
+        self.assertEqual(self.mock_table.query.call_count, 2)
+        self.assertEqual(self.mock_table.query.call_args.kwargs["ExclusiveStartKey"], {"match_id": "m1"})
+        self.assertIsNone(page2["next_cursor"])
+
+    def test_match_timestamps_use_one_utc_clock(self):
+        """Test offset and naive timestamps are stored, bucketed and queried in UTC."""
+        self.mock_dynamodb_resource.batch_write_item.return_value = {"UnprocessedItems": {}}
+        try:
+            # Naive timestamps are local time; run as a UTC+07:00 host
+            with patch.dict(os.environ, {"TZ": "ICT-7"}):
+                time.tzset()
+                self.dynamodb_client.save_matches_batch(
+                    [
+                        {"match_id": "m1", "person_id": "p1", "timestamp": "2026-10-17T06:30:00+07:00"},
+                        {"match_id": "m2", "person_id": "p1", "timestamp": "2026-10-17T08:00:00"},
+                        {"match_id": "m3", "person_id": "p1", "timestamp": "2026-10-17T09:00:00Z"},
+                    ]
+                )
+                bounds = DynamoDBClient._match_range("2026-10-17T00:00:00+07:00", "2026-10-17")
+        finally:
+            time.tzset()
+
+        items = [
+            r["PutRequest"]["Item"]
+            for c in self.mock_dynamodb_resource.batch_write_item.call_args_list
+            for r in c.kwargs["RequestItems"][self.matches_table]
+        ]
+        # 06:30 and 08:00 at UTC+07:00 are still the 16th and early 17th in UTC
+        self.assertEqual(
+            [(i["timestamp"], i["person_day"]) for i in items],
+            [
+                ("2026-10-16T23:30:00+00:00", "p1#2026-10-16"),
+                ("2026-10-17T01:00:00+00:00", "p1#2026-10-17"),
+                ("2026-10-17T09:00:00+00:00", "p1#2026-10-17"),
+            ],
+        )
+        since_key, until_key, days = bounds
+        self.assertEqual(since_key, "2026-10-16T17:00:00+00:00")
+        self.assertEqual(days, ["2026-10-17", "2026-10-16"])
+        self.assertTrue(all(since_key <= i["timestamp"] <= until_key for i in items))
+
+    def test_query_person_matches_invalid_range(self):
+        """Test bad bounds and foreign cursors raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.dynamodb_client.query_person_matches("p1", since="yesterday")
+        with self.assertRaises(ValueError):
+            self.dynamodb_client.query_person_matches("p1", since="2026-10-17", until="2026-10-01")
+        with self.assertRaises(ValueError):
+            self.dynamodb_client.query_person_matches("p1", since="2024-01-01", until="2026-01-01")
+        cursor = DynamoDBClient.encode_cursor({"day": "2020-01-01"})
+        with self.assertRaises(ValueError):
+            self.dynamodb_client.query_person_matches("p1", until="2026-10-17", cursor=cursor)
+        self.mock_table.query.assert_not_called()
+
+    def test_get_people_batch_chunks_and_dedupes(self):
+        """Test keys are de-duplicated and split into 100-key chunks."""
+        ids = [f"p{i}" for i in range(250)] + ["p0", "p1"]
+
+        def batch_get_item(RequestItems):
+            keys = RequestItems[self.people_table]["Keys"]
+            return {"Responses": {self.people_table: [dict(k) for k in keys]}}
+
+        self.mock_dynamodb_resource.batch_get_item.side_effect = batch_get_item
+
+        result = self.dynamodb_client.get_people_batch(ids)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(len(result["people"]), 250)
+        sizes = sorted(
+            len(c.kwargs["RequestItems"][self.people_table]["Keys"])
+            for c in self.mock_dynamodb_resource.batch_get_item.call_args_list
+        )
+        self.assertEqual(sizes, [50, 100, 100])
+
+    @patch("aws.backend.aws.dynamodb_client.time.sleep")
+    def test_get_people_batch_retries_unprocessed_keys(self, mock_sleep):
+        """Test UnprocessedKeys are retried instead of dropped."""
+        self.mock_dynamodb_resource.batch_get_item.side_effect = [
+            {
+                "Responses": {self.people_table: [{"person_id": "p1"}]},
+                "UnprocessedKeys": {self.people_table: {"Keys": [{"person_id": "p2"}]}},
+            },
+            {"Responses": {self.people_table: [{"person_id": "p2"}]}},
+        ]
+
+        result = self.dynamodb_client.get_people_batch(["p1", "p2"])
+
+        self.assertEqual([p["person_id"] for p in result["people"]], ["p1", "p2"])
+        self.assertEqual(result["unprocessed"], [])
+        retry = self.mock_dynamodb_resource.batch_get_item.call_args_list[1]
+        self.assertEqual(retry.kwargs["RequestItems"][self.people_table]["Keys"], [{"person_id": "p2"}])
+        mock_sleep.assert_called_once()
+
+    @patch("aws.backend.aws.dynamodb_client.time.sleep")
+    def test_get_people_batch_reports_exhausted_retries(self, mock_sleep):
+        """Test keys still unprocessed after max_retries are reported."""
+        self.mock_dynamodb_resource.batch_get_item.return_value = {
+            "Responses": {},
+            "UnprocessedKeys": {self.people_table: {"Keys": [{"person_id": "p1"}]}},
+        }
+
+        result = self.dynamodb_client.get_people_batch(["p1"], max_retries=2)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["unprocessed"], ["p1"])
+        self.assertEqual(self.mock_dynamodb_resource.batch_get_item.call_count, 3)
+
+    def test_get_people_batch_projection(self):
+        """Test attributes become a ProjectionExpression including the key."""
+        self.mock_dynamodb_resource.batch_get_item.return_value = {"Responses": {}}
+
+        self.dynamodb_client.get_people_batch(["p1"], attributes=["user_name", "hometown"])
+
+        request = self.mock_dynamodb_resource.batch_get_item.call_args.kwargs["RequestItems"][self.people_table]
+        names = request["ExpressionAttributeNames"]
+        self.assertEqual(set(names.values()), {"person_id", "user_name", "hometown"})
+        self.assertEqual(set(request["ProjectionExpression"].split(", ")), set(names))
+
+    def test_list_people_follows_last_evaluated_key(self):
+        """Test a page keeps scanning until the limit and returns a cursor."""
+        self.mock_table.scan.side_effect = [
+            {"Items": [{"person_id": "p-1"}], "LastEvaluatedKey": {"person_id": "p-1"}},
+            {"Items": [{"person_id": "p-2"}], "LastEvaluatedKey": {"person_id": "p-2"}},
+        ]
+
+        result = self.dynamodb_client.list_people(limit=2)
+
+        self.assertEqual([p["person_id"] for p in result["people"]], ["p-1", "p-2"])
+        self.assertEqual(DynamoDBClient.decode_cursor(result["next_cursor"]), {"person_id": "p-2"})
+        second_call = self.mock_table.scan.call_args_list[1]
+        self.assertEqual(second_call.kwargs, {"Limit": 1, "ExclusiveStartKey": {"person_id": "p-1"}})
+
+    def test_list_people_resumes_from_cursor(self):
+        """Test a cursor becomes the ExclusiveStartKey and the last page has no cursor."""
+        cursor = DynamoDBClient.encode_cursor({"person_id": "p-2"})
+        self.mock_table.scan.return_value = {"Items": [{"person_id": "p-3"}]}
+
+        result = self.dynamodb_client.list_people(limit=10, cursor=cursor)
+
+        self.mock_table.scan.assert_called_once_with(Limit=10, ExclusiveStartKey={"person_id": "p-2"})
+        self.assertIsNone(result["next_cursor"])
+
+    def test_list_people_invalid_cursor(self):
+        """Test a malformed cursor is rejected."""
+        with self.assertRaises(ValueError):
+            self.dynamodb_client.list_people(cursor="not-a-cursor")
+
+    def test_iter_people_parallel_segments(self):
+        """Test every segment is scanned to completion."""
+
+        def scan(**kwargs):
+            segment = kwargs["Segment"]
+            if "ExclusiveStartKey" not in kwargs:
+                return {
+                    "Items": [{"person_id": f"s{segment}-a"}],
+                    "LastEvaluatedKey": {"person_id": f"s{segment}-a"},
+                }
+            return {"Items": [{"person_id": f"s{segment}-b"}]}
+
+        self.mock_table.scan.side_effect = scan
+
+        people = list(self.dynamodb_client.iter_people(total_segments=3, page_size=1))
+
+        self.assertEqual(
+            sorted(p["person_id"] for p in people),
+            ["s0-a", "s0-b", "s1-a", "s1-b", "s2-a", "s2-b"],
+        )
+        segments = {c.kwargs["Segment"] for c in self.mock_table.scan.call_args_list}
+        self.assertEqual(segments, {0, 1, 2})
+        self.assertTrue(all(c.kwargs["TotalSegments"] == 3 for c in self.mock_table.scan.call_args_list))
+
+    def test_iter_people_segment_error(self):
+        """Test a failing segment surfaces as an error."""
+        self.mock_table.scan.side_effect = Exception("Throttled")
+
+        with self.assertRaises(RuntimeError):
+            list(self.dynamodb_client.iter_people(total_segments=2))
+
 
 if __name__ == "__main__":
     unittest.main()
-
@@ -0,0 +1,133 @@
+"""
+Unit tests for the two-tier Redis client.
+"""
+
+import json
+import pickle
+import unittest
+from unittest.mock import MagicMock, patch
+
+from aws.backend.aws.redis_client import TwoTierRedisClient
+
+
+class TestTwoTierRedisClient(unittest.TestCase):
+    """Test suite for TwoTierRedisClient."""
+
+    @patch("aws.backend.aws.redis_client.redis")
+    def setUp(self, mock_redis):
+        """Set up a client backed by a mock Redis connection."""
+        self.mock_conn = MagicMock()
+        mock_redis.Redis.return_value = self.mock_conn
+        self.mock_pubsub = self.mock_conn.pubsub.return_value
+
+        self.client = TwoTierRedisClient(local_max_entries=16, local_ttl=30)
+
+    def _invalidation_handler(self):
+        _, kwargs = self.mock_pubsub.subscribe.call_args
+        return kwargs[TwoTierRedisClient.INVALIDATION_CHANNEL]
+
+    def test_subscribes_to_invalidation_channel(self):
+        """Test the listener thread is started on init."""
+        self.assertTrue(self.client.enabled)
+        self.mock_pubsub.run_in_thread.assert_called_once()
+
+    def test_hot_key_served_from_local_tier(self):
+        """Test a Redis hit is cached locally and not fetched again."""
+        self.mock_conn.get.return_value = pickle.dumps({"name": "Alice"})
+
+        first = self.client.get_user_metadata("u1")
+        second = self.client.get_user_metadata("u1")
+
+        self.assertEqual(first, {"name": "Alice"})
+        self.assertEqual(second, {"name": "Alice"})
+        self.mock_conn.get.assert_called_once()
+
+    def test_local_tier_returns_copies(self):
+        """Test callers cannot mutate the cached value."""
+        self.client.set_search_result("h1", {"faces": []})
+
+        result = self.client.get_search_result("h1")
+        result["cache_hit"] = True
+
+        self.assertNotIn("cache_hit", self.client.get_search_result("h1"))
+        self.mock_conn.get.assert_not_called()
+
+    def test_cold_keys_bypass_local_tier(self):
+        """Test keys outside the hot prefixes always go to Redis."""
+        self.mock_conn.get.return_value = pickle.dumps({"vector": [1.0]})
+
+        self.client.get_embedding("u1")
+        self.client.get_embedding("u1")
+
+        self.assertEqual(self.mock_conn.get.call_count, 2)
+
+    def test_invalidate_user_evicts_and_publishes(self):
+        """Test invalidate_user clears the local entry and broadcasts."""
+        self.client.set_user_metadata("u1", {"name": "Alice"})
+
+        self.client.invalidate_user("u1")
+
+        self.assertIsNone(self.client.local.get("facerecog:user:u1"))
+        channel, payload = self.mock_conn.publish.call_args[0]
+        self.assertEqual(channel, TwoTierRedisClient.INVALIDATION_CHANNEL)
+        self.assertIn("facerecog:user:u1", json.loads(payload)["keys"])
+
+    def test_invalidation_message_from_other_worker(self):
+        """Test a published invalidation evicts the local entry."""
+        self.client.set_user_metadata("u1", {"name": "Alice"})
+        self.client.set_search_result("h1", {"faces": []})
+        handler = self._invalidation_handler()
+
+        handler({"data": json.dumps({"keys": ["facerecog:user:u1"], "pattern": None})})
+        handler({"data": json.dumps({"keys": [], "pattern": "facerecog:search:*"})})
+
+        self.assertIsNone(self.client.local.get("facerecog:user:u1"))
+        self.assertIsNone(self.client.local.get("facerecog:search:h1"))
+
+    @patch("aws.backend.aws.redis_client.redis")
+    def test_local_tier_disabled_without_subscription(self, mock_redis):
+        """Test hot keys go to Redis when pub/sub is unavailable."""
+        conn = MagicMock()
+        conn.pubsub.side_effect = Exception("no pubsub")
+        conn.get.return_value = pickle.dumps({"name": "Alice"})
+        mock_redis.Redis.return_value = conn
+
+        client = TwoTierRedisClient()
+        client.get_user_metadata("u1")
+        client.get_user_metadata("u1")
+
+        self.assertEqual(conn.get.call_count, 2)
+
+    def test_get_many_fetches_only_local_misses(self):
+        """Test a multi-get reads local hits and MGETs the rest."""
+        self.client.set_user_metadata("u1", {"name": "Alice"})
+        self.mock_conn.mget.return_value = [pickle.dumps({"name": "Bob"}), None]
+
+        found = self.client.get_user_metadata_many(["u1", "u2", "u3"])
+
+        self.assertEqual(found, {"u1": {"name": "Alice"}, "u2": {"name": "Bob"}})
+        self.mock_conn.mget.assert_called_once_with(["facerecog:user:u2", "facerecog:user:u3"])
+        self.assertEqual(self.client.local.get("facerecog:user:u2"), {"name": "Bob"})
+
+    def test_set_many_uses_pipeline(self):
+        """Test a multi-set is pipelined and populates the local tier."""
+        pipe = self.mock_conn.pipeline.return_value
+
+        self.client.set_user_metadata_many({"u1": {"name": "Alice"}, "u2": {"name": "Bob"}})
+
+        self.assertEqual(pipe.setex.call_count, 2)
+        pipe.execute.assert_called_once()
+        self.assertEqual(self.client.local.get("facerecog:user:u2"), {"name": "Bob"})
+
+    def test_close_stops_listener(self):
+        """Test close stops the pub/sub thread."""
+        listener = self.mock_pubsub.run_in_thread.return_value
+
+        self.client.close()
+
+        listener.stop.assert_called_once()
+        self.mock_conn.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,13 +13,13 @@ from aws.backend.aws.rekognition_client import RekognitionClient
 class TestRekognitionClient(unittest.TestCase):
     """Test suite for RekognitionClient."""
 
-    @patch("aws.backend.aws.rekognition_client.boto3")
-    def setUp(self, mock_boto3):
+    @patch("aws.backend.aws.rekognition_client.get_client")
+    def setUp(self, mock_get_client):
         """Set up a mock Rekognition client before each test."""
         self.mock_boto_client = MagicMock()
         # Configure the exception class on the mock client
         self.mock_boto_client.exceptions.InvalidParameterException = ClientError
-        mock_boto3.client.return_value = self.mock_boto_client
+        mock_get_client.return_value = self.mock_boto_client
         self.collection_id = "test-collection"
         self.region = "us-west-2"
 
@@ -247,6 +247,19 @@ class TestRekognitionClient(unittest.TestCase):
         self.assertEqual(result["error"], "AWS Error")
 
 
+    def test_get_collection_stats(self):
+        """Test the face count comes from DescribeCollection."""
+        self.mock_boto_client.describe_collection.return_value = {"FaceCount": 42}
+
+        result = self.rekognition_client.get_collection_stats()
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["face_count"], 42)
+        self.mock_boto_client.describe_collection.assert_called_once_with(
+            CollectionId=self.collection_id
+        )
+        self.mock_boto_client.list_faces.assert_not_called()
+
     def test_list_faces_success(self):
         """Test successfully listing faces in the collection."""
         # Arrange
@@ -11,11 +11,11 @@ from aws.backend.aws.s3_client import S3Client
 class TestS3Client(unittest.TestCase):
     """Test suite for S3Client."""
 
-    @patch("aws.backend.aws.s3_client.boto3")
-    def setUp(self, mock_boto3):
+    @patch("aws.backend.aws.s3_client.get_client")
+    def setUp(self, mock_get_client):
         """Set up a mock S3 client before each test."""
         self.mock_s3_client = MagicMock()
-        mock_boto3.client.return_value = self.mock_s3_client
+        mock_get_client.return_value = self.mock_s3_client
 
         self.bucket_name = "test-bucket"
         self.region = "us-west-2"
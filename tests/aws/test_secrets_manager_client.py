@@ -18,12 +18,12 @@ class TestSecretsManagerClient(unittest.TestCase):
         """Clear the cache after each test to ensure isolation."""
         get_secret.cache_clear()
 
-    @patch("aws.backend.aws.secrets_manager_client.boto3")
-    def test_get_secret_success(self, mock_boto3):
+    @patch("aws.backend.aws.secrets_manager_client.get_client")
+    def test_get_secret_success(self, mock_get_client):
         """Test successfully retrieving and parsing a secret."""
         # Arrange
         mock_sm_client = MagicMock()
-        mock_boto3.session.Session.return_value.client.return_value = mock_sm_client
+        mock_get_client.return_value = mock_sm_client
 
         secret_name = "my/secret"
         region_name = "us-east-1"
@@ -39,12 +39,12 @@ class TestSecretsManagerClient(unittest.TestCase):
         self.assertEqual(result, secret_content)
         mock_sm_client.get_secret_value.assert_called_once_with(SecretId=secret_name)
 
-    @patch("aws.backend.aws.secrets_manager_client.boto3")
-    def test_get_secret_cached(self, mock_boto3):
+    @patch("aws.backend.aws.secrets_manager_client.get_client")
+    def test_get_secret_cached(self, mock_get_client):
         """Test that the secret retrieval is cached."""
         # Arrange
         mock_sm_client = MagicMock()
-        mock_boto3.session.Session.return_value.client.return_value = mock_sm_client
+        mock_get_client.return_value = mock_sm_client
 
         secret_name = "my/cached/secret"
         region_name = "us-east-1"
@@ -63,12 +63,12 @@ class TestSecretsManagerClient(unittest.TestCase):
         # The mock should only be called once due to caching
         mock_sm_client.get_secret_value.assert_called_once_with(SecretId=secret_name)
 
-    @patch("aws.backend.aws.secrets_manager_client.boto3")
-    def test_get_secret_client_error(self, mock_boto3):
+    @patch("aws.backend.aws.secrets_manager_client.get_client")
+    def test_get_secret_client_error(self, mock_get_client):
         """Test handling of ClientError from AWS."""
         # Arrange
         mock_sm_client = MagicMock()
-        mock_boto3.session.Session.return_value.client.return_value = mock_sm_client
+        mock_get_client.return_value = mock_sm_client
 
         error_response = {"Error": {"Code": "ResourceNotFoundException"}}
         side_effect = ClientError(error_response, "GetSecretValue")
@@ -80,12 +80,12 @@ class TestSecretsManagerClient(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
 
-    @patch("aws.backend.aws.secrets_manager_client.boto3")
-    def test_get_secret_no_secret_string(self, mock_boto3):
+    @patch("aws.backend.aws.secrets_manager_client.get_client")
+    def test_get_secret_no_secret_string(self, mock_get_client):
         """Test handling of a secret that has no SecretString."""
         # Arrange
         mock_sm_client = MagicMock()
-        mock_boto3.session.Session.return_value.client.return_value = mock_sm_client
+        mock_get_client.return_value = mock_sm_client
         mock_sm_client.get_secret_value.return_value = {"SecretBinary": b"data"}
 
         # Act
@@ -94,12 +94,12 @@ class TestSecretsManagerClient(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
 
-    @patch("aws.backend.aws.secrets_manager_client.boto3")
-    def test_get_secret_json_decode_error(self, mock_boto3):
+    @patch("aws.backend.aws.secrets_manager_client.get_client")
+    def test_get_secret_json_decode_error(self, mock_get_client):
         """Test handling of a secret with invalid JSON."""
         # Arrange
         mock_sm_client = MagicMock()
-        mock_boto3.session.Session.return_value.client.return_value = mock_sm_client
+        mock_get_client.return_value = mock_sm_client
         mock_sm_client.get_secret_value.return_value = {"SecretString": "not-valid-json"}
 
         # Act
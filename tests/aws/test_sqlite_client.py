@@ -0,0 +1,237 @@
+"""
+Unit tests for the embedded SQLite storage backend.
+"""
+
+import gc
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from aws.backend.aws.sqlite_client import SQLiteClient
+
+
+class TestSQLiteClient(unittest.TestCase):
+    """Test suite for SQLiteClient (real database in a temp directory)."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "nested", "faces.db")
+        self.client = SQLiteClient(path=self.path)
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(self.client.close)
+
+    def test_init_creates_wal_database(self):
+        """Test the file (and parent directory) are created in WAL mode."""
+        self.assertTrue(os.path.exists(self.path))
+        mode = self.client._conn().execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+        self.assertEqual(self.client.check_health()["status"], "ok")
+
+    def test_person_roundtrip_update_and_delete(self):
+        """Test save/get/update/increment/delete keep DynamoDB semantics."""
+        saved = self.client.save_person({"person_id": "p1", "user_name": "An", "score": Decimal("1.5")})
+        self.assertTrue(saved["success"])
+        person = self.client.get_person("p1")
+        self.assertEqual(person["score"], 1.5)
+        self.assertIn("created_at", person)
+
+        self.client.update_person("p1", {"hometown": "Hue"})
+        self.client.increment_embedding_count("p1")
+        self.client.increment_embedding_count("p1")
+        person = self.client.get_person("p1")
+        self.assertEqual((person["user_name"], person["hometown"], person["embedding_count"]), ("An", "Hue", 2))
+
+        self.client.delete_person("p1")
+        self.assertIsNone(self.client.get_person("p1"))
+
+    def test_update_person_versioning(self):
+        """Test updates need an existing person and honour expected_version."""
+        self.assertTrue(self.client.update_person("ghost", {"user_name": "X"})["not_found"])
+        self.client.save_person({"person_id": "p1", "user_name": "An"})
+
+        first = self.client.update_person("p1", {"user_name": "Binh"}, expected_version=0)
+        stale = self.client.update_person("p1", {"user_name": "Chi"}, expected_version=0)
+
+        self.assertEqual(first["person"]["version"], 1)
+        self.assertTrue(stale["conflict"])
+        self.assertEqual(self.client.get_person("p1")["user_name"], "Binh")
+
+    def test_save_person_with_embedding_all_or_nothing(self):
+        """Test the pair is written together and a duplicate person writes neither."""
+        first = self.client.save_person_with_embedding(
+            {"person_id": "p1", "user_name": "An", "embedding_count": 1},
+            {"embedding_id": "e1", "person_id": "p1"},
+        )
+        duplicate = self.client.save_person_with_embedding(
+            {"person_id": "p1", "user_name": "Other"},
+            {"embedding_id": "e2", "person_id": "p1"},
+        )
+
+        self.assertTrue(first["success"])
+        self.assertFalse(duplicate["success"])
+        self.assertEqual(self.client.get_person("p1")["user_name"], "An")
+        self.assertEqual([e["embedding_id"] for e in self.client.get_embeddings_by_person("p1")], ["e1"])
+
+    def test_image_hash_claimed_once(self):
+        """Test a content hash maps to one enrollment and a reused hash writes nothing."""
+        first = self.client.save_person_with_embedding(
+            {"person_id": "p1", "user_name": "An"},
+            {"embedding_id": "e1", "person_id": "p1"},
+            image_hash={"content_hash": "h1", "person_id": "p1", "face_id": "f1"},
+        )
+        retry = self.client.save_person_with_embedding(
+            {"person_id": "p2", "user_name": "An"},
+            {"embedding_id": "e2", "person_id": "p2"},
+            image_hash={"content_hash": "h1", "person_id": "p2", "face_id": "f2"},
+        )
+
+        self.assertTrue(first["success"])
+        self.assertFalse(retry["success"])
+        self.assertIsNone(self.client.get_person("p2"))
+        records = self.client.get_image_hashes(["h1", "h2"])["records"]
+        self.assertEqual(list(records), ["h1"])
+        self.assertEqual(records["h1"]["face_id"], "f1")
+
+        self.assertTrue(self.client.save_image_hash({"content_hash": "h2", "person_id": "p1"})["success"])
+        self.assertTrue(self.client.save_image_hash({"content_hash": "h2", "person_id": "p2"})["exists"])
+        self.client.delete_image_hash("h2")
+        self.assertEqual(self.client.get_image_hashes(["h2"])["records"], {})
+
+    def test_claim_image_hashes_all_or_none(self):
+        """Test a claim overlapping an existing hash writes nothing and the owner can finalize."""
+        claim = self.client.claim_image_hashes(
+            [{"content_hash": h, "person_id": "p1", "pending": True} for h in ("h1", "h2")]
+        )
+        lost = self.client.claim_image_hashes(
+            [{"content_hash": h, "person_id": "p2", "pending": True} for h in ("h3", "h2")]
+        )
+
+        self.assertTrue(claim["success"])
+        self.assertTrue(lost["exists"])
+        self.assertEqual(sorted(self.client.get_image_hashes(["h1", "h2", "h3"])["records"]), ["h1", "h2"])
+        self.assertTrue(self.client.save_image_hash({"content_hash": "h1", "person_id": "p2"})["exists"])
+        self.assertTrue(
+            self.client.save_image_hash({"content_hash": "h1", "person_id": "p1", "face_id": "f1"})["success"]
+        )
+        record = self.client.get_image_hashes(["h1"])["records"]["h1"]
+        self.assertEqual(record["face_id"], "f1")
+        self.assertNotIn("pending", record)
+
+        # Releasing a claim never deletes a record finalized meanwhile
+        self.assertTrue(self.client.delete_image_hash("h1", only_pending=True)["finalized"])
+        self.assertTrue(self.client.delete_image_hash("h2", only_pending=True)["success"])
+        self.assertEqual(list(self.client.get_image_hashes(["h1", "h2"])["records"]), ["h1"])
+
+    def test_list_people_keyset_pagination(self):
+        """Test pages follow person_id order and the last page has no cursor."""
+        self.client.save_people_bulk([{"person_id": f"p{i:02d}", "user_name": f"U{i}"} for i in range(5)])
+
+        first = self.client.list_people(limit=3)
+        second = self.client.list_people(limit=3, cursor=first["next_cursor"])
+
+        self.assertEqual([p["person_id"] for p in first["people"]], ["p00", "p01", "p02"])
+        self.assertEqual([p["person_id"] for p in second["people"]], ["p03", "p04"])
+        self.assertIsNone(second["next_cursor"])
+        with self.assertRaises(ValueError):
+            self.client.list_people(cursor="!!")
+
+    def test_bulk_results_and_batch_get(self):
+        """Test bulk writes report per-item results and batch get projects."""
+        result = self.client.save_people_bulk(
+            [{"person_id": "a", "user_name": "A"}, {"user_name": "no id"}, {"person_id": "b", "user_name": "B"}]
+        )
+
+        self.assertEqual((result["saved"], result["failed"]), (2, 1))
+        self.assertEqual(result["results"][1]["error"], "missing person_id")
+        batch = self.client.get_people_batch(["a", "b", "a", "zz"], attributes=["user_name"])
+        self.assertEqual(
+            sorted(batch["people"], key=lambda p: p["person_id"]),
+            [{"person_id": "a", "user_name": "A"}, {"person_id": "b", "user_name": "B"}],
+        )
+
+    def test_search_people_accent_insensitive(self):
+        """Test search uses the shared name index and sees later writes."""
+        self.client.save_person({"person_id": "p1", "user_name": "Nguyễn Văn An"})
+        self.client.save_person({"person_id": "p2", "user_name": "Trần Bình"})
+        self.assertEqual([p["person_id"] for p in self.client.search_people("nguyen")["people"]], ["p1"])
+
+        self.client.save_person({"person_id": "p3", "user_name": "Nguyen Thi"})
+        found = {p["person_id"] for p in self.client.search_people("nguyen")["people"]}
+        self.assertEqual(found, {"p1", "p3"})
+
+    def test_embeddings_by_person(self):
+        """Test embeddings are looked up by person."""
+        self.client.save_embeddings_bulk(
+            [{"embedding_id": f"e{i}", "person_id": "p1" if i < 2 else "p2"} for i in range(3)]
+        )
+        self.assertEqual(len(self.client.get_embeddings_by_person("p1")), 2)
+
+    def test_matches_range_pagination_and_stats(self):
+        """Test range queries page newest first with daily counts and stats."""
+        self.client.save_matches_batch(
+            [
+                {"match_id": "m1", "person_id": "p1", "timestamp": "2026-10-15T08:00:00", "site_id": "gate"},
+                {"match_id": "m2", "person_id": "p1", "timestamp": "2026-10-16T08:00:00"},
+                {"match_id": "m3", "person_id": "p1", "timestamp": "2026-10-16T09:00:00"},
+                {"match_id": "m4", "person_id": "p1", "timestamp": "2026-10-17T08:00:00"},
+                {"match_id": "m5", "person_id": "p2", "timestamp": "2026-10-16T08:00:00"},
+            ]
+        )
+
+        page = self.client.query_person_matches("p1", since="2026-10-16", until="2026-10-17", limit=2)
+        rest = self.client.query_person_matches(
+            "p1", since="2026-10-16", until="2026-10-17", limit=2, cursor=page["next_cursor"]
+        )
+
+        self.assertEqual([m["match_id"] for m in page["matches"]], ["m4", "m3"])
+        self.assertEqual([m["match_id"] for m in rest["matches"]], ["m2"])
+        self.assertIsNone(rest["next_cursor"])
+        self.assertEqual(page["daily_counts"], {"2026-10-16": 2, "2026-10-17": 1})
+        self.assertEqual([m["match_id"] for m in self.client.query_matches_by_person("p1", limit=1)], ["m4"])
+
+        stats = self.client.get_stats()["stats"]
+        self.assertEqual(stats["total_matches"], 5)
+        self.assertEqual(stats["matches_per_day"]["2026-10-16"], 3)
+        self.assertEqual(stats["matches_per_site"], {"gate": 1})
+
+    def test_concurrent_writers(self):
+        """Test writes from several threads all land (per-thread connections)."""
+        def worker(n):
+            for i in range(20):
+                self.client.save_match({"match_id": f"m{n}-{i}", "person_id": f"p{n}", "confidence": 99.0})
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(self.client.get_stats()["stats"]["total_matches"], 80)
+
+    def test_connections_closed_when_threads_exit(self):
+        """Test short-lived threads do not leave connections behind."""
+        opened = []
+
+        def worker():
+            self.client.get_person("p1")
+            opened.append(self.client._conn())
+
+        for _ in range(10):
+            with ThreadPoolExecutor(max_workers=20) as pool:
+                for _ in range(20):
+                    pool.submit(worker)
+        gc.collect()
+
+        # Only the main thread's connection is left open
+        self.assertEqual(len(self.client._connections), 1)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+        self.assertEqual(self.client.get_person("p1"), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from fastapi.testclient import TestClient
 
 # Import the app and settings
@@ -71,7 +71,9 @@ def mock_identification_service():
 @pytest.fixture(scope="function")
 def mock_db_manager():
     """Fixture for a mocked DatabaseManager."""
-    return MagicMock()
+    mock = MagicMock()
+    mock.check_health_async = AsyncMock(side_effect=mock.check_health)
+    return mock
 
 
 # ==================================================================
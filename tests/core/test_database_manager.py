@@ -138,41 +138,32 @@ def test_get_all_people_success(db_manager, mock_dynamodb_client):
         {"person_id": "person_1", "user_name": "Alice", "embedding_count": 3},
         {"person_id": "person_2", "user_name": "Bob", "embedding_count": 5},
     ]
-    mock_dynamodb_client.list_people.return_value = {
-        "success": True,
-        "people": people_list,
-    }
+    mock_dynamodb_client.iter_people.return_value = iter(people_list)
 
     result = db_manager.get_all_people()
 
-    mock_dynamodb_client.list_people.assert_called_once()
+    mock_dynamodb_client.iter_people.assert_called_once()
     assert result == people_list
     assert len(result) == 2
 
 
 def test_get_all_people_empty(db_manager, mock_dynamodb_client):
     """Test retrieving all people when database is empty."""
-    mock_dynamodb_client.list_people.return_value = {
-        "success": True,
-        "people": [],
-    }
+    mock_dynamodb_client.iter_people.return_value = iter([])
 
     result = db_manager.get_all_people()
 
-    mock_dynamodb_client.list_people.assert_called_once()
+    mock_dynamodb_client.iter_people.assert_called_once()
     assert result == []
 
 
 def test_get_all_people_failure(db_manager, mock_dynamodb_client):
     """Test failed retrieval of all people."""
-    mock_dynamodb_client.list_people.return_value = {
-        "success": False,
-        "error": "Database connection error",
-    }
+    mock_dynamodb_client.iter_people.side_effect = RuntimeError("Database connection error")
 
     result = db_manager.get_all_people()
 
-    mock_dynamodb_client.list_people.assert_called_once()
+    mock_dynamodb_client.iter_people.assert_called_once()
     assert result == []
 
 
@@ -264,3 +255,182 @@ def test_get_embeddings_failure(db_manager, mock_dynamodb_client):
 
     mock_dynamodb_client.get_embeddings_by_person.assert_called_with("person_123")
     assert result == []
+
+
+@pytest.fixture
+def mock_redis():
+    """Redis client stub with an in-memory user metadata store."""
+    store = {}
+    redis_client = MagicMock()
+    redis_client.enabled = True
+    redis_client.get_user_metadata_many.side_effect = (
+        lambda ids: {i: store[i] for i in ids if i in store}
+    )
+    redis_client.set_user_metadata_many.side_effect = (
+        lambda users, ttl=1800: store.update(users) or True
+    )
+    redis_client.invalidate_user.side_effect = lambda i: store.pop(i, None) is not None
+    return redis_client
+
+
+@pytest.fixture
+def cached_db_manager(mock_dynamodb_client, mock_redis):
+    """DatabaseManager with a read-through person metadata cache."""
+    return DatabaseManager(aws_dynamodb_client=mock_dynamodb_client, redis_client=mock_redis)
+
+
+def test_get_people_batch_fetches_only_cache_misses(cached_db_manager, mock_dynamodb_client, mock_redis):
+    """Test cached people are not re-read from DynamoDB."""
+    mock_dynamodb_client.get_people_batch.return_value = {
+        "success": True,
+        "people": [{"person_id": "p1", "user_name": "A"}, {"person_id": "p2", "user_name": "B"}],
+    }
+    cached_db_manager.get_people_batch(["p1", "p2"])
+    mock_dynamodb_client.get_people_batch.assert_called_once_with(["p1", "p2"])
+
+    mock_dynamodb_client.get_people_batch.reset_mock()
+    mock_dynamodb_client.get_people_batch.return_value = {
+        "success": True,
+        "people": [{"person_id": "p3", "user_name": "C"}],
+    }
+    people = cached_db_manager.get_people_batch(["p1", "p3", "p1"])
+
+    mock_dynamodb_client.get_people_batch.assert_called_once_with(["p3"])
+    assert {p["person_id"] for p in people} == {"p1", "p3"}
+    mock_redis.get_user_metadata_many.assert_called_with(["p1", "p3"])
+
+
+def test_get_people_batch_all_cached_skips_dynamodb(cached_db_manager, mock_dynamodb_client, mock_redis):
+    """Test a fully cached batch makes no DynamoDB call."""
+    mock_redis.set_user_metadata_many({"p1": {"person_id": "p1"}})
+
+    people = cached_db_manager.get_people_batch(["p1"])
+
+    assert people == [{"person_id": "p1"}]
+    mock_dynamodb_client.get_people_batch.assert_not_called()
+
+
+def test_update_and_delete_invalidate_person_cache(cached_db_manager, mock_dynamodb_client, mock_redis):
+    """Test successful writes evict the cached person."""
+    mock_dynamodb_client.update_person.return_value = {"success": True}
+    mock_dynamodb_client.delete_person.return_value = {"success": True}
+
+    cached_db_manager.update_person("p1", {"user_name": "New"})
+    cached_db_manager.delete_person("p2")
+
+    mock_redis.invalidate_user.assert_any_call("p1")
+    mock_redis.invalidate_user.assert_any_call("p2")
+
+
+def test_failed_update_keeps_person_cache(cached_db_manager, mock_dynamodb_client, mock_redis):
+    """Test a failed update does not invalidate."""
+    mock_dynamodb_client.update_person.return_value = {"success": False, "error": "boom"}
+
+    cached_db_manager.update_person("p1", {"user_name": "New"})
+
+    mock_redis.invalidate_user.assert_not_called()
+
+
+def test_get_people_batch_projects_cached_records(cached_db_manager, mock_dynamodb_client, mock_redis):
+    """Test full records are cached and attributes applied on return."""
+    mock_dynamodb_client.get_people_batch.return_value = {
+        "success": True,
+        "people": [{"person_id": "p1", "user_name": "A", "embedding_count": 3}],
+    }
+
+    people = cached_db_manager.get_people_batch(["p1"], attributes=["user_name"])
+
+    assert people == [{"person_id": "p1", "user_name": "A"}]
+    mock_dynamodb_client.get_people_batch.assert_called_once_with(["p1"])
+    assert cached_db_manager.get_people_batch(["p1"])[0]["embedding_count"] == 3
+
+
+def test_get_all_people_uses_segmented_scan(mock_dynamodb_client):
+    """Test get_all_people streams the parallel scan into a list."""
+    mock_dynamodb_client.iter_people.return_value = iter([{"person_id": "p1"}, {"person_id": "p2"}])
+    manager = DatabaseManager(aws_dynamodb_client=mock_dynamodb_client, scan_segments=8)
+
+    people = manager.get_all_people()
+
+    assert [p["person_id"] for p in people] == ["p1", "p2"]
+    mock_dynamodb_client.iter_people.assert_called_once_with(total_segments=8, attributes=None)
+
+
+def test_create_people_bulk(cached_db_manager, mock_dynamodb_client, mock_redis):
+    """Test bulk creation uses one bulk write and invalidates written people."""
+    mock_dynamodb_client.save_people_bulk.return_value = {
+        "success": False,
+        "saved": 1,
+        "failed": 1,
+        "error": "1 item(s) not written",
+        "results": [
+            {"person_id": "p1", "success": True, "error": None},
+            {"person_id": "p2", "success": False, "error": "throttled"},
+        ],
+    }
+
+    result = cached_db_manager.create_people_bulk(
+        [{"user_name": "A", "person_id": "p1"}, {"user_name": "B", "person_id": "p2"}]
+    )
+
+    (records,), _ = mock_dynamodb_client.save_people_bulk.call_args
+    assert [r["person_id"] for r in records] == ["p1", "p2"]
+    assert records[0]["embedding_count"] == 0
+    mock_dynamodb_client.save_person.assert_not_called()
+    mock_redis.invalidate_user.assert_called_once_with("p1")
+    assert result["saved"] == 1
+
+
+def test_add_embeddings_bulk(db_manager, mock_dynamodb_client):
+    """Test bulk embedding records get generated IDs."""
+    mock_dynamodb_client.save_embeddings_bulk.return_value = {"success": True, "saved": 2, "results": []}
+
+    result = db_manager.add_embeddings_bulk(
+        [
+            {"person_id": "p1", "face_id": "f1", "image_url": "s3://a"},
+            {"person_id": "p1", "face_id": "f2", "image_url": "s3://b", "quality_score": 0.9},
+        ]
+    )
+
+    (records,), _ = mock_dynamodb_client.save_embeddings_bulk.call_args
+    assert len({r["embedding_id"] for r in records}) == 2
+    assert records[0]["quality_score"] == 0.0
+    mock_dynamodb_client.save_embedding.assert_not_called()
+    assert result["success"] is True
+
+
+def test_get_statistics_cached(mock_dynamodb_client):
+    """Test statistics come from the counters and are cached briefly."""
+    from datetime import datetime, timezone
+
+    today = datetime.now(timezone.utc).date().isoformat()
+    mock_dynamodb_client.get_stats.return_value = {
+        "success": True,
+        "stats": {
+            "total_people": 2,
+            "total_embeddings": 5,
+            "total_matches": 7,
+            "matches_per_day": {today: 3},
+            "matches_per_site": {},
+            "last_updated": None,
+        },
+    }
+    manager = DatabaseManager(aws_dynamodb_client=mock_dynamodb_client, stats_cache_ttl=60)
+
+    first = manager.get_statistics()
+    second = manager.get_statistics()
+
+    assert first["total_people"] == 2
+    assert first["matches_today"] == 3
+    assert second == first
+    mock_dynamodb_client.get_stats.assert_called_once()
+    mock_dynamodb_client.get_all_people.assert_not_called()
+
+
+def test_get_statistics_failure(db_manager, mock_dynamodb_client):
+    """Test failed counter reads return None and are not cached."""
+    mock_dynamodb_client.get_stats.return_value = {"success": False, "error": "boom", "stats": None}
+
+    assert db_manager.get_statistics() is None
+    assert db_manager.get_statistics() is None
+    assert mock_dynamodb_client.get_stats.call_count == 2
@@ -3,6 +3,7 @@ Unit tests for the EnrollmentService class.
 """
 
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 from aws.backend.core.enrollment_service import EnrollmentService
 
@@ -10,6 +11,7 @@ from aws.backend.core.enrollment_service import EnrollmentService
 @pytest.fixture
 def enrollment_service(mock_s3_client, mock_rekognition_client, mock_dynamodb_client):
     """Fixture to create an EnrollmentService instance with mocked clients."""
+    mock_dynamodb_client.get_image_hashes.return_value = {"success": True, "records": {}}
     return EnrollmentService(
         s3_client=mock_s3_client,
         rekognition_client=mock_rekognition_client,
@@ -17,6 +19,13 @@ def enrollment_service(mock_s3_client, mock_rekognition_client, mock_dynamodb_cl
     )
 
 
+@pytest.fixture(autouse=True)
+def skip_quality_validation():
+    """The fake image bytes cannot pass the real quality validator."""
+    with patch("aws.backend.core.enrollment_service.QUALITY_VALIDATOR_AVAILABLE", False):
+        yield
+
+
 def test_init_requires_all_clients():
     """Test that EnrollmentService raises ValueError if any client is missing."""
     with pytest.raises(ValueError, match="All AWS clients"):
@@ -36,20 +45,14 @@ def test_enroll_face_success(enrollment_service, mock_s3_client, mock_rekognitio
     }
     mock_s3_client.upload_bytes.return_value = {
         "success": True,
-        "url": "s3://bucket/test.jpg",
-    }
-    mock_dynamodb_client.save_person.return_value = {"success": True}
-    mock_dynamodb_client.get_person.return_value = {
-        "success": True,
-        "person": {"person_id": "person_123", "embedding_count": 0},
+        "s3_url": "s3://bucket/test.jpg",
     }
-    mock_dynamodb_client.update_person.return_value = {"success": True}
     mock_rekognition_client.index_face.return_value = {
         "success": True,
         "face_id": "face_abc123",
         "quality_score": 95.5,
     }
-    mock_dynamodb_client.save_embedding.return_value = {"success": True}
+    mock_dynamodb_client.save_person_with_embedding.return_value = {"success": True}
 
     # Act: Call enroll_face
     result = enrollment_service.enroll_face(
@@ -62,12 +65,19 @@ def test_enroll_face_success(enrollment_service, mock_s3_client, mock_rekognitio
     assert result["user_name"] == "Test User"
     assert result["face_id"] == "face_abc123"
     assert result["duplicate_found"] is False
+    assert result["image_url"] == "s3://bucket/test.jpg"
     
     # Verify client interactions
     mock_rekognition_client.search_faces.assert_called_once()
     mock_s3_client.upload_bytes.assert_called_once()
-    mock_dynamodb_client.save_person.assert_called_once()
     mock_rekognition_client.index_face.assert_called_once()
+    # Person and embedding are committed together, with the same person ID
+    mock_dynamodb_client.save_person_with_embedding.assert_called_once()
+    person, embedding = mock_dynamodb_client.save_person_with_embedding.call_args.args
+    assert person["person_id"] == embedding["person_id"] == result["person_id"]
+    assert embedding["face_id"] == "face_abc123"
+    mock_dynamodb_client.save_person.assert_not_called()
+    mock_s3_client.delete_image.assert_not_called()
 
 
 def test_enroll_face_duplicate_detected(enrollment_service, mock_rekognition_client):
@@ -84,10 +94,10 @@ def test_enroll_face_duplicate_detected(enrollment_service, mock_rekognition_cli
         ],
     }
     # Mock getting the existing person's info
-    enrollment_service.db.get_person = MagicMock(return_value={
-        "person_id": "person_existing",
-        "user_name": "Existing User",
-    })
+    enrollment_service.db.dynamodb.get_people_batch.return_value = {
+        "success": True,
+        "people": [{"person_id": "person_existing", "user_name": "Existing User"}],
+    }
 
     # Act: Call enroll_face
     result = enrollment_service.enroll_face(
@@ -102,12 +112,19 @@ def test_enroll_face_duplicate_detected(enrollment_service, mock_rekognition_cli
     assert len(result["duplicate_info"]) == 1
     assert result["duplicate_info"][0]["user_name"] == "Existing User"
     
-    # Verify that S3 upload was NOT called (enrollment stopped early)
+    enrollment_service.db.dynamodb.get_people_batch.assert_called_once_with(
+        ["person_existing"], attributes=["user_name"]
+    )
+
+    # Verify that no side effects happened (enrollment stopped early)
     enrollment_service.s3.upload_bytes.assert_not_called()
+    mock_rekognition_client.index_face.assert_not_called()
 
 
-def test_enroll_face_s3_upload_fails(enrollment_service, mock_s3_client, mock_rekognition_client):
-    """Test enrollment failure when S3 upload fails."""
+def test_enroll_face_s3_upload_fails(
+    enrollment_service, mock_s3_client, mock_rekognition_client, mock_dynamodb_client
+):
+    """Test the concurrently indexed face is removed when the S3 upload fails."""
     # Arrange: Mock no duplicates but S3 upload fails
     mock_rekognition_client.search_faces.return_value = {
         "success": True,
@@ -117,6 +134,12 @@ def test_enroll_face_s3_upload_fails(enrollment_service, mock_s3_client, mock_re
         "success": False,
         "error": "S3 connection error",
     }
+    mock_rekognition_client.index_face.return_value = {
+        "success": True,
+        "face_id": "face_abc123",
+        "quality_score": 95.5,
+    }
+    mock_rekognition_client.delete_faces.return_value = {"success": True}
 
     # Act
     result = enrollment_service.enroll_face(
@@ -128,8 +151,9 @@ def test_enroll_face_s3_upload_fails(enrollment_service, mock_s3_client, mock_re
     assert result["success"] is False
     assert "Failed to upload image" in result["message"]
     
-    # Verify Rekognition indexing was NOT called
-    mock_rekognition_client.index_face.assert_not_called()
+    # Verify rollback of the indexed face and that nothing was written
+    mock_rekognition_client.delete_faces.assert_called_once_with(["face_abc123"])
+    mock_dynamodb_client.save_person_with_embedding.assert_not_called()
 
 
 def test_enroll_face_rekognition_fails_with_rollback(
@@ -138,7 +162,7 @@ def test_enroll_face_rekognition_fails_with_rollback(
     mock_rekognition_client, 
     mock_dynamodb_client
 ):
-    """Test that person is deleted (rollback) when Rekognition indexing fails."""
+    """Test that the uploaded image is deleted (rollback) when indexing fails."""
     # Arrange: Mock successful steps up to Rekognition, then fail
     mock_rekognition_client.search_faces.return_value = {
         "success": True,
@@ -146,14 +170,13 @@ def test_enroll_face_rekognition_fails_with_rollback(
     }
     mock_s3_client.upload_bytes.return_value = {
         "success": True,
-        "url": "s3://bucket/test.jpg",
+        "s3_url": "s3://bucket/test.jpg",
     }
-    mock_dynamodb_client.save_person.return_value = {"success": True}
+    mock_s3_client.delete_image.return_value = {"success": True}
     mock_rekognition_client.index_face.return_value = {
         "success": False,
         "error": "No face detected",
     }
-    mock_dynamodb_client.delete_person.return_value = {"success": True}
 
     # Act
     result = enrollment_service.enroll_face(
@@ -165,6 +188,399 @@ def test_enroll_face_rekognition_fails_with_rollback(
     assert result["success"] is False
     assert "Failed to index face" in result["message"]
     
-    # Verify rollback: delete_person should have been called
-    mock_dynamodb_client.delete_person.assert_called_once()
+    # Verify rollback: the uploaded image is removed and no person is written
+    mock_s3_client.delete_image.assert_called_once()
+    mock_dynamodb_client.save_person_with_embedding.assert_not_called()
+
+
+def test_enroll_face_commit_fails_rolls_back_everything(
+    enrollment_service,
+    mock_s3_client,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test both side effects are undone when the metadata write fails."""
+    mock_rekognition_client.search_faces.return_value = {"success": True, "matches": []}
+    mock_s3_client.upload_bytes.return_value = {"success": True, "s3_url": "s3://bucket/test.jpg"}
+    mock_rekognition_client.index_face.return_value = {
+        "success": True,
+        "face_id": "face_abc123",
+        "quality_score": 95.5,
+    }
+    mock_dynamodb_client.save_person_with_embedding.return_value = {
+        "success": False,
+        "error": "TransactionCanceledException",
+    }
+
+    result = enrollment_service.enroll_face(
+        image_bytes=b"fake_image_data",
+        user_name="Test User",
+    )
+
+    assert result["success"] is False
+    assert "Failed to create person" in result["message"]
+    mock_rekognition_client.delete_faces.assert_called_once_with(["face_abc123"])
+    mock_s3_client.delete_image.assert_called_once()
+
+
+def test_enroll_face_retry_returns_existing_enrollment(
+    enrollment_service,
+    mock_s3_client,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test a retried upload replays the first result without new side effects."""
+    existing = {
+        "person_id": "person_1",
+        "face_id": "face_abc123",
+        "embedding_id": "emb_1",
+        "image_url": "s3://bucket/test.jpg",
+        "quality_score": 95.5,
+    }
+    mock_dynamodb_client.get_image_hashes.side_effect = lambda hashes: {
+        "success": True,
+        "records": {h: dict(existing, content_hash=h) for h in hashes},
+    }
+    mock_dynamodb_client.get_people_batch.return_value = {
+        "success": True,
+        "people": [{"person_id": "person_1", "user_name": "Test User"}],
+    }
+
+    result = enrollment_service.enroll_face(
+        image_bytes=b"fake_image_data",
+        user_name="Test User",
+    )
+
+    assert result["success"] is True
+    assert result["already_enrolled"] is True
+    assert (result["person_id"], result["face_id"]) == ("person_1", "face_abc123")
+    mock_s3_client.upload_bytes.assert_not_called()
+    mock_rekognition_client.index_face.assert_not_called()
+    mock_rekognition_client.search_faces.assert_not_called()
+    mock_dynamodb_client.save_person_with_embedding.assert_not_called()
+
+
+def test_enroll_face_stale_hash_of_deleted_person_is_dropped(
+    enrollment_service,
+    mock_s3_client,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test an image of a deleted person is enrolled again."""
+    mock_dynamodb_client.get_image_hashes.side_effect = lambda hashes: {
+        "success": True,
+        "records": {h: {"content_hash": h, "person_id": "gone", "face_id": "f0"} for h in hashes},
+    }
+    mock_dynamodb_client.get_people_batch.return_value = {"success": True, "people": []}
+    mock_rekognition_client.search_faces.return_value = {"success": True, "matches": []}
+    mock_s3_client.upload_bytes.return_value = {"success": True, "s3_url": "s3://bucket/test.jpg"}
+    mock_rekognition_client.index_face.return_value = {"success": True, "face_id": "face_new"}
+    mock_dynamodb_client.save_person_with_embedding.return_value = {"success": True}
+
+    result = enrollment_service.enroll_face(image_bytes=b"fake_image_data", user_name="Test User")
+
+    assert result["success"] is True
+    assert result["already_enrolled"] is False
+    assert result["face_id"] == "face_new"
+    mock_dynamodb_client.delete_image_hash.assert_called_once()
+    # The new enrollment records the hash in the same transactional write
+    image_hash = mock_dynamodb_client.save_person_with_embedding.call_args.kwargs["image_hash"]
+    assert image_hash["person_id"] == result["person_id"]
+    assert image_hash["face_id"] == "face_new"
+
+
+def test_enroll_face_concurrent_retry_loses_race(
+    enrollment_service,
+    mock_s3_client,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test the losing request of two concurrent retries undoes its work and replays."""
+    winner = {"person_id": "person_1", "face_id": "face_first", "image_url": "s3://bucket/first.jpg"}
+    mock_dynamodb_client.get_image_hashes.side_effect = [
+        {"success": True, "records": {}},
+        {"success": True, "records": {"h": winner}},
+    ]
+    mock_dynamodb_client.get_people_batch.return_value = {
+        "success": True,
+        "people": [{"person_id": "person_1", "user_name": "Test User"}],
+    }
+    mock_rekognition_client.search_faces.return_value = {"success": True, "matches": []}
+    mock_s3_client.upload_bytes.return_value = {"success": True, "s3_url": "s3://bucket/test.jpg"}
+    mock_rekognition_client.index_face.return_value = {"success": True, "face_id": "face_second"}
+    mock_dynamodb_client.save_person_with_embedding.return_value = {
+        "success": False,
+        "error": "TransactionCanceledException",
+    }
+
+    with patch.object(EnrollmentService, "_content_hash", return_value="h"):
+        result = enrollment_service.enroll_face(image_bytes=b"fake_image_data", user_name="Test User")
+
+    assert result["success"] is True
+    assert result["already_enrolled"] is True
+    assert result["face_id"] == "face_first"
+    mock_rekognition_client.delete_faces.assert_called_once_with(["face_second"])
+    mock_s3_client.delete_image.assert_called_once()
+
+
+def test_check_duplicates_one_search_per_image_one_lookup(
+    enrollment_service,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test bulk checks search each image once and resolve people in one batch."""
+    matches_by_image = {
+        b"img1": [
+            {"external_image_id": "p1", "face_id": "f1", "similarity": 99.0},
+            {"external_image_id": "p2", "face_id": "f2", "similarity": 97.0},
+        ],
+        b"img2": [],
+        b"img3": [
+            {"external_image_id": "p1", "face_id": "f3", "similarity": 98.0},
+            {"external_image_id": "gone", "face_id": "f4", "similarity": 96.0},
+        ],
+    }
+    mock_rekognition_client.search_faces.side_effect = lambda image, **kwargs: {
+        "success": True,
+        "matches": matches_by_image[image],
+    }
+    mock_dynamodb_client.get_people_batch.return_value = {
+        "success": True,
+        "people": [{"person_id": "p1", "user_name": "An"}, {"person_id": "p2", "user_name": "Binh"}],
+    }
+
+    results = enrollment_service.check_duplicates([b"img1", b"img2", b"img3"], threshold=90.0)
+
+    assert mock_rekognition_client.search_faces.call_count == 3
+    mock_dynamodb_client.get_people_batch.assert_called_once_with(["p1", "p2", "gone"], attributes=["user_name"])
+    assert [r["duplicate_found"] for r in results] == [True, False, True]
+    assert [m["user_name"] for m in results[0]["matches"]] == ["An", "Binh"]
+    # Faces whose person record no longer exists are ignored
+    assert [m["face_id"] for m in results[2]["matches"]] == ["f3"]
+
+
+def test_check_duplicates_search_error_is_not_a_duplicate(
+    enrollment_service,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test a failed search only affects its own image."""
+    mock_rekognition_client.search_faces.side_effect = [
+        Exception("Throttled"),
+        {"success": True, "matches": [{"external_image_id": "p1", "face_id": "f1", "similarity": 99.0}]},
+    ]
+    mock_dynamodb_client.get_people_batch.return_value = {
+        "success": True,
+        "people": [{"person_id": "p1", "user_name": "An"}],
+    }
+
+    with patch.object(enrollment_service, "index_concurrency", 1):
+        results = enrollment_service.check_duplicates([b"img1", b"img2"])
+
+    assert [r["duplicate_found"] for r in results] == [False, True]
+
+
+ADMIN_EVENT = {"requestContext": {"authorizer": {"claims": {"cognito:groups": "admin"}}}}
+
+
+def test_enroll_multiple_faces_parallel_enrolls_best_shots_only(
+    enrollment_service,
+    mock_s3_client,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test parallel mode only uploads and indexes the selected images."""
+    mock_dynamodb_client.save_person.return_value = {"success": True}
+    mock_dynamodb_client.save_embedding.return_value = {"success": True}
+    mock_s3_client.upload_bytes.return_value = {"success": True, "s3_url": "s3://bucket/face.jpg"}
+    mock_rekognition_client.index_face.side_effect = lambda image, **kwargs: {
+        "success": True,
+        "face_id": f"face_{image.decode()}",
+        "quality_score": 99.0,
+    }
+    images = [f"img{i}".encode() for i in range(1, 7)]
+
+    with patch.object(enrollment_service, "_select_best_shots", return_value=[2, 5, 6]) as select:
+        result = enrollment_service.enroll_multiple_faces(
+            ADMIN_EVENT, images, user_name="Test User", parallel=True, top_k=3
+        )
+
+    select.assert_called_once_with(images, 3)
+    assert result["success"] is True
+    assert (result["enrolled_count"], result["failed_count"], result["skipped_count"]) == (3, 0, 3)
+    assert [r["face_id"] for r in result["results"]] == ["face_img2", "face_img5", "face_img6"]
+    assert mock_rekognition_client.index_face.call_count == 3
+    mock_dynamodb_client.save_person.assert_called_once()
+
+
+def test_enroll_multiple_faces_parallel_no_usable_images(enrollment_service, mock_dynamodb_client):
+    """Test nothing is written when no image survives scoring."""
+    with patch.object(enrollment_service, "_select_best_shots", return_value=[]):
+        result = enrollment_service.enroll_multiple_faces(
+            ADMIN_EVENT, [b"junk"], user_name="Test User", parallel=True
+        )
+
+    assert result["success"] is False
+    assert "No usable images" in result["message"]
+    mock_dynamodb_client.save_person.assert_not_called()
+
+
+def test_enroll_multiple_faces_retry_only_enrolls_new_images(
+    enrollment_service,
+    mock_s3_client,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test a retried batch reuses the person and skips images already enrolled."""
+    known_hash = EnrollmentService._content_hash(b"img1")
+    mock_dynamodb_client.get_image_hashes.side_effect = lambda hashes: {
+        "success": True,
+        "records": {
+            h: {"content_hash": h, "person_id": "person_1", "face_id": "face_img1"}
+            for h in hashes
+            if h == known_hash
+        },
+    }
+    mock_dynamodb_client.get_people_batch.return_value = {
+        "success": True,
+        "people": [{"person_id": "person_1", "user_name": "Test User"}],
+    }
+    mock_dynamodb_client.save_embedding.return_value = {"success": True}
+    mock_dynamodb_client.save_image_hash.return_value = {"success": True, "exists": False}
+    mock_s3_client.upload_bytes.return_value = {"success": True, "s3_url": "s3://bucket/face.jpg"}
+    mock_rekognition_client.index_face.side_effect = lambda image, **kwargs: {
+        "success": True,
+        "face_id": f"face_{image.decode()}",
+    }
 
+    result = enrollment_service.enroll_multiple_faces(
+        ADMIN_EVENT, [b"img1", b"img2", b"img2"], user_name="Test User"
+    )
+
+    assert result["success"] is True
+    assert result["already_enrolled"] is True
+    assert result["person_id"] == "person_1"
+    assert (result["enrolled_count"], result["skipped_count"]) == (2, 1)
+    assert [r.get("already_enrolled", False) for r in result["results"]] == [True, False]
+    mock_dynamodb_client.save_person.assert_not_called()
+    mock_rekognition_client.index_face.assert_called_once()
+    assert mock_dynamodb_client.save_image_hash.call_args.args[0]["face_id"] == "face_img2"
+
+
+def test_enroll_multiple_faces_lost_claim_indexes_nothing(
+    enrollment_service,
+    mock_s3_client,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test a concurrent retry that loses the hash claim creates and indexes nothing."""
+    mock_dynamodb_client.claim_image_hashes.return_value = {"success": False, "exists": True}
+
+    result = enrollment_service.enroll_multiple_faces(
+        ADMIN_EVENT, [b"img1", b"img2"], user_name="Test User"
+    )
+
+    assert result["success"] is False
+    assert "another request" in result["message"]
+    claims = mock_dynamodb_client.claim_image_hashes.call_args.args[0]
+    assert [c["content_hash"] for c in claims] == [
+        EnrollmentService._content_hash(b"img1"), EnrollmentService._content_hash(b"img2")
+    ]
+    assert all(c["pending"] for c in claims)
+    mock_dynamodb_client.save_person.assert_not_called()
+    mock_s3_client.upload_bytes.assert_not_called()
+    mock_rekognition_client.index_face.assert_not_called()
+
+
+def test_enroll_multiple_faces_releases_claims_of_failed_images(
+    enrollment_service,
+    mock_s3_client,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test images that fail to index give their claim back for a later retry."""
+    mock_dynamodb_client.claim_image_hashes.return_value = {"success": True, "exists": False}
+    mock_dynamodb_client.save_person.return_value = {"success": True}
+    mock_dynamodb_client.save_embedding.return_value = {"success": True}
+    mock_dynamodb_client.save_image_hash.return_value = {"success": True, "exists": False}
+    mock_dynamodb_client.delete_image_hash.return_value = {"success": True}
+    mock_s3_client.upload_bytes.return_value = {"success": True, "s3_url": "s3://bucket/face.jpg"}
+    mock_rekognition_client.index_face.side_effect = lambda image, **kwargs: (
+        {"success": True, "face_id": "face_img1"} if image == b"img1" else {"success": False}
+    )
+
+    result = enrollment_service.enroll_multiple_faces(
+        ADMIN_EVENT, [b"img1", b"img2"], user_name="Test User"
+    )
+
+    assert (result["enrolled_count"], result["failed_count"]) == (1, 1)
+    claim_person = mock_dynamodb_client.claim_image_hashes.call_args.args[0][0]["person_id"]
+    assert claim_person == result["person_id"]
+    mock_dynamodb_client.delete_image_hash.assert_called_once_with(
+        EnrollmentService._content_hash(b"img2"), only_pending=True
+    )
+
+
+def test_find_enrolled_skips_pending_claims(enrollment_service, mock_dynamodb_client):
+    """Test pending claims are not replayed and only expired ones are released."""
+    fresh = datetime.now(timezone.utc).isoformat()
+    mock_dynamodb_client.get_image_hashes.return_value = {
+        "success": True,
+        "records": {
+            "h1": {"content_hash": "h1", "person_id": "p1", "pending": True, "created_at": fresh},
+            "h2": {"content_hash": "h2", "person_id": "p2", "pending": True,
+                   "created_at": "2020-01-01T00:00:00+00:00"},
+        },
+    }
+
+    assert enrollment_service._find_enrolled(["h1", "h2"]) == {}
+    mock_dynamodb_client.delete_image_hash.assert_called_once_with("h2", only_pending=True)
+
+
+@pytest.mark.parametrize(
+    "lookup",
+    [
+        {"success": False, "error": "ProvisionedThroughputExceededException", "people": []},
+        {"success": True, "people": [], "unprocessed": ["p1"]},
+    ],
+)
+def test_find_enrolled_keeps_records_when_person_lookup_is_incomplete(
+    enrollment_service, mock_dynamodb_client, lookup
+):
+    """Test a failed or incomplete person lookup never drops a hash record."""
+    record = {"content_hash": "h1", "person_id": "p1", "face_id": "f1"}
+    mock_dynamodb_client.get_image_hashes.return_value = {"success": True, "records": {"h1": record}}
+    mock_dynamodb_client.get_people_batch.return_value = lookup
+
+    found = enrollment_service._find_enrolled(["h1"])
+
+    assert found["h1"]["face_id"] == "f1"
+    mock_dynamodb_client.delete_image_hash.assert_not_called()
+
+
+def test_enroll_multiple_faces_embedding_failure_rolls_back_and_releases_claim(
+    enrollment_service,
+    mock_s3_client,
+    mock_rekognition_client,
+    mock_dynamodb_client
+):
+    """Test a failed embedding write undoes the face and gives the hash claim back."""
+    mock_dynamodb_client.claim_image_hashes.return_value = {"success": True, "exists": False}
+    mock_dynamodb_client.save_person.return_value = {"success": True}
+    mock_dynamodb_client.save_embedding.return_value = {"success": False, "error": "throttled"}
+    mock_dynamodb_client.delete_image_hash.return_value = {"success": True}
+    mock_s3_client.upload_bytes.return_value = {"success": True, "s3_url": "s3://bucket/face.jpg"}
+    mock_s3_client.delete_image.return_value = {"success": True}
+    mock_rekognition_client.index_face.return_value = {"success": True, "face_id": "face_1"}
+    mock_rekognition_client.delete_faces.return_value = {"success": True}
+
+    result = enrollment_service.enroll_multiple_faces(ADMIN_EVENT, [b"img1"], user_name="Test User")
+
+    assert result["success"] is False
+    assert result["results"][0]["success"] is False
+    assert "throttled" in result["results"][0]["error"]
+    mock_rekognition_client.delete_faces.assert_called_once_with(["face_1"])
+    mock_s3_client.delete_image.assert_called_once()
+    mock_dynamodb_client.delete_image_hash.assert_called_once_with(
+        EnrollmentService._content_hash(b"img1"), only_pending=True
+    )
@@ -0,0 +1,60 @@
+"""
+Unit tests for the shared AWS executor.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from aws.backend.core import executor
+
+
+@pytest.fixture(autouse=True)
+def reset_executor():
+    """Give every test a fresh executor."""
+    executor.configure_executor(4)
+    yield
+    executor.shutdown_executor()
+
+
+def test_run_blocking_runs_off_the_event_loop_thread():
+    """Test that blocking calls run on an executor thread, not the loop thread."""
+    async def main():
+        loop_thread = threading.get_ident()
+        worker_thread = await executor.run_blocking(threading.get_ident)
+        return loop_thread, worker_thread
+
+    loop_thread, worker_thread = asyncio.run(main())
+
+    assert loop_thread != worker_thread
+
+
+def test_run_blocking_passes_arguments():
+    """Test that positional and keyword arguments reach the callable."""
+    def combine(a, b, sep="-"):
+        return f"{a}{sep}{b}"
+
+    result = asyncio.run(executor.run_blocking(combine, "x", "y", sep="+"))
+
+    assert result == "x+y"
+
+
+def test_blocking_calls_overlap_up_to_pool_size():
+    """Test that concurrent blocking calls overlap instead of serializing."""
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(*(executor.run_blocking(time.sleep, 0.1) for _ in range(4)))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(main())
+
+    assert elapsed < 0.3
+
+
+def test_configure_executor_resizes_pool():
+    """Test that reconfiguring replaces the pool with the new size."""
+    executor.configure_executor(2)
+
+    assert executor.get_executor()._max_workers == 2
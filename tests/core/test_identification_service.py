@@ -5,7 +5,8 @@ Unit tests for the IdentificationService.
 import unittest
 from unittest.mock import MagicMock, patch
 
-from aws.backend.core.identification_service import IdentificationService
+from aws.backend.core.identification_service import PERSON_ATTRIBUTES, IdentificationService
+from aws.backend.utils.perceptual_hash import FrameKey, NearDuplicateCache
 
 
 class TestIdentificationService(unittest.TestCase):
@@ -187,6 +188,156 @@ class TestIdentificationService(unittest.TestCase):
         mock_db_instance.get_person.assert_called_once_with("unknown_person_456")
 
 
+    @patch("aws.backend.core.identification_service.DatabaseManager")
+    def test_identify_faces_batch_deduplicates_people_lookup(self, MockDatabaseManager):
+        """Test that a batch resolves all matched people with one batch call."""
+        # Arrange
+        mock_db_instance = MockDatabaseManager.return_value
+        mock_db_instance.get_people_batch.return_value = [
+            {"person_id": "person_1", "user_name": "Alice"},
+            {"person_id": "person_2", "user_name": "Bob"},
+        ]
+
+        def search_faces(image, max_faces, face_match_threshold):
+            matches = {
+                b"img_a": [{"external_image_id": "person_1", "face_id": "f1", "similarity": 99.0}],
+                b"img_b": [
+                    {"external_image_id": "person_1", "face_id": "f1", "similarity": 97.0},
+                    {"external_image_id": "person_2", "face_id": "f2", "similarity": 91.0},
+                ],
+                b"img_c": [],
+            }[image]
+            return {"success": True, "matches": matches}
+
+        self.mock_rekognition_client.search_faces.side_effect = search_faces
+
+        service = IdentificationService(
+            rekognition_client=self.mock_rekognition_client,
+            dynamodb_client=self.mock_dynamodb_client,
+            batch_max_workers=2,
+        )
+        service.db = mock_db_instance
+
+        # Act
+        result = service.identify_faces_batch(
+            [b"img_a", b"img_b", b"img_c"], save_result=False
+        )
+
+        # Assert
+        self.assertTrue(result["success"])
+        self.assertEqual(result["total_images"], 3)
+        self.assertEqual(result["faces_detected"], 3)
+        self.assertEqual(self.mock_rekognition_client.search_faces.call_count, 3)
+        mock_db_instance.get_people_batch.assert_called_once_with(
+            ["person_1", "person_2"], attributes=PERSON_ATTRIBUTES
+        )
+
+        first, second, third = result["results"]
+        self.assertEqual([f["user_name"] for f in first["faces"]], ["Alice"])
+        self.assertEqual([f["user_name"] for f in second["faces"]], ["Alice", "Bob"])
+        self.assertTrue(third["success"])
+        self.assertEqual(third["faces"], [])
+
+    @patch("aws.backend.core.identification_service.DatabaseManager")
+    def test_identify_faces_batch_isolates_failures(self, MockDatabaseManager):
+        """Test that one failing search does not fail the rest of the batch."""
+        # Arrange
+        mock_db_instance = MockDatabaseManager.return_value
+        mock_db_instance.get_people_batch.return_value = [
+            {"person_id": "person_1", "user_name": "Alice"},
+        ]
+
+        def search_faces(image, max_faces, face_match_threshold):
+            if image == b"bad":
+                raise RuntimeError("throttled")
+            return {
+                "success": True,
+                "matches": [{"external_image_id": "person_1", "face_id": "f1", "similarity": 99.0}],
+            }
+
+        self.mock_rekognition_client.search_faces.side_effect = search_faces
+
+        service = IdentificationService(
+            rekognition_client=self.mock_rekognition_client,
+            dynamodb_client=self.mock_dynamodb_client,
+        )
+        service.db = mock_db_instance
+
+        # Act
+        result = service.identify_faces_batch([b"bad", b"good"], save_result=False)
+
+        # Assert
+        self.assertTrue(result["success"])
+        self.assertFalse(result["results"][0]["success"])
+        self.assertIn("throttled", result["results"][0]["message"])
+        self.assertTrue(result["results"][1]["success"])
+
+    @patch("aws.backend.core.identification_service.DatabaseManager")
+    def test_identify_face_near_duplicate_cache_hit(self, MockDatabaseManager):
+        """Test that a near-identical frame is served without a Rekognition call."""
+        # Arrange
+        mock_db_instance = MockDatabaseManager.return_value
+        mock_db_instance.get_people_batch.return_value = [
+            {"person_id": "person_1", "user_name": "Alice"},
+        ]
+        self.mock_rekognition_client.search_faces.return_value = {
+            "success": True,
+            "matches": [{"external_image_id": "person_1", "face_id": "f1", "similarity": 99.0}],
+        }
+        near_duplicate_cache = NearDuplicateCache(max_distance=4, ttl=60)
+        frame_hashes = {
+            b"frame_1": FrameKey(0b1010 << 32, (40, 30, 45, 60)),
+            b"frame_2": FrameKey((0b1010 << 32) | 0b1, (41, 30, 45, 60)),
+        }
+        near_duplicate_cache.hash_image = frame_hashes.get
+
+        service = IdentificationService(
+            rekognition_client=self.mock_rekognition_client,
+            dynamodb_client=self.mock_dynamodb_client,
+            near_duplicate_cache=near_duplicate_cache,
+        )
+        service.db = mock_db_instance
+
+        # Act
+        first = service.identify_face(image_bytes=b"frame_1", save_result=False)
+        second = service.identify_face(image_bytes=b"frame_2", save_result=False)
+
+        # Assert
+        self.assertFalse(first["cache_hit"])
+        self.assertTrue(second["cache_hit"])
+        self.assertEqual(second["faces"][0]["user_name"], "Alice")
+        self.mock_rekognition_client.search_faces.assert_called_once()
+
+    @patch("aws.backend.core.identification_service.DatabaseManager")
+    def test_identify_face_near_duplicate_cache_hit_records_match(self, MockDatabaseManager):
+        """Test that a frame served from the near-duplicate cache is still recorded."""
+        mock_db_instance = MockDatabaseManager.return_value
+        mock_db_instance.get_people_batch.return_value = [
+            {"person_id": "person_1", "user_name": "Alice"},
+        ]
+        self.mock_rekognition_client.search_faces.return_value = {
+            "success": True,
+            "matches": [{"external_image_id": "person_1", "face_id": "f1", "similarity": 99.0}],
+        }
+        near_duplicate_cache = NearDuplicateCache(max_distance=4, ttl=60)
+        near_duplicate_cache.hash_image = lambda image_bytes: FrameKey(7, (40, 30, 45, 60))
+        match_recorder = MagicMock()
+
+        service = IdentificationService(
+            rekognition_client=self.mock_rekognition_client,
+            dynamodb_client=self.mock_dynamodb_client,
+            near_duplicate_cache=near_duplicate_cache,
+            match_recorder=match_recorder,
+        )
+        service.db = mock_db_instance
+
+        service.identify_face(image_bytes=b"frame_1")
+        second = service.identify_face(image_bytes=b"frame_2")
+
+        self.assertTrue(second["cache_hit"])
+        self.assertEqual(match_recorder.record.call_count, 2)
+        self.assertEqual(match_recorder.record.call_args.args[0], b"frame_2")
+
     def test_compare_faces_success(self):
         """Test successful 1:1 face comparison."""
         # Arrange
@@ -268,10 +419,12 @@ class TestIdentificationService(unittest.TestCase):
         """Test retrieving system statistics."""
         # Arrange
         mock_db_instance = MockDatabaseManager.return_value
-        mock_db_instance.get_all_people.return_value = [
-            {"person_id": "p1", "embedding_count": 2},
-            {"person_id": "p2", "embedding_count": 3},
-        ]
+        mock_db_instance.get_statistics.return_value = {
+            "total_people": 2,
+            "total_embeddings": 5,
+            "total_matches": 4,
+            "matches_today": 1,
+        }
 
         self.mock_rekognition_client.get_collection_stats.return_value = {
             "face_count": 10,
@@ -290,13 +443,33 @@ class TestIdentificationService(unittest.TestCase):
         # Assert
         self.assertEqual(stats["total_people"], 2)
         self.assertEqual(stats["total_embeddings"], 5)
+        self.assertEqual(stats["total_matches"], 4)
         self.assertEqual(stats["rekognition_faces"], 10)
         self.assertEqual(stats["collection_id"], "test_collection")
 
-        # Verify mocks
-        mock_db_instance.get_all_people.assert_called_once()
+        # Verify mocks: counters, not a full scan
+        mock_db_instance.get_statistics.assert_called_once()
+        mock_db_instance.get_all_people.assert_not_called()
         self.mock_rekognition_client.get_collection_stats.assert_called_once()
 
 
+    @patch("aws.backend.core.identification_service.DatabaseManager")
+    def test_save_match_results_uses_recorder(self, MockDatabaseManager):
+        """Test matches are queued on the recorder instead of written inline."""
+        recorder = MagicMock()
+        service = IdentificationService(
+            rekognition_client=self.mock_rekognition_client,
+            dynamodb_client=self.mock_dynamodb_client,
+            s3_client=self.mock_s3_client,
+            match_recorder=recorder,
+        )
+        faces = [{"person_id": "p1", "user_name": "A", "confidence": 0.9, "similarity": 90.0}]
+
+        service._save_match_results(b"img", faces, site_id="lobby")
+
+        recorder.record.assert_called_once_with(b"img", faces, site_id="lobby")
+        self.mock_s3_client.upload_bytes.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
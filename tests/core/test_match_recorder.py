@@ -0,0 +1,112 @@
+"""
+Unit tests for the write-behind MatchRecorder.
+"""
+
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+
+from aws.backend.core.match_recorder import MatchRecorder, build_match_items
+
+FACES = [
+    {"person_id": "p1", "confidence": 0.95, "similarity": 95.0, "face_id": "f1"},
+    {"person_id": "p2", "confidence": 0.85, "similarity": 85.0, "face_id": "f2"},
+]
+
+
+@pytest.fixture
+def mock_dynamodb():
+    dynamodb = MagicMock()
+    dynamodb.save_matches_batch.side_effect = lambda items: {
+        "success": True,
+        "saved": len(items),
+        "unprocessed": 0,
+    }
+    return dynamodb
+
+
+@pytest.fixture
+def mock_s3():
+    s3 = MagicMock()
+    s3.upload_bytes.side_effect = lambda data, key: {"success": True, "s3_url": f"s3://b/{key}"}
+    return s3
+
+
+def test_build_match_items():
+    items = build_match_items(FACES, "s3://b/k.jpg", "2024-01-01T00:00:00")
+
+    assert [i["person_id"] for i in items] == ["p1", "p2"]
+    assert all(i["image_url"] == "s3://b/k.jpg" for i in items)
+    assert items[0]["match_id"] != items[1]["match_id"]
+
+
+def test_requires_dynamodb_client():
+    with pytest.raises(ValueError):
+        MatchRecorder(dynamodb_client=None)
+
+
+def test_records_are_batched_and_flushed(mock_dynamodb, mock_s3):
+    recorder = MatchRecorder(mock_dynamodb, mock_s3, batch_size=10, flush_interval=0.05)
+    recorder.start()
+
+    for _ in range(3):
+        assert recorder.record(b"img", FACES)
+    assert recorder.flush(timeout=5)
+    recorder.stop()
+
+    items = [i for call in mock_dynamodb.save_matches_batch.call_args_list for i in call.args[0]]
+    assert len(items) == 6
+    # Stamped in UTC with an explicit offset
+    assert all(i["timestamp"].endswith("+00:00") for i in items)
+    assert all(i["image_url"].startswith("s3://b/identifications/") for i in items)
+    assert mock_s3.upload_bytes.call_count == 3
+
+    stats = recorder.stats()
+    assert stats["matches_written"] == 6
+    assert stats["snapshots_uploaded"] == 3
+    assert stats["queue_depth"] == 0
+    assert stats["running"] is False
+
+
+def test_snapshot_failure_still_writes_matches(mock_dynamodb, mock_s3):
+    mock_s3.upload_bytes.side_effect = None
+    mock_s3.upload_bytes.return_value = {"success": False, "error": "denied"}
+    recorder = MatchRecorder(mock_dynamodb, mock_s3, flush_interval=0.05)
+    recorder.start()
+
+    recorder.record(b"img", FACES[:1])
+    recorder.stop()
+
+    items = mock_dynamodb.save_matches_batch.call_args.args[0]
+    assert items[0]["image_url"] is None
+    assert recorder.stats()["snapshots_failed"] == 1
+
+
+def test_full_queue_drops_without_blocking(mock_dynamodb):
+    release = threading.Event()
+    mock_dynamodb.save_matches_batch.side_effect = lambda items: (
+        release.wait(5) and {"success": True, "saved": len(items)}
+    )
+    recorder = MatchRecorder(mock_dynamodb, max_queue_size=2, batch_size=1, flush_interval=0.01)
+    recorder.start()
+
+    results = [recorder.record(b"img", FACES[:1]) for _ in range(10)]
+    release.set()
+    recorder.stop()
+
+    assert results.count(False) >= 1
+    stats = recorder.stats()
+    assert stats["dropped"] == results.count(False)
+    assert stats["queue_high_water"] <= 2
+
+
+def test_stop_flushes_pending_matches(mock_dynamodb):
+    recorder = MatchRecorder(mock_dynamodb, batch_size=100, flush_interval=30)
+    recorder.start()
+
+    for _ in range(5):
+        recorder.record(b"img", FACES[:1])
+    recorder.stop()
+
+    assert recorder.stats()["matches_written"] == 5
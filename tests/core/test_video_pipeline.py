@@ -0,0 +1,173 @@
+"""
+Unit tests for the streaming video identification pipeline.
+"""
+
+import queue
+import threading
+
+import cv2
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from aws.backend.core.identification_service import IdentificationService
+from aws.backend.core.video_pipeline import (
+    PresenceTracker,
+    VideoFrameSampler,
+    VideoIdentificationPipeline,
+)
+
+FPS = 30
+
+
+@pytest.fixture
+def scene_video(tmp_path):
+    """3 s clip: 1.5 s black, then 1.5 s white (one scene change)."""
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), FPS, (64, 48))
+    for i in range(90):
+        writer.write(np.full((48, 64, 3), 0 if i < 45 else 255, np.uint8))
+    writer.release()
+    return path
+
+
+def _is_bright(image_bytes):
+    frame = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_GRAYSCALE)
+    return frame.mean() > 127
+
+
+def _identify(image_bytes):
+    faces = [{"person_id": "p1", "user_name": "Alice", "similarity": 97.0}] if _is_bright(image_bytes) else []
+    return {"success": True, "faces": faces}
+
+
+def test_sampler_samples_on_scene_change(scene_video):
+    sampler = VideoFrameSampler(probe_interval=5, min_sample_gap=0.1, max_sample_gap=10.0)
+
+    frames = list(sampler.frames(scene_video))
+
+    # First probe plus the first probe after the cut; static frames are skipped
+    assert [f["frame_number"] for f in frames] == [5, 50]
+    assert sampler.stats["frames_decoded"] == 90
+    assert sampler.stats["frames_probed"] == 18
+
+
+def test_sampler_max_gap_refreshes_static_scene(scene_video):
+    sampler = VideoFrameSampler(probe_interval=5, min_sample_gap=0.1, max_sample_gap=0.5)
+
+    frames = [f["frame_number"] for f in sampler.frames(scene_video)]
+
+    assert len(frames) > 2
+    gaps = np.diff(frames) / FPS
+    assert gaps.max() <= 0.5 + 5 / FPS
+
+
+def test_sampler_missing_video():
+    with pytest.raises(IOError):
+        list(VideoFrameSampler().frames("/nonexistent/clip.mp4"))
+
+
+def test_presence_tracker_intervals():
+    tracker = PresenceTracker(max_gap=2.0)
+    face = {"person_id": "p1", "user_name": "Alice", "similarity": 90.0}
+
+    for ts in (1.0, 2.0, 3.5, 10.0, 11.0):
+        tracker.add(ts, [face])
+
+    (person,) = tracker.summary()
+    assert person["first_seen"] == 1.0
+    assert person["last_seen"] == 11.0
+    assert person["detections"] == 5
+    assert person["intervals"] == [{"start": 1.0, "end": 3.5}, {"start": 10.0, "end": 11.0}]
+
+
+def test_pipeline_streams_frames_then_summary(scene_video):
+    pipeline = VideoIdentificationPipeline(
+        identify_fn=_identify,
+        workers=2,
+        sampler=VideoFrameSampler(probe_interval=5, min_sample_gap=0.1, max_sample_gap=0.5),
+    )
+
+    events = list(pipeline.run(scene_video))
+
+    frames, summary = events[:-1], events[-1]
+    assert all(e["type"] == "frame" for e in frames)
+    assert [e["frame_number"] for e in frames] == sorted(e["frame_number"] for e in frames)
+    assert all(e["frame_number"] > 45 for e in frames)
+    assert summary["type"] == "summary"
+    assert summary["success"] is True
+    assert summary["unique_persons"] == ["p1"]
+    person = summary["persons"][0]
+    assert 1.5 <= person["first_seen"] <= 2.0
+    assert len(person["intervals"]) == 1
+    assert summary["duration_seconds"] == 3.0
+
+
+def test_pipeline_runs_identify_concurrently(scene_video):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    gate = threading.Barrier(2, timeout=2)
+
+    def identify(image_bytes):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            gate.wait()
+        except threading.BrokenBarrierError:
+            pass
+        with lock:
+            active -= 1
+        return {"success": True, "faces": []}
+
+    pipeline = VideoIdentificationPipeline(
+        identify_fn=identify,
+        workers=2,
+        sampler=VideoFrameSampler(probe_interval=5, min_sample_gap=0.1, max_sample_gap=0.3),
+    )
+    list(pipeline.run(scene_video))
+
+    assert peak == 2
+
+
+def test_pipeline_reports_decode_error():
+    pipeline = VideoIdentificationPipeline(identify_fn=_identify)
+
+    (summary,) = list(pipeline.run("/nonexistent/clip.mp4"))
+
+    assert summary["success"] is False
+    assert "Failed to open video" in summary["message"]
+
+
+def test_decoder_exits_when_consumer_stopped_on_full_queue():
+    """The decoder must not block on a full queue once the consumer has gone."""
+    pipeline = VideoIdentificationPipeline(identify_fn=_identify)
+    frames = queue.Queue(maxsize=1)
+    frames.put({"frame_number": 1})
+    stop = threading.Event()
+
+    # Missing video: the decoder tries to hand the error to a consumer that never reads
+    decoder = threading.Thread(target=pipeline._decode, args=("/nonexistent/clip.mp4", frames, stop))
+    decoder.start()
+    decoder.join(timeout=0.3)
+    assert decoder.is_alive()
+
+    stop.set()
+    decoder.join(timeout=1.0)
+    assert not decoder.is_alive()
+
+
+def test_identify_faces_in_video_collects_stream(scene_video):
+    service = IdentificationService(rekognition_client=MagicMock(), dynamodb_client=MagicMock())
+    service.identify_face = MagicMock(side_effect=lambda image_bytes, **kwargs: _identify(image_bytes))
+
+    result = service.identify_faces_in_video(scene_video, frame_interval=5)
+
+    assert result["success"] is True
+    assert result["unique_persons"] == ["p1"]
+    assert result["frame_results"]
+    assert result["persons"][0]["intervals"]
+    _, kwargs = service.identify_face.call_args
+    assert kwargs["save_result"] is False
@@ -0,0 +1,173 @@
+"""
+Depth estimation (FFT liveness check) benchmark.
+
+Computes the raw high-frequency energy behind the depth score for the same
+images with the original full-resolution fft2 analysis and with the
+downsampled variants, reporting the time per call and how far each
+variant's energy is from the original (absolute and relative), plus
+whether the liveness check's pass/fail decision is the same.
+
+The depth score is energy / 50 capped at 1, and a live face needs a score
+above 0.7, so only energies of roughly 35-50 decide anything: detailed
+photos are far above that and saturate. The synthetic inputs therefore
+include dim, low-detail portraits whose energy lands in or near that band
+at every resolution (marked "*"), next to sharp, noisy and blurred ones
+that show how much detail above the analysis size's resolution is lost.
+Agreement is reported for the near-band images separately. Use --images to
+benchmark your own photos instead.
+
+Usage:
+    python tests/load_tests/depth_estimation_benchmark.py --sizes 640x480,1600x1200,4000x3000
+    python tests/load_tests/depth_estimation_benchmark.py --images "photos/*.jpg"
+"""
+
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from aws.backend.utils.image_quality import (  # noqa: E402
+    DEPTH_ANALYSIS_SIZE,
+    ImageQualityValidator,
+    QualityContext,
+)
+
+# Depth score a live face must exceed (see detect_liveness)
+DEPTH_PASS = 0.7
+# Energy at which the depth score saturates (see _estimate_depth)
+ENERGY_SCALE = 50.0
+# Images whose original energy is this close to the decision band count as near it
+NEAR_BAND = (DEPTH_PASS * ENERGY_SCALE - 10.0, ENERGY_SCALE + 10.0)
+
+VARIANTS = {
+    "original": dict(depth_analysis_size=0, depth_use_rfft=False, depth_float32=False),
+    "full-rfft": dict(depth_analysis_size=0, depth_use_rfft=True, depth_float32=False),
+    "down-fft2": dict(depth_analysis_size=DEPTH_ANALYSIS_SIZE, depth_use_rfft=False, depth_float32=False),
+    "down-rfft": dict(depth_analysis_size=DEPTH_ANALYSIS_SIZE, depth_use_rfft=True, depth_float32=False),
+    "down-rfft32": dict(depth_analysis_size=DEPTH_ANALYSIS_SIZE, depth_use_rfft=True, depth_float32=True),
+}
+
+
+def synthetic_images(width: int, height: int):
+    """Detailed portraits, then dim low-detail ones near the decision band."""
+    rng = np.random.default_rng(width)
+    base = np.zeros((height, width, 3), dtype=np.uint8)
+    base[:] = np.linspace(40, 200, width, dtype=np.uint8)[None, :, None]
+    cv2.ellipse(base, (width // 2, height // 2), (width // 7, height // 4), 0, 0, 360, (180, 160, 150), -1)
+    for name, noise, blur in (("sharp", 3.0, 0), ("noisy", 8.0, 0), ("blurred", 0.5, 3)):
+        image = np.clip(base + rng.normal(0, noise, base.shape), 0, 255).astype(np.uint8)
+        if blur:
+            image = cv2.GaussianBlur(image, (0, 0), blur)
+        yield f"{width}x{height} {name}", image
+
+    # Blurred at 640 wide and scaled up, so the same scene is equally smooth
+    # at every size (and large blurs stay cheap); the 8-bit rounding of the
+    # dim gradient is what is left of high frequencies
+    small = cv2.resize(base, (640, round(640 * height / width)), interpolation=cv2.INTER_AREA)
+    smooth = cv2.GaussianBlur(small.astype(np.float64), (0, 0), 4)
+    for gain in (0.01, 0.015, 0.02, 0.03):
+        image = cv2.resize(smooth * gain, (width, height), interpolation=cv2.INTER_LINEAR)
+        yield f"{width}x{height} dim-{gain:g}", np.clip(np.round(image), 0, 255).astype(np.uint8)
+
+
+def load_images(pattern: str):
+    for path in sorted(glob.glob(pattern)):
+        image = cv2.imread(path, cv2.IMREAD_COLOR)
+        if image is not None:
+            yield os.path.basename(path), image
+
+
+def time_energy(validator: ImageQualityValidator, image: np.ndarray, repeat: int):
+    """Median ms per depth energy (fresh context each time, gray conversion excluded)."""
+    timings = []
+    energy = 0.0
+    for _ in range(repeat):
+        context = QualityContext(image)
+        context.gray  # noqa: B018 - shared with the other checks, not part of depth
+        start = time.perf_counter()
+        energy = context.high_frequency_energy(
+            validator.depth_analysis_size, validator.depth_use_rfft, validator.depth_float32
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), energy
+
+
+def passes(energy: float) -> bool:
+    return min(energy / ENERGY_SCALE, 1.0) > DEPTH_PASS
+
+
+def summarize(deltas, relative, agree, count):
+    if not deltas:
+        return f"{'-':>9} {'-':>10} {'-':>9} {'-':>10}"
+    return (
+        f"{max(map(abs, deltas)):>9.2f} {statistics.mean(deltas):>+10.2f} "
+        f"{max(map(abs, relative)):>8.1%} {agree:>5}/{count:<4}"
+    )
+
+
+def main(args):
+    if args.images:
+        images = list(load_images(args.images))
+    else:
+        images = []
+        for size in args.sizes.split(","):
+            width, height = (int(v) for v in size.lower().split("x"))
+            images.extend(synthetic_images(width, height))
+    if not images:
+        sys.exit("No images to benchmark")
+
+    validators = {name: ImageQualityValidator(**config) for name, config in VARIANTS.items()}
+
+    print("Raw high-frequency energy per variant; dE = energy - original (* = near the decision band)")
+    print(f"{'image':<26} " + " ".join(f"{name:>24}" for name in VARIANTS))
+    groups = ("all", "near")
+    deltas = {group: {name: [] for name in VARIANTS} for group in groups}
+    relative = {group: {name: [] for name in VARIANTS} for group in groups}
+    agree = {group: {name: 0 for name in VARIANTS} for group in groups}
+    counts = {group: 0 for group in groups}
+    totals = {name: 0.0 for name in VARIANTS}
+    for label, image in images:
+        cells = []
+        reference = None
+        for name, validator in validators.items():
+            ms, energy = time_energy(validator, image, args.repeat)
+            if reference is None:
+                reference = energy
+                near = NEAR_BAND[0] <= reference <= NEAR_BAND[1]
+                for group in groups[:1 + near]:
+                    counts[group] += 1
+            for group in groups[:1 + near]:
+                deltas[group][name].append(energy - reference)
+                relative[group][name].append((energy - reference) / reference if reference else 0.0)
+                agree[group][name] += passes(energy) == passes(reference)
+            totals[name] += ms
+            cells.append(f"{ms:8.2f}ms E={energy:6.1f} {energy - reference:+5.1f}")
+        print(f"{label + (' *' if near else ''):<26} " + " ".join(f"{cell:>24}" for cell in cells))
+
+    print()
+    header = f"{'max |dE|':>9} {'mean dE':>10} {'max rel':>9} {'same pass':>10}"
+    print(f"{'':<12} {'':>10} {'':>8} {'all images':^40} {'near the decision band':^40}")
+    print(f"{'variant':<12} {'total ms':>10} {'speedup':>8} {header} {header}")
+    for name in VARIANTS:
+        print(
+            f"{name:<12} {totals[name]:>10.1f} {totals['original'] / totals[name]:>7.1f}x "
+            + " ".join(
+                summarize(deltas[group][name], relative[group][name], agree[group][name], counts[group])
+                for group in groups
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="640x480,1600x1200,4000x3000")
+    parser.add_argument("--images", help="Glob of image files to use instead of synthetic ones")
+    parser.add_argument("--repeat", type=int, default=3)
+    main(parser.parse_args())
@@ -0,0 +1,113 @@
+"""
+Event-loop blocking benchmark for the identify endpoint.
+
+Drives /api/v1/identify in-process (no network, no AWS) with an
+IdentificationService stub that sleeps for a fixed "Rekognition latency",
+and compares two modes at increasing concurrency:
+
+- blocking: the sync call runs directly on the event loop (old behaviour)
+- executor: the call runs on the shared AWS executor (identify_face_async)
+
+Usage:
+    python tests/load_tests/executor_benchmark.py --latency-ms 150 --workers 32
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from aws.backend.api import app as app_module  # noqa: E402
+from aws.backend.core import executor  # noqa: E402
+
+# 1x1 PNG; the stub never decodes it
+IMAGE_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+class StubIdentificationService:
+    """Identification service whose AWS round trip is a fixed sleep."""
+
+    def __init__(self, latency_s: float, blocking: bool):
+        self.latency_s = latency_s
+        self.blocking = blocking
+
+    def identify_face(self, image_bytes: bytes, **kwargs):
+        time.sleep(self.latency_s)
+        return {"success": True, "faces_detected": 0, "faces": []}
+
+    async def identify_face_async(self, image_bytes: bytes, **kwargs):
+        if self.blocking:
+            return self.identify_face(image_bytes, **kwargs)
+        return await executor.run_blocking(self.identify_face, image_bytes, **kwargs)
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    index = max(0, int(round(pct / 100.0 * len(ordered))) - 1)
+    return ordered[index]
+
+
+async def run_level(client: AsyncClient, concurrency: int, rounds: int):
+    """Fire `rounds` waves of `concurrency` simultaneous requests."""
+    latencies = []
+
+    async def one_request(issued_at: float):
+        response = await client.post(
+            "/api/v1/identify", files={"image": ("frame.png", IMAGE_BYTES, "image/png")}
+        )
+        response.raise_for_status()
+        # Measured from when the wave was issued: a blocked loop delays the
+        # start of every other request, which is exactly what we want to see
+        latencies.append((time.perf_counter() - issued_at) * 1000)
+
+    wall_start = time.perf_counter()
+    for _ in range(rounds):
+        issued_at = time.perf_counter()
+        await asyncio.gather(*(one_request(issued_at) for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+
+    return {
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 99),
+        "rps": len(latencies) / wall,
+    }
+
+
+async def main(args):
+    executor.configure_executor(args.workers)
+    levels = [int(level) for level in args.levels.split(",")]
+
+    print(f"Simulated AWS latency: {args.latency_ms:.0f} ms, executor workers: {args.workers}")
+    print(f"{'mode':<9} {'conc':>5} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>8}")
+
+    for mode in ("blocking", "executor"):
+        app_module.identification_service = StubIdentificationService(
+            args.latency_ms / 1000.0, blocking=(mode == "blocking")
+        )
+        async with AsyncClient(
+            transport=ASGITransport(app=app_module.app), base_url="http://bench"
+        ) as client:
+            for concurrency in levels:
+                stats = await run_level(client, concurrency, args.rounds)
+                print(
+                    f"{mode:<9} {concurrency:>5} {stats['p50']:>9.1f} "
+                    f"{stats['p99']:>9.1f} {stats['rps']:>8.1f}"
+                )
+
+    executor.shutdown_executor()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--levels", default="1,4,16,32")
+    parser.add_argument("--rounds", type=int, default=3)
+    asyncio.run(main(parser.parse_args()))
@@ -2,10 +2,14 @@
 
 import pytest
 import base64
+import io
+import json
+import os
+from fastapi import UploadFile
 from httpx import AsyncClient, ASGITransport
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
-from aws.backend.api.app import app, telemetry_events
+from aws.backend.api.app import app, identify_faces_in_video, telemetry_events
 
 # A valid base64 encoded 1x1 pixel red PNG
 VALID_IMAGE_BASE64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/wcAAwAB/epv2AAAAABJRU5ErkJggg=="
@@ -26,6 +30,11 @@ def mock_identification_service(monkeypatch):
             }
         ],
     }
+    # Routes await the async variants; delegate them to the sync mocks
+    mock_service.identify_face_async = AsyncMock(side_effect=mock_service.identify_face)
+    mock_service.identify_faces_batch_async = AsyncMock(
+        side_effect=mock_service.identify_faces_batch
+    )
     monkeypatch.setattr("aws.backend.api.app.identification_service", mock_service)
     return mock_service
 
@@ -85,3 +94,195 @@ async def test_identify_endpoint_missing_image():
 
     # FastAPI returns 422 for validation errors like missing required form fields
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_identify_batch_endpoint_success(mock_identification_service):
+    """Test batch identification keeps per-image results in upload order."""
+    mock_identification_service.identify_faces_batch.return_value = {
+        "success": True,
+        "total_images": 2,
+        "faces_detected": 1,
+        "results": [
+            {
+                "success": True,
+                "faces_detected": 1,
+                "faces": [{"user_name": "test_user", "confidence": 0.99}],
+                "message": "✅ Found 1 matching face(s)",
+                "cache_hit": False,
+            },
+            {
+                "success": True,
+                "faces_detected": 0,
+                "faces": [],
+                "message": "✅ No matching faces found",
+                "cache_hit": False,
+            },
+        ],
+    }
+    image_bytes = base64.b64decode(VALID_IMAGE_BASE64)
+    files = [
+        ("images", ("a.png", image_bytes, "image/png")),
+        ("images", ("b.png", image_bytes, "image/png")),
+    ]
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        response = await ac.post("/api/v1/identify/batch", files=files)
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["total_images"] == 2
+    assert [r["image_index"] for r in response_data["results"]] == [0, 1]
+    assert response_data["results"][0]["faces"][0]["user_name"] == "test_user"
+    _, kwargs = mock_identification_service.identify_faces_batch.call_args
+    assert len(kwargs["images"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_identify_video_endpoint_streams_ndjson(mock_identification_service):
+    """Test video identification streams one JSON event per line."""
+    events = [
+        {"type": "frame", "frame_number": 30, "timestamp": 1.0, "faces": [{"person_id": "p1"}]},
+        {"type": "summary", "success": True, "unique_persons": ["p1"], "persons": []},
+    ]
+    mock_identification_service.stream_video_identification.return_value = iter(events)
+    files = {"video": ("clip.mp4", b"not-really-a-video", "video/mp4")}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        response = await ac.post("/api/v1/identify/video", files=files)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["type"] for line in lines] == ["frame", "summary"]
+    video_path = mock_identification_service.stream_video_identification.call_args[0][0]
+    assert not os.path.exists(video_path)
+
+
+@pytest.mark.asyncio
+async def test_identify_video_endpoint_cleans_up_unconsumed_stream(mock_identification_service):
+    """Test the temp upload is removed by a background task, not by the stream."""
+    video = UploadFile(file=io.BytesIO(b"not-really-a-video"), filename="clip.mp4")
+    response = await identify_faces_in_video(video=video, threshold=0.6)
+    video_path = response.background.args[0]
+    assert os.path.exists(video_path)
+
+    # The client went away before the body was streamed
+    await response.background()
+
+    assert not os.path.exists(video_path)
+    mock_identification_service.stream_video_identification.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_identify_video_endpoint_rejects_extension(mock_identification_service):
+    """Test non-video uploads are rejected before processing."""
+    files = {"video": ("clip.txt", b"data", "text/plain")}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        response = await ac.post("/api/v1/identify/video", files=files)
+
+    assert response.status_code == 400
+    mock_identification_service.stream_video_identification.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_people_endpoint_paginates(monkeypatch):
+    """Test /api/v1/people returns one page with a cursor for the next."""
+    mock_db = MagicMock()
+    mock_db.list_people_page_async = AsyncMock(
+        return_value={
+            "success": True,
+            "people": [{"person_id": "p-1", "user_name": "John", "embedding_count": 1}],
+            "next_cursor": "next-token",
+        }
+    )
+    monkeypatch.setattr("aws.backend.api.app.db_manager", mock_db)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        response = await ac.get("/api/v1/people", params={"limit": 1, "cursor": "tok"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["people"][0]["folder_name"] == "p-1"
+    assert data["next_cursor"] == "next-token"
+    mock_db.list_people_page_async.assert_awaited_once_with(limit=1, cursor="tok")
+
+
+@pytest.mark.asyncio
+async def test_list_people_endpoint_unconfigured(monkeypatch):
+    """Test /api/v1/people returns an empty page of the same shape without AWS."""
+    monkeypatch.setattr("aws.backend.api.app.db_manager", None)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        response = await ac.get("/api/v1/people")
+
+    assert response.status_code == 200
+    assert response.json() == {"total": 0, "people": [], "next_cursor": None}
+
+
+@pytest.mark.asyncio
+async def test_stats_endpoint_uses_counters(monkeypatch):
+    """Test /api/v1/stats serves the cached aggregate counters."""
+    mock_db = MagicMock()
+    mock_db.get_statistics_async = AsyncMock(
+        return_value={
+            "total_people": 3,
+            "total_embeddings": 8,
+            "total_matches": 12,
+            "matches_today": 2,
+            "matches_per_day": {},
+            "matches_per_site": {},
+            "last_updated": "2026-10-17T10:00:00",
+        }
+    )
+    monkeypatch.setattr("aws.backend.api.app.db_manager", mock_db)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        response = await ac.get("/api/v1/stats")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_people"] == 3
+    assert data["last_updated"] == "2026-10-17T10:00:00"
+    mock_db.get_all_people_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_person_matches_endpoint(mock_identification_service):
+    """Test /api/v1/people/{id}/matches pages the time-bucketed history."""
+    mock_identification_service.get_person_matches_async = AsyncMock(
+        return_value={
+            "success": True,
+            "matches": [
+                {"match_id": "m-1", "person_id": "p-1", "timestamp": "2026-10-17T08:00:00"}
+            ],
+            "next_cursor": None,
+            "daily_counts": {"2026-10-17": 1},
+        }
+    )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        response = await ac.get("/api/v1/people/p-1/matches?until=2026-10-17&limit=5")
+        bad_limit = await ac.get("/api/v1/people/p-1/matches?limit=0")
+
+    assert response.status_code == 200
+    assert response.json()["matches"][0]["match_id"] == "m-1"
+    assert bad_limit.status_code == 400
+    mock_identification_service.get_person_matches_async.assert_awaited_once_with(
+        "p-1", since=None, until="2026-10-17", limit=5, cursor=None
+    )
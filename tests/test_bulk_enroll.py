@@ -0,0 +1,115 @@
+"""Unit tests for the bulk_enroll script (checkpoint resume and interrupts)."""
+
+import _thread
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# The script imports the backend as a top-level package, as when run from aws/;
+# its sys.path changes would shadow the aws package in process pool workers
+_sys_path = list(sys.path)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "aws")))
+import bulk_enroll  # noqa: E402
+sys.path[:] = _sys_path
+
+
+@pytest.fixture
+def photos(tmp_path):
+    """One image per person: a, b, c and d."""
+    source = tmp_path / "photos"
+    source.mkdir()
+    for key in "abcd":
+        (source / f"{key}.jpg").write_bytes(key.encode())
+    return source
+
+
+@pytest.fixture
+def enrolled(monkeypatch):
+    """Stub out AWS; returns the keys enroll_person was called with."""
+    calls = []
+
+    def enroll_person(service, job, args):
+        calls.append(job.key)
+        return {"key": job.key, "user_name": job.user_name, "status": "enrolled", "images_enrolled": 1}
+
+    monkeypatch.setattr(bulk_enroll, "enroll_person", enroll_person)
+    monkeypatch.setattr(
+        bulk_enroll, "build_service", lambda args, settings: (object(), SimpleNamespace(waited=0.0))
+    )
+    return calls
+
+
+def read_checkpoint(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_resume_from_partial_checkpoint(photos, enrolled, tmp_path):
+    """Test finished people are skipped and a line cut off by a kill is re-enrolled."""
+    checkpoint = tmp_path / "run.checkpoint.jsonl"
+    checkpoint.write_text(
+        json.dumps({"key": "a.jpg", "status": "enrolled"}) + "\n"
+        + json.dumps({"key": "b.jpg", "status": "failed", "error": "boom"}) + "\n"
+        + '{"key": "c.jpg", "sta',
+        encoding="utf-8",
+    )
+
+    assert bulk_enroll.main([str(photos), "--checkpoint", str(checkpoint), "--workers", "1"]) is True
+    assert sorted(enrolled) == ["c.jpg", "d.jpg"]
+
+    enrolled.clear()
+    bulk_enroll.main([str(photos), "--checkpoint", str(checkpoint), "--retry-failed"])
+    assert enrolled == ["b.jpg"]
+
+    state = bulk_enroll.Checkpoint(checkpoint)
+    state.close()
+    assert all(state.is_finished(key, retry_failed=True) for key in ("a.jpg", "b.jpg", "c.jpg", "d.jpg"))
+
+
+def test_interrupt_records_finished_people(photos, enrolled, tmp_path, monkeypatch):
+    """Test Ctrl+C still checkpoints the people whose enrollment completed."""
+    checkpoint = tmp_path / "run.checkpoint.jsonl"
+    enroll_person = bulk_enroll.enroll_person
+
+    def interrupted(service, job, args):
+        if job.key == "d.jpg":
+            _thread.interrupt_main()
+        return enroll_person(service, job, args)
+
+    monkeypatch.setattr(bulk_enroll, "enroll_person", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        bulk_enroll.main([str(photos), "--checkpoint", str(checkpoint), "--workers", "4"])
+
+    assert sorted(e["key"] for e in read_checkpoint(checkpoint)) == ["a.jpg", "b.jpg", "c.jpg", "d.jpg"]
+
+    enrolled.clear()
+    monkeypatch.setattr(bulk_enroll, "enroll_person", enroll_person)
+    assert bulk_enroll.main([str(photos), "--checkpoint", str(checkpoint)]) is True
+    assert enrolled == []
+
+
+def test_fractional_tps_still_allows_calls(monkeypatch):
+    """Test a --tps below 1 keeps a bucket big enough for one call."""
+    captured = {}
+
+    class RateLimited:
+        def __init__(self, client, rate, burst, operations):
+            captured.update(rate=rate, burst=burst)
+
+    for name in ("S3Client", "RekognitionClient", "DynamoDBClient", "EnrollmentService"):
+        monkeypatch.setattr(bulk_enroll, name, lambda *args, **kwargs: object())
+    monkeypatch.setattr(bulk_enroll, "RateLimitedClient", RateLimited)
+    monkeypatch.setattr(bulk_enroll.client_factory, "configure", lambda **kwargs: None)
+    settings = SimpleNamespace(
+        aws_max_pool_connections=10, aws_max_attempts=3, aws_retry_mode="adaptive", aws_s3_bucket="b",
+        aws_region="us-east-1", aws_rekognition_collection="c", storage_backend="dynamodb",
+        aws_dynamodb_people_table="p", aws_dynamodb_embeddings_table="e", aws_dynamodb_matches_table="m",
+        aws_dynamodb_stats_table="s", aws_dynamodb_image_hashes_table="h", enroll_best_shot_count=3,
+        enroll_scoring_workers=2, enroll_index_concurrency=2,
+    )
+
+    bulk_enroll.build_service(bulk_enroll.parse_args(["photos", "--tps", "0.5"]), settings)
+
+    assert captured == {"rate": 0.5, "burst": 1.0}
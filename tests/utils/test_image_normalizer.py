@@ -0,0 +1,99 @@
+"""
+Unit tests for ingest image normalization.
+"""
+
+import struct
+import unittest
+
+import cv2
+import numpy as np
+
+from aws.backend.utils.image_normalizer import (
+    encode_frame,
+    jpeg_exif_orientation,
+    normalize_image,
+)
+
+
+def make_photo(width: int, height: int) -> np.ndarray:
+    """Synthetic photo with some texture (so JPEG sizes are realistic)."""
+    rng = np.random.default_rng(0)
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image[:] = np.linspace(40, 200, width, dtype=np.uint8)[None, :, None]
+    cv2.circle(image, (width // 2, height // 2), min(width, height) // 4, (180, 160, 150), -1)
+    noise = rng.normal(0, 4, image.shape)
+    return np.clip(image + noise, 0, 255).astype(np.uint8)
+
+
+def with_exif_orientation(jpeg: bytes, orientation: int) -> bytes:
+    """Insert a minimal EXIF APP1 segment carrying the orientation tag."""
+    ifd = struct.pack("<H", 1) + struct.pack("<HHIHH", 0x0112, 3, 1, orientation, 0) + struct.pack("<I", 0)
+    tiff = b"II" + struct.pack("<HI", 42, 8) + ifd
+    payload = b"Exif\x00\x00" + tiff
+    return jpeg[:2] + b"\xff\xe1" + struct.pack(">H", len(payload) + 2) + payload + jpeg[2:]
+
+
+class TestNormalizeImage(unittest.TestCase):
+    """Test suite for normalize_image and encode_frame."""
+
+    def test_large_png_is_downscaled_to_jpeg(self):
+        """Test oversized uploads are resized and re-encoded as JPEG."""
+        ok, png = cv2.imencode(".png", make_photo(3200, 2400))
+        self.assertTrue(ok)
+
+        result = normalize_image(png.tobytes(), max_dimension=1600, jpeg_quality=85)
+
+        self.assertTrue(result.resized and result.reencoded)
+        self.assertEqual((result.width, result.height), (1600, 1200))
+        self.assertEqual(result.data[:2], b"\xff\xd8")
+        self.assertLess(len(result.data), result.original_size)
+        decoded = cv2.imdecode(np.frombuffer(result.data, np.uint8), cv2.IMREAD_COLOR)
+        self.assertEqual(decoded.shape[:2], (1200, 1600))
+
+    def test_small_compact_jpeg_passes_through(self):
+        """Test an already-normalized JPEG is not re-encoded."""
+        jpeg = encode_frame(make_photo(640, 480))
+
+        result = normalize_image(jpeg)
+
+        self.assertIs(result.data, jpeg)
+        self.assertFalse(result.resized or result.reencoded)
+        self.assertEqual(result.image.shape[:2], (480, 640))
+
+    def test_heavy_jpeg_is_recompressed(self):
+        """Test a full-resolution quality-100 JPEG gets re-encoded smaller."""
+        ok, jpeg = cv2.imencode(".jpg", make_photo(1280, 720), [int(cv2.IMWRITE_JPEG_QUALITY), 100])
+        self.assertTrue(ok)
+
+        result = normalize_image(jpeg.tobytes())
+
+        self.assertTrue(result.reencoded)
+        self.assertLess(len(result.data), len(jpeg.tobytes()))
+
+    def test_exif_orientation_is_applied(self):
+        """Test a rotated phone photo comes out upright without EXIF."""
+        jpeg = with_exif_orientation(encode_frame(make_photo(640, 480)), orientation=6)
+        self.assertEqual(jpeg_exif_orientation(jpeg), 6)
+
+        result = normalize_image(jpeg)
+
+        self.assertTrue(result.reencoded)
+        self.assertEqual((result.width, result.height), (480, 640))
+        self.assertEqual(jpeg_exif_orientation(result.data), 1)
+
+    def test_undecodable_input_passes_through(self):
+        """Test bytes that are not an image are left for downstream errors."""
+        result = normalize_image(b"not an image")
+
+        self.assertEqual(result.data, b"not an image")
+        self.assertIsNone(result.image)
+
+    def test_encode_frame_downscales(self):
+        """Test frames are downscaled to the max dimension before encoding."""
+        data = encode_frame(make_photo(1920, 1080), max_dimension=960)
+        decoded = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        self.assertEqual(decoded.shape[:2], (540, 960))
+
+
+if __name__ == "__main__":
+    unittest.main()
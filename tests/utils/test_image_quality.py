@@ -0,0 +1,256 @@
+"""
+Unit tests for local enrollment image scoring, best-shot selection, the
+shared quality metrics context and batch validation.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+
+from aws.backend.utils import image_quality
+from aws.backend.utils.image_quality import (
+    ImageQualityValidator,
+    QualityContext,
+    high_frequency_mask,
+)
+
+
+def make_portrait(seed: int = 0, noise: float = 0.0, shift: int = 0, gain: float = 1.0) -> bytes:
+    """Render a synthetic face photo and JPEG-encode it."""
+    rng = np.random.default_rng(seed)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame[:] = np.linspace(40, 200, 640, dtype=np.uint8)[None, :, None]
+    cv2.ellipse(frame, (320 + shift, 240), (90, 120), 0, 0, 360, (180, 160, 150), -1)
+    cv2.circle(frame, (290 + shift, 210), 12, (30, 30, 30), -1)
+    cv2.circle(frame, (350 + shift, 210), 12, (30, 30, 30), -1)
+    cv2.ellipse(frame, (320 + shift, 300), (40, 15), 0, 0, 180, (60, 40, 40), 4)
+    image = frame.astype(np.float64) * gain
+    if noise:
+        image += rng.normal(0, noise, frame.shape)
+    ok, buf = cv2.imencode(".jpg", np.clip(image, 0, 255).astype(np.uint8))
+    assert ok
+    return buf.tobytes()
+
+
+class TestEnrollmentImageScoring(unittest.TestCase):
+    """Test suite for score_enrollment_image and select_best_shots."""
+
+    def setUp(self):
+        self.validator = ImageQualityValidator()
+
+    def test_score_valid_image(self):
+        """Test a well-exposed image is valid and gets a unit signature."""
+        score = self.validator.score_enrollment_image(make_portrait())
+
+        self.assertTrue(score["valid"])
+        self.assertGreater(score["quality_score"], 0.0)
+        self.assertEqual(score["signature"].shape, (256,))
+        self.assertAlmostEqual(float(np.linalg.norm(score["signature"])), 1.0, places=4)
+
+    def test_score_dark_and_undecodable_images(self):
+        """Test bad exposure is invalid and garbage bytes have no signature."""
+        dark = self.validator.score_enrollment_image(make_portrait(gain=0.1))
+        garbage = self.validator.score_enrollment_image(b"not an image")
+
+        self.assertFalse(dark["valid"])
+        self.assertIsNotNone(dark["signature"])
+        self.assertFalse(garbage["valid"])
+        self.assertIsNone(garbage["signature"])
+
+    def test_select_prefers_diverse_valid_shots(self):
+        """Test near-identical frames lose to a different pose; bad images are dropped."""
+        images = [
+            make_portrait(seed=1, noise=2),
+            make_portrait(seed=2, noise=2),
+            make_portrait(seed=3, noise=2),
+            make_portrait(shift=150),
+            make_portrait(gain=0.1),
+            b"not an image",
+        ]
+        scores = [self.validator.score_enrollment_image(image) for image in images]
+
+        chosen = self.validator.select_best_shots(scores, top_k=2)
+
+        self.assertEqual(len(chosen), 2)
+        self.assertIn(3, chosen)
+        self.assertEqual(len(set(chosen) & {0, 1, 2}), 1)
+
+    def test_select_falls_back_to_invalid_images(self):
+        """Test invalid (but decodable) images fill in when too few are valid."""
+        scores = [
+            self.validator.score_enrollment_image(image)
+            for image in (make_portrait(), make_portrait(gain=0.1), b"junk")
+        ]
+
+        self.assertEqual(self.validator.select_best_shots(scores, top_k=3), [0, 1])
+        self.assertEqual(self.validator.select_best_shots(scores, top_k=0), [])
+
+
+class TestQualityContext(unittest.TestCase):
+    """Test suite for QualityContext and the validator entry points using it."""
+
+    def setUp(self):
+        self.validator = ImageQualityValidator()
+        self.image_bytes = make_portrait(noise=3)
+        self.image = cv2.imdecode(np.frombuffer(self.image_bytes, np.uint8), cv2.IMREAD_COLOR)
+
+    def test_metrics_match_per_call_computation(self):
+        """Test shared-buffer metrics equal the standalone OpenCV/NumPy formulas."""
+        context = QualityContext(self.image)
+        gray = cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
+
+        self.assertAlmostEqual(context.brightness, np.mean(gray) / 255.0, places=6)
+        self.assertAlmostEqual(context.contrast, float(np.std(gray)), places=4)
+        self.assertAlmostEqual(
+            context.laplacian_variance, cv2.Laplacian(gray, cv2.CV_64F).var(), places=2
+        )
+        self.assertAlmostEqual(
+            context.edge_density, np.count_nonzero(cv2.Canny(gray, 100, 200)) / gray.size
+        )
+
+    def test_face_crop(self):
+        """Test metrics use the face crop; tiny boxes fall back to the whole image."""
+        face = QualityContext(self.image, {"Left": 0.35, "Top": 0.25, "Width": 0.3, "Height": 0.5})
+        tiny = QualityContext(self.image, {"Left": 0.5, "Top": 0.5, "Width": 0.01, "Height": 0.01})
+
+        self.assertEqual(face.gray.shape, (240, 192))
+        self.assertEqual((face.width, face.height), (640, 480))
+        self.assertEqual(tiny.gray.shape, (480, 640))
+
+    def test_context_shared_across_entry_points(self):
+        """Test quality validation and liveness on one context convert to gray once."""
+        context = QualityContext.from_bytes(self.image_bytes)
+
+        with patch("aws.backend.utils.image_quality.cv2.cvtColor", wraps=cv2.cvtColor) as cvt:
+            quality = self.validator.validate_image_quality(context)
+            liveness = self.validator.detect_liveness(context)
+
+        self.assertEqual(cvt.call_count, 1)
+        self.assertTrue(quality["valid"])
+        self.assertGreater(liveness["checks"]["texture"]["score"], 0.0)
+        self.assertGreater(liveness["checks"]["depth"]["score"], 0.0)
+        self.assertIsNone(QualityContext.from_bytes(b"not an image"))
+
+
+class TestDepthEstimation(unittest.TestCase):
+    """Test suite for the downsampled, real-FFT depth estimation."""
+
+    def setUp(self):
+        frame = cv2.imdecode(np.frombuffer(make_portrait(noise=2), np.uint8), cv2.IMREAD_COLOR)
+        self.large = cv2.resize(frame, (1600, 1200))
+        self.flat = cv2.GaussianBlur((self.large * 0.02).astype(np.uint8), (0, 0), 15)
+
+    def test_mask_cached_and_matches_full_spectrum_layout(self):
+        """Test masks are reused per shape and match the radial fft2 mask."""
+        h, w = 48, 64
+        y, x = np.ogrid[:h, :w]
+        expected = ((y - h // 2) ** 2 + (x - w // 2) ** 2) > (min(h, w) * 0.3) ** 2
+
+        self.assertIs(high_frequency_mask((h, w)), high_frequency_mask((h, w)))
+        np.testing.assert_array_equal(high_frequency_mask((h, w)), expected)
+        # rfft columns are frequencies 0..w/2 (the last one is Nyquist)
+        np.testing.assert_array_equal(high_frequency_mask((h, w), real=True)[:, :-1], expected[:, w // 2:])
+
+    def test_full_resolution_matches_original_formula(self):
+        """Test size 0 without rfft is exactly the original full-resolution analysis."""
+        gray = cv2.cvtColor(self.flat, cv2.COLOR_BGR2GRAY)
+        spectrum = 20 * np.log(np.abs(np.fft.fftshift(np.fft.fft2(gray))) + 1)
+        expected = min(np.mean(spectrum[high_frequency_mask(gray.shape)]) / 50.0, 1.0)
+        validator = ImageQualityValidator(depth_analysis_size=0, depth_use_rfft=False)
+
+        self.assertAlmostEqual(validator._estimate_depth(QualityContext(self.flat)), expected, places=9)
+
+    def test_downsampled_energy_agrees_near_threshold(self):
+        """Test the fast path's raw energy matches full resolution on low-detail images."""
+        darker = (self.large * 0.01).astype(np.uint8)
+        for blur in (15, 25):
+            image = cv2.GaussianBlur(darker, (0, 0), blur)
+            original = QualityContext(image).high_frequency_energy()
+            # Unsaturated (energy / 50 < 1) so the score actually depends on it
+            self.assertLess(original, 50.0)
+            for real, float32 in ((False, False), (True, False), (True, True)):
+                self.assertAlmostEqual(
+                    QualityContext(image).high_frequency_energy(256, real, float32), original, delta=2.0
+                )
+
+    def test_downsampled_scores_agree_with_full_resolution(self):
+        """Test the fast path keeps the original score (detailed images saturate)."""
+        original = ImageQualityValidator(depth_analysis_size=0, depth_use_rfft=False)
+        for fast in (ImageQualityValidator(), ImageQualityValidator(depth_float32=True)):
+            for image in (self.large, self.flat):
+                self.assertAlmostEqual(
+                    fast._estimate_depth(QualityContext(image)),
+                    original._estimate_depth(QualityContext(image)),
+                    delta=0.05,
+                )
+
+        context = QualityContext(self.large)
+        ImageQualityValidator()._estimate_depth(context)
+        self.assertEqual(context.magnitude_spectrum(256, real=True).shape, (192, 129))
+
+
+class TestValidateBatch(unittest.TestCase):
+    """Test suite for validate_batch (process pool + shared memory)."""
+
+    def setUp(self):
+        self.validator = ImageQualityValidator()
+        frame = cv2.imdecode(np.frombuffer(make_portrait(noise=3), np.uint8), cv2.IMREAD_COLOR)
+        # Encoded, decoded color, decoded grayscale, dark and undecodable inputs
+        self.images = [
+            make_portrait(noise=3),
+            frame,
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY),
+            make_portrait(gain=0.1),
+            b"not an image",
+        ]
+        face = {
+            "BoundingBox": {"Left": 0.3, "Top": 0.2, "Width": 0.4, "Height": 0.6},
+            "Pose": {"Yaw": 5.0, "Pitch": 3.0, "Roll": 1.0},
+        }
+        self.face_details = [None, face, None, None, None]
+        self.expected = [
+            self.validator._assess(image, details, True)
+            for image, details in zip(self.images, self.face_details)
+        ]
+
+    def assert_expected(self, results):
+        self.assertEqual(len(results), len(self.expected))
+        for result, expected in zip(results, self.expected):
+            self.assertEqual(result["quality"], expected["quality"])
+            self.assertEqual(result["liveness"], expected["liveness"])
+
+    def test_process_pool_results_in_order(self):
+        """Test pool workers read images from shared memory and keep input order."""
+        self.addCleanup(image_quality.shutdown_process_pool)
+
+        results = self.validator.validate_batch(self.images, self.face_details)
+
+        self.assertIsNotNone(image_quality._process_pool)
+        self.assert_expected(results)
+        self.assertEqual([r["quality"]["valid"] for r in results], [True, True, True, False, False])
+        self.assertEqual(results[4]["quality"]["errors"], ["Failed to decode image"])
+        self.assertIsNone(results[4]["liveness"])
+        self.assertEqual(self.validator.validate_batch([]), [])
+
+    def test_falls_back_in_process_without_shared_memory(self):
+        """Test hosts without /dev/shm (e.g. Lambda) still get every result."""
+        with patch.object(image_quality, "get_process_pool", return_value=MagicMock()), patch.object(
+            image_quality.shared_memory, "SharedMemory", side_effect=OSError("no /dev/shm")
+        ):
+            results = self.validator.validate_batch(self.images, self.face_details)
+
+        self.assert_expected(results)
+
+    def test_quality_only(self):
+        """Test liveness can be skipped."""
+        with patch.object(image_quality, "get_process_pool", return_value=None):
+            results = self.validator.validate_batch(self.images[:1], liveness=False)
+
+        self.assertTrue(results[0]["quality"]["valid"])
+        self.assertIsNone(results[0]["liveness"])
+
+
+if __name__ == "__main__":
+    unittest.main()
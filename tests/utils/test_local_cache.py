@@ -0,0 +1,55 @@
+"""
+Unit tests for the in-process LRU/TTL cache.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from aws.backend.utils.local_cache import LocalTTLCache
+
+
+class TestLocalTTLCache(unittest.TestCase):
+    """Test suite for LocalTTLCache."""
+
+    def test_get_set(self):
+        cache = LocalTTLCache()
+        cache.set("a", {"x": 1})
+        self.assertEqual(cache.get("a"), {"x": 1})
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_lru_eviction(self):
+        cache = LocalTTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    @patch("aws.backend.utils.local_cache.time")
+    def test_ttl_expiry(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        cache = LocalTTLCache(default_ttl=5)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60)
+
+        mock_time.monotonic.return_value = 106.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+
+    def test_delete_and_pattern(self):
+        cache = LocalTTLCache()
+        cache.set("facerecog:user:1", 1)
+        cache.set("facerecog:search:h1", 2)
+        cache.set("facerecog:search:h2", 3)
+
+        self.assertEqual(cache.delete(["facerecog:user:1", "missing"]), 1)
+        self.assertEqual(cache.delete_pattern("facerecog:search:*"), 2)
+        self.assertEqual(cache.stats()["size"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
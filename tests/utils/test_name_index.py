@@ -0,0 +1,65 @@
+"""
+Unit tests for the accent-folded name search index.
+"""
+
+import unittest
+
+from aws.backend.utils.name_index import NameSearchIndex, normalize_name
+
+
+class TestNormalizeName(unittest.TestCase):
+    """Test suite for normalize_name."""
+
+    def test_folds_vietnamese_diacritics(self):
+        self.assertEqual(normalize_name("Nguyễn Văn Đức"), "nguyen van duc")
+        self.assertEqual(normalize_name("  TRẦN   thị  Ánh "), "tran thi anh")
+
+    def test_empty(self):
+        self.assertEqual(normalize_name(None), "")
+        self.assertEqual(normalize_name(""), "")
+
+
+class TestNameSearchIndex(unittest.TestCase):
+    """Test suite for NameSearchIndex."""
+
+    def setUp(self):
+        self.index = NameSearchIndex()
+        self.index.rebuild([
+            {"person_id": "p1", "user_name": "Nguyễn Văn An"},
+            {"person_id": "p2", "user_name": "Trần Thị Ánh"},
+            {"person_id": "p3", "user_name": "Anh Nguyễn"},
+            {"person_id": "p4", "user_name": "Lê Đức Thắng"},
+        ])
+
+    def test_accent_and_case_insensitive(self):
+        self.assertEqual(self.index.search("NGUYEN VAN"), ["p1"])
+        self.assertEqual(self.index.search("duc thang"), ["p4"])
+        self.assertEqual(self.index.search("Đức"), ["p4"])
+
+    def test_short_query_is_direct_lookup(self):
+        self.assertEqual(set(self.index.search("an")), {"p1", "p2", "p3", "p4"})
+
+    def test_ranking_prefix_then_word_then_substring(self):
+        # "anh nguyen" starts with the query, "tran thi anh" has it as a word
+        self.assertEqual(self.index.search("anh"), ["p3", "p2"])
+
+    def test_ngram_hit_without_contiguous_match_is_rejected(self):
+        # Every trigram of "nguyen an" occurs in "nguyen van an", but not contiguously
+        self.assertEqual(self.index.search("nguyen an"), [])
+
+    def test_upsert_rename_and_remove(self):
+        self.index.upsert("p1", "Phạm Minh")
+        self.assertEqual(self.index.search("nguyen van"), [])
+        self.assertEqual(self.index.search("pham"), ["p1"])
+
+        self.index.remove("p1")
+        self.assertEqual(self.index.search("pham"), [])
+        self.assertEqual(len(self.index), 3)
+
+    def test_limit_and_empty_query(self):
+        self.assertEqual(len(self.index.search("n", limit=2)), 2)
+        self.assertEqual(self.index.search("   "), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Unit tests for perceptual hashing and the near-duplicate cache.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from aws.backend.utils import perceptual_hash
+from aws.backend.utils.perceptual_hash import (
+    FrameKey,
+    NearDuplicateCache,
+    compute_dhash,
+    compute_face_key,
+    hamming_distance,
+)
+
+BOX = (40, 30, 45, 60)
+
+
+def make_frame(seed: int = 0, noise: float = 0.0, shift: int = 0) -> bytes:
+    """Render a synthetic 'kiosk frame' and JPEG-encode it."""
+    rng = np.random.default_rng(seed)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame[:] = np.linspace(40, 200, 640, dtype=np.uint8)[None, :, None]
+    cv2.ellipse(frame, (320 + shift, 240), (90, 120), 0, 0, 360, (180, 160, 150), -1)
+    cv2.circle(frame, (290 + shift, 210), 12, (30, 30, 30), -1)
+    cv2.circle(frame, (350 + shift, 210), 12, (30, 30, 30), -1)
+    cv2.ellipse(frame, (320 + shift, 300), (40, 15), 0, 0, 180, (60, 40, 40), 4)
+    if noise:
+        jitter = rng.normal(0, noise, frame.shape)
+        frame = np.clip(frame.astype(np.float64) + jitter, 0, 255).astype(np.uint8)
+    ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+    assert ok
+    return buf.tobytes()
+
+
+class TestComputeDhash(unittest.TestCase):
+    """Test suite for compute_dhash."""
+
+    def test_near_identical_frames_have_close_hashes(self):
+        """Test that sensor noise between frames only flips a few bits."""
+        a = compute_dhash(make_frame(seed=1, noise=3.0))
+        b = compute_dhash(make_frame(seed=2, noise=3.0))
+
+        self.assertIsNotNone(a)
+        self.assertLessEqual(hamming_distance(a, b), 6)
+
+    def test_different_frames_have_distant_hashes(self):
+        """Test that a different scene lands far away in Hamming space."""
+        a = compute_dhash(make_frame())
+        flipped = cv2.flip(cv2.imdecode(np.frombuffer(make_frame(), np.uint8), cv2.IMREAD_COLOR), 1)
+        b = compute_dhash(cv2.imencode(".jpg", flipped)[1].tobytes())
+
+        self.assertGreater(hamming_distance(a, b), 6)
+
+    def test_invalid_image_returns_none(self):
+        """Test that undecodable bytes yield no hash."""
+        self.assertIsNone(compute_dhash(b"not an image"))
+
+
+class FakeDetector:
+    """Stands in for the Haar cascade with fixed detections."""
+
+    def __init__(self, faces):
+        self.faces = faces
+
+    def detectMultiScale(self, gray, **kwargs):
+        return np.array(self.faces).reshape(-1, 4)
+
+
+class TestComputeFaceKey(unittest.TestCase):
+    """Test suite for compute_face_key."""
+
+    def test_key_has_hash_and_largest_face_box(self):
+        """Test the key combines the face crop hash with its bounding box."""
+        detector = FakeDetector([(10, 10, 20, 20), BOX])
+        with patch.object(perceptual_hash, "_get_face_detector", return_value=detector):
+            key = compute_face_key(make_frame())
+
+        self.assertEqual(key.box, BOX)
+        self.assertIsInstance(key.phash, int)
+
+    def test_no_face_means_no_key(self):
+        """Test frames without a detected face are never keyed (no central fallback)."""
+        with patch.object(perceptual_hash, "_get_face_detector", return_value=FakeDetector([])):
+            self.assertIsNone(compute_face_key(make_frame()))
+        with patch.object(perceptual_hash, "_get_face_detector", return_value=None):
+            self.assertIsNone(compute_face_key(make_frame()))
+
+
+class TestNearDuplicateCache(unittest.TestCase):
+    """Test suite for NearDuplicateCache."""
+
+    def test_hit_within_radius(self):
+        """Test that a hash a few bits away returns the cached value."""
+        cache = NearDuplicateCache(max_distance=4, ttl=60)
+        cache.set(FrameKey(0b1011 << 40, BOX), {"faces": ["a"]})
+
+        result = cache.get(FrameKey((0b1011 << 40) ^ 0b111, BOX))
+
+        self.assertEqual(result, {"faces": ["a"]})
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_miss_outside_radius(self):
+        """Test that a hash beyond the radius is a miss."""
+        cache = NearDuplicateCache(max_distance=2, ttl=60)
+        cache.set(FrameKey(0, BOX), {"faces": ["a"]})
+
+        self.assertIsNone(cache.get(FrameKey(0b1111, BOX)))
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_miss_when_face_moved(self):
+        """Test that a matching hash with a face elsewhere in the frame is a miss."""
+        cache = NearDuplicateCache(max_distance=2, ttl=60)
+        cache.set(FrameKey(0, BOX), {"faces": ["a"]})
+
+        self.assertIsNone(cache.get(FrameKey(0, (200, 30, 45, 60))))
+        self.assertEqual(cache.get(FrameKey(0, (42, 31, 45, 60))), {"faces": ["a"]})
+
+    def test_no_key_is_never_cached(self):
+        """Test that frames without a key are neither stored nor served."""
+        cache = NearDuplicateCache(max_distance=2, ttl=60)
+
+        self.assertFalse(cache.set(None, {"faces": ["a"]}))
+        self.assertIsNone(cache.get(None))
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_returns_closest_match(self):
+        """Test that the nearest cached hash wins when several are in range."""
+        cache = NearDuplicateCache(max_distance=6, ttl=60)
+        cache.set(FrameKey(0b111111, BOX), "far")
+        cache.set(FrameKey(0b000001, BOX), "near")
+
+        self.assertEqual(cache.get(FrameKey(0, BOX)), "near")
+
+    def test_entries_expire(self):
+        """Test that entries are not served after their TTL."""
+        cache = NearDuplicateCache(max_distance=2, ttl=5)
+        with patch.object(perceptual_hash.time, "monotonic", return_value=100.0):
+            cache.set(FrameKey(42, BOX), "value")
+        with patch.object(perceptual_hash.time, "monotonic", return_value=104.0):
+            self.assertEqual(cache.get(FrameKey(42, BOX)), "value")
+        with patch.object(perceptual_hash.time, "monotonic", return_value=106.0):
+            self.assertIsNone(cache.get(FrameKey(42, BOX)))
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_oldest_entry_evicted_when_full(self):
+        """Test that the cache stays within max_entries."""
+        cache = NearDuplicateCache(max_distance=0, ttl=60, max_entries=2)
+        cache.set(FrameKey(1, BOX), "one")
+        cache.set(FrameKey(2, BOX), "two")
+        cache.set(FrameKey(3, BOX), "three")
+
+        self.assertIsNone(cache.get(FrameKey(1, BOX)))
+        self.assertEqual(cache.get(FrameKey(3, BOX)), "three")
+        self.assertEqual(cache.stats()["size"], 2)
+
+    def test_returned_values_are_copies(self):
+        """Test that callers cannot mutate cached entries."""
+        cache = NearDuplicateCache(max_distance=0, ttl=60)
+        cache.set(FrameKey(7, BOX), {"cache_hit": False})
+
+        cache.get(FrameKey(7, BOX))["cache_hit"] = True
+
+        self.assertFalse(cache.get(FrameKey(7, BOX))["cache_hit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
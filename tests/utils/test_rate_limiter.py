@@ -0,0 +1,73 @@
+"""
+Unit tests for the token bucket and the rate-limited client proxy.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from aws.backend.utils.rate_limiter import RateLimitedClient, TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test suite for TokenBucket."""
+
+    def test_burst_then_refill(self):
+        """Test the burst is available at once and refills at the rate."""
+        clock = [100.0]
+        with patch("aws.backend.utils.rate_limiter.time.monotonic", side_effect=lambda: clock[0]):
+            bucket = TokenBucket(rate=2, capacity=3)
+            self.assertTrue(all(bucket.try_acquire() for _ in range(3)))
+            self.assertFalse(bucket.try_acquire())
+
+            clock[0] += 0.5
+            self.assertTrue(bucket.try_acquire())
+            self.assertFalse(bucket.try_acquire())
+
+            clock[0] += 10
+            self.assertTrue(all(bucket.try_acquire() for _ in range(3)))
+            self.assertFalse(bucket.try_acquire())
+
+    def test_acquire_blocks_to_hold_rate(self):
+        """Test concurrent callers are held to the configured rate."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+
+        threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 20 tokens, 1 free: at least 19 refills at 50/s
+        self.assertGreaterEqual(time.monotonic() - start, 19 / 50 * 0.9)
+
+    def test_invalid_arguments(self):
+        """Test rate and token counts are validated."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=5, capacity=2).acquire(3)
+
+
+class TestRateLimitedClient(unittest.TestCase):
+    """Test suite for RateLimitedClient."""
+
+    def test_limits_operations_and_passes_through_attributes(self):
+        """Test limited methods take tokens per operation; others pass through."""
+        client = MagicMock()
+        client.collection_id = "faces"
+        client.index_face.return_value = {"success": True}
+        proxy = RateLimitedClient(client, rate=5, operations=["index_face", "search_faces"], rates={"search_faces": 1})
+
+        self.assertEqual(proxy.collection_id, "faces")
+        self.assertEqual(proxy.index_face(image=b"x"), {"success": True})
+        client.index_face.assert_called_once_with(image=b"x")
+        self.assertEqual(proxy.bucket("index_face").rate, 5)
+        self.assertEqual(proxy.bucket("search_faces").rate, 1)
+        self.assertIs(proxy.delete_faces, client.delete_faces)
+
+
+if __name__ == "__main__":
+    unittest.main()